@@ -343,6 +343,7 @@ base_extension_info = {
     "cpp_files": ["time_func.cpp",
                   "interruption.cpp",
                   "exceptions_test.cpp",
+                  "parallel/thread_pool.cpp",
                   "math/t2exp.cpp",
                   "math/normal_distribution.cpp",
                   ],
@@ -355,6 +356,7 @@ base_extension_info = {
 
                 "parallel/parallel.h",
                 "parallel/parallel_utils.h",
+                "parallel/thread_pool.h",
 
                 "interruption.h",
                 "base_test.h",
@@ -364,6 +366,7 @@ base_extension_info = {
                 "math/t2exp.h",
                 "math/t2exp.inl",
                 "math/normal_distribution.h",
+                "math/sum_tree.h",
                 ],
     "swig_files": ["base_module.i"],
     "module_dir": "./tick/base",
@@ -402,9 +405,9 @@ random_extension = create_extension(**random_extension_info)
 
 simulation_extension_info = {
     "cpp_files": ["pp.cpp", "poisson.cpp", "inhomogeneous_poisson.cpp",
-                  "hawkes.cpp"],
+                  "hawkes.cpp", "hawkes_multi.cpp"],
     "h_files": ["pp.h", "poisson.h", "inhomogeneous_poisson.h",
-                "hawkes.h"],
+                "hawkes.h", "hawkes_multi.h"],
     "folders": ["hawkes_kernels"],
     "swig_files": ["simulation_module.i"],
     "module_dir": "./tick/simulation/",
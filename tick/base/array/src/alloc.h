@@ -12,8 +12,10 @@
 #include <Python.h>
 #define PYDECREF(ref) Py_DECREF(reinterpret_cast<PyObject*>(ref))
 #define PYINCREF(ref) Py_INCREF(reinterpret_cast<PyObject*>(ref))
-#define _PYSHARED_FREE_ARRAY(ptr) PyMem_Free(reinterpret_cast<void*> (ptr))
-#define _PYSHARED_ALLOC_ARRAY(ptr, type, n) ptr = reinterpret_cast<type*>(PyMem_Malloc((n)*sizeof(type)))
+// The raw allocator does not require the GIL to be held, hence arrays can be allocated (and freed)
+// by C++ threads that run while the GIL is released
+#define _PYSHARED_FREE_ARRAY(ptr) PyMem_RawFree(reinterpret_cast<void*> (ptr))
+#define _PYSHARED_ALLOC_ARRAY(ptr, type, n) ptr = reinterpret_cast<type*>(PyMem_RawMalloc((n)*sizeof(type)))
 #else
 #define PYDECREF(ref)
 #define PYINCREF(ref)
@@ -52,6 +52,33 @@ struct cblas_wrappers_base {
             x[i] = alpha;
         }
     }
+
+    /**
+     * y = alpha * A x + beta * y, or y = alpha * A^T x + beta * y if transpose is true,
+     * where A is a m x n row-major matrix. As in BLAS, y is not read if beta is 0.
+     */
+    virtual void gemv(const bool transpose, const ulong m, const ulong n, const T alpha,
+                      const T *a, const T *x, const T beta, T *y) const {
+        if (!transpose) {
+            for (ulong i = 0; i < m; ++i) {
+                const T a_i_x = alpha * dot(n, a + i * n, x);
+                y[i] = beta == 0 ? a_i_x : a_i_x + beta * y[i];
+            }
+        } else {
+            if (beta == 0) {
+                set(n, T{0}, y);
+            } else if (beta != 1) {
+                scale(n, beta, y);
+            }
+            for (ulong i = 0; i < m; ++i) {
+                const T alpha_x_i = alpha * x[i];
+                const T *a_i = a + i * n;
+                for (ulong j = 0; j < n; ++j) {
+                    y[j] += alpha_x_i * a_i[j];
+                }
+            }
+        }
+    }
 };
 
 template<typename T>
@@ -72,6 +99,12 @@ struct cblas_wrappers<float> final : public cblas_wrappers_base<float> {
         cblas_sscal(n, alpha, x, 1);
     }
 
+    void gemv(const bool transpose, const ulong m, const ulong n, const float alpha,
+              const float *a, const float *x, const float beta, float *y) const override {
+        cblas_sgemv(CblasRowMajor, transpose ? CblasTrans : CblasNoTrans,
+                    m, n, alpha, a, n, x, 1, beta, y, 1);
+    }
+
 #if defined(XDATA_CATLAS_AVAILABLE)
     void set(const ulong n, const float alpha, float* x) const override {
         catlas_sset(n, alpha, x, 1);
@@ -93,6 +126,12 @@ struct cblas_wrappers<double> final : public cblas_wrappers_base<double> {
         cblas_dscal(n, alpha, x, 1);
     }
 
+    void gemv(const bool transpose, const ulong m, const ulong n, const double alpha,
+              const double *a, const double *x, const double beta, double *y) const override {
+        cblas_dgemv(CblasRowMajor, transpose ? CblasTrans : CblasNoTrans,
+                    m, n, alpha, a, n, x, 1, beta, y, 1);
+    }
+
 #if defined(XDATA_CATLAS_AVAILABLE)
     void set(const ulong n, const double alpha, double* x) const override {
         catlas_dset(n, alpha, x, 1);
@@ -1,11 +1,10 @@
 # import warnings
 import os
 import inspect
+import textwrap
 from datetime import datetime
 from abc import ABCMeta
 import json
-import pydoc
-import numpydoc as nd
 import copy
 
 
@@ -59,10 +58,13 @@ class BaseMeta(ABCMeta):
             cpp_obj_setter = getattr(cpp_obj, cpp_setter)
             cpp_obj_setter(val)
 
+    # Name of the instance flag telling that its __init__ is running, it is
+    # set by BaseMeta.__call__
+    in_init_flag = '__in_init'
+
     @staticmethod
-    def detect_if_called_in_init(self):
-        """This function examine stacktrace in order to determine if it has
-        been called from the __init__ function of the given instance
+    def is_in_init(self):
+        """Tells if the __init__ function of the given instance is running
 
         Parameters
         ----------
@@ -71,35 +73,10 @@ class BaseMeta(ABCMeta):
 
         Returns
         -------
-        set_int_init : `bool`
-            True if this function was called by __init__
+        in_init : `bool`
+            True if the instance is being initialized
         """
-        # It is forbidden to set a readonly (non writable) attribute
-        # expect from __init__ function of the class
-        set_in_init = False
-        # trace contains information of the current execution
-        # environment
-        trace = inspect.currentframe()
-        while trace is not None:
-            # We retrieve the name of the executor (for example the
-            # function that launched this command)
-            exec_name = trace.f_code.co_name
-            # We inspect the local variables
-            if 'self' in trace.f_locals:
-                local_self = trace.f_locals['self']
-            else:
-                local_self = None
-            # We check if environment corresponds to our instance's
-            # __init__
-            if exec_name == '__init__' and local_self == self:
-                set_in_init = True
-                break
-            # If this frame was not the good one, we try the previous
-            # one, the one that has launched it
-            # If there is no previous one, `None` will be returned
-            trace = trace.f_back
-
-        return set_in_init
+        return self.__dict__.get(BaseMeta.in_init_flag, False)
 
     @staticmethod
     def build_property(class_name, attrs, attr_name, writable,
@@ -138,12 +115,13 @@ class BaseMeta(ABCMeta):
         hidden_name = BaseMeta.hidden_attr(attr_name)
 
         def getter(self):
-            # if it was not assigned yet we raise the correct error message
-            if not hasattr(self, hidden_name):
+            try:
+                return self.__dict__[hidden_name]
+            except KeyError:
+                # if it was not assigned yet we raise the correct error
+                # message
                 raise AttributeError("'%s' object has no attribute '%s'" %
-                                     (class_name, attr_name))
-            # Get the attribute
-            return object.__getattribute__(self, hidden_name)
+                                     (class_name, attr_name)) from None
 
         def create_base_setter():
             if cpp_setter is None:
@@ -166,10 +144,9 @@ class BaseMeta(ABCMeta):
             # If it is not writable we wrap the base setter with something
             # that detect if attribute setting was called in __init__
             def setter(self, val):
-                set_in_init = Base.detect_if_called_in_init(self)
-                # If and only if this was launched from our instance's __init__
-                # we allow user to set the attribute
-                if set_in_init:
+                # If and only if our instance's __init__ is running we allow
+                # user to set the attribute
+                if BaseMeta.is_in_init(self):
                     base_setter(self, val)
                 else:
                     raise AttributeError("%s is readonly in %s" %
@@ -187,7 +164,7 @@ class BaseMeta(ABCMeta):
         # All attributes are actually properties when the base
         # class is Base.
         # The docstring of all properties are then putted back
-        # in the __init__ of the Base class below.
+        # when the class is first instantiated, see set_property_docs.
         prop = property(getter, setter, deletter, None)
         return prop
 
@@ -200,8 +177,9 @@ class BaseMeta(ABCMeta):
         class_name : `str`
             Name of the class the property comes from
 
-        attr_doc : `list`
-            List output by numpydoc contained parsed documentation
+        attr_doc : `tuple`
+            Name, type and description lines of the attribute, as output by
+            parse_doc_params
 
         Returns
         -------
@@ -236,6 +214,74 @@ class BaseMeta(ABCMeta):
         return [attr_name for attr_name, value in attrs.items() if
                 isinstance(value, property)]
 
+    @staticmethod
+    def read_doc_sections(doc):
+        """Split a numpydoc formatted docstring into its sections
+
+        This follows the rules of numpydoc, which is not imported here as
+        parsing all class docstrings with it would slow down tick imports
+
+        Parameters
+        ----------
+        doc : `str`
+            The cleaned docstring
+
+        Returns
+        -------
+        output : `list`
+            List of (name, lines) of each section, the summary of the
+            docstring is not included
+        """
+        lines = doc.split('\n')
+
+        def is_section_title(i):
+            title = lines[i].strip()
+            if len(title) == 0 or (i > 0 and len(lines[i - 1].strip()) > 0):
+                return False
+            underline = lines[i + 1].strip() if i + 1 < len(lines) else ''
+            return underline.startswith('-' * len(title)) or \
+                underline.startswith('=' * len(title))
+
+        starts = [i for i in range(len(lines)) if is_section_title(i)]
+        sections = []
+        for start, end in zip(starts, starts[1:] + [len(lines)]):
+            name = ' '.join(word.capitalize()
+                            for word in lines[start].strip().split(' '))
+            content = textwrap.dedent('\n'.join(lines[start + 2:end]))
+            sections.append((name, content.strip('\n').split('\n')))
+        return sections
+
+    @staticmethod
+    def parse_doc_params(lines):
+        """Parse the lines of a Parameters or Attributes docstring section
+
+        Parameters
+        ----------
+        lines : `list`
+            Lines of the section
+
+        Returns
+        -------
+        output : `list`
+            List of (name, type, description lines) of each entry
+        """
+        params = []
+        for line in lines:
+            if len(line.strip()) > 0 and not line[0].isspace():
+                header = line.strip()
+                if ' : ' in header:
+                    name, attr_type = header.split(' : ', 1)
+                    attr_type = ' '.join(attr_type.split())
+                else:
+                    name, attr_type = header, ''
+                params.append((name, attr_type, []))
+            elif len(params) > 0:
+                params[-1][2].append(line)
+
+        return [(name, attr_type,
+                 textwrap.dedent('\n'.join(desc)).strip('\n').split('\n'))
+                for name, attr_type, desc in params]
+
     @staticmethod
     def find_documented_attributes(class_name, attrs):
         """Parse the documentation to retrieve all attributes that have been
@@ -246,8 +292,10 @@ class BaseMeta(ABCMeta):
             return []
 
         current_class_doc = inspect.cleandoc(attrs['__doc__'])
-        parsed_doc = nd.docscrape.ClassDoc(None, doc=current_class_doc)
-        attr_docs = parsed_doc['Parameters'] + parsed_doc['Attributes']
+        sections = dict(BaseMeta.read_doc_sections(current_class_doc))
+        attr_docs = \
+            BaseMeta.parse_doc_params(sections.get('Parameters', [])) + \
+            BaseMeta.parse_doc_params(sections.get('Attributes', []))
 
         attr_and_doc = []
 
@@ -475,30 +523,41 @@ class BaseMeta(ABCMeta):
     def __init__(cls, class_name, bases, attrs):
         return ABCMeta.__init__(cls, class_name, bases, attrs)
 
+    def __call__(cls, *args, **kwargs):
+        # Property docs are set once per class
+        if not cls.__dict__.get('_property_docs_set', False):
+            BaseMeta.set_property_docs(cls)
 
-class Base(metaclass=BaseMeta):
-    """The BaseClass of the tick project. This relies on some dark
-    magic based on a metaclass. The aim is to have read-only attributes,
-    docstring for all parameters, and some other nasty features
-
-    Attributes
-    ----------
-    name : str (read-only)
-        Name of the class
-    """
-
-    _attrinfos = {
-        "name": {"writable": False},
-    }
+        # As type.__call__, arguments are given to __new__ only if it is
+        # overridden and __init__ is not run on instances of another class
+        if cls.__new__ is object.__new__:
+            obj = cls.__new__(cls)
+        else:
+            obj = cls.__new__(cls, *args, **kwargs)
+        if not isinstance(obj, cls):
+            return obj
+
+        # Read-only attributes can be set as long as this flag is set
+        obj.__dict__[BaseMeta.in_init_flag] = True
+        try:
+            obj.__init__(*args, **kwargs)
+        finally:
+            del obj.__dict__[BaseMeta.in_init_flag]
+        return obj
 
-    def __init__(self, *args, **kwargs):
-        # We add the name of the class
-        self._set("name", self.__class__.__name__)
+    @staticmethod
+    def set_property_docs(cls):
+        """Give to the properties of the class the documentation found in
+        the docstrings
 
-        for attr_name, prop in self.__class__.__dict__.items():
+        This is not done at class creation to avoid conflicts between the
+        docstring of a class and the ones of its properties (see
+        build_property)
+        """
+        for attr_name, prop in list(cls.__dict__.items()):
             if isinstance(prop, property):
-                if attr_name in self._attrinfos and len(
-                        self._attrinfos[attr_name].get('doc', [])) > 0:
+                if attr_name in cls._attrinfos and len(
+                        cls._attrinfos[attr_name].get('doc', [])) > 0:
                     # we create the property documentation based o what we
                     # have found in the docstring.
                     # First we will have the type of the property, then the
@@ -507,15 +566,36 @@ class Base(metaclass=BaseMeta):
                     # Note: We join doc with '-' instead of '\n'
                     # because multiline doc does not print well in iPython
 
-                    prop_doc = self._attrinfos[attr_name]['doc']
+                    prop_doc = cls._attrinfos[attr_name]['doc']
                     prop_doc = ' - '.join([str(d).strip()
                                            for d in prop_doc
                                            if len(str(d).strip()) > 0])
 
                     # We copy property and add the doc found in docstring
-                    setattr(self.__class__, attr_name,
+                    setattr(cls, attr_name,
                             property(prop.fget, prop.fset, prop.fdel,
                                      prop_doc))
+        type.__setattr__(cls, '_property_docs_set', True)
+
+
+class Base(metaclass=BaseMeta):
+    """The BaseClass of the tick project. This relies on some dark
+    magic based on a metaclass. The aim is to have read-only attributes,
+    docstring for all parameters, and some other nasty features
+
+    Attributes
+    ----------
+    name : str (read-only)
+        Name of the class
+    """
+
+    _attrinfos = {
+        "name": {"writable": False},
+    }
+
+    def __init__(self, *args, **kwargs):
+        # We add the name of the class
+        self._set("name", self.__class__.__name__)
 
     @staticmethod
     def _get_now():
@@ -0,0 +1,204 @@
+import os
+
+import numpy as np
+
+_timestamps_file = 'timestamps.npy'
+_offsets_file = 'offsets.npy'
+_end_times_file = 'end_times.npy'
+
+
+class EventStore(object):
+    """Memory-mapped, columnar store of several realizations of a
+    multi-dimensional point process
+
+    All timestamps are kept in a single contiguous array on disk, along with
+    an offsets table: the timestamps of node j of realization r are
+    ``values[offsets[r * n_nodes + j]:offsets[r * n_nodes + j + 1]]``
+    (the layout of `SimuHawkesMulti.flat_timestamps`). A store is a directory
+    containing these arrays and the end times of the realizations as ``.npy``
+    files, it is written with `EventStore.write` or `EventStore.write_flat`.
+
+    Realizations are memory-mapped views of this array, hence nothing is
+    loaded until it is read. They can be given to Hawkes models and learners
+    (either the store itself or `timestamps`) which use them without copy.
+
+    Parameters
+    ----------
+    path : `str`
+        Directory of the store
+
+    mmap_mode : {'r', 'r+', 'c'}, default='r'
+        Mode used to memory-map the timestamps, see `numpy.memmap`
+
+    Attributes
+    ----------
+    values : `np.ndarray`, shape=(n_total_jumps, )
+        Timestamps of all nodes of all realizations, memory-mapped
+
+    offsets : `np.ndarray`, shape=(n_realizations * n_nodes + 1, )
+        Offsets of the timestamps of each node of each realization in
+        `values`
+
+    end_times : `np.ndarray`, shape=(n_realizations, )
+        End time of each realization
+
+    n_nodes : `int`
+        Number of nodes of the point process
+    """
+
+    def __init__(self, path, mmap_mode='r'):
+        self.path = path
+        # C++ models only accept exact numpy arrays, not np.memmap instances,
+        # hence values is a plain view on the memory map
+        self.values = np.load(os.path.join(path, _timestamps_file),
+                              mmap_mode=mmap_mode).view(np.ndarray)
+        self.offsets = np.load(os.path.join(path, _offsets_file))
+        self.end_times = np.load(os.path.join(path, _end_times_file))
+
+        n_realizations = len(self.end_times)
+        if n_realizations == 0 or (len(self.offsets) - 1) % n_realizations:
+            raise ValueError("Corrupted event store in %s, %d offsets for %d "
+                             "realizations" % (path, len(self.offsets),
+                                               n_realizations))
+        self.n_nodes = (len(self.offsets) - 1) // n_realizations
+
+    @property
+    def n_realizations(self):
+        return len(self.end_times)
+
+    @property
+    def n_total_jumps(self):
+        return len(self.values)
+
+    def __len__(self):
+        return self.n_realizations
+
+    def __getitem__(self, r):
+        """Timestamps of realization r, as a list of views on `values`
+        """
+        if not -self.n_realizations <= r < self.n_realizations:
+            raise IndexError("Realization %d out of range, store has %d "
+                             "realizations" % (r, self.n_realizations))
+        r %= self.n_realizations
+        offsets = self.offsets[r * self.n_nodes:(r + 1) * self.n_nodes + 1]
+        return [self.values[int(offsets[j]):int(offsets[j + 1])]
+                for j in range(self.n_nodes)]
+
+    def __iter__(self):
+        for r in range(self.n_realizations):
+            yield self[r]
+
+    @property
+    def timestamps(self):
+        """Timestamps of all realizations, as lists of views on `values`
+        """
+        return list(self)
+
+    @staticmethod
+    def write(path, events, end_times=None):
+        """Write realizations to a new store
+
+        Parameters
+        ----------
+        path : `str`
+            Directory of the store, created if it does not exist
+
+        events : `list` of `list` of `np.ndarray`
+            List of realizations, `events[r][j]` contains the timestamps of
+            node j of realization r, given as an array or a list. If only one
+            realization is given, it will be wrapped into a list
+
+        end_times : `np.ndarray` or `float`, default=None
+            End time of each realization. If None, it will be set to each
+            realization's latest time, or 0 if it has no event
+
+        Returns
+        -------
+        output : `EventStore`
+            The written store
+        """
+        # A single realization is a list of nodes, whose first node is empty
+        # or contains timestamps
+        first = events[0]
+        if len(first) == 0 or np.ndim(first[0]) == 0:
+            events = [events]
+        events = [[np.asarray(timestamps, dtype=float)
+                   for timestamps in realization] for realization in events]
+
+        n_nodes = len(events[0])
+        for r, realization in enumerate(events):
+            if len(realization) != n_nodes:
+                raise ValueError("Realization %d should have %d nodes but has "
+                                 "%d" % (r, n_nodes, len(realization)))
+
+        if end_times is None:
+            end_times = [max((timestamps.max() for timestamps in realization
+                              if len(timestamps) > 0), default=0.)
+                         for realization in events]
+
+        sizes = [len(timestamps) for realization in events
+                 for timestamps in realization]
+        offsets = np.zeros(len(sizes) + 1, dtype=np.uint64)
+        np.cumsum(sizes, out=offsets[1:])
+
+        os.makedirs(path, exist_ok=True)
+        values = np.lib.format.open_memmap(
+            os.path.join(path, _timestamps_file), mode='w+', dtype=float,
+            shape=(int(offsets[-1]),))
+        node = 0
+        for realization in events:
+            for timestamps in realization:
+                values[int(offsets[node]):int(offsets[node + 1])] = timestamps
+                node += 1
+        values.flush()
+        del values
+
+        return EventStore._write_tables(path, offsets, end_times)
+
+    @staticmethod
+    def write_flat(path, offsets, values, end_times):
+        """Write realizations given in the columnar layout to a new store
+
+        Parameters
+        ----------
+        path : `str`
+            Directory of the store, created if it does not exist
+
+        offsets : `np.ndarray`, shape=(n_realizations * n_nodes + 1, )
+            Offsets of the timestamps of each node of each realization in
+            `values`
+
+        values : `np.ndarray`, shape=(n_total_jumps, )
+            Timestamps of all nodes of all realizations
+
+        end_times : `np.ndarray`, shape=(n_realizations, )
+            End time of each realization
+
+        Returns
+        -------
+        output : `EventStore`
+            The written store
+        """
+        offsets = np.asarray(offsets, dtype=np.uint64)
+        if len(offsets) == 0 or offsets[0] != 0 or \
+                offsets[-1] != len(values) or \
+                np.any(offsets[1:] < offsets[:-1]):
+            raise ValueError("offsets must be non decreasing, from 0 to the "
+                             "number of values")
+
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, _timestamps_file),
+                np.asarray(values, dtype=float))
+
+        return EventStore._write_tables(path, offsets, end_times)
+
+    @staticmethod
+    def _write_tables(path, offsets, end_times):
+        end_times = np.array(end_times, dtype=float).ravel()
+        if len(end_times) == 0 or (len(offsets) - 1) % len(end_times):
+            raise ValueError("%d end times were given for %d nodes "
+                             "timestamps" % (len(end_times), len(offsets) - 1))
+
+        np.save(os.path.join(path, _offsets_file), offsets)
+        np.save(os.path.join(path, _end_times_file), end_times)
+        return EventStore(path)
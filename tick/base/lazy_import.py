@@ -0,0 +1,53 @@
+import importlib
+import sys
+
+
+def lazy_attributes(package_name, modules):
+    """Make the public objects of a package be imported from its submodules
+    only when they are first accessed
+
+    This relies on module level ``__getattr__`` (PEP 562). With Python older
+    than 3.7, all objects are imported right away.
+
+    Parameters
+    ----------
+    package_name : `str`
+        Name of the package, `__name__` in its `__init__`
+
+    modules : `dict`
+        For each submodule (relative to the package) the `list` of names of
+        the objects the package imports from it. An object must not have the
+        name of a submodule, as importing the submodule would override it
+
+    Returns
+    -------
+    __getattr__ : `function`
+        To be set as ``__getattr__`` of the package
+
+    __dir__ : `function`
+        To be set as ``__dir__`` of the package
+    """
+    package = sys.modules[package_name]
+    names_module = {name: module for module, names in modules.items()
+                    for name in names}
+
+    def __getattr__(name):
+        if name not in names_module:
+            raise AttributeError("module '%s' has no attribute '%s'"
+                                 % (package_name, name))
+        module_name = names_module[name]
+        module = importlib.import_module(module_name, package_name)
+        # Next accesses to the objects of this submodule will not go
+        # through __getattr__
+        for module_attr in modules[module_name]:
+            setattr(package, module_attr, getattr(module, module_attr))
+        return getattr(module, name)
+
+    def __dir__():
+        return sorted(set(vars(package)) | set(names_module))
+
+    if sys.version_info < (3, 7):
+        for name in names_module:
+            __getattr__(name)
+
+    return __getattr__, __dir__
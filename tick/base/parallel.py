@@ -0,0 +1,39 @@
+from tick.base.build.base import set_thread_pool_size as \
+    _set_thread_pool_size, get_thread_pool_size as _get_thread_pool_size
+
+
+def set_thread_pool_size(n_workers):
+    """Set the number of worker threads of the pool used by all
+    multi-threaded C++ computations (such as `grad` and `loss` of linear
+    models)
+
+    Workers are created once and reused by all subsequent computations. The
+    thread that launches a computation also takes part in it, hence up to
+    ``n_workers + 1`` threads work simultaneously.
+
+    Parameters
+    ----------
+    n_workers : `int`
+        Number of worker threads. If ``0``, the pool is disabled and threads
+        are created and joined at each parallel computation
+
+    Notes
+    -----
+    This must not be called while a multi-threaded computation is running
+    """
+    if n_workers < 0:
+        raise ValueError("n_workers must be non-negative, received %s"
+                         % n_workers)
+    _set_thread_pool_size(int(n_workers))
+
+
+def get_thread_pool_size():
+    """Get the number of worker threads of the pool used by all
+    multi-threaded C++ computations
+
+    Returns
+    -------
+    output : `int`
+        Number of worker threads, ``0`` means that the pool is disabled
+    """
+    return _get_thread_pool_size()
@@ -0,0 +1,37 @@
+_pickle_formats = ['binary', 'json']
+
+_pickle_format = 'binary'
+
+
+def set_pickle_format(pickle_format):
+    """Set the format used to pickle C++ objects (such as simulations,
+    kernels or models)
+
+    Parameters
+    ----------
+    pickle_format : {'binary', 'json'}
+        * ``'binary'`` : default, objects are pickled with cereal binary
+          archives. This is fast and compact but depends on the platform
+          endianness
+        * ``'json'`` : objects are pickled as human readable JSON strings
+
+    Notes
+    -----
+    Unpickling accepts both formats whatever the selected one
+    """
+    global _pickle_format
+    if pickle_format not in _pickle_formats:
+        raise ValueError("Unknown pickle format '%s', must be one of %s"
+                         % (pickle_format, _pickle_formats))
+    _pickle_format = pickle_format
+
+
+def get_pickle_format():
+    """Get the format used to pickle C++ objects
+
+    Returns
+    -------
+    output : `str`
+        Either ``'binary'`` or ``'json'``
+    """
+    return _pickle_format
@@ -0,0 +1,70 @@
+#ifndef TICK_BASE_SRC_MATH_SUM_TREE_H_
+#define TICK_BASE_SRC_MATH_SUM_TREE_H_
+
+#include <vector>
+
+#include "defs.h"
+
+/*! \class SumTree
+ * \brief Complete binary tree holding non-negative weights in its leaves and
+ * partial sums in its inner nodes
+ *
+ * Setting a weight and sampling an index proportionally to the weights both
+ * cost O(log n) where n is the number of weights. Inner nodes are recomputed
+ * from their children at each update, hence rounding errors do not accumulate
+ * over updates.
+ */
+class SumTree {
+    ulong n_leaves;
+    // Index of the first leaf, a power of two
+    ulong first_leaf;
+    std::vector<double> nodes;
+
+ public:
+    explicit SumTree(ulong n_leaves = 0)
+        : n_leaves(n_leaves), first_leaf(1) {
+        while (first_leaf < n_leaves) first_leaf *= 2;
+        nodes.assign(2 * first_leaf, 0.);
+    }
+
+    ulong size() const { return n_leaves; }
+
+    //! @brief Weight of the ith leaf
+    double get(ulong i) const { return nodes[first_leaf + i]; }
+
+    //! @brief Sum of all weights
+    double total() const { return nodes[1]; }
+
+    //! @brief Sets the weight of the ith leaf and updates partial sums above it
+    void set(ulong i, double weight) {
+        ulong node = first_leaf + i;
+        nodes[node] = weight;
+        for (node /= 2; node >= 1; node /= 2) {
+            nodes[node] = nodes[2 * node] + nodes[2 * node + 1];
+        }
+    }
+
+    /**
+     * @brief Finds the leaf i such that the sum of the weights of the leaves
+     * before i is lower or equal to x and the same sum including leaf i is
+     * greater than x
+     * \param x : a value in [0, total())
+     * \note If x is greater than total() because of rounding errors, the last
+     * leaf with a positive weight is returned
+     */
+    ulong find(double x) const {
+        ulong node = 1;
+        while (node < first_leaf) {
+            const ulong left = 2 * node;
+            if (x < nodes[left] || nodes[left + 1] <= 0) {
+                node = left;
+            } else {
+                x -= nodes[left];
+                node = left + 1;
+            }
+        }
+        return node - first_leaf;
+    }
+};
+
+#endif  // TICK_BASE_SRC_MATH_SUM_TREE_H_
@@ -11,6 +11,7 @@
 
 #include "interruption.h"
 #include "parallel_utils.h"
+#include "thread_pool.h"
 
 /*
  * This file implements templates for parallel computing of a method f(i,...) for a range of i.
@@ -24,6 +25,9 @@
  *         b- f(...) returns a type not taken care by the SArray<V>Ptr
  *            The collected returned values are stored in an std::vector<V>
  *                  std::vector<V> parallel_map(...)
+ *
+ * All the templates split the range of i in n_threads contiguous chunks that are dispatched to the
+ * process-wide tick::ThreadPool (see thread_pool.h), no thread is created at each call.
  */
 
 namespace tick {
@@ -58,12 +62,12 @@ inline std::tuple<ulong, ulong> get_thread_indices(unsigned int thread_num, unsi
 
 template<typename R, typename T, typename S, typename... Args>
 void _parallel_map_execute_task_and_store_result(R &map_result,
-                                                 unsigned int thread_num,
+                                                 ulong thread_num,
                                                  unsigned int num_threads,
                                                  ulong dim,
                                                  T &f,
                                                  S &obj,
-                                                 std::exception_ptr &ex,
+                                                 std::vector<std::exception_ptr> &exceptions,
                                                  Args &&... args) {
     ulong min_index{}, max_index{};
 
@@ -77,7 +81,7 @@ void _parallel_map_execute_task_and_store_result(R &map_result,
         // If an interruption was thrown we just return.
         // The Interruption flag is set and will be dealt during the join
     catch (...) {
-        ex = std::current_exception();
+        exceptions[thread_num] = std::current_exception();
     }
 }
 
@@ -104,25 +108,19 @@ void _parallel_map(R &map_result,
 
         Interruption::throw_if_raised();
     } else {
-        std::vector<std::thread> threads;
         std::vector<std::exception_ptr> exceptions{n_threads};
 
-        for (unsigned int n = 0; n < std::min(static_cast<ulong>(n_threads), dim); n++) {
-            threads.push_back(std::thread(
-                _parallel_map_execute_task_and_store_result<R, T, S, Args...>,
-                std::ref(map_result),
-                n,
-                n_threads,
-                dim,
-                std::ref(f),
-                std::ref(obj),
-                std::ref(exceptions[n]),
-                std::ref(args)...));
-        }
-
-        for (auto &thread : threads) {
-            thread.join();
-        }
+        tick::ThreadPool::instance().run(
+            std::min(static_cast<ulong>(n_threads), dim),
+            std::bind(_parallel_map_execute_task_and_store_result<R, T, S, Args...>,
+                      std::ref(map_result),
+                      std::placeholders::_1,
+                      n_threads,
+                      dim,
+                      std::ref(f),
+                      std::ref(obj),
+                      std::ref(exceptions),
+                      std::ref(args)...));
 
         tick::rethrow_exceptions(exceptions);
 
@@ -270,12 +268,12 @@ auto parallel_map(unsigned int n_threads,
 
 template<typename T, typename S, typename... Args>
 void _parallel_run_execute_task(
-    unsigned int thread_num,
+    ulong thread_num,
     unsigned int num_threads,
     ulong dim,
     T &f,
     S &obj,
-    std::exception_ptr &ex,
+    std::vector<std::exception_ptr> &exceptions,
     Args &&... args) {
     ulong min_index{}, max_index{};
 
@@ -289,7 +287,7 @@ void _parallel_run_execute_task(
         // If an interruption was thrown we just return.
         // The Interruption flag is set and will be dealt during the join
     catch (...) {
-        ex = std::current_exception();
+        exceptions[thread_num] = std::current_exception();
     }
 }
 
@@ -309,24 +307,18 @@ void parallel_run(unsigned int n_threads,
 
         Interruption::throw_if_raised();
     } else {
-        std::vector<std::thread> threads;
         std::vector<std::exception_ptr> exceptions{n_threads};
 
-        for (unsigned int n = 0; n < std::min(static_cast<ulong>(n_threads), dim); n++) {
-            threads.push_back(std::thread(
-                _parallel_run_execute_task<T, S, Args...>,
-                n,
-                n_threads,
-                dim,
-                std::ref(f),
-                std::ref(obj),
-                std::ref(exceptions[n]),
-                std::ref(args)...));
-        }
-
-        for (auto &thread : threads) {
-            thread.join();
-        }
+        tick::ThreadPool::instance().run(
+            std::min(static_cast<ulong>(n_threads), dim),
+            std::bind(_parallel_run_execute_task<T, S, Args...>,
+                      std::placeholders::_1,
+                      n_threads,
+                      dim,
+                      std::ref(f),
+                      std::ref(obj),
+                      std::ref(exceptions),
+                      std::ref(args)...));
 
         tick::rethrow_exceptions(exceptions);
 
@@ -343,19 +335,22 @@ void parallel_run(unsigned int n_threads,
 // reduce function must take as first argument the previous result, as second argument, the result
 // of thread i and return the result of the merged result
 template<typename T, typename S, typename BinaryOp, typename... Args>
-void _parallel_map_execute_task_and_reduce_result(unsigned int thread_num,
-                                                  unsigned int num_threads,
-                                                  ulong dim,
-                                                  BinaryOp reduce_function,
-                                                  T &f,
-                                                  S &obj,
-                                                  std::exception_ptr &ex,
-                                                  typename tick::FuncResultType<T, S, Args...> &result_ref,
-                                                  Args &&... args) {
+void _parallel_map_execute_task_and_reduce_result(
+    ulong thread_num,
+    unsigned int num_threads,
+    ulong dim,
+    BinaryOp reduce_function,
+    T &f,
+    S &obj,
+    std::vector<std::exception_ptr> &exceptions,
+    std::vector<typename tick::FuncResultType<T, S, Args...>> &local_results,
+    Args &&... args) {
     ulong min_index{}, max_index{};
 
     std::tie(min_index, max_index) = tick::get_thread_indices(thread_num, num_threads, dim);
 
+    auto &result_ref = local_results[thread_num];
+
     try {
         for (ulong i = min_index; i < max_index; ++i) {
             result_ref = reduce_function(result_ref, (obj->*f)(i, args...));
@@ -364,7 +359,7 @@ void _parallel_map_execute_task_and_reduce_result(unsigned int thread_num,
         // If an interruption was thrown we just return.
         // The Interruption flag is set and will be dealt during the join
     catch (...) {
-        ex = std::current_exception();
+        exceptions[thread_num] = std::current_exception();
     }
 }
 /// @endcond
@@ -417,26 +412,20 @@ auto parallel_map_reduce(unsigned int n_threads,
 
         Interruption::throw_if_raised();
     } else {
-        std::vector<std::thread> threads;
         std::vector<std::exception_ptr> exceptions{n_threads};
 
-        for (unsigned int n = 0; n < std::min(static_cast<ulong>(n_threads), dim); n++) {
-            threads.push_back(std::thread(
-                _parallel_map_execute_task_and_reduce_result<T, S, BinaryOp, Args...>,
-                n,
-                n_threads,
-                dim,
-                reduce_function,
-                std::ref(f),
-                std::ref(obj),
-                std::ref(exceptions[n]),
-                std::ref(local_results[n]),
-                std::ref(args)...));
-        }
-
-        for (auto &thread : threads) {
-            thread.join();
-        }
+        tick::ThreadPool::instance().run(
+            std::min(static_cast<ulong>(n_threads), dim),
+            std::bind(_parallel_map_execute_task_and_reduce_result<T, S, BinaryOp, Args...>,
+                      std::placeholders::_1,
+                      n_threads,
+                      dim,
+                      reduce_function,
+                      std::ref(f),
+                      std::ref(obj),
+                      std::ref(exceptions),
+                      std::ref(local_results),
+                      std::ref(args)...));
 
         tick::rethrow_exceptions(exceptions);
 
@@ -460,12 +449,12 @@ auto parallel_map_reduce(unsigned int n_threads,
 
 
 template<typename R, typename Functor, typename... Args>
-void _parallel_map_array_execute_task_and_reduce_result(unsigned int thread_num,
+void _parallel_map_array_execute_task_and_reduce_result(ulong thread_num,
                                                         unsigned int num_threads,
                                                         ulong dim,
-                                                        Functor f,
-                                                        R &local_result,
-                                                        std::exception_ptr &ex,
+                                                        Functor &f,
+                                                        std::vector<R> &local_results,
+                                                        std::vector<std::exception_ptr> &exceptions,
                                                         Args &... args) {
     ulong min_index{}, max_index{};
 
@@ -473,13 +462,13 @@ void _parallel_map_array_execute_task_and_reduce_result(unsigned int thread_num,
 
     try {
         for (ulong i = min_index; i < max_index; ++i) {
-            f(i, local_result, args...);
+            f(i, local_results[thread_num], args...);
         }
     } catch (...) {
         // If an interruption was thrown we just return.
         // The Interruption flag is set and will be dealt during the join
 
-        ex = std::current_exception();
+        exceptions[thread_num] = std::current_exception();
     }
 }
 
@@ -506,26 +495,35 @@ void parallel_map_array(unsigned int n_threads,
                         Functor f,
                         R &out,
                         Args &... args) {
-    std::vector<R> local_results(n_threads, out);
+    // if n_threads <= 1, we run the computation with no thread
+    if (n_threads <= 1) {
+        R local_result = out;
+        for (ulong i = 0; i < dim; ++i)
+            f(i, local_result, args...);
 
-    std::vector<std::thread> threads;
-    std::vector<std::exception_ptr> exceptions{n_threads};
+        Interruption::throw_if_raised();
 
-    for (unsigned int n = 0; n < std::min(static_cast<ulong>(n_threads), dim); n++) {
-        threads.push_back(std::thread(
-            _parallel_map_array_execute_task_and_reduce_result<R, Functor, Args...>,
-            n,
-            n_threads,
-            dim,
-            std::ref(f),
-            std::ref(local_results[n]),
-            std::ref(exceptions[n]),
-            std::ref(args)...));
+        redux(out, local_result);
+        return;
     }
 
-    for (auto &thread : threads) {
-        thread.join();
-    }
+    std::vector<R> local_results(n_threads, out);
+    std::vector<std::exception_ptr> exceptions{n_threads};
+
+    tick::ThreadPool::instance().run(
+        std::min(static_cast<ulong>(n_threads), dim),
+        std::bind(_parallel_map_array_execute_task_and_reduce_result<R, Functor, Args...>,
+                  std::placeholders::_1,
+                  n_threads,
+                  dim,
+                  std::ref(f),
+                  std::ref(local_results),
+                  std::ref(exceptions),
+                  std::ref(args)...));
+
+    tick::rethrow_exceptions(exceptions);
+
+    Interruption::throw_if_raised();
 
     for (auto &local_result : local_results) {
         redux(out, local_result);
@@ -0,0 +1,167 @@
+#include "parallel/thread_pool.h"
+
+#include <algorithm>
+
+namespace tick {
+
+void ThreadPool::Batch::work() {
+    ulong chunk;
+    while ((chunk = next_chunk.fetch_add(1)) < n_chunks) {
+        std::exception_ptr chunk_exception;
+        try {
+            task(chunk);
+        } catch (...) {
+            chunk_exception = std::current_exception();
+        }
+
+        std::lock_guard<std::mutex> lock(mutex);
+        if (chunk_exception != nullptr && exception == nullptr) {
+            exception = chunk_exception;
+        }
+        if (++n_done == n_chunks) {
+            finished.notify_all();
+        }
+    }
+}
+
+void ThreadPool::Batch::wait() {
+    std::unique_lock<std::mutex> lock(mutex);
+    finished.wait(lock, [this] { return n_done == n_chunks; });
+}
+
+ThreadPool::ThreadPool()
+    : n_workers(std::max(std::thread::hardware_concurrency(), 2u) - 1),
+      stopping(false) {}
+
+ThreadPool::~ThreadPool() {
+    stop_workers();
+}
+
+ThreadPool &ThreadPool::instance() {
+    static ThreadPool pool;
+    return pool;
+}
+
+unsigned int ThreadPool::get_n_workers() const {
+    return n_workers;
+}
+
+void ThreadPool::set_n_workers(unsigned int n_workers) {
+    // Running workers are stopped, new ones will be started on next call to run
+    stop_workers();
+    this->n_workers = n_workers;
+}
+
+void ThreadPool::start_workers() {
+    // Must be called with mutex locked
+    for (unsigned int n = workers.size(); n < n_workers; ++n) {
+        workers.emplace_back(&ThreadPool::worker_loop, this);
+    }
+}
+
+void ThreadPool::stop_workers() {
+    std::vector<std::thread> to_join;
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        stopping = true;
+        std::swap(to_join, workers);
+    }
+    has_work.notify_all();
+
+    for (auto &worker : to_join) {
+        worker.join();
+    }
+
+    std::lock_guard<std::mutex> lock(mutex);
+    stopping = false;
+}
+
+void ThreadPool::worker_loop() {
+    while (true) {
+        std::shared_ptr<Batch> batch;
+        {
+            std::unique_lock<std::mutex> lock(mutex);
+            has_work.wait(lock, [this] { return stopping || !queue.empty(); });
+            if (stopping) return;
+
+            batch = queue.front();
+            if (!batch->has_pending_chunks()) {
+                // Every chunk of this batch has been picked, the threads working on it will
+                // finish it
+                queue.pop_front();
+                continue;
+            }
+        }
+        batch->work();
+    }
+}
+
+void ThreadPool::run_spawn_per_call(ulong n_chunks, const std::function<void(ulong)> &task) {
+    std::vector<std::thread> threads;
+    std::vector<std::exception_ptr> exceptions(n_chunks);
+
+    for (ulong n = 0; n < n_chunks; ++n) {
+        threads.emplace_back([&task, &exceptions, n]() {
+            try {
+                task(n);
+            } catch (...) {
+                exceptions[n] = std::current_exception();
+            }
+        });
+    }
+
+    for (auto &thread : threads) {
+        thread.join();
+    }
+
+    for (auto &eptr : exceptions) {
+        if (eptr != nullptr) std::rethrow_exception(eptr);
+    }
+}
+
+void ThreadPool::run(ulong n_chunks, const std::function<void(ulong)> &task) {
+    if (n_chunks == 0) return;
+
+    if (n_chunks == 1) {
+        task(0);
+        return;
+    }
+
+    if (n_workers == 0) {
+        run_spawn_per_call(n_chunks, task);
+        return;
+    }
+
+    auto batch = std::make_shared<Batch>(n_chunks, task);
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        start_workers();
+        queue.push_back(batch);
+    }
+    has_work.notify_all();
+
+    // The calling thread works on its own batch as well
+    batch->work();
+    batch->wait();
+
+    {
+        // The batch might still be in the queue if no worker saw it exhausted
+        std::lock_guard<std::mutex> lock(mutex);
+        auto it = std::find(queue.begin(), queue.end(), batch);
+        if (it != queue.end()) queue.erase(it);
+    }
+
+    if (batch->exception != nullptr) {
+        std::rethrow_exception(batch->exception);
+    }
+}
+
+void set_thread_pool_size(unsigned int n_workers) {
+    ThreadPool::instance().set_n_workers(n_workers);
+}
+
+unsigned int get_thread_pool_size() {
+    return ThreadPool::instance().get_n_workers();
+}
+
+}  // namespace tick
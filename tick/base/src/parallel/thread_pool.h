@@ -0,0 +1,127 @@
+#ifndef TICK_BASE_SRC_PARALLEL_THREAD_POOL_H_
+#define TICK_BASE_SRC_PARALLEL_THREAD_POOL_H_
+
+#include <atomic>
+#include <condition_variable>
+#include <deque>
+#include <exception>
+#include <functional>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+#include "defs.h"
+
+/*
+ * This file implements the process-wide pool of worker threads on which the templates of
+ * parallel.h dispatch their work.
+ *
+ * A parallel call is split in a batch of chunks (one chunk per requested thread). The chunks of a
+ * batch are scheduled dynamically: every worker, and the calling thread itself, atomically picks
+ * the next chunk that has not been started yet until none is left. As the calling thread always
+ * takes part in the computation, nested parallel calls (a parallel call made from a task already
+ * running on a worker) cannot deadlock.
+ *
+ * Workers are started lazily on the first parallel call and then live until the end of the process
+ * (or until the pool is resized), which removes the cost of creating and joining threads at each
+ * call of a model's grad or loss.
+ */
+
+namespace tick {
+
+class DLL_PUBLIC ThreadPool {
+ private:
+    /// @cond
+    struct Batch {
+        Batch(ulong n_chunks, const std::function<void(ulong)> &task)
+            : n_chunks(n_chunks), task(task), next_chunk(0), n_done(0) {}
+
+        const ulong n_chunks;
+        const std::function<void(ulong)> &task;
+
+        std::atomic<ulong> next_chunk;
+
+        // Guarded by mutex
+        ulong n_done;
+        std::exception_ptr exception;
+
+        std::mutex mutex;
+        std::condition_variable finished;
+
+        bool has_pending_chunks() const { return next_chunk < n_chunks; }
+
+        void work();
+
+        void wait();
+    };
+    /// @endcond
+
+    unsigned int n_workers;
+
+    std::vector<std::thread> workers;
+    std::deque<std::shared_ptr<Batch>> queue;
+
+    // Guards workers, queue and stopping
+    std::mutex mutex;
+    std::condition_variable has_work;
+    bool stopping;
+
+    ThreadPool();
+
+    void start_workers();
+
+    void stop_workers();
+
+    void worker_loop();
+
+    void run_spawn_per_call(ulong n_chunks, const std::function<void(ulong)> &task);
+
+ public:
+    ThreadPool(const ThreadPool &) = delete;
+    ThreadPool &operator=(const ThreadPool &) = delete;
+
+    ~ThreadPool();
+
+    /**
+     * @brief The process-wide pool used by ::parallel_run, ::parallel_map and their variants
+     */
+    static ThreadPool &instance();
+
+    /**
+     * @brief Number of worker threads of the pool. The thread that submits a batch also works on
+     * it, hence up to n_workers + 1 chunks are processed concurrently.
+     */
+    unsigned int get_n_workers() const;
+
+    /**
+     * @brief Set the number of worker threads of the pool.
+     *
+     * \param n_workers : the new number of workers. If 0, the pool is disabled and each parallel
+     * call spawns (and joins) its own threads, as tick used to do.
+     *
+     * \warning This must not be called while a parallel computation is running
+     */
+    void set_n_workers(unsigned int n_workers);
+
+    /**
+     * @brief Run task(n) for all n in [0, n_chunks) and block until all of them are done.
+     *
+     * If a task throws, the first exception caught is rethrown once all chunks are done.
+     */
+    void run(ulong n_chunks, const std::function<void(ulong)> &task);
+};
+
+/**
+ * @brief Set the number of worker threads of the process-wide pool (0 disables the pool)
+ */
+DLL_PUBLIC void set_thread_pool_size(unsigned int n_workers);
+
+/**
+ * @brief Get the number of worker threads of the process-wide pool
+ */
+DLL_PUBLIC unsigned int get_thread_pool_size();
+
+}  // namespace tick
+
+#endif  // TICK_BASE_SRC_PARALLEL_THREAD_POOL_H_
@@ -4,28 +4,67 @@
 #include <cereal/archives/binary.hpp>
 #include <cereal/archives/json.hpp>
 
+#include <sstream>
+#include <string>
+
 namespace tick {
 
-template <typename T>
-std::string object_to_string(T* ptr) {
+/**
+ * @brief Serialize an object in a string with the given cereal output archive
+ */
+template <typename OutputArchive, typename T>
+std::string object_to_archive_string(T* ptr) {
   std::ostringstream ss(std::ios::binary);
 
   {
-    cereal::JSONOutputArchive ar(ss);
+    OutputArchive ar(ss);
     ar(*ptr);
   }
 
   return ss.str();
 }
 
-template <typename T>
-void object_from_string(T* ptr, const std::string& data) {
+/**
+ * @brief Deserialize an object from a string produced by object_to_archive_string with the
+ * matching output archive
+ */
+template <typename InputArchive, typename T>
+void object_from_archive_string(T* ptr, const std::string& data) {
   std::istringstream ss(data, std::ios::binary);
 
-  cereal::JSONInputArchive ar(ss);
+  InputArchive ar(ss);
   ar(*ptr);
 }
 
+/**
+ * @brief Serialize an object in a human readable JSON string
+ */
+template <typename T>
+std::string object_to_string(T* ptr) {
+  return object_to_archive_string<cereal::JSONOutputArchive>(ptr);
+}
+
+template <typename T>
+void object_from_string(T* ptr, const std::string& data) {
+  object_from_archive_string<cereal::JSONInputArchive>(ptr, data);
+}
+
+/**
+ * @brief Serialize an object in a compact binary string. Arrays are written as raw memory, this
+ * is much faster and smaller than JSON for objects holding large arrays
+ *
+ * \warning Binary strings are not portable across platforms with different endianness
+ */
+template <typename T>
+std::string object_to_binary_string(T* ptr) {
+  return object_to_archive_string<cereal::BinaryOutputArchive>(ptr);
+}
+
+template <typename T>
+void object_from_binary_string(T* ptr, const std::string& data) {
+  object_from_archive_string<cereal::BinaryInputArchive>(ptr, data);
+}
+
 }  // namespace tick
 
 #endif  // TICK_BASE_SRC_SERIALIZATION_H_
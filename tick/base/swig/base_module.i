@@ -11,5 +11,6 @@
 
 %include normal_distribution.i
 %include time_func.i
+%include thread_pool.i
 %include base_test.i
 %include exceptions_test.i
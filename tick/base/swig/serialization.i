@@ -6,16 +6,41 @@
 
 %include serialization.h
 
+// Objects are pickled in cereal binary format (as Python bytes) unless JSON has
+// been requested with tick.base.serialization.set_pickle_format('json').
+// __setstate__ accepts both formats, JSON states being stored as str.
 %define TICK_MAKE_PICKLABLE(CLASS_NAME, CONSTRUCTOR_ARGS...)
 
   %template(##CLASS_NAME##Deserialize) tick::object_from_string<CLASS_NAME>;
   %template(##CLASS_NAME##Serialize) tick::object_to_string<CLASS_NAME>;
 
   %extend CLASS_NAME {
+    PyObject *_serialize_binary() {
+      const std::string data = tick::object_to_binary_string($self);
+      return PyBytes_FromStringAndSize(data.data(), data.size());
+    }
+
+    void _deserialize_binary(PyObject *state) {
+      char *data = nullptr;
+      Py_ssize_t size = 0;
+      if (PyBytes_AsStringAndSize(state, &data, &size) == -1) {
+        PyErr_Clear();
+        throw std::invalid_argument("Binary state must be given as bytes");
+      }
+      tick::object_from_binary_string($self, std::string(data, size));
+    }
+
     %pythoncode {
-            def __getstate__(self): return CLASS_NAME##Serialize(self)
+            def __getstate__(self):
+                from tick.base.serialization import get_pickle_format
+                if get_pickle_format() == 'json':
+                    return CLASS_NAME##Serialize(self)
+                return self._serialize_binary()
+
             def __setstate__(self, s):
                 self.__init__(CONSTRUCTOR_ARGS)
+                if isinstance(s, bytes):
+                    return self._deserialize_binary(s)
                 return CLASS_NAME##Deserialize(self, s)
     }
   }
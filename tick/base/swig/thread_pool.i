@@ -0,0 +1,10 @@
+%{
+#include "parallel/thread_pool.h"
+%}
+
+namespace tick {
+
+void set_thread_pool_size(unsigned int n_workers);
+unsigned int get_thread_pool_size();
+
+}
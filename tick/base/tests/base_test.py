@@ -1,7 +1,11 @@
 # -*- coding: utf8 -*-
+import importlib
+import inspect
 import unittest
+import warnings
 
 from tick.base import Base
+from tick.base.base import BaseMeta
 from tick.base.build.base import A0 as _A0
 
 
@@ -192,6 +196,51 @@ class Test(unittest.TestCase):
         # Test we can force setting a readonly attribute from class method
         self.a0.force_set_x0(32)
 
+    def test_readonly_set_in_init_only(self):
+        """...Test that read only attributes can be set from methods called
+        by __init__ only while it runs, even if it raises an error
+        """
+        created = []
+
+        class A5(A0):
+            def __init__(self, x0: int):
+                created.append(self)
+                A0.__init__(self, x0, 22)
+                raise ValueError("A5 cannot be created")
+
+        with self.assertRaisesRegex(ValueError, "A5 cannot be created"):
+            A5(2)
+        a5 = created[0]
+        self.assertEqual(a5.x0, 2)
+        self.assertRaises(AttributeError, a5.set_x0, 32)
+
+        # Another instance being initialized does not allow it either
+        class A6(A0):
+            def __init__(self, x0: int, other: A0):
+                A0.__init__(self, x0, 22)
+                other.set_x0(x0)
+
+        self.assertRaises(AttributeError, A6, 2, self.a0)
+
+    def test_overridden_new(self):
+        """...Test that an overridden __new__ receives the arguments of the
+        construction and that __init__ is not run when __new__ returns an
+        instance of another class
+        """
+        class A5(A0):
+            def __new__(cls, x0: int, arg0: int):
+                if x0 < 0:
+                    return None
+                obj = A0.__new__(cls)
+                obj.__dict__['new_args'] = (x0, arg0)
+                return obj
+
+        a5 = A5(2, 22)
+        self.assertEqual(a5.new_args, (2, 22))
+        self.assertEqual(a5.x0, 2)
+        self.assertEqual(a5.arg0, 22)
+        self.assertIsNone(A5(-2, 22))
+
     def test_inherited_readonly(self):
         """...Test that assign read only attribute defined in parent class
         raises an error
@@ -312,6 +361,23 @@ class Test(unittest.TestCase):
                           'is readonly',
                           'from A0'])
 
+    def test_property_doc(self):
+        """...Test that properties are given the documentation of the
+        closest class in which they are documented
+        """
+        self.assertEqual(A0.x0.__doc__,
+                         '`int` - This is doc of x0 from A0 - from A0')
+        self.assertEqual(A1.x0.__doc__,
+                         '`int` - This is doc of x0 from A1 that overrides '
+                         'A0 doc - from A1')
+        self.assertEqual(A1.y0.__doc__,
+                         '`float` - This is doc of y0 from A0 - from A0')
+
+        # Documentation is only set once per class
+        x0_property = A1.x0
+        A1(3)
+        self.assertIs(A1.x0, x0_property)
+
     def test_inherited_parameter_doc(self):
         """...Test that docstring is correctly inherited
 
@@ -459,6 +525,61 @@ class Test(unittest.TestCase):
         self.assertEqual(a02.y0, 12)
         self.assertEqual(a02.kwarg0, '13')
 
+    def test_doc_parsing_as_numpydoc(self):
+        """...Test that the Parameters and Attributes sections of the
+        docstrings of tick classes are parsed as numpydoc does
+        """
+        try:
+            from numpydoc.docscrape import ClassDoc
+        except ImportError:
+            self.skipTest('numpydoc is not installed')
+
+        # Objects of tick packages are imported when they are first accessed
+        for package_name in ['tick.optim.model', 'tick.optim.prox',
+                             'tick.optim.solver', 'tick.optim.history',
+                             'tick.simulation', 'tick.inference',
+                             'tick.preprocessing']:
+            package = importlib.import_module(package_name)
+            for name in package.__all__:
+                getattr(package, name)
+
+        def all_subclasses(cls):
+            for subclass in cls.__subclasses__():
+                yield subclass
+                yield from all_subclasses(subclass)
+
+        def non_empty_lines(lines):
+            return [line.strip() for line in lines if len(line.strip()) > 0]
+
+        n_classes = 0
+        for cls in set(all_subclasses(Base)):
+            doc = cls.__dict__.get('__doc__')
+            if doc is None:
+                continue
+            doc = inspect.cleandoc(doc)
+
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                numpydoc_doc = ClassDoc(None, doc=doc)
+            expected = [
+                (param.name, param.type, non_empty_lines(param.desc))
+                for section in ['Parameters', 'Attributes']
+                for param in numpydoc_doc[section]
+            ]
+
+            sections = dict(BaseMeta.read_doc_sections(doc))
+            parsed = [
+                (name, attr_type, non_empty_lines(desc))
+                for section in ['Parameters', 'Attributes']
+                for name, attr_type, desc in BaseMeta.parse_doc_params(
+                    sections.get(section, []))
+            ]
+
+            self.assertEqual(parsed, expected, cls.__name__)
+            n_classes += 1
+
+        self.assertGreater(n_classes, 50)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,108 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from tick.base import EventStore
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(2387)
+        self.n_nodes = 3
+        self.events = [[np.cumsum(np.random.rand(np.random.randint(0, 10)))
+                        for _ in range(self.n_nodes)] for _ in range(4)]
+        # Every realization has at least one event
+        for realization in self.events:
+            realization[0] = np.append(realization[0], 20.)
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_event_store_write(self):
+        """...Test that realizations written to an EventStore are read back
+        as views of a single memory-mapped array
+        """
+        store = EventStore.write(self.path, self.events)
+        store = EventStore(self.path)
+
+        self.assertEqual(store.n_realizations, len(self.events))
+        self.assertEqual(len(store), len(self.events))
+        self.assertEqual(store.n_nodes, self.n_nodes)
+        self.assertEqual(store.n_total_jumps,
+                         sum(map(len, sum(self.events, []))))
+        np.testing.assert_array_equal(store.end_times, [20.] * 4)
+
+        for realization, stored_realization in zip(self.events, store):
+            self.assertEqual(len(stored_realization), self.n_nodes)
+            for timestamps, stored_timestamps in zip(realization,
+                                                     stored_realization):
+                np.testing.assert_array_equal(stored_timestamps, timestamps)
+                self.assertIs(type(stored_timestamps), np.ndarray)
+                self.assertTrue(np.shares_memory(stored_timestamps,
+                                                 store.values))
+
+        np.testing.assert_array_equal(store[-1][1], self.events[-1][1])
+        self.assertEqual(len(store.timestamps), len(self.events))
+        with self.assertRaises(IndexError):
+            store[len(self.events)]
+
+    def test_event_store_write_lists(self):
+        """...Test that realizations given as lists and realizations without
+        events are written to an EventStore
+        """
+        events = [[list(timestamps) for timestamps in realization]
+                  for realization in self.events]
+        events[1] = [[] for _ in range(self.n_nodes)]
+        store = EventStore.write(self.path, events)
+
+        self.assertEqual(store.n_realizations, len(events))
+        self.assertEqual(store.n_nodes, self.n_nodes)
+        np.testing.assert_array_equal(store.end_times, [20., 0., 20., 20.])
+        for realization, stored_realization in zip(events, store):
+            for timestamps, stored_timestamps in zip(realization,
+                                                     stored_realization):
+                np.testing.assert_array_equal(stored_timestamps, timestamps)
+
+        # A single realization given as lists, with an empty first node
+        single_store = EventStore.write(os.path.join(self.path, 'single'),
+                                        [[], [1., 2.], [3.]])
+        self.assertEqual(single_store.n_realizations, 1)
+        self.assertEqual(single_store.n_nodes, 3)
+        np.testing.assert_array_equal(single_store[0][1], [1., 2.])
+        np.testing.assert_array_equal(single_store.end_times, [3.])
+
+        # A single realization without events
+        empty_store = EventStore.write(os.path.join(self.path, 'empty'),
+                                       [np.zeros(0), np.zeros(0)])
+        self.assertEqual(empty_store.n_realizations, 1)
+        self.assertEqual(empty_store.n_total_jumps, 0)
+        np.testing.assert_array_equal(empty_store.end_times, [0.])
+
+    def test_event_store_write_flat(self):
+        """...Test that an EventStore written from the columnar layout is the
+        same as the one written from the list of realizations
+        """
+        store = EventStore.write(os.path.join(self.path, 'list'),
+                                 self.events, end_times=np.arange(4.) + 30)
+        flat_store = EventStore.write_flat(os.path.join(self.path, 'flat'),
+                                           store.offsets, store.values,
+                                           store.end_times)
+
+        np.testing.assert_array_equal(flat_store.offsets, store.offsets)
+        np.testing.assert_array_equal(flat_store.values, store.values)
+        np.testing.assert_array_equal(flat_store.end_times,
+                                      np.arange(4.) + 30)
+
+        with self.assertRaisesRegex(ValueError, "offsets must be non"):
+            EventStore.write_flat(self.path, [0, 2, 1], np.zeros(1), [1.])
+        with self.assertRaisesRegex(ValueError, "2 end times were given"):
+            EventStore.write_flat(self.path, [0, 1, 2, 3], np.zeros(3),
+                                  [1., 2.])
+
+
+if __name__ == "__main__":
+    unittest.main()
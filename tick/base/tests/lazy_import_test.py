@@ -0,0 +1,96 @@
+# -*- coding: utf8 -*-
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from tick.base.lazy_import import lazy_attributes
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        # A package with two submodules whose objects are imported lazily
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        package_dir = os.path.join(self.tmp_dir.name, 'lazy_package')
+        os.mkdir(package_dir)
+        files = {
+            '__init__.py': (
+                "from tick.base.lazy_import import lazy_attributes\n"
+                "__getattr__, __dir__ = lazy_attributes(__name__, {\n"
+                "    '.first': ['a', 'b'],\n"
+                "    '.second': ['c'],\n"
+                "})\n"
+                "__all__ = ['a', 'b', 'c']\n"),
+            'first.py': "a = 1\nb = 2\n",
+            'second.py': "c = 3\n",
+        }
+        for file_name, content in files.items():
+            with open(os.path.join(package_dir, file_name), 'w') as f:
+                f.write(content)
+        sys.path.insert(0, self.tmp_dir.name)
+
+    def tearDown(self):
+        sys.path.remove(self.tmp_dir.name)
+        for module in ['lazy_package', 'lazy_package.first',
+                       'lazy_package.second']:
+            sys.modules.pop(module, None)
+        self.tmp_dir.cleanup()
+
+    def test_lazy_attributes(self):
+        """...Test that objects of a package are imported from their
+        submodule when they are first accessed
+        """
+        import lazy_package
+        if sys.version_info >= (3, 7):
+            self.assertNotIn('lazy_package.first', sys.modules)
+            self.assertNotIn('lazy_package.second', sys.modules)
+
+        self.assertEqual(lazy_package.a, 1)
+        self.assertIn('lazy_package.first', sys.modules)
+        self.assertEqual(lazy_package.__dict__['b'], 2)
+
+        from lazy_package import c
+        self.assertEqual(c, 3)
+
+        namespace = {}
+        exec("from lazy_package import *", namespace)
+        self.assertEqual({name: namespace[name] for name in 'abc'},
+                         {'a': 1, 'b': 2, 'c': 3})
+
+        self.assertTrue({'a', 'b', 'c'}.issubset(dir(lazy_package)))
+
+        with self.assertRaisesRegex(
+                AttributeError,
+                "module 'lazy_package' has no attribute 'd'"):
+            lazy_package.d
+
+    @unittest.skipIf(sys.version_info < (3, 7),
+                     "objects are imported lazily from Python 3.7")
+    def test_import_time(self):
+        """...Test that importing tick packages does not import their heavy
+        dependencies
+        """
+        heavy_modules = ['matplotlib', 'numpydoc', 'sklearn', 'pandas',
+                         'tick.inference.build', 'tick.optim.solver.build']
+        for package in ['tick', 'tick.optim.model', 'tick.optim.solver',
+                        'tick.simulation', 'tick.inference',
+                        'tick.preprocessing', 'tick.dataset']:
+            # Each import is run in a new interpreter, which lists all
+            # imported modules on stderr
+            process = subprocess.run(
+                [sys.executable, '-X', 'importtime', '-c',
+                 'import %s' % package],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                universal_newlines=True, check=True)
+            imported_modules = [line.split('|')[-1].strip()
+                                for line in process.stderr.splitlines()
+                                if line.startswith('import time:')]
+
+            for module in heavy_modules:
+                self.assertNotIn(module, imported_modules,
+                                 "import %s imports %s" % (package, module))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+# -*- coding: utf8 -*-
+import unittest
+
+import numpy as np
+
+from tick.base import set_thread_pool_size, get_thread_pool_size
+from tick.optim.model import ModelLogReg
+from tick.simulation import SimuLogReg, weights_sparse_gauss
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.initial_pool_size = get_thread_pool_size()
+
+    def tearDown(self):
+        set_thread_pool_size(self.initial_pool_size)
+
+    def test_thread_pool_size(self):
+        """...Test thread pool size can be set and retrieved
+        """
+        set_thread_pool_size(3)
+        self.assertEqual(get_thread_pool_size(), 3)
+        set_thread_pool_size(0)
+        self.assertEqual(get_thread_pool_size(), 0)
+
+        with self.assertRaisesRegex(ValueError,
+                                    "n_workers must be non-negative"):
+            set_thread_pool_size(-1)
+
+    def test_thread_pool_results(self):
+        """...Test that multi-threaded computations give the same results
+        whatever the size of the thread pool
+        """
+        np.random.seed(12)
+        n_samples, n_features = 500, 10
+        w0 = weights_sparse_gauss(n_features, nnz=3)
+        features, labels = SimuLogReg(w0, n_samples=n_samples,
+                                      verbose=False, seed=123).simulate()
+        coeffs = np.random.randn(n_features)
+
+        model = ModelLogReg(n_threads=1).fit(features, labels)
+        expected_grad = model.grad(coeffs)
+        expected_loss = model.loss(coeffs)
+
+        model = ModelLogReg(n_threads=4).fit(features, labels)
+        for n_workers in [0, 1, 2, 8]:
+            set_thread_pool_size(n_workers)
+            np.testing.assert_almost_equal(model.grad(coeffs), expected_grad)
+            self.assertAlmostEqual(model.loss(coeffs), expected_loss)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,7 @@
 
 #include "parallel/parallel.h"
 #include "time_func.h"
+#include "math/sum_tree.h"
 #include "array2d.h"
 
 #include <gtest/gtest.h>
@@ -255,6 +256,76 @@ TEST(ParallelTest, TooManyThreads) {
   parallel_run(8, 4, &CalcFibo::DoIt, &c);
 }
 
+struct NestedCaller {
+  std::atomic<ulong> n_calls{0};
+
+  void Inner(unsigned long i) {
+    ++n_calls;
+  }
+
+  void Outer(unsigned long i) {
+    parallel_run(4, 10, &NestedCaller::Inner, this);
+  }
+};
+
+class ThreadPoolTest : public ::testing::TestWithParam<unsigned> {
+ protected:
+  unsigned int initial_n_workers;
+
+  void SetUp() override {
+    initial_n_workers = tick::get_thread_pool_size();
+    tick::set_thread_pool_size(GetParam());
+  }
+
+  void TearDown() override {
+    tick::set_thread_pool_size(initial_n_workers);
+  }
+};
+
+TEST_P(ThreadPoolTest, Size) {
+  EXPECT_EQ(GetParam(), tick::get_thread_pool_size());
+}
+
+TEST_P(ThreadPoolTest, AllChunksRunOnce) {
+  const ulong n_chunks = 100;
+  std::vector<int> counts(n_chunks, 0);
+
+  tick::ThreadPool::instance().run(n_chunks, [&counts](ulong n) { counts[n] += 1; });
+
+  EXPECT_EQ(std::vector<int>(n_chunks, 1), counts);
+}
+
+TEST_P(ThreadPoolTest, Nested) {
+  NestedCaller c{};
+
+  parallel_run(8, 50, &NestedCaller::Outer, &c);
+
+  EXPECT_EQ(500u, c.n_calls);
+}
+
+TEST_P(ThreadPoolTest, ExceptionThrow) {
+  ExceptionThrower e{};
+
+  EXPECT_THROW(parallel_run(4, 1000, &ExceptionThrower::DoIt, &e), std::runtime_error);
+  EXPECT_THROW(tick::ThreadPool::instance().run(4, [](ulong n) { throw std::runtime_error("Example"); }),
+               std::runtime_error);
+}
+
+TEST_P(ThreadPoolTest, ReduceSum) {
+  MapFunctorsUnary m{XDATA_TEST_DATA_SIZE};
+
+  for (int repeat = 0; repeat < 100; ++repeat) {
+    const long result = parallel_map_additive_reduce(8, m.data.size(), &MapFunctorsUnary::Set, &m);
+
+    const auto na = m.data.size() - 1;
+    ASSERT_EQ((na * (na + 1)) / 2, result);
+  }
+}
+
+INSTANTIATE_TEST_CASE_P(AllThreadPoolTests,
+                        ThreadPoolTest,
+                        ::testing::Values(0, 1, 3, 8));
+
 TEST(DebugTest, WarningDebug) {
   testing::internal::CaptureStdout();
 
@@ -344,3 +415,32 @@ TEST(DebugTest, PrintSparseArray) {
   const std::string msg = testing::internal::GetCapturedStdout();
   EXPECT_PRED_FORMAT2(testing::IsSubstring, "SparseArray", msg);
 }
+
+TEST(SumTreeTest, TotalAndFind) {
+  const std::vector<double> weights {0.5, 0., 2., 1.5, 0., 1.};
+  SumTree tree(weights.size());
+  for (ulong i = 0; i < weights.size(); ++i) tree.set(i, weights[i]);
+
+  EXPECT_EQ(tree.size(), weights.size());
+  EXPECT_DOUBLE_EQ(tree.total(), 5.);
+
+  double cumsum = 0;
+  for (ulong i = 0; i < weights.size(); ++i) {
+    EXPECT_DOUBLE_EQ(tree.get(i), weights[i]);
+    if (weights[i] > 0) {
+      EXPECT_EQ(tree.find(cumsum), i);
+      EXPECT_EQ(tree.find(cumsum + 0.99 * weights[i]), i);
+    }
+    cumsum += weights[i];
+  }
+
+  // Rounding errors never lead to an empty leaf
+  EXPECT_EQ(tree.find(5.), 5u);
+  EXPECT_EQ(tree.find(6.), 5u);
+
+  tree.set(5, 0.);
+  tree.set(2, 1.);
+  EXPECT_DOUBLE_EQ(tree.total(), 3.);
+  EXPECT_EQ(tree.find(1.4), 2u);
+  EXPECT_EQ(tree.find(3.), 3u);
+}
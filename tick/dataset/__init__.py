@@ -1,6 +1,9 @@
 import tick.base
+from tick.base.lazy_import import lazy_attributes
 
-from .download_helper import fetch_tick_dataset
-from .fetch_hawkes_data import fetch_hawkes_bund_data
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    ".download_helper": ["fetch_tick_dataset"],
+    ".fetch_hawkes_data": ["fetch_hawkes_bund_data"],
+})
 
 __all__ = ['fetch_tick_dataset', 'fetch_hawkes_bund_data']
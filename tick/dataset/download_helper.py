@@ -4,6 +4,7 @@ repository
 Inspired from
 https://github.com/scikit-learn/scikit-learn/blob/14031f6/sklearn/datasets/twenty_newsgroups.py
 """
+import hashlib
 import logging
 from urllib.request import urlopen
 
@@ -12,7 +13,7 @@ import os
 import shutil
 
 import numpy as np
-from sklearn.datasets import load_svmlight_file
+from scipy.sparse import csr_matrix
 import math
 
 logger = logging.getLogger(__name__)
@@ -74,7 +75,8 @@ def download_tick_dataset(dataset_path, data_home=None, verbose=True):
     return cache_path
 
 
-def fetch_tick_dataset(dataset_path, data_home=None, verbose=True):
+def fetch_tick_dataset(dataset_path, data_home=None, verbose=True,
+                       binary_cache=True):
     """Fetch dataset from tick_datasets github repository.
      
     Uses cache if this dataset has already been downloaded.
@@ -92,6 +94,10 @@ def fetch_tick_dataset(dataset_path, data_home=None, verbose=True):
     verbose : `bool`, default=True
         If True, download progress bar will be printed
 
+    binary_cache : `bool`, default=True
+        If True, svmlight datasets are converted once to a binary cache
+        which is memory-mapped by later calls, see `load_dataset`
+
     Returns
     -------
     output : `np.ndarray` or `dict` or `tuple`
@@ -103,7 +109,8 @@ def fetch_tick_dataset(dataset_path, data_home=None, verbose=True):
     dataset = None
     if os.path.exists(cache_path):
         try:
-            dataset = load_dataset(dataset_path, data_home=data_home)
+            dataset = load_dataset(dataset_path, data_home=data_home,
+                                   binary_cache=binary_cache)
         except Exception as e:
             print(80 * '_')
             print('Cache loading failed')
@@ -113,12 +120,13 @@ def fetch_tick_dataset(dataset_path, data_home=None, verbose=True):
     if dataset is None:
         download_tick_dataset(dataset_path, data_home=data_home,
                               verbose=verbose)
-        dataset = load_dataset(dataset_path, data_home=data_home)
+        dataset = load_dataset(dataset_path, data_home=data_home,
+                               binary_cache=binary_cache)
 
     return dataset
 
 
-def load_dataset(dataset_path, data_home=None):
+def load_dataset(dataset_path, data_home=None, binary_cache=True):
     """Load dataset from given path
 
     Parameters
@@ -130,6 +138,13 @@ def load_dataset(dataset_path, data_home=None):
         Specify a download and cache folder for the datasets. If None,
         all tick datasets are stored in '~/tick_datasets' subfolders.
 
+    binary_cache : `bool`, default=True
+        If True, a svmlight dataset is parsed only once and its features
+        and labels are stored next to it as ``.npy`` files, along with the
+        checksum of the file they come from. Later calls memory-map these
+        files instead of parsing the svmlight file again. The cache is
+        rebuilt if the svmlight file has changed
+
     Returns
     -------
     output : `np.ndarray` or `dict` or `tuple`
@@ -147,12 +162,103 @@ def load_dataset(dataset_path, data_home=None):
             dataset = dataset[key_0]
         else:
             dataset = dataset.items()
+    elif binary_cache:
+        dataset = load_svmlight_binary_cache(cache_path)
     else:
+        from sklearn.datasets import load_svmlight_file
         dataset = load_svmlight_file(cache_path)
 
     return dataset
 
 
+_binary_cache_arrays = ['data', 'indices', 'indptr', 'shape', 'labels']
+
+
+def _binary_cache_dir(cache_path):
+    return cache_path + '.npy'
+
+
+def _file_checksum(path, chunk_size=1 << 20):
+    """SHA-256 checksum of a file, read by chunks
+    """
+    checksum = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            checksum.update(chunk)
+    return checksum.hexdigest()
+
+
+def load_svmlight_binary_cache(cache_path):
+    """Load a svmlight dataset through its binary cache, which is built
+    if it does not exist or if it does not match the svmlight file checksum
+
+    Parameters
+    ----------
+    cache_path : `str`
+        Path of the svmlight file
+
+    Returns
+    -------
+    features : `scipy.sparse.csr_matrix`, shape=(n_samples, n_features)
+        Features matrix, its data, indices and indptr are memory-mapped
+        (copy-on-write) and can be given to tick models without copy
+
+    labels : `np.ndarray`, shape=(n_samples, )
+        Labels vector, memory-mapped (copy-on-write)
+    """
+    checksum = _file_checksum(cache_path)
+    cache_dir = _binary_cache_dir(cache_path)
+    checksum_path = os.path.join(cache_dir, 'checksum')
+
+    cached_checksum = None
+    if os.path.exists(checksum_path):
+        with open(checksum_path) as f:
+            cached_checksum = f.read().strip()
+
+    if cached_checksum != checksum:
+        # sklearn is only needed to parse the svmlight file
+        from sklearn.datasets import load_svmlight_file
+        features, labels = load_svmlight_file(cache_path)
+        features = csr_matrix(features)
+        arrays = {
+            'data': np.ascontiguousarray(features.data, dtype=np.float64),
+            'indices': np.ascontiguousarray(features.indices, dtype=np.int32),
+            'indptr': np.ascontiguousarray(features.indptr, dtype=np.int32),
+            'shape': np.array(features.shape, dtype=np.int64),
+            'labels': np.ascontiguousarray(labels, dtype=np.float64),
+        }
+
+        if os.path.exists(cache_dir):
+            shutil.rmtree(cache_dir)
+        os.makedirs(cache_dir)
+        for name in _binary_cache_arrays:
+            np.save(os.path.join(cache_dir, name + '.npy'), arrays[name])
+        # The checksum is written last, the cache is valid only once all
+        # arrays have been written
+        with open(checksum_path, 'w') as f:
+            f.write(checksum)
+
+    # Arrays are given as plain numpy arrays as tick C++ objects do not
+    # accept np.memmap instances
+    arrays = {
+        name: np.load(os.path.join(cache_dir, name + '.npy'),
+                      mmap_mode='c').view(np.ndarray)
+        for name in _binary_cache_arrays if name != 'shape'
+    }
+    shape = tuple(int(n) for n in np.load(os.path.join(cache_dir,
+                                                      'shape.npy')))
+    if len(arrays['indptr']) != shape[0] + 1 or \
+            len(arrays['labels']) != shape[0] or \
+            len(arrays['indices']) != len(arrays['data']) or \
+            arrays['indptr'][-1] != len(arrays['data']):
+        raise ValueError("Corrupted binary cache in %s, remove it to rebuild "
+                         "it" % cache_dir)
+
+    features = csr_matrix((arrays['data'], arrays['indices'],
+                           arrays['indptr']), shape=shape, copy=False)
+    return features, arrays['labels']
+
+
 def get_data_home(data_home=None):
     """Return the path of the tick data dir.
 
@@ -183,6 +289,10 @@ def clear_dataset(dataset_path, data_home=None):
     if os.path.exists(cache_path):
         os.remove(cache_path)
 
+    cache_dir = _binary_cache_dir(cache_path)
+    if os.path.exists(cache_dir):
+        shutil.rmtree(cache_dir)
+
 
 def clear_data_home(data_home=None):
     """Delete all the content of the data home cache.
@@ -1,9 +1,17 @@
+import bz2
 import os
+import shutil
+import tempfile
 import unittest
 import socket
+import warnings
+
+import numpy as np
+from sklearn.datasets import dump_svmlight_file, load_svmlight_file
 
 from tick.dataset.download_helper import fetch_tick_dataset, clear_dataset, \
-    get_data_home
+    get_data_home, load_dataset
+from tick.inference import LogisticRegression
 
 
 def is_connected():
@@ -46,6 +54,63 @@ class Test(unittest.TestCase):
             file_modification_time_2 = os.path.getmtime(cache_path)
             self.assertEqual(file_modification_time_1, file_modification_time_2)
 
+    def test_load_dataset_binary_cache(self):
+        """...Test svmlight dataset is loaded from its binary cache, which is
+        rebuilt when the dataset changes
+        """
+        data_home = tempfile.mkdtemp()
+        try:
+            dataset_path = "binary/toy/toy.trn.bz2"
+            cache_path = os.path.join(data_home, dataset_path)
+            os.makedirs(os.path.dirname(cache_path))
+
+            def write_dataset(seed):
+                np.random.seed(seed)
+                features = np.random.randn(30, 5)
+                features[features < 0.5] = 0
+                labels = np.sign(np.random.randn(30))
+                with bz2.open(cache_path, 'wb') as f:
+                    dump_svmlight_file(features, labels, f)
+
+            write_dataset(2383)
+            features, labels = load_dataset(dataset_path, data_home=data_home)
+            cache_dir = cache_path + '.npy'
+            self.assertTrue(os.path.exists(
+                os.path.join(cache_dir, 'checksum')))
+            modification_time = os.path.getmtime(
+                os.path.join(cache_dir, 'data.npy'))
+
+            features, labels = load_dataset(dataset_path, data_home=data_home)
+            self.assertEqual(os.path.getmtime(
+                os.path.join(cache_dir, 'data.npy')), modification_time)
+
+            svm_features, svm_labels = load_svmlight_file(cache_path)
+            self.assertEqual(features.shape, svm_features.shape)
+            np.testing.assert_array_equal(features.toarray(),
+                                          svm_features.toarray())
+            np.testing.assert_array_equal(labels, svm_labels)
+            self.assertEqual(features.indices.dtype, np.int32)
+            self.assertEqual(features.indptr.dtype, np.int32)
+
+            # Features and labels are given to the learner without copy
+            with warnings.catch_warnings():
+                warnings.simplefilter('error', RuntimeWarning)
+                LogisticRegression(max_iter=5).fit(features, labels)
+
+            # Cache is rebuilt when the dataset changes
+            write_dataset(9832)
+            features, labels = load_dataset(dataset_path, data_home=data_home)
+            svm_features, svm_labels = load_svmlight_file(cache_path)
+            np.testing.assert_array_equal(features.toarray(),
+                                          svm_features.toarray())
+            np.testing.assert_array_equal(labels, svm_labels)
+
+            clear_dataset(dataset_path, data_home=data_home)
+            self.assertFalse(os.path.exists(cache_path))
+            self.assertFalse(os.path.exists(cache_dir))
+        finally:
+            shutil.rmtree(data_home)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,14 +1,17 @@
 import tick.base
+from tick.base.lazy_import import lazy_attributes
 
-from .logistic_regression import LogisticRegression
-from .cox_regression import CoxRegression
-from .hawkes_expkern_fixeddecay import HawkesExpKern
-from .hawkes_sumexpkern_fixeddecay import HawkesSumExpKern
-from .hawkes_conditional_law import HawkesConditionalLaw
-from .hawkes_em import HawkesEM
-from .hawkes_adm4 import HawkesADM4
-from .hawkes_basis_kernels import HawkesBasisKernels
-from .hawkes_sumgaussians import HawkesSumGaussians
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    ".logistic_regression": ["LogisticRegression"],
+    ".cox_regression": ["CoxRegression"],
+    ".hawkes_expkern_fixeddecay": ["HawkesExpKern"],
+    ".hawkes_sumexpkern_fixeddecay": ["HawkesSumExpKern"],
+    ".hawkes_conditional_law": ["HawkesConditionalLaw"],
+    ".hawkes_em": ["HawkesEM"],
+    ".hawkes_adm4": ["HawkesADM4"],
+    ".hawkes_basis_kernels": ["HawkesBasisKernels"],
+    ".hawkes_sumgaussians": ["HawkesSumGaussians"],
+})
 
 __all__ = ["LogisticRegression",
            "CoxRegression",
@@ -138,16 +138,130 @@ class LearnerGLM(LearnerOptim):
         self : LearnerGLM
             The fitted instance of the model
         """
-        solver_obj = self._solver_obj
+        self._prepare_fit(X, y)
+        coeffs = self._solver_obj.solve(self._warm_start_coeffs())
+        self._set_coeffs(coeffs)
+        return self
+
+    def fit_path(self, X: object, y: np.array, Cs=None, n_Cs: int = 20,
+                 eps: float = 1e-3, strong_rules: bool = False):
+        """Fit the model along a regularization path: the problem is solved
+        for increasing values of ``C`` (namely decreasing penalization), each
+        fit starting from the solution of the previous one.
+
+        The model is given the data once, hence its Lipschitz constants (and
+        the step size deduced from them) are shared by all fits. At the end,
+        the learner is fitted with the last (largest) value of ``C``.
+
+        Parameters
+        ----------
+        X : `np.ndarray` or `scipy.sparse.csr_matrix`, shape=(n_samples, n_features)
+            Training vector, where n_samples in the number of samples and
+            n_features is the number of features.
+
+        y : `np.array`, shape=(n_samples,)
+            Target vector relative to X.
+
+        Cs : `np.array`, default=None
+            Values of ``C`` along the path. If `None`, ``n_Cs`` values are
+            taken evenly on a log scale, from the smallest ``C`` for which
+            all weights are zero to this value divided by ``eps``. This
+            default is only available for 'l1' and 'elasticnet' penalties
+
+        n_Cs : `int`, default=20
+            Number of values of ``C`` on the path, used if ``Cs`` is `None`
+
+        eps : `float`, default=1e-3
+            Ratio between the smallest and the largest penalization
+            strengths on the path, used if ``Cs`` is `None`
+
+        strong_rules : `bool`, default=False
+            If `True`, features screened out by sequential strong rules
+            are discarded before each fit, which is then performed on the
+            remaining features only. Features wrongly discarded (violating
+            the optimality conditions) are then added back and the fit is
+            performed again. Only available for 'l1' and 'elasticnet'
+            penalties
+
+        Returns
+        -------
+        Cs : `np.array`, shape=(n_Cs,)
+            The values of ``C`` of the path, sorted increasingly
+
+        coeffs_path : `np.ndarray`, shape=(n_Cs, n_coeffs)
+            The coefficients fitted for each value of ``C``, namely the
+            weights followed by the intercept if ``fit_intercept=True``
+        """
+        if self.solver == 'sdca':
+            raise ValueError('SDCA cannot be warm started, hence cannot fit a '
+                             'regularization path')
+
+        if Cs is None or strong_rules:
+            if self.penalty == 'l1':
+                l1_ratio = 1.
+            elif self.penalty == 'elasticnet' and self.elastic_net_ratio > 0:
+                l1_ratio = self.elastic_net_ratio
+            else:
+                raise ValueError('Default values of ``Cs`` and strong rules '
+                                 'are only available for penalties with a '
+                                 'l1 part, got penalty %s' % self.penalty)
+
+        X = self._prepare_fit(X, y)
         model_obj = self._model_obj
-        prox_obj = self._prox_obj
-        fit_intercept = self.fit_intercept
+        n_features = model_obj.n_features
+
+        # Solution for an infinite penalization: weights are zero and the
+        # intercept is the one of the model fitted without features
+        null_coeffs = np.zeros(model_obj.n_coeffs)
+        if self.fit_intercept:
+            null_coeffs[-1] = self._intercept_only(model_obj.labels)
+
+        coeffs = self._warm_start_coeffs()
+        if coeffs is None:
+            coeffs = null_coeffs
+
+        if Cs is None or strong_rules:
+            grad = model_obj.grad(null_coeffs)
+            # Smallest penalization strength for which weights equal to zero
+            # satisfy the optimality conditions
+            previous_strength = np.abs(grad[:n_features]).max() / l1_ratio
+
+        if Cs is None:
+            C_min = 1. / previous_strength
+            Cs = np.logspace(np.log10(C_min), np.log10(C_min / eps), n_Cs)
+        else:
+            Cs = np.sort(np.array(Cs, dtype=float))
+
+        # Models restricted to the active features, fitted once per set of
+        # active features
+        sub_models = {}
+        coeffs_path = np.empty((len(Cs), model_obj.n_coeffs))
+        for k, C in enumerate(Cs):
+            self.C = C
+            if strong_rules:
+                coeffs = self._solve_with_strong_rules(X, coeffs,
+                                                       previous_strength,
+                                                       l1_ratio, sub_models)
+                previous_strength = self._prox_obj.strength
+            else:
+                coeffs = self._solver_obj.solve(coeffs)
+            coeffs_path[k] = coeffs
 
+        if strong_rules:
+            self._set_solver_model(model_obj)
+
+        self._set_coeffs(coeffs_path[-1])
+        return Cs, coeffs_path
+
+    def _prepare_fit(self, X, y):
+        """Gives the data to the model and the model to the solver. Returns
+        X in the format used by the model
+        """
         X = LearnerOptim._safe_array(X)
         y = LearnerOptim._safe_array(y)
 
         # Pass the data to the model
-        model_obj.fit(X, y)
+        self._model_obj.fit(X, y)
 
         if self.step is None and self.solver in self._solvers_with_step:
 
@@ -163,17 +277,22 @@ class LearnerGLM(LearnerOptim):
                 warn('SGD step needs to be tuned manually', RuntimeWarning)
                 self.step = 1.
 
+        self._set_solver_model(self._model_obj)
+        return X
+
+    def _set_solver_model(self, model_obj):
         # Determine the range of the prox
         # User cannot specify a custom range if he is using learners
-        if fit_intercept:
+        if self.fit_intercept:
             # Don't penalize the intercept (intercept is the last coeff)
-            prox_obj.range = (0, model_obj.n_coeffs - 1)
+            self._prox_obj.range = (0, model_obj.n_coeffs - 1)
         else:
-            prox_obj.range = (0, model_obj.n_coeffs)
+            self._prox_obj.range = (0, model_obj.n_coeffs)
 
         # Now, we can pass the model and prox objects to the solver
-        solver_obj.set_model(model_obj).set_prox(prox_obj)
+        self._solver_obj.set_model(model_obj).set_prox(self._prox_obj)
 
+    def _warm_start_coeffs(self):
         coeffs_start = None
         if self.warm_start and self.weights is not None:
             if self.fit_intercept and self.intercept is not None:
@@ -181,21 +300,84 @@ class LearnerGLM(LearnerOptim):
             else:
                 coeffs = self.weights
             # ensure starting point has the right format
-            if coeffs is not None and coeffs.shape == (model_obj.n_coeffs,):
+            if coeffs is not None and \
+                    coeffs.shape == (self._model_obj.n_coeffs,):
                 coeffs_start = coeffs
+        return coeffs_start
 
-        # Launch the solver
-        coeffs = solver_obj.solve(coeffs_start)
-
+    def _set_coeffs(self, coeffs):
         # Get the learned coefficients
-        if fit_intercept:
+        if self.fit_intercept:
             self._set("weights", coeffs[:-1])
             self._set("intercept", coeffs[-1])
         else:
             self._set("weights", coeffs)
             self._set("intercept", None)
         self._set("_fitted", True)
-        return self
+
+    def _intercept_only(self, labels):
+        """Intercept of the model fitted without any feature, namely the
+        solution of the problem for an infinite penalization of the weights
+        """
+        raise NotImplementedError('%s does not give the intercept of its '
+                                  'model fitted without features'
+                                  % self.__class__.__name__)
+
+    def _solve_with_strong_rules(self, X, coeffs, previous_strength,
+                                 l1_ratio, sub_models):
+        """Solves the problem for the current penalization strength, given
+        the solution obtained for previous_strength. sub_models maps the
+        sets of active features already met along the path to the model
+        restricted to them
+        """
+        model_obj = self._model_obj
+        n_features = model_obj.n_features
+        strength = self._prox_obj.strength
+
+        abs_grad = np.abs(model_obj.grad(coeffs)[:n_features])
+
+        # Sequential strong rule: features with a small enough gradient are
+        # likely to have a zero weight for the current strength
+        active = (abs_grad >= l1_ratio * (2 * strength - previous_strength))
+        active |= coeffs[:n_features] != 0
+        if not active.any():
+            active[np.argmax(abs_grad)] = True
+
+        while True:
+            features_indices = np.flatnonzero(active)
+            key = features_indices.tobytes()
+            if key not in sub_models:
+                sub_model = self._construct_model_obj(
+                    fit_intercept=self.fit_intercept)
+                sub_models[key] = sub_model.fit(X[:, features_indices],
+                                                model_obj.labels)
+            coeffs = self._solve_on_features(sub_models[key],
+                                             features_indices, coeffs)
+            # Check the optimality conditions of discarded features
+            abs_grad = np.abs(model_obj.grad(coeffs)[:n_features])
+            violations = ~active & (abs_grad > l1_ratio * strength)
+            if not violations.any():
+                return coeffs
+            active |= violations
+
+    def _solve_on_features(self, sub_model, features_indices, coeffs):
+        """Solves the problem restricted to the given features, the weights of
+        the other ones being zero. sub_model is the model fitted on these
+        features only
+        """
+        fit_intercept = self.fit_intercept
+        self._set_solver_model(sub_model)
+
+        sub_coeffs_start = coeffs[features_indices]
+        if fit_intercept:
+            sub_coeffs_start = np.hstack((sub_coeffs_start, coeffs[-1]))
+        sub_coeffs = self._solver_obj.solve(sub_coeffs_start)
+
+        coeffs = np.zeros(self._model_obj.n_coeffs)
+        coeffs[features_indices] = sub_coeffs[:len(features_indices)]
+        if fit_intercept:
+            coeffs[-1] = sub_coeffs[-1]
+        return coeffs
 
     def get_params(self):
         """
@@ -1,5 +1,6 @@
 import numpy as np
 
+from tick.base import EventStore
 from tick.optim.solver.base import Solver
 
 
@@ -77,19 +78,26 @@ class LearnerHawkesNoParam(Solver):
 
         Parameters
         ----------
-        events : `list` of `list` of `np.ndarray`
+        events : `list` of `list` of `np.ndarray` or `EventStore`
             List of Hawkes processes realizations.
             Each realization of the Hawkes process is a list of n_node for
             each component of the Hawkes. Namely `events[i][j]` contains a
             one-dimensional `numpy.array` of the events' timestamps of
             component j of realization i.
-            If only one realization is given, it will be wrapped into a list
+            If only one realization is given, it will be wrapped into a list.
+            Realizations of an `EventStore` are used without copy.
 
         end_times : `np.ndarray` or `float`, default = None
             List of end time of all hawkes processes that will be given to the
-            model. If None, it will be set to each realization's latest time.
+            model. If None, it will be set to each realization's latest time
+            (or to the end times of the `EventStore`).
             If only one realization is provided, then a float can be given.
         """
+        if isinstance(events, EventStore):
+            if end_times is None:
+                end_times = events.end_times
+            events = events.timestamps
+
         self._set('_fitted', True)
         self._set('_end_times', end_times)
         self._set_data(events)
@@ -108,6 +108,13 @@ class HawkesADM4(LearnerHawkesNoParam):
         If None, it will be set given a heuristic which look at last
         relative difference obtained in the main loop.
 
+    weights_memory_budget : `int`, default=0
+        Maximum memory, in bytes, that the weights precomputed from the
+        events may use. If they need more, they are not stored and are
+        computed again at each iteration instead, which makes iterations
+        slower but needs memory that does not grow with the number of
+        events. If 0, weights are always stored
+
     Attributes
     ----------
     n_nodes : `int`
@@ -136,6 +143,9 @@ class HawkesADM4(LearnerHawkesNoParam):
         "rho": {
             "cpp_setter": "set_rho"
         },
+        "weights_memory_budget": {
+            "cpp_setter": "set_weights_memory_budget"
+        },
         "_C": {"writable": False},
         "baseline": {"writable": False},
         "adjacency": {"writable": False},
@@ -148,7 +158,7 @@ class HawkesADM4(LearnerHawkesNoParam):
     def __init__(self, decay, C=1e3, lasso_nuclear_ratio=0.5, max_iter=50,
                  tol=1e-5, n_threads=1, verbose=False, print_every=10,
                  record_every=10, rho=.1, approx=0, em_max_iter=30,
-                 em_tol=None):
+                 em_tol=None, weights_memory_budget=0):
 
         LearnerHawkesNoParam.__init__(self, verbose=verbose, max_iter=max_iter,
                                       print_every=print_every, tol=tol,
@@ -175,8 +185,10 @@ class HawkesADM4(LearnerHawkesNoParam):
         self._learner = _HawkesADM4(decay, rho, n_threads, approx)
 
         # TODO add approx to model
-        self._model = ModelHawkesFixedExpKernLogLik(self.decay,
-                                                    n_threads=self.n_threads)
+        self._model = ModelHawkesFixedExpKernLogLik(
+            self.decay, n_threads=self.n_threads,
+            weights_memory_budget=weights_memory_budget)
+        self.weights_memory_budget = weights_memory_budget
 
         self.history.print_order += ["rel_baseline", "rel_adjacency"]
 
@@ -3,11 +3,11 @@ import sys
 import warnings
 
 import numpy as np
-from tick.base import Base, ThreadPool
+from tick.base import Base
 from numpy.polynomial.legendre import leggauss
 from scipy.linalg import solve
 
-from .build.inference import PointProcessCondLaw
+from .build.inference import PointProcessCondLawList
 
 
 # noinspection PyPep8Naming
@@ -153,7 +153,6 @@ class HawkesConditionalLaw(Base):
     _attrinfos = {
         '_hawkes_object': {},
         '_lags': {},
-        '_lock': {'writable': False},
         '_phi_ijl': {}, '_norm_ijl': {},
         '_ijl2index': {},
         '_index2ijl': {},
@@ -211,7 +210,6 @@ class HawkesConditionalLaw(Base):
         # Represents the conditional laws written above without conditioning by
         # the mark (so a i,j list)
         self._claw1 = None
-        self._lock = None
 
         # quad_x : `np.ndarray`, shape=(n_quad, )
         # The abscissa of the quadrature points used for the Fredholm system
@@ -225,7 +223,7 @@ class HawkesConditionalLaw(Base):
         self.kernels, self.kernels_norms, self.baseline = None, None, None
         self.mark_functions = None
 
-        if n_threads == -1:
+        if n_threads <= 0:
             import multiprocessing
             n_threads = multiprocessing.cpu_count()
         self.n_threads = n_threads
@@ -499,24 +497,20 @@ class HawkesConditionalLaw(Base):
         if self.n_realizations == 0:
             self._claw = [0] * len(self._index2ijl)
 
-        # We might want to use threads, since this is the time consuming part
-        with_multi_processing = self.n_threads > 1
-        if with_multi_processing:
-            pool = ThreadPool(with_lock=True, max_threads=self.n_threads)
-            self._set('_lock', pool.lock)
-
-        for index, (i, j, l) in enumerate(self._index2ijl):
-            if len(realization[i][0]) == 0 or len(realization[j][0]) == 0:
-                msg = "Some realizations are empty, it is not allowed"
-                raise ValueError(msg)
-            if with_multi_processing:
-                pool.add_work(self._PointProcessCondLaw, realization,
-                              index, i, j, l)
-            else:
-                self._PointProcessCondLaw(realization, index, i, j, l)
+        if any(len(realization[i][0]) == 0 for i in range(self.n_nodes)):
+            msg = "Some realizations are empty, it is not allowed"
+            raise ValueError(msg)
 
-        if with_multi_processing:
-            pool.start()
+        # This is the time consuming part, all conditional laws are computed
+        # at once with n_threads threads
+        claw_Y = self._PointProcessCondLaw(realization)
+        for index in range(self._n_index):
+            if self.n_realizations == 0:
+                self._claw[index] = claw_Y[index]
+            else:
+                self._claw[index] = \
+                    (self._claw[index] * self.n_realizations +
+                     claw_Y[index]) / (self.n_realizations + 1)
 
         # Here we compute the G^ij (not conditioned to l)
         # It is recomputed each time
@@ -577,31 +571,33 @@ class HawkesConditionalLaw(Base):
         if compute:
             self.compute()
 
-    def _PointProcessCondLaw(self, realization, index, i, j, l):
-
-        realization_no_mark_i = (realization[i][0],
-                                 np.arange(0., len(realization[i][0])))
+    def _PointProcessCondLaw(self, realization):
+        """Computes the conditional laws G^ij_l of all indices on the given
+        realization, they are returned in the rows of a 2d array
+        """
+        times = [realization[i][0] for i in range(self.n_nodes)]
+        counts = [np.arange(0., len(realization[i][0]))
+                  for i in range(self.n_nodes)]
+        marks = [realization[i][1] for i in range(self.n_nodes)]
+
+        y_nodes = np.array([i for (i, j, l) in self._index2ijl],
+                           dtype=np.uint64)
+        z_nodes = np.array([j for (i, j, l) in self._index2ijl],
+                           dtype=np.uint64)
+        z_min = np.array([self.marked_components[j][l][0]
+                          for (i, j, l) in self._index2ijl])
+        z_max = np.array([self.marked_components[j][l][1]
+                          for (i, j, l) in self._index2ijl])
 
         claw_X = np.zeros(len(self._lags) - 1)
-        claw_Y = np.zeros(len(self._lags) - 1)
+        claw_Y = np.zeros((self._n_index, len(self._lags) - 1))
 
-        PointProcessCondLaw(realization_no_mark_i[0], realization_no_mark_i[1],
-                            realization[j][0], realization[j][1], self._lags,
-                            self.marked_components[j][l][0],
-                            self.marked_components[j][l][1], claw_X, claw_Y)
+        PointProcessCondLawList(times, counts, marks, self._lags,
+                                y_nodes, z_nodes, z_min, z_max,
+                                claw_X, claw_Y, self.n_threads)
 
         self._claw_X = claw_X
-        # TODO: this lock acquire is very expensive here
-        if self.n_threads > 1:
-            self._lock.acquire()
-        if self.n_realizations == 0:
-            self._claw[index] = claw_Y
-        else:
-            self._claw[index] *= self.n_realizations
-            self._claw[index] += claw_Y
-            self._claw[index] /= self.n_realizations + 1
-        if self.n_threads > 1:
-            self._lock.release()
+        return claw_Y
 
     def _compute_lags(self):
         """Computes the lags at which the claw will be computed
@@ -623,29 +619,29 @@ class HawkesConditionalLaw(Base):
         """Computes the claw and its integrals at the difference of
         quadrature points using a linear interpolation
         """
+        # The claws are interpolated at the quadrature points, at their own
+        # abscissa and at the differences of quadrature points (only positive
+        # abscissa are kept). These abscissa are shared by all claws.
+        xe = self._claw_X
+        xs2 = np.unique(np.hstack((
+            self._quad_x, xe,
+            np.subtract.outer(self._quad_x, self._quad_x).ravel())))
+        xs2 = xs2[xs2 >= 0.]
+
+        # Each abscissa lower than the last claw abscissa is interpolated on
+        # the first claw segment that ends after it, claws are null after
+        inside = xs2 < xe[-1]
+        x_inside = xs2[inside]
+        segment = np.maximum(np.searchsorted(xe, x_inside, side='right'), 1)
+        x_start, x_end = xe[segment - 1], xe[segment]
 
         self._int_claw = [0] * self._n_index
-        # Builds a linear interpolation of the claws at the difference of
-        # quadrature (only positive abscissa are kept)
         for index in range(self._n_index):
-            xe = self._claw_X
             ye = self._claw[index]
-            xs2 = np.array([(a - b) for (a, b) in
-                            itertools.product(self._quad_x, repeat=2)])
-            xs2 = np.append(xe, xs2)
-            xs2 = np.append(self._quad_x, xs2)
-            xs2 = np.array(np.lib.arraysetops.unique(xs2))
-            xs2 = np.array(np.core.fromnumeric.sort(xs2))
-            xs2 = xs2[xs2 >= 0.]
             ys2 = np.zeros(len(xs2))
-            j = 0
-            for i in range(1, len(xe)):
-                while j < len(xs2) and xs2[j] < xe[i]:
-                    ys2[j] = (ye[i - 1]) + ((ye[i]) - (ye[i - 1])) * (
-                        xs2[j] - xe[i - 1]) / (xe[i] - xe[i - 1])
-                    j += 1
-            sc = (xs2, ys2)
-            self._int_claw[index] = sc
+            ys2[inside] = ye[segment - 1] + (ye[segment] - ye[segment - 1]) * (
+                x_inside - x_start) / (x_end - x_start)
+            self._int_claw[index] = (xs2, ys2)
 
         # Computes the integrals of the claws (IG) and the integrals of x
         # times the claws from 0 to the abscissa we have just computed
@@ -665,39 +661,42 @@ class HawkesConditionalLaw(Base):
                 np.diff(xc) / 2. * yc[:-1]))
             self._IG2 += [(xc, iyc_IG2)]
 
+    @staticmethod
+    def _closest_indices(x, t):
+        """Indices of the closest values of x to each t (x being sorted)
+        """
+        index = np.minimum(np.searchsorted(x, t), len(x) - 1)
+        next_index = np.minimum(index + 1, len(x) - 1)
+        return np.where(np.abs(x[index] - t) < np.abs(x[next_index] - t),
+                        index, next_index)
+
     @staticmethod
     def _lin0(sig, t):
         """Find closest value of a signal, zero value border
+
+        t can be a number or an array of points
         """
         x, y = sig
-        if t >= x[-1]:
-            return 0
-        index = np.searchsorted(x, t)
-        if index == len(y) - 1:
-            return y[index]
-        elif np.abs(x[index] - t) < np.abs(x[index + 1] - t):
-            return y[index]
-        else:
-            return y[index + 1]
+        t = np.asarray(t, dtype=float)
+        values = y[HawkesConditionalLaw._closest_indices(x, t)]
+        return np.where(t >= x[-1], 0., values)
 
     @staticmethod
     def _linc(sig, t):
         """Find closest value of a signal, continuous border
+
+        t can be a number or an array of points
         """
         x, y = sig
-        if t >= x[-1]:
-            return y[-1]
-        index = np.searchsorted(x, t)
-        if np.abs(x[index] - t) < np.abs(x[index + 1] - t):
-            return y[index]
-        else:
-            return y[index + 1]
+        t = np.asarray(t, dtype=float)
+        values = y[HawkesConditionalLaw._closest_indices(x, t)]
+        return np.where(t >= x[-1], y[-1], values)
 
     def _G(self, i, j, l, t):
-        """Returns the value of a claw at a point
+        """Returns the value of a claw at a point (or an array of points)
         Used to fill V and M with 'gauss' method
         """
-        if t < 0:
+        if np.any(np.asarray(t) < 0):
             warnings.warn("G(): should not be called for t < 0")
         index = self._ijl2index[i][j][l]
         return HawkesConditionalLaw._lin0(self._int_claw[index], t)
@@ -705,7 +704,7 @@ class HawkesConditionalLaw(Base):
     def _DIG(self, i, j, l, t1, t2):
         """Returns the integral of a claw between t1 and t2
         """
-        if t1 >= t2:
+        if np.any(np.asarray(t1) >= np.asarray(t2)):
             warnings.warn("t2>t1 wrong in DIG")
         index = self._ijl2index[i][j][l]
         return HawkesConditionalLaw._linc(self._IG[index], t2) - \
@@ -714,7 +713,7 @@ class HawkesConditionalLaw(Base):
     def _DIG2(self, i, j, l, t1, t2):
         """Returns the integral of x times a claw between t1 and t2
         """
-        if t1 >= t2:
+        if np.any(np.asarray(t1) >= np.asarray(t2)):
             warnings.warn("t2>t1 wrong in DIG2")
         index = self._ijl2index[i][j][l]
         return HawkesConditionalLaw._linc(self._IG2[index], t2) - \
@@ -758,38 +757,29 @@ class HawkesConditionalLaw(Base):
         # quadrature points using a linear interpolation
         self._compute_ints_claw()
 
-        # For each i we write and solve the system V =  M PHI
-        index_first = 0
+        # For each i we write the system V = M PHI. The indices (i, j, l)
+        # of node i run over the same (j, l) for all i, hence all these
+        # systems share the same matrix M and are solved at once
+        index_ranges = [(self._ijl2index[i][0][0], self._ijl2index[i][-1][-1])
+                        for i in range(self.n_nodes)]
+        index_first, index_last = index_ranges[0]
+        n_index = index_last - index_first + 1
+
+        M = self._compute_M(n_index, self.n_quad, index_first, index_last,
+                            self.quad_method)
+        V = np.hstack([
+            self._compute_V(i, n_index, self.n_quad, index_first, index_last)
+            for i, (index_first, index_last) in enumerate(index_ranges)])
+        res = solve(M, V)
+
         self._phi_ijl = []
         self._norm_ijl = []
         self.kernels = []
         self.kernels_norms = np.mat(np.zeros((self.n_nodes, self.n_nodes)))
-
-        for i in range(0, self.n_nodes):
-
-            # We must compute the last valid index which corresponds to i
-            index_last = index_first
-            for index_last in range(index_first, self._n_index):
-                (i1, j1, l1) = self._index2ijl[index_last]
-                if i1 != i:
-                    index_last -= 1
-                    break
-
-            # Number of indices corresponding to i
-            n_index = index_last - index_first + 1
-
-            # Compute V and M
-            V = self._compute_V(i, n_index, self.n_quad, index_first,
-                                index_last)
-            M = self._compute_M(n_index, self.n_quad, index_first, index_last,
-                                self.quad_method)
-            # Then we solve it
-            res = solve(M, V)
-
-            self._estimate_kernels_and_norms(i, index_first, index_last, res,
-                                             self.n_quad, self.quad_method)
-
-            index_first = index_last + 1
+        for i, (index_first, index_last) in enumerate(index_ranges):
+            self._estimate_kernels_and_norms(i, index_first, index_last,
+                                             res[:, [i]], self.n_quad,
+                                             self.quad_method)
 
         self._estimate_baseline()
         self._estimate_mark_functions()
@@ -798,150 +788,127 @@ class HawkesConditionalLaw(Base):
         V = np.zeros((n_index * n_quad, 1))
         for index in range(index_first, index_last + 1):
             (x, j, l) = self._index2ijl[index]
-            for n in range(0, n_quad):
-                index_i_quad = (index - index_first) * n_quad + n
-                V[index_i_quad] = self._G(i, j, l, self._quad_x[n])
+            row = (index - index_first) * n_quad
+            V[row:row + n_quad, 0] = self._G(i, j, l, self._quad_x[:n_quad])
         return V
 
     def _compute_M(self, n_index, n_quad, index_first, index_last, method):
         M = np.mat(np.zeros((n_index * n_quad, n_index * n_quad)))
         for index in range(index_first, index_last + 1):
             (x, j, l) = self._index2ijl[index]
+            row = (index - index_first) * n_quad
             for index1 in range(index_first, index_last + 1):
                 (i1, j1, l1) = self._index2ijl[index1]
                 fact = self.mean_intensity[j1] / self.mean_intensity[j]
-                for n in range(0, n_quad):
-                    for n1 in range(0, n_quad):
-                        if method == 'gauss' or method == 'gauss-':
-                            self._fill_M_for_gauss(M, method, n_quad,
-                                                   index_first, index, index1,
-                                                   j, l, j1, l1, fact,
-                                                   n, n1)
-
-                        elif method == 'log' or method == 'lin':
-                            self._fill_M_for_log_lin(M, method, n_quad,
-                                                     index_first, index, index1,
-                                                     j, l, j1, l1, fact,
-                                                     n, n1)
+                if method == 'gauss' or method == 'gauss-':
+                    block = self._M_block_for_gauss(method, n_quad,
+                                                    j, l, j1, l1, fact)
+                elif method == 'log' or method == 'lin':
+                    block = self._M_block_for_log_lin(n_quad,
+                                                      j, l, j1, l1, fact)
+                else:
+                    continue
+                col = (index1 - index_first) * n_quad
+                M[row:row + n_quad, col:col + n_quad] = block
         return M
 
-    def _fill_M_for_gauss(self, M, method, n_quad,
-                          index_first, index, index1,
-                          j, l, j1, l1, fact, n, n1):
-
-        def x_value(n_lower, n_greater, j_lower, j_greater, l_greater):
-            return self._mark_probabilities[j1][l1] * self._quad_w[n1] * \
-                   self._G(j_lower, j_greater, l_greater,
-                           self._quad_x[n_greater] - self._quad_x[n_lower])
-
-        if n > n1:
-            x = x_value(n1, n, j1, j, l)
+    def _M_block_for_gauss(self, method, n_quad, j, l, j1, l1, fact):
+        """Block of M of the rows of (j, l) and of the columns of (j1, l1),
+        for all pairs of quadrature points (n, n1)
+        """
+        quad_x = self._quad_x[:n_quad]
+        # lags[n, n1] = quad_x[n] - quad_x[n1]
+        lags = np.subtract.outer(quad_x, quad_x)
+        weights = self._mark_probabilities[j1][l1] * self._quad_w[:n_quad]
 
-        elif n < n1:
-            x = fact * x_value(n, n1, j, j1, l1)
+        # Values used when n >= n1 and when n <= n1
+        x_greater = weights * self._G(j1, j, l, np.maximum(lags, 0))
+        x_lower = fact * (weights * self._G(j, j1, l1, np.maximum(-lags, 0)))
 
-        else:
-            if method == 'gauss-':
-                x = 0
-            else:
-                x1 = x_value(n1, n, j1, j, l)
-                x2 = fact * x_value(n, n1, j, j1, l1)
-                x = (x1 + x2) / 2
+        block = np.where(np.tri(n_quad, k=-1, dtype=bool), x_greater, x_lower)
 
+        diagonal = np.arange(n_quad)
         if method == 'gauss-':
-            row = (index - index_first) * n_quad + n
-            col = (index1 - index_first) * n_quad + n
-            M[row, col] -= x
-
-        if l == l1 and j == j1 and n == n1:
-            x += 1
+            block[diagonal, diagonal] = 0
+            block[diagonal, diagonal] -= block.sum(axis=1)
+        else:
+            block[diagonal, diagonal] = (x_greater[diagonal, diagonal] +
+                                         x_lower[diagonal, diagonal]) / 2
 
-        row = (index - index_first) * n_quad + n
-        col = (index1 - index_first) * n_quad + n1
-        M[row, col] += x
+        if l == l1 and j == j1:
+            block[diagonal, diagonal] += 1
 
-    def _fill_M_for_log_lin(self, M, method, n_quad,
-                            index_first, index, index1,
-                            j, l, j1, l1, fact, n, n1):
+        return block
 
+    def _M_block_for_log_lin(self, n_quad, j, l, j1, l1, fact):
+        """Block of M of the rows of (j, l) and of the columns of (j1, l1),
+        for all pairs of quadrature points (n, n1)
+        """
+        quad_x = self._quad_x[:n_quad]
+        quad_w = self._quad_w[:n_quad]
         mark_probability = self._mark_probabilities[j1][l1]
 
-        ratio_dig = lambda n_q: (
-            (self._quad_x[n] - self._quad_x[n_q]) / self._quad_w[n_q]
-        )
-
-        ratio_dig2 = lambda n_q: 1. / self._quad_w[n_q]
-
-        dig_arg_greater = lambda n_q: (
-            j1, j, l,
-            self._quad_x[n] - self._quad_x[n_q] - self._quad_w[n_q],
-            self._quad_x[n] - self._quad_x[n_q])
-
-        dig_arg_lower = lambda n_q: (
-            j, j1, l1,
-            self._quad_x[n_q] - self._quad_x[n],
-            self._quad_x[n_q] - self._quad_x[n] + self._quad_w[n_q])
-
-        x = 0
-        if n > n1:
-            x += mark_probability * self._DIG(*dig_arg_greater(n1))
-
-            if n1 < n_quad - 1:
-                x -= ratio_dig(n1) * mark_probability * \
-                     self._DIG(*dig_arg_greater(n1))
-
-                x += ratio_dig2(n1) * mark_probability * \
-                     self._DIG2(*dig_arg_greater(n1))
-
-            if n1 > 0:
-                x += ratio_dig(n1 - 1) * mark_probability * \
-                     self._DIG(*dig_arg_greater(n1 - 1))
-
-                x -= ratio_dig2(n1 - 1) * mark_probability * \
-                     self._DIG2(*dig_arg_greater(n1 - 1))
-
-        elif n < n1:
-
-            x += fact * mark_probability * self._DIG(*dig_arg_lower(n1))
-
-            if n1 < n_quad - 1:
-                x -= fact * ratio_dig(n1) * mark_probability * \
-                     self._DIG(*dig_arg_lower(n1))
-
-                x -= fact * ratio_dig2(n1) * mark_probability * \
-                     self._DIG2(*dig_arg_lower(n1))
-
-            if n1 > 0:
-                x += fact * ratio_dig(n1 - 1) * mark_probability * \
-                     self._DIG(*dig_arg_lower(n1 - 1))
-
-                x += fact * ratio_dig2(n1 - 1) * mark_probability * \
-                     self._DIG2(*dig_arg_lower(n1 - 1))
-
-        elif n == n1:
-            x += fact * self._mark_probabilities[j1][l1] * \
-                 self._DIG(*dig_arg_lower(n1))
-
-            if n1 < n_quad - 1:
-                x -= fact * ratio_dig(n1) * mark_probability * \
-                     self._DIG(*dig_arg_lower(n1))
-
-                x -= fact * ratio_dig2(n1) * mark_probability * \
-                     self._DIG2(*dig_arg_lower(n1))
-
-            if n1 > 0:
-                x += ratio_dig(n1 - 1) * mark_probability * \
-                     self._DIG(*dig_arg_greater(n1 - 1))
-
-                x -= ratio_dig2(n1 - 1) * mark_probability * \
-                     self._DIG2(*dig_arg_greater(n1 - 1))
-
-        if l == l1 and j == j1 and n == n1:
-            x += 1
-
-        row = (index - index_first) * n_quad + n
-        col = (index1 - index_first) * n_quad + n1
-        M[row, col] += x
+        # All the arrays below are indexed by (n, n_q)
+        lags = np.subtract.outer(quad_x, quad_x)
+        ratio_dig = lags / quad_w
+        ratio_dig2 = np.broadcast_to(1. / quad_w, lags.shape)
+
+        dig_greater = self._DIG(j1, j, l, lags - quad_w, lags)
+        dig2_greater = self._DIG2(j1, j, l, lags - quad_w, lags)
+        dig_lower = self._DIG(j, j1, l1, -lags, -lags + quad_w)
+        dig2_lower = self._DIG2(j, j1, l1, -lags, -lags + quad_w)
+
+        def previous(values):
+            # Values taken at n_q - 1 instead of n_q
+            return np.hstack((np.zeros((n_quad, 1)), values[:, :-1]))
+
+        # Whether n1 < n_quad - 1 and whether n1 > 0
+        has_next = np.arange(n_quad) < n_quad - 1
+        has_previous = np.arange(n_quad) > 0
+
+        def if_next(values):
+            return np.where(has_next, values, 0.)
+
+        def if_previous(values):
+            return np.where(has_previous, values, 0.)
+
+        # Terms involving the claws of (j1, j, l), used when n >= n1
+        next_greater = \
+            - if_next(ratio_dig * mark_probability * dig_greater)
+        next_greater2 = \
+            if_next(ratio_dig2 * mark_probability * dig2_greater)
+        previous_greater = if_previous(
+            previous(ratio_dig) * mark_probability * previous(dig_greater))
+        previous_greater2 = - if_previous(
+            previous(ratio_dig2) * mark_probability * previous(dig2_greater))
+
+        # Terms involving the claws of (j, j1, l1), used when n <= n1
+        next_lower = \
+            - if_next(fact * ratio_dig * mark_probability * dig_lower)
+        next_lower2 = \
+            - if_next(fact * ratio_dig2 * mark_probability * dig2_lower)
+        previous_lower = if_previous(
+            fact * previous(ratio_dig) * mark_probability *
+            previous(dig_lower))
+        previous_lower2 = if_previous(
+            fact * previous(ratio_dig2) * mark_probability *
+            previous(dig2_lower))
+
+        x_greater = mark_probability * dig_greater + next_greater + \
+            next_greater2 + previous_greater + previous_greater2
+        x_lower = fact * mark_probability * dig_lower + next_lower + \
+            next_lower2 + previous_lower + previous_lower2
+        x_diagonal = fact * mark_probability * dig_lower + next_lower + \
+            next_lower2 + previous_greater + previous_greater2
+
+        n, n1 = np.indices((n_quad, n_quad))
+        block = np.where(n > n1, x_greater,
+                         np.where(n < n1, x_lower, x_diagonal))
+
+        if l == l1 and j == j1:
+            block[np.diag_indices(n_quad)] += 1
+
+        return block
 
     def _estimate_kernels_and_norms(self, i, index_first, index_last,
                                     res, n_quad, method):
@@ -110,6 +110,25 @@ class HawkesSumGaussians(LearnerHawkesNoParam):
         will stop.
         If None, it will be set given a heuristic which look at last
 
+    truncation_n_std : `float`, default=0
+        Number of standard deviations around their means beyond which
+        Gaussian basis functions are considered null when precomputing the
+        weights of the algorithm. Only pairs of events whose time lag is
+        lower than the mean of the last Gaussian plus this many standard
+        deviations are then considered, which makes this precomputation
+        linear in the number of events instead of quadratic. The error made
+        on each Gaussian is bounded by
+        :math:`e^{-n^2 / 2} / (\\sqrt{2 \\pi} \\sigma)`, where :math:`n`
+        is ``truncation_n_std``.
+        If 0, Gaussian functions are not truncated
+
+    weights_memory_budget : `int`, default=0
+        Maximum memory, in bytes, that the weights precomputed from the
+        events may use. If they need more, they are not stored and are
+        computed again at each iteration instead, which makes iterations
+        slower but needs memory that does not grow with the number of
+        events. If 0, weights are always stored
+
     Attributes
     ----------
     n_nodes : `int`
@@ -150,6 +169,12 @@ class HawkesSumGaussians(LearnerHawkesNoParam):
         "step_size": {
             "cpp_setter": "set_step_size"
         },
+        "truncation_n_std": {
+            "cpp_setter": "set_truncation_n_std"
+        },
+        "weights_memory_budget": {
+            "cpp_setter": "set_weights_memory_budget"
+        },
         "baseline": {"writable": False},
         "amplitudes": {"writable": False},
         "approx": {"writable": False}
@@ -159,7 +184,8 @@ class HawkesSumGaussians(LearnerHawkesNoParam):
                  C=1e3, lasso_grouplasso_ratio=0.5, max_iter=50,
                  tol=1e-5, n_threads=1, verbose=False, print_every=10,
                  record_every=10, approx=0, em_max_iter=30,
-                 em_tol=None):
+                 em_tol=None, truncation_n_std=0,
+                 weights_memory_budget=0):
 
         LearnerHawkesNoParam.__init__(self, verbose=verbose, max_iter=max_iter,
                                       print_every=print_every, tol=tol,
@@ -181,6 +207,8 @@ class HawkesSumGaussians(LearnerHawkesNoParam):
         self._learner = _HawkesSumGaussians(
             n_gaussians, max_mean_gaussian, step_size, strength_lasso,
             strength_grouplasso, em_max_iter, n_threads, approx)
+        self.truncation_n_std = truncation_n_std
+        self.weights_memory_budget = weights_memory_budget
 
         self.verbose = verbose
 
@@ -105,6 +105,11 @@ class LogisticRegression(LearnerGLM):
     def _construct_model_obj(self, fit_intercept=True):
         return ModelLogReg(fit_intercept)
 
+    def _intercept_only(self, labels):
+        # Logit of the frequency of label 1
+        p = np.mean(labels == 1)
+        return np.log(p / (1 - p))
+
     def _encode_labels_vector(self, labels):
         """Encodes labels values to canonical labels -1 and 1
 
@@ -149,6 +154,31 @@ class LogisticRegression(LearnerGLM):
         self : LearnerGLM
             The fitted instance of the model
         """
+        y = self._set_classes(y)
+        LearnerGLM.fit(self, X, y)
+
+    def fit_path(self, X: object, y: np.array, Cs=None, n_Cs: int = 20,
+                 eps: float = 1e-3, strong_rules: bool = False):
+        """Fit the model along a regularization path, with warm starts from
+        the smallest to the largest value of ``C``. See
+        `LearnerGLM.fit_path` for the description of the parameters
+
+        Returns
+        -------
+        Cs : `np.array`, shape=(n_Cs,)
+            The values of ``C`` of the path, sorted increasingly
+
+        coeffs_path : `np.ndarray`, shape=(n_Cs, n_coeffs)
+            The coefficients fitted for each value of ``C``, namely the
+            weights followed by the intercept if ``fit_intercept=True``
+        """
+        y = self._set_classes(y)
+        return LearnerGLM.fit_path(self, X, y, Cs=Cs, n_Cs=n_Cs, eps=eps,
+                                   strong_rules=strong_rules)
+
+    def _set_classes(self, y):
+        """Finds the two classes of labels y and returns them encoded
+        """
         self.classes = np.unique(y)
         if len(self.classes) != 2:
             raise ValueError('You wan only fit binary problems with '
@@ -163,9 +193,7 @@ class LogisticRegression(LearnerGLM):
             self.classes[1] = 1.
 
         # If classes are not in the canonical shape we must transform them
-        y = self._encode_labels_vector(y)
-
-        LearnerGLM.fit(self, X, y)
+        return self._encode_labels_vector(y)
 
     def decision_function(self, X):
         """
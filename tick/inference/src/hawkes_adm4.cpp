@@ -4,7 +4,7 @@
 
 HawkesADM4::HawkesADM4(const double decay, const double rho,
                        const int max_n_threads, const unsigned int optimization_level)
-    : ModelHawkesList(max_n_threads, optimization_level) {
+    : ModelHawkesList(max_n_threads, optimization_level), weights_stored(true) {
   set_decay(decay);
   set_rho(rho);
 }
@@ -16,9 +16,11 @@ void HawkesADM4::compute_weights() {
   unnormalized_next_C = ArrayDouble2d(n_realizations * n_nodes, n_nodes);
 
   kernel_integral = ArrayDouble(n_nodes);
+  weights_stored = weights_fit_in_budget(get_weights_size());
   g = ArrayDouble2dList2D(n_realizations);
   for (ulong r = 0; r < n_realizations; ++r) {
     g[r] = ArrayDouble2dList1D(n_nodes);
+    if (!weights_stored) continue;
     for (ulong u = 0; u < n_nodes; ++u) {
       g[r][u] = ArrayDouble2d(timestamps_list[r][u]->size(), n_nodes);
     }
@@ -47,11 +49,20 @@ void HawkesADM4::compute_weights_ru(const ulong r_u, ArrayDouble2d &map_kernel_i
   // Obtain realization and node index from r_u
   const ulong r = static_cast<const ulong>(r_u / n_nodes);
   const ulong u = r_u % n_nodes;
-  ArrayDouble2d g_ru = view(g[r][u]);
   const ArrayDouble timestamps_ru = view(*timestamps_list[r][u]);
   const double end_time_r = (*end_times)[r];
   ArrayDouble map_kernel_integral_r = view_row(map_kernel_integral, r);
 
+  if (!weights_stored) {
+    // g will be computed on the fly, only kernel_integral is filled
+    for (ulong k = 0; k < timestamps_ru.size(); k++) {
+      map_kernel_integral_r[u] += (1. - cexp(-decay * (end_time_r - timestamps_ru[k])));
+    }
+    return;
+  }
+
+  ArrayDouble2d g_ru = view(g[r][u]);
+
   for (ulong v = 0; v < n_nodes; v++) {
     const ArrayDouble timestamps_rv = view(*timestamps_list[r][v]);
     ulong ij = 0;
@@ -78,6 +89,11 @@ void HawkesADM4::compute_weights_ru(const ulong r_u, ArrayDouble2d &map_kernel_i
   }
 }
 
+ulong HawkesADM4::get_weights_size() const {
+  // g[r][u] has one row of size n_nodes per jump of node u in realization r
+  return n_jumps_per_realization->sum() * n_nodes;
+}
+
 // The main method for performing one iteration
 void HawkesADM4::solve(ArrayDouble &mu, ArrayDouble2d &adjacency,
                        ArrayDouble2d &z1, ArrayDouble2d &z2,
@@ -122,7 +138,6 @@ void HawkesADM4::estimate_ru(const ulong r_u,
   // Fetch corresponding data
   SArrayDoublePtrList1D &realization = timestamps_list[r];
   ArrayDouble adjacency_u = view_row(adjacency, node_u);
-  ArrayDouble2d g_ru = view(g[r][node_u]);
   double mu_u = mu[node_u];
 
   // initialize next data
@@ -130,11 +145,14 @@ void HawkesADM4::estimate_ru(const ulong r_u,
   ArrayDouble next_C_ru = view_row(next_C, r * n_nodes + node_u);
   ArrayDouble unnormalized_next_C_ru = view_row(unnormalized_next_C, r * n_nodes + node_u);
 
-  // We loop in reverse order to benefit from last_indices
-  for (ulong i = realization[node_u]->size() - 1; i != static_cast<ulong>(-1); i--) {
+  // Only used if g is not stored
+  HawkesExpKernSums kernel_sums(realization, node_u, decay, optimization_level);
+
+  for (ulong i = 0; i < realization[node_u]->size(); i++) {
     // this array will store temporary values
     unnormalized_next_C_ru.init_to_zero();
-    ArrayDouble g_ru_i = view_row(g_ru, i);
+    const ArrayDouble g_ru_i = weights_stored ? view_row(g[r][node_u], i)
+                                              : view(kernel_sums.next());
 
     // norm will be equal to mu_u + \sum_v \sum_(t_j < t_i) a_uv g(t_i - t_j)
     double norm = mu_u;
@@ -3,6 +3,7 @@
 
 #include "base.h"
 #include "base/hawkes_list.h"
+#include "hawkes_utils.h"
 
 /**
  * \class HawkesADM4
@@ -25,6 +26,10 @@ class HawkesADM4 : public ModelHawkesList {
   //! for realization r: g[r][u][i][v] = \sum_{t_j^v < t_i^u} g(t_i^u - t_j^v)
   ArrayDouble2dList2D g;
 
+  //! @brief Whether g is stored or computed on the fly at each iteration, depending on
+  //! weights_memory_budget
+  bool weights_stored;
+
   //! @brief Buffer variables used to compute p_ij
   ArrayDouble2d next_C, unnormalized_next_C;
 
@@ -45,6 +50,9 @@ class HawkesADM4 : public ModelHawkesList {
  private:
   void compute_weights_ru(const ulong r_u, ArrayDouble2d &map_kernel_integral);
 
+  //! @brief Number of values stored in g
+  ulong get_weights_size() const;
+
   void update_u(const ulong u, ArrayDouble &mu, ArrayDouble2d &adjacency, ArrayDouble2d &z1,
                 ArrayDouble2d &z2, ArrayDouble2d &u1, ArrayDouble2d &u2);
 
@@ -6,7 +6,8 @@
 #define Py_END_ALLOW_THREADS
 #endif
 
-#include "array.h"
+#include "hawkes_conditional_law.h"
+#include "parallel/parallel.h"
 
 #include <algorithm>
 
@@ -18,11 +19,17 @@
 //
 // where epsilon is infinitely small
 //
-void PointProcessCondLaw(ArrayDouble &y_time, ArrayDouble &y_mark,
-                         ArrayDouble &z_time, ArrayDouble &z_mark,
-                         ArrayDouble &lags,
-                         double zmin, double zmax,
-                         ArrayDouble &res_X, ArrayDouble &res_Y) {
+// This function does not take the GIL, hence it can be called concurrently
+// on different res_Y. The abscissa res_X are not filled, they are the middles
+// of the lags slices.
+//
+namespace {
+
+void cond_law_values(const ArrayDouble &y_time, const ArrayDouble &y_mark,
+                     const ArrayDouble &z_time, const ArrayDouble &z_mark,
+                     const ArrayDouble &lags,
+                     double zmin, double zmax,
+                     ArrayDouble &res_Y) {
   ulong y_index_lag;
   ulong y_index_lag_delta;
   double ytlag;
@@ -33,12 +40,7 @@ void PointProcessCondLaw(ArrayDouble &y_time, ArrayDouble &y_mark,
   ArrayDouble end_slice = ArrayDouble(N);
   ArrayULong tab_y_index = ArrayULong(N);
 
-  Py_BEGIN_ALLOW_THREADS
-
-  for (ulong i = 0; i < res_Y.size(); i++) {
-    res_Y[i] = 0;
-    res_X[i] = lags[i];
-  }
+  res_Y.init_to_zero();
 
   double count = 0;
 
@@ -77,7 +79,7 @@ void PointProcessCondLaw(ArrayDouble &y_time, ArrayDouble &y_mark,
 
     // Loop on the lag
     for (ulong k = 0; k < N; k++) {
-      lag = res_X[k];
+      lag = lags[k];
       y_index_lag = y_index_lag_delta;
 
       while (y_time[y_index_lag] <= z_t + lag) {
@@ -97,12 +99,101 @@ void PointProcessCondLaw(ArrayDouble &y_time, ArrayDouble &y_mark,
 
   for (ulong k = 0; k < N; k++) {
     res_Y[k] /= count;
-    res_Y[k] /= (end_slice[k] - res_X[k]);
+    res_Y[k] /= (end_slice[k] - lags[k]);
     res_Y[k] -= lambda;
-    res_X[k] = (end_slice[k] + res_X[k]) / 2.0;
   }
+}
+
+void cond_law_abscissa(const ArrayDouble &lags, ArrayDouble &res_X) {
+  for (ulong k = 0; k < lags.size() - 1; k++) {
+    res_X[k] = (lags[k + 1] + lags[k]) / 2.0;
+  }
+}
 
+// Conditional laws of several pairs of components of a realization, indexed
+// as (y_nodes[index], z_nodes[index], zmins[index], zmaxs[index]). Each of them
+// is computed by compute_index in its own row of res_Y, hence no lock is needed.
+class CondLawList {
+  const SArrayDoublePtrList1D &times, &counts, &marks;
+  const ArrayDouble &lags;
+  const ArrayULong &y_nodes, &z_nodes;
+  const ArrayDouble &zmins, &zmaxs;
+  ArrayDouble2d &res_Y;
+
+ public:
+  CondLawList(const SArrayDoublePtrList1D &times,
+              const SArrayDoublePtrList1D &counts,
+              const SArrayDoublePtrList1D &marks, const ArrayDouble &lags,
+              const ArrayULong &y_nodes, const ArrayULong &z_nodes,
+              const ArrayDouble &zmins, const ArrayDouble &zmaxs,
+              ArrayDouble2d &res_Y)
+      : times(times), counts(counts), marks(marks), lags(lags),
+        y_nodes(y_nodes), z_nodes(z_nodes), zmins(zmins), zmaxs(zmaxs),
+        res_Y(res_Y) {}
+
+  void compute_index(const ulong index) {
+    const ulong y = y_nodes[index];
+    const ulong z = z_nodes[index];
+    ArrayDouble res_Y_index = view_row(res_Y, index);
+    cond_law_values(view(*times[y]), view(*counts[y]),
+                    view(*times[z]), view(*marks[z]), lags,
+                    zmins[index], zmaxs[index], res_Y_index);
+  }
+};
+
+}  // namespace
+
+void PointProcessCondLaw(ArrayDouble &y_time, ArrayDouble &y_mark,
+                         ArrayDouble &z_time, ArrayDouble &z_mark,
+                         ArrayDouble &lags,
+                         double zmin, double zmax,
+                         ArrayDouble &res_X, ArrayDouble &res_Y) {
+  Py_BEGIN_ALLOW_THREADS
+  cond_law_values(y_time, y_mark, z_time, z_mark, lags, zmin, zmax, res_Y);
+  cond_law_abscissa(lags, res_X);
+  Py_END_ALLOW_THREADS
+}
+
+void PointProcessCondLawList(const SArrayDoublePtrList1D &times,
+                             const SArrayDoublePtrList1D &counts,
+                             const SArrayDoublePtrList1D &marks,
+                             ArrayDouble &lags,
+                             ArrayULong &y_nodes, ArrayULong &z_nodes,
+                             ArrayDouble &zmins, ArrayDouble &zmaxs,
+                             ArrayDouble &res_X, ArrayDouble2d &res_Y,
+                             const int n_threads) {
+  const ulong n_index = y_nodes.size();
+  if (z_nodes.size() != n_index || zmins.size() != n_index || zmaxs.size() != n_index) {
+    TICK_ERROR("y_nodes, z_nodes, zmins and zmaxs must have the same size");
+  }
+  if (res_Y.n_rows() != n_index || res_Y.n_cols() != lags.size() - 1
+      || res_X.size() != lags.size() - 1) {
+    TICK_ERROR("res_X and res_Y must have shapes (" << lags.size() - 1 << ",) and ("
+                   << n_index << ", " << lags.size() - 1 << ")");
+  }
+  for (ulong index = 0; index < n_index; ++index) {
+    if (y_nodes[index] >= times.size() || z_nodes[index] >= times.size()) {
+      TICK_ERROR("node index " << std::max(y_nodes[index], z_nodes[index])
+                     << " is out of range, realization has " << times.size() << " nodes");
+    }
+  }
+  if (counts.size() != times.size() || marks.size() != times.size()) {
+    TICK_ERROR("times, counts and marks must have the same number of nodes");
+  }
+
+  CondLawList cond_law_list(times, counts, marks, lags, y_nodes, z_nodes,
+                            zmins, zmaxs, res_Y);
+
+  std::exception_ptr eptr;
+  Py_BEGIN_ALLOW_THREADS
+  try {
+    parallel_run(n_threads, n_index, &CondLawList::compute_index, &cond_law_list);
+    cond_law_abscissa(lags, res_X);
+  } catch (...) {
+    eptr = std::current_exception();
+  }
   Py_END_ALLOW_THREADS
+  if (eptr != nullptr) std::rethrow_exception(eptr);
 }
 
 //
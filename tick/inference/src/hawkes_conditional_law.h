@@ -11,4 +11,18 @@ extern void PointProcessCondLaw(ArrayDouble &y_time, ArrayDouble &y_mark,
                                 double zmin, double zmax,
                                 ArrayDouble &res_X,  ArrayDouble &res_Y);
 
+// Computes, using n_threads threads and without holding the GIL, the
+// conditional laws of the components y_nodes[index] conditioned by the jumps of
+// the components z_nodes[index] whose marks are in [zmins[index], zmaxs[index]],
+// for all index. counts[i] are the cumulated number of jumps of component i
+// and marks[i] its cumulated marks. They are stored in the rows of res_Y.
+extern void PointProcessCondLawList(const SArrayDoublePtrList1D &times,
+                                    const SArrayDoublePtrList1D &counts,
+                                    const SArrayDoublePtrList1D &marks,
+                                    ArrayDouble &lags,
+                                    ArrayULong &y_nodes, ArrayULong &z_nodes,
+                                    ArrayDouble &zmins, ArrayDouble &zmaxs,
+                                    ArrayDouble &res_X, ArrayDouble2d &res_Y,
+                                    const int n_threads = 1);
+
 #endif  // TICK_INFERENCE_SRC_HAWKES_CONDITIONAL_LAW_H_
@@ -27,9 +27,11 @@ void HawkesSumGaussians::compute_weights() {
   unnormalized_next_C = ArrayDouble2d(n_realizations * n_nodes, n_nodes * n_gaussians);
 
   kernel_integral = ArrayDouble(n_nodes * n_gaussians);
+  weights_stored = weights_fit_in_budget(get_weights_size());
   g = ArrayDouble2dList2D(n_realizations);
   for (ulong r = 0; r < n_realizations; r++) {
     g[r] = ArrayDouble2dList1D(n_nodes);
+    if (!weights_stored) continue;
     for (ulong u = 0; u < n_nodes; u++) {
       g[r][u] = ArrayDouble2d(timestamps_list[r][u]->size(), n_nodes * n_gaussians);
     }
@@ -70,40 +72,85 @@ void HawkesSumGaussians::compute_weights_ru(const ulong r_u, ArrayDouble2d &map_
   // Obtain realization and node index from r_u
   const ulong r = static_cast<const ulong>(r_u / n_nodes);
   const ulong u = r_u % n_nodes;
-  ArrayDouble2d g_ru = view(g[r][u]);
-  g_ru.init_to_zero();
   const ArrayDouble timestamps_ru = view(*timestamps_list[r][u]);
   const double end_time_r = (*end_times)[r];
   ArrayDouble map_kernel_integral_r = view_row(map_kernel_integral, r);
 
-  for (ulong v = 0; v < n_nodes; v++) {
-    const ArrayDouble timestamps_rv = view(*timestamps_list[r][v]);
+  if (weights_stored) {
+    ArrayDouble2d g_ru = view(g[r][u]);
+    g_ru.init_to_zero();
+    ArrayULong ij_start(n_nodes), ij_end(n_nodes);
+    ij_start.init_to_zero();
+    ij_end.init_to_zero();
     for (ulong k = 0; k < timestamps_ru.size(); k++) {
-      const double t_ru_k = timestamps_ru[k];
       ArrayDouble g_ru_k = view_row(g_ru, k);
-      for (ulong m = 0; m < n_gaussians; m++) {
-        ulong ij = 0;
-        while ((ij < timestamps_rv.size()) && (timestamps_rv[ij] < t_ru_k)) {
-          g_ru_k[v * n_gaussians + m] +=
-              cexp(-(t_ru_k - timestamps_rv[ij] - means_gaussians[m])
-                       * (t_ru_k - timestamps_rv[ij] - means_gaussians[m])
-                       / (2. * std_gaussian_sq))
-                  / norm_constant_gauss;
-          ij++;
-        }
+      compute_g_ru_k(r, u, k, ij_start, ij_end, g_ru_k);
+    }
+  }
+
+  for (ulong k = 0; k < timestamps_ru.size(); k++) {
+    const double t_ru_k = timestamps_ru[k];
+    for (ulong m = 0; m < n_gaussians; m++) {
+      map_kernel_integral_r[u * n_gaussians + m] +=
+          0.5 * std::erf((end_time_r - t_ru_k - means_gaussians[m]) / norm_constant_erf)
+              + 0.5 * std::erf(means_gaussians[m] / norm_constant_erf);
+    }
+  }
+}
+
+void HawkesSumGaussians::compute_g_ru_k(const ulong r, const ulong u, const ulong k,
+                                        ArrayULong &ij_start, ArrayULong &ij_end,
+                                        ArrayDouble &g_ru_k) {
+  const double t_ru_k = (*timestamps_list[r][u])[k];
+
+  // If gaussian functions are truncated, only the lags lower than max_lag contribute to the
+  // weights and each lag only contributes to the gaussians whose means are closer than half_width
+  const bool truncate = truncation_n_std > 0;
+  const double half_width = truncation_n_std * std_gaussian;
+  const double max_lag = means_gaussians[n_gaussians - 1] + half_width;
+  const double means_spacing = max_mean_gaussian / n_gaussians;
+
+  for (ulong v = 0; v < n_nodes; v++) {
+    const ArrayDouble timestamps_rv = view(*timestamps_list[r][v]);
+    // Events of node v that contribute to the weights of t_ru_k are in [ij_start, ij_end). As
+    // timestamps are sorted, these bounds only move forward.
+    ulong &ij_start_v = ij_start[v];
+    ulong &ij_end_v = ij_end[v];
+
+    while ((ij_end_v < timestamps_rv.size()) && (timestamps_rv[ij_end_v] < t_ru_k)) ij_end_v++;
+    if (truncate) {
+      while ((ij_start_v < ij_end_v) && (t_ru_k - timestamps_rv[ij_start_v] > max_lag)) {
+        ij_start_v++;
       }
-      if (u == v) {
-        // We use this pass over the data to fill kernel_integral
-        for (ulong m = 0; m < n_gaussians; m++) {
-          map_kernel_integral_r[u * n_gaussians + m] +=
-              0.5 * std::erf((end_time_r - t_ru_k - means_gaussians[m]) / norm_constant_erf)
-                  + 0.5 * std::erf(means_gaussians[m] / norm_constant_erf);
+    }
+
+    for (ulong ij = ij_start_v; ij < ij_end_v; ij++) {
+      const double lag = t_ru_k - timestamps_rv[ij];
+
+      ulong m_min = 0, m_max = n_gaussians;
+      if (truncate) {
+        if (lag > half_width) {
+          m_min = static_cast<ulong>(std::ceil((lag - half_width) / means_spacing));
         }
+        m_max = std::min(n_gaussians,
+                         static_cast<ulong>(std::floor((lag + half_width) / means_spacing)) + 1);
+      }
+
+      for (ulong m = m_min; m < m_max; m++) {
+        g_ru_k[v * n_gaussians + m] +=
+            cexp(-(lag - means_gaussians[m]) * (lag - means_gaussians[m])
+                     / (2. * std_gaussian_sq))
+                / norm_constant_gauss;
       }
     }
   }
 }
 
+ulong HawkesSumGaussians::get_weights_size() const {
+  // g[r][u] has one row of size n_nodes * n_gaussians per jump of node u in realization r
+  return n_jumps_per_realization->sum() * n_nodes * n_gaussians;
+}
+
 // The main method for performing one iteration
 void HawkesSumGaussians::solve(ArrayDouble &mu, ArrayDouble2d &amplitudes) {
   if (!weights_computed) compute_weights();
@@ -142,7 +189,6 @@ void HawkesSumGaussians::estimate_ru(const ulong r_u,
   // Fetch corresponding data
   SArrayDoublePtrList1D &realization = timestamps_list[r];
   ArrayDouble amplitudes_u = view_row(amplitudes, node_u);
-  ArrayDouble2d g_ru = view(g[r][node_u]);
   double mu_u = mu[node_u];
 
   // initialize next data
@@ -150,11 +196,25 @@ void HawkesSumGaussians::estimate_ru(const ulong r_u,
   ArrayDouble next_C_ru = view_row(next_C, r * n_nodes + node_u);
   ArrayDouble unnormalized_next_C_ru = view_row(unnormalized_next_C, r * n_nodes + node_u);
 
-  // We loop in reverse order to benefit from last_indices
-  for (ulong i = realization[node_u]->size() - 1; i != static_cast<ulong>(-1); i--) {
+  // Only used if g is not stored, to compute its rows on the fly
+  ArrayDouble g_ru_buffer;
+  ArrayULong ij_start, ij_end;
+  if (!weights_stored) {
+    g_ru_buffer = ArrayDouble(n_nodes * n_gaussians);
+    ij_start = ArrayULong(n_nodes);
+    ij_start.init_to_zero();
+    ij_end = ArrayULong(n_nodes);
+    ij_end.init_to_zero();
+  }
+
+  for (ulong i = 0; i < realization[node_u]->size(); i++) {
     // this array will store temporary values
     unnormalized_next_C_ru.init_to_zero();
-    ArrayDouble g_ru_i = view_row(g_ru, i);
+    if (!weights_stored) {
+      g_ru_buffer.init_to_zero();
+      compute_g_ru_k(r, node_u, i, ij_start, ij_end, g_ru_buffer);
+    }
+    const ArrayDouble g_ru_i = weights_stored ? view_row(g[r][node_u], i) : view(g_ru_buffer);
 
     // norm will be equal to mu_u + \sum_v \sum_m a_uv^m \sum_(t_j < t_i) g_m(t_i - t_j)
     double norm = mu_u;
@@ -333,3 +393,15 @@ void HawkesSumGaussians::set_strength_grouplasso(const double strength_grouplass
   }
   this->strength_grouplasso = strength_grouplasso;
 }
+
+double HawkesSumGaussians::get_truncation_n_std() const {
+  return truncation_n_std;
+}
+
+void HawkesSumGaussians::set_truncation_n_std(const double truncation_n_std) {
+  if (truncation_n_std < 0) {
+    TICK_ERROR("truncation_n_std must be non negative, received " << truncation_n_std);
+  }
+  this->truncation_n_std = truncation_n_std;
+  weights_computed = false;
+}
@@ -26,6 +26,10 @@ class HawkesSumGaussians : public ModelHawkesList {
   double norm_constant_gauss = std_gaussian * std::sqrt(2.*M_PI);
   double norm_constant_erf = std_gaussian * std::sqrt(2);
 
+  //! @brief Number of standard deviations around its mean beyond which a gaussian function is
+  //! considered null when computing weights. If 0, gaussian functions are not truncated.
+  double truncation_n_std = 0;
+
   //! @brief Step size used in update formulas (7) and (8)
   double step_size;
 
@@ -49,6 +53,10 @@ class HawkesSumGaussians : public ModelHawkesList {
   //! for realization r: g[r][u][i][v*n_nodes+m] = \sum_{t_j^v < t_i^u} g_m(t_i^u - t_j^v)
   ArrayDouble2dList2D g;
 
+  //! @brief Whether g is stored or computed on the fly at each iteration, depending on
+  //! weights_memory_budget
+  bool weights_stored = true;
+
   //! @brief Buffer variables used to compute p_ij
   ArrayDouble2d next_C, unnormalized_next_C;
 
@@ -70,6 +78,16 @@ class HawkesSumGaussians : public ModelHawkesList {
  private:
   void compute_weights_ru(const ulong r_u, ArrayDouble2d &map_kernel_integral);
 
+  //! @brief Add to g_ru_k the weights of the k-th event of node u in realization r
+  //! \param ij_start : for each node v, first event of v that might contribute to these weights
+  //! \param ij_end : for each node v, first event of v that happened after the previous event of u
+  //! \note ij_start and ij_end are updated so that they can be reused for event k + 1
+  void compute_g_ru_k(const ulong r, const ulong u, const ulong k,
+                      ArrayULong &ij_start, ArrayULong &ij_end, ArrayDouble &g_ru_k);
+
+  //! @brief Number of values stored in g
+  ulong get_weights_size() const;
+
   void update_u(const ulong u, ArrayDouble &mu, ArrayDouble2d &amplitudes);
 
   void estimate_ru(const ulong r_u,
@@ -94,6 +112,8 @@ class HawkesSumGaussians : public ModelHawkesList {
   void set_strength_lasso(const double strength_lasso);
   double get_strength_grouplasso() const;
   void set_strength_grouplasso(const double strength_grouplasso);
+  double get_truncation_n_std() const;
+  void set_truncation_n_std(const double truncation_n_std);
 };
 
 #endif  // TICK_INFERENCE_SRC_HAWKES_SUMGAUSSIANS_H_
@@ -4,3 +4,12 @@
 
 extern void PointProcessCondLaw(ArrayDouble &y_time, ArrayDouble & y_mark, ArrayDouble & z_time, ArrayDouble & z_mark, ArrayDouble & lags,double zmin,double zmax, ArrayDouble & res_X, ArrayDouble & res_Y);
 
+
+extern void PointProcessCondLawList(const SArrayDoublePtrList1D &times,
+                                    const SArrayDoublePtrList1D &counts,
+                                    const SArrayDoublePtrList1D &marks,
+                                    ArrayDouble &lags,
+                                    ArrayULong &y_nodes, ArrayULong &z_nodes,
+                                    ArrayDouble &zmins, ArrayDouble &zmaxs,
+                                    ArrayDouble &res_X, ArrayDouble2d &res_Y,
+                                    const int n_threads = 1);
@@ -31,4 +31,6 @@ class HawkesSumGaussians : public ModelHawkesList {
   void set_strength_lasso(const double strength_lasso);
   double get_strength_grouplasso() const;
   void set_strength_grouplasso(const double strength_grouplasso);
+  double get_truncation_n_std() const;
+  void set_truncation_n_std(const double truncation_n_std);
 };
\ No newline at end of file
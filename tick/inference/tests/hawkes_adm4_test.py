@@ -44,6 +44,29 @@ class Test(unittest.TestCase):
         np.testing.assert_array_almost_equal(learner.adjacency, adjacency,
                                              decimal=6)
 
+    def test_hawkes_adm4_weights_memory_budget(self):
+        """...Test that HawkesADM4 gives the same solution when its weights
+        do not fit in weights_memory_budget
+        """
+        events = [np.array([1, 1.2, 3.4, 5.8, 10.3, 11, 13.4]),
+                  np.array([2, 5, 8.3, 9.10, 15, 18, 20, 33])]
+
+        def fit(weights_memory_budget):
+            learner = HawkesADM4(0.7, rho=0.5, C=10, max_iter=10,
+                                 verbose=False, em_max_iter=3,
+                                 weights_memory_budget=weights_memory_budget)
+            learner.fit(events, baseline_start=np.zeros(2) + .2,
+                        adjacency_start=np.zeros((2, 2)) + .2)
+            return learner
+
+        learner = fit(0)
+        learner_budget = fit(8)
+        self.assertEqual(learner_budget.weights_memory_budget, 8)
+        np.testing.assert_array_almost_equal(learner_budget.baseline,
+                                             learner.baseline, decimal=12)
+        np.testing.assert_array_almost_equal(learner_budget.adjacency,
+                                             learner.adjacency, decimal=12)
+
     def test_hawkes_adm4_set_data(self):
         """...Test set_data method of Hawkes ADM4
         """
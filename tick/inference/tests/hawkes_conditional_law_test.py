@@ -87,5 +87,25 @@ class Test(unittest.TestCase):
                                              [[0.42528942, -0.49200346],
                                               [-1.18794187, -6.19311372]])
 
+    def test_hawkes_conditional_law_n_threads(self):
+        """...Test HawkesConditionalLaw estimates are the same when
+        conditional laws of several realizations are computed with threads
+        """
+        timestamps_2 = [np.cumsum(random(randint(20, 25))) * 10
+                        for _ in range(self.dim)]
+
+        model = HawkesConditionalLaw(n_quad=5)
+        model.incremental_fit(self.timestamps, compute=False)
+        model.incremental_fit(timestamps_2)
+
+        model_threads = HawkesConditionalLaw(n_quad=5, n_threads=3)
+        model_threads.incremental_fit(self.timestamps, compute=False)
+        model_threads.incremental_fit(timestamps_2)
+
+        np.testing.assert_array_almost_equal(model_threads.kernels_norms,
+                                             model.kernels_norms)
+        np.testing.assert_array_almost_equal(model_threads.kernels,
+                                             model.kernels)
+
 if __name__ == "__main__":
     unittest.main()
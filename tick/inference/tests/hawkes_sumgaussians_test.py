@@ -75,6 +75,70 @@ class Test(unittest.TestCase):
                                              means_gaussians)
         self.assertEqual(learner.std_gaussian, std_gaussian)
 
+    def test_hawkes_sumgaussians_truncation(self):
+        """...Test that truncating Gaussian functions gives the same solution
+        up to the truncation error
+        """
+        np.random.seed(2039)
+        events = [np.cumsum(np.random.exponential(size=300)),
+                  np.cumsum(np.random.exponential(size=250))]
+
+        n_nodes = len(events)
+        n_gaussians = 4
+        baseline_start = np.zeros(n_nodes) + .2
+        amplitudes_start = np.zeros((n_nodes, n_nodes, n_gaussians)) + .2
+
+        def fit(truncation_n_std):
+            learner = HawkesSumGaussians(n_gaussians=n_gaussians,
+                                         max_mean_gaussian=5, step_size=1e-3,
+                                         C=10, n_threads=2, max_iter=10,
+                                         em_max_iter=3, verbose=False,
+                                         truncation_n_std=truncation_n_std)
+            learner.fit(events, baseline_start=baseline_start,
+                        amplitudes_start=amplitudes_start)
+            return learner
+
+        learner = fit(0)
+        learner_truncated = fit(8)
+        self.assertEqual(learner_truncated.truncation_n_std, 8)
+        np.testing.assert_array_almost_equal(learner_truncated.baseline,
+                                             learner.baseline, decimal=8)
+        np.testing.assert_array_almost_equal(learner_truncated.amplitudes,
+                                             learner.amplitudes, decimal=8)
+
+        msg = '^truncation_n_std must be non negative, received -1$'
+        with self.assertRaisesRegex(RuntimeError, msg):
+            learner.truncation_n_std = -1
+
+    def test_hawkes_sumgaussians_weights_memory_budget(self):
+        """...Test that HawkesSumGaussians gives the same solution when its
+        weights do not fit in weights_memory_budget
+        """
+        np.random.seed(2039)
+        events = [np.cumsum(np.random.exponential(size=100)),
+                  np.cumsum(np.random.exponential(size=80))]
+
+        n_nodes = len(events)
+        n_gaussians = 4
+
+        def fit(weights_memory_budget):
+            learner = HawkesSumGaussians(
+                n_gaussians=n_gaussians, max_mean_gaussian=5, step_size=1e-3,
+                C=10, n_threads=2, max_iter=10, em_max_iter=3, verbose=False,
+                weights_memory_budget=weights_memory_budget)
+            learner.fit(events, baseline_start=np.zeros(n_nodes) + .2,
+                        amplitudes_start=np.zeros(
+                            (n_nodes, n_nodes, n_gaussians)) + .2)
+            return learner
+
+        learner = fit(0)
+        learner_budget = fit(8)
+        self.assertEqual(learner_budget.weights_memory_budget, 8)
+        np.testing.assert_array_almost_equal(learner_budget.baseline,
+                                             learner.baseline, decimal=12)
+        np.testing.assert_array_almost_equal(learner_budget.amplitudes,
+                                             learner.amplitudes, decimal=12)
+
     def test_hawkes_sumgaussians_set_data(self):
         """...Test set_data method of Hawkes SumGaussians
         """
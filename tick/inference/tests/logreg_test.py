@@ -119,6 +119,66 @@ class Test(InferenceTest):
                 self.assertLess(learner._solver_obj.objective(coeffs_2),
                                 learner._solver_obj.objective(coeffs_1))
 
+    def test_LogisticRegression_fit_path(self):
+        """...Test LogisticRegression regularization path, with and without
+        strong rules
+        """
+        X, y = Test.get_train_data(n_features=30, n_samples=1000)
+
+        for penalty, fit_intercept in itertools.product(['l1', 'elasticnet'],
+                                                        [True, False]):
+            learner_kwargs = {'penalty': penalty, 'solver': 'agd',
+                              'fit_intercept': fit_intercept,
+                              'max_iter': 1000, 'tol': 1e-12,
+                              'verbose': False}
+            learner = LogisticRegression(**learner_kwargs)
+            Cs, coeffs_path = learner.fit_path(X, y, n_Cs=6)
+
+            n_coeffs = 31 if fit_intercept else 30
+            self.assertEqual(coeffs_path.shape, (6, n_coeffs))
+            np.testing.assert_array_equal(Cs, np.sort(Cs))
+            self.assertAlmostEqual(Cs[-1] / Cs[0], 1e3)
+            # Path starts at the solution of the intercept only model
+            np.testing.assert_almost_equal(coeffs_path[0, :30], 0)
+            if fit_intercept:
+                p = np.mean(y == 1)
+                self.assertAlmostEqual(coeffs_path[0, 30],
+                                       np.log(p / (1 - p)), places=5)
+            # Penalization decreases along the path
+            n_nonzeros = (coeffs_path[:, :30] != 0).sum(axis=1)
+            self.assertLess(n_nonzeros[0], n_nonzeros[-1])
+
+            # Learner is left fitted with the last C
+            self.assertAlmostEqual(learner.C, Cs[-1])
+            np.testing.assert_array_equal(learner.weights,
+                                          coeffs_path[-1, :30])
+
+            # Each point of the path is the solution of the problem
+            for C, coeffs in zip(Cs[[0, 3, 5]], coeffs_path[[0, 3, 5]]):
+                learner_C = LogisticRegression(C=C, **learner_kwargs)
+                learner_C.fit(X, y)
+                np.testing.assert_almost_equal(coeffs[:30],
+                                               learner_C.weights, decimal=5)
+
+            strong_learner = LogisticRegression(**learner_kwargs)
+            strong_Cs, strong_coeffs_path = strong_learner.fit_path(
+                X, y, Cs=Cs, strong_rules=True)
+            np.testing.assert_array_equal(strong_Cs, Cs)
+            np.testing.assert_almost_equal(strong_coeffs_path, coeffs_path,
+                                           decimal=5)
+            np.testing.assert_array_equal(strong_learner.weights,
+                                          strong_coeffs_path[-1, :30])
+
+        msg = '^Default values of ``Cs`` and strong rules are only ' \
+              'available for penalties with a l1 part, got penalty l2$'
+        with self.assertRaisesRegex(ValueError, msg):
+            LogisticRegression(penalty='l2').fit_path(X, y)
+
+        msg = '^SDCA cannot be warm started, hence cannot fit a ' \
+              'regularization path$'
+        with self.assertRaisesRegex(ValueError, msg):
+            LogisticRegression(solver='sdca').fit_path(X, y, Cs=[1., 10.])
+
     @staticmethod
     def specific_solver_kwargs(solver):
         """...A simple method to as systematically some kwargs to our tests
@@ -1,5 +1,8 @@
 import tick.base
+from tick.base.lazy_import import lazy_attributes
 
-from .history import History
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    ".history": ["History"],
+})
 
 __all__ = ["History"]
@@ -5,14 +5,94 @@ from tick.base import Base
 from numpy.linalg import norm
 
 
-def spars_func(coeffs, **kwargs):
-    eps = np.finfo(coeffs.dtype).eps
-    return np.sum(np.abs(coeffs) > eps, axis=None)
+def spars_func(x, **kwargs):
+    eps = np.finfo(x.dtype).eps
+    return np.sum(np.abs(x) > eps, axis=None)
+
+
+def _column_dtype(value):
+    if isinstance(value, (bool, np.bool_)):
+        return np.dtype(bool)
+    if isinstance(value, (int, np.integer)):
+        return np.dtype(np.int64)
+    if isinstance(value, (float, np.floating)):
+        return np.dtype(np.float64)
+    return np.dtype(object)
+
+
+class _Column(object):
+    """Values recorded in the history under one name, stored in a
+    preallocated array whose capacity doubles when it is full
+
+    If ``max_size`` is given, the column is a ring buffer that only keeps the
+    last ``max_size`` values.
+    """
+
+    def __init__(self, dtype, shape=(), max_size=None, capacity=16):
+        if max_size is not None:
+            if max_size < 1:
+                raise ValueError("A history buffer must keep at least one "
+                                 "value, got size %d" % max_size)
+            capacity = max_size
+        self._data = np.empty((capacity,) + shape, dtype=dtype)
+        self._max_size = max_size
+        self.n_appended = 0
+
+    def __len__(self):
+        return min(self.n_appended, len(self._data))
+
+    def append(self, value):
+        data = self._data
+        if data.ndim == 1:
+            dtype = np.promote_types(data.dtype, _column_dtype(value))
+            if dtype != data.dtype:
+                data = data.astype(dtype)
+        if self._max_size is None and self.n_appended == len(data):
+            grown = np.empty((2 * len(data),) + data.shape[1:],
+                             dtype=data.dtype)
+            grown[:len(data)] = data
+            data = grown
+        self._data = data
+
+        data[self.n_appended % len(data)] = value
+        self.n_appended += 1
+
+    def last(self):
+        return self._data[(self.n_appended - 1) % len(self._data)]
+
+    def array(self):
+        """Recorded values in chronological order, a view on the column
+        unless the ring buffer has wrapped around
+        """
+        if self.n_appended <= len(self._data):
+            return self._data[:self.n_appended]
+        start = self.n_appended % len(self._data)
+        return np.concatenate((self._data[start:], self._data[:start]))
 
 
 class History(Base):
     """A class to manage the history along iterations of a solver
 
+    Values recorded along iterations are stored in preallocated numpy arrays
+    whose capacity grows geometrically. Arrays given to the history (such as
+    the iterate ``x`` of solvers) are copied in two-dimensional arrays,
+    which may take a lot of memory for large models: they can be stored only
+    every ``iterates_every`` recorded iterations, only the last
+    ``iterates_buffer_size`` of them can be kept, or none at all. Values
+    derived from them (such as the distance to a minimizer or the sparsity)
+    can still be recorded at each iteration with `add_metric`.
+
+    Parameters
+    ----------
+    iterates_every : `int`, default=1
+        Arrays given to the history are stored every ``iterates_every``
+        recorded iterations, and at the last iteration of the solver. If 0,
+        they are not stored
+
+    iterates_buffer_size : `int`, default=None
+        If given, only the last ``iterates_buffer_size`` stored arrays are
+        kept
+
     Attributes
     ----------
     print_order : `list` or `str`
@@ -20,7 +100,10 @@ class History(Base):
 
     values : `dict`
         A `dict` containing the history. Key is the value name and
-        values are the values taken along the iterations
+        values are the values taken along the iterations, as a
+        `numpy.ndarray`. Stored arrays (such as ``x``) are given as
+        two-dimensional arrays, with one row per stored iteration (see
+        `get_iterates`)
 
     last_values : `dict`
         A `dict` containing all the last history values
@@ -45,6 +128,16 @@ class History(Base):
         the sparsity, the rank, among other things, of the iterates
         along iterations of the solver
 
+    _columns : `dict`
+        Storage of the recorded values, one `_Column` per name
+
+    _iterates_n_iter : `dict`
+        For each stored array name, a `_Column` of the iterations at which
+        it was stored
+
+    _n_records : `int`
+        Number of recorded iterations
+
     _n_iter : `int`
         The current iteration number
 
@@ -54,16 +147,16 @@ class History(Base):
     """
 
     _attrinfos = {
-        "values": {
-            "writable": False
-        },
         "last_values": {
             "writable": False
         },
     }
 
-    def __init__(self):
+    def __init__(self, iterates_every: int = 1,
+                 iterates_buffer_size: int = None):
         Base.__init__(self)
+        self.iterates_every = iterates_every
+        self.iterates_buffer_size = iterates_buffer_size
         self._minimum_col_width = 9
         self.print_order = ["n_iter", "obj", "step", "rel_obj"]
         # Instantiate values of the history
@@ -71,23 +164,12 @@ class History(Base):
 
         self._minimizer = None
         self._minimum = None
-        self._set("values", None)
         self._col_widths = None
         self._n_iter = None
 
         # History function to compute history values based on parameters
-        # used in a solver
-        history_func = {}
-        # history_func["n_iter"] = n_iter_func
-        # history_func["obj"] = obj_func
-        # history_func["step"] = step_func
-        # history_func["rel_obj"] = rel_obj_func
-        # history_func["n_epoch"] = n_epoch_func
-        # history_func["n_inner_prod"] = n_inner_prod_func
-        # history_func["norm"] = norm_func
-        # history_func["spars"] = spars_func
-        # history_func["rank"] = rank_func
-        self._history_func = history_func
+        # used in a solver, see add_metric
+        self._history_func = {}
 
         # Default print style of history values. Default is %.2e
         print_style = defaultdict(lambda: "%.2e")
@@ -100,13 +182,38 @@ class History(Base):
 
     def _clear(self):
         """Reset history values"""
-        self._set("values", defaultdict(list))
-
-    def _update(self, **kwargs):
+        self._columns = {}
+        self._iterates_n_iter = {}
+        self._n_records = 0
+
+    def _append(self, key, value, force=False):
+        column = self._columns.get(key)
+        if isinstance(value, np.ndarray) and value.ndim == 0:
+            value = value[()]
+        if isinstance(value, np.ndarray):
+            if self.iterates_every <= 0:
+                return
+            if not force and self._n_records % self.iterates_every != 0:
+                return
+            if column is None:
+                column = _Column(value.dtype, value.shape,
+                                 max_size=self.iterates_buffer_size)
+                self._columns[key] = column
+                self._iterates_n_iter[key] = _Column(
+                    np.int64, max_size=self.iterates_buffer_size)
+            self._iterates_n_iter[key].append(self._n_iter)
+        elif column is None:
+            column = _Column(_column_dtype(value))
+            self._columns[key] = column
+        column.append(value)
+
+    def _update(self, force=False, **kwargs):
         """Update the history along the iterations.
 
         For each keyword argument, we apply the history function corresponding
-        to this keyword, and use its results in the history
+        to this keyword, and use its results in the history. If force is
+        `True` (last record of a solver), arrays are stored whatever
+        ``iterates_every``, unless it is 0
         """
         self._n_iter = kwargs["n_iter"]
         history_func = self._history_func
@@ -117,40 +224,24 @@ class History(Base):
             # apply on all keywords
             if key in history_func:
                 func = history_func[key]
-                self.values[key].append(func(**kwargs))
+                self._append(key, func(**kwargs), force=force)
             # Either we only record the value
             else:
-                value = kwargs[key]
-                self.values[key].append(value)
-
-    # def set_print_order(self, *args):
-    #     """Allows to set the print order of the solver's history
-    #     """
-    #     self.set_params(print_order=list(args))
-    #     self.clear()
-    #     return self
-
-    # def update_history_func(self, **kwargs):
-    #     self._history_func.update(**kwargs)
-    #     self._clear()
-    #     return self
-
-    # def update_print_style(self, **kwargs):
-    #     self.print_style.update(**kwargs)
-    #     return self
+                self._append(key, kwargs[key], force=force)
+        self._n_records += 1
 
     def _format_last(self, name):
+        last_value = self._columns[name].last()
         try:
-            formatted_str = self._print_style[name] % \
-                            self.values[name][-1]
+            formatted_str = self._print_style[name] % last_value
         except TypeError:
-            formatted_str = str(self.values[name][-1])
+            formatted_str = str(last_value)
         return formatted_str
 
     def _print_history(self):
         """Verbose the current line of history
         """
-        values = self.values
+        columns = self._columns
         n_iter = self._n_iter
         print_order = self.print_order
         # If this is the first iteration, plot the history's column
@@ -158,7 +249,7 @@ class History(Base):
         if n_iter == 0:
             min_width = self._minimum_col_width
             line = ' | '.join(list([name.center(min_width) for name in
-                                    print_order if name in values]))
+                                    print_order if name in columns]))
             names = [name.center(min_width) for name in print_order]
             self._col_widths = list(map(len, names))
             print(line)
@@ -166,16 +257,79 @@ class History(Base):
         line = ' | '.join(list([self._format_last(name)
                                .rjust(col_widths[i])
                                 for i, name in enumerate(print_order)
-                                if name in values]))
+                                if name in columns]))
         print(line)
 
+    @property
+    def values(self):
+        return {key: column.array() for key, column in self._columns.items()}
+
     @property
     def last_values(self):
         last_values = {}
-        for key, hist in self.values.items():
-            last_values[key] = hist[-1]
+        for key, column in self._columns.items():
+            last_values[key] = column.last()
         return last_values
 
+    def get_iterates(self, name: str = "x"):
+        """Arrays stored in the history along with the iterations at which
+        they were stored
+
+        Parameters
+        ----------
+        name : `str`, default="x"
+            Name of the stored array, ``x`` is the iterate of solvers
+
+        Returns
+        -------
+        n_iter : `numpy.ndarray`, shape=(n_stored,)
+            Iterations at which the arrays were stored
+
+        iterates : `numpy.ndarray`, shape=(n_stored, ...)
+            The stored arrays
+        """
+        if name not in self._iterates_n_iter:
+            raise ValueError("No array %s is stored in history" % name)
+        return self._iterates_n_iter[name].array(), \
+            self._columns[name].array()
+
+    def add_metric(self, name: str, func, print_style: str = None,
+                   display: bool = True):
+        """Add a value computed at each recorded iteration from the values
+        given by the solver
+
+        This allows to follow a function of the iterate (such as its
+        sparsity) without storing it, see ``iterates_every``.
+
+        Parameters
+        ----------
+        name : `str`
+            Name of the value in history
+
+        func : `callable`
+            Function computing the value, it receives as keyword arguments
+            all values given by the solver (such as ``x`` the iterate,
+            ``obj`` or ``n_iter``) and must accept the others through
+            ``**kwargs``, e.g. ``lambda x, **kwargs: np.abs(x).max()``
+
+        print_style : `str`, default=None
+            Format of the value when printed. If None, ``%.2e`` is used
+
+        display : `bool`, default=True
+            If `True`, the value is printed along iterations
+
+        Notes
+        -----
+        The sparsity of the iterate is given by
+        ``history.add_metric("spars", spars_func)``
+        """
+        self._history_func[name] = func
+        if print_style is not None:
+            self._print_style[name] = print_style
+        print_order = self.print_order
+        if display and name not in print_order:
+            print_order.append(name)
+
     def set_minimizer(self, minimizer: np.ndarray):
         """Set the minimizer of the objective, to compute distance
         to it along iterations
@@ -191,11 +345,8 @@ class History(Base):
         which is printed along iterations
         """
         self._minimizer = minimizer.copy()
-        self._history_func["dist_coeffs"] = \
-            lambda x, **kwargs: norm(x - self._minimizer)
-        print_order = self.print_order
-        if "dist_coeffs" not in print_order:
-            print_order.append("dist_coeffs")
+        self.add_metric("dist_coeffs",
+                        lambda x, **kwargs: norm(x - self._minimizer))
 
     def set_minimum(self, minimum: float):
         """Set the minimum of the objective, to compute distance to the
@@ -212,11 +363,8 @@ class History(Base):
         is printed along iterations
         """
         self._minimum = minimum
-        self._history_func["dist_obj"] = \
-            lambda obj, **kwargs: obj - self._minimum
-        print_order = self.print_order
-        if "dist_obj" not in print_order:
-            print_order.append("dist_obj")
+        self.add_metric("dist_obj",
+                        lambda obj, **kwargs: obj - self._minimum)
 
     def _as_dict(self):
         dd = Base._as_dict(self)
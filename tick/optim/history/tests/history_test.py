@@ -0,0 +1,154 @@
+import unittest
+
+import numpy as np
+from numpy.linalg import norm
+
+from tick.optim.history import History
+from tick.optim.history.history import spars_func
+from tick.optim.model import ModelLinReg
+from tick.optim.prox import ProxL1
+from tick.optim.solver import GD
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(238924)
+        self.n_iter = 100
+        self.objs = np.random.rand(self.n_iter)
+        self.iterates = np.random.randn(self.n_iter, 5)
+
+    def record(self, history):
+        for n_iter in range(self.n_iter):
+            history._update(n_iter=n_iter, obj=self.objs[n_iter],
+                            x=self.iterates[n_iter], name='gd')
+        return history
+
+    def test_history_values(self):
+        """...Test that values recorded in history are given as arrays
+        """
+        history = self.record(History())
+
+        np.testing.assert_array_equal(history.values['n_iter'],
+                                      np.arange(self.n_iter))
+        self.assertEqual(history.values['n_iter'].dtype, np.int64)
+        np.testing.assert_array_equal(history.values['obj'], self.objs)
+        np.testing.assert_array_equal(history.values['x'], self.iterates)
+        self.assertEqual(list(history.values['name']), ['gd'] * self.n_iter)
+
+        last_values = history.last_values
+        self.assertEqual(last_values['n_iter'], self.n_iter - 1)
+        np.testing.assert_array_equal(last_values['x'], self.iterates[-1])
+
+        # Values of a column are promoted to the type of new values
+        history._update(n_iter=self.n_iter, obj=None)
+        self.assertIsNone(history.values['obj'][-1])
+        self.assertEqual(history.values['obj'][0], self.objs[0])
+
+        history._clear()
+        self.assertEqual(history.values, {})
+
+    def test_history_iterates(self):
+        """...Test that iterates are stored every iterates_every recorded
+        iterations and only the last ones in a ring buffer
+        """
+        history = self.record(History(iterates_every=7))
+        n_iter, iterates = history.get_iterates()
+        np.testing.assert_array_equal(n_iter, np.arange(0, self.n_iter, 7))
+        np.testing.assert_array_equal(iterates, self.iterates[::7])
+        self.assertEqual(len(history.values['obj']), self.n_iter)
+
+        history = self.record(History(iterates_every=3,
+                                      iterates_buffer_size=5))
+        n_iter, iterates = history.get_iterates()
+        np.testing.assert_array_equal(n_iter, np.arange(0, self.n_iter, 3)[-5:])
+        np.testing.assert_array_equal(iterates, self.iterates[::3][-5:])
+        np.testing.assert_array_equal(history.last_values['x'],
+                                      self.iterates[99])
+
+        history = self.record(History(iterates_every=0))
+        self.assertNotIn('x', history.values)
+        with self.assertRaisesRegex(ValueError, "No array x is stored"):
+            history.get_iterates()
+
+        with self.assertRaisesRegex(ValueError, "at least one value"):
+            self.record(History(iterates_buffer_size=0))
+
+    def test_history_forced_iterates(self):
+        """...Test that iterates of forced records, such as the last one of
+        a solver, are stored whatever iterates_every
+        """
+        history = History(iterates_every=7)
+        for n_iter in range(10):
+            history._update(n_iter=n_iter, x=self.iterates[n_iter],
+                            force=n_iter == 9)
+        n_iter, iterates = history.get_iterates()
+        np.testing.assert_array_equal(n_iter, [0, 7, 9])
+        np.testing.assert_array_equal(iterates, self.iterates[[0, 7, 9]])
+        np.testing.assert_array_equal(history.last_values['x'],
+                                      self.iterates[9])
+
+        history = History(iterates_every=0)
+        history._update(n_iter=0, x=self.iterates[0], force=True)
+        self.assertNotIn('x', history.values)
+
+        # Last iteration of a solver is recorded with its iterate
+        np.random.seed(238924)
+        X, y = np.random.randn(100, 10), np.random.randn(100)
+        model = ModelLinReg(fit_intercept=False).fit(X, y)
+        solver = GD(max_iter=25, verbose=False, step=1e-1, linesearch=False,
+                    record_every=10)
+        solver.set_model(model).set_prox(ProxL1(1e-1))
+        solver.history.iterates_every = 2
+        coeffs = solver.solve()
+
+        np.testing.assert_array_equal(solver.get_history('n_iter'),
+                                      [0, 10, 20, 25])
+        n_iter, iterates = solver.history.get_iterates()
+        np.testing.assert_array_equal(n_iter, [0, 20, 25])
+        np.testing.assert_array_equal(iterates[-1], coeffs)
+
+    def test_history_metrics(self):
+        """...Test that metrics computed from the iterates are recorded
+        when iterates are not stored
+        """
+        history = History(iterates_every=0)
+        minimizer = np.ones(5)
+        history.set_minimizer(minimizer)
+        history.add_metric("spars", spars_func)
+        history.add_metric("max_coeff", lambda x, **kwargs: x.max(),
+                           display=False)
+        self.record(history)
+
+        np.testing.assert_almost_equal(
+            history.values['dist_coeffs'],
+            norm(self.iterates - minimizer, axis=1))
+        np.testing.assert_array_equal(history.values['spars'],
+                                      [5] * self.n_iter)
+        np.testing.assert_array_equal(history.values['max_coeff'],
+                                      self.iterates.max(axis=1))
+        self.assertIn("spars", history.print_order)
+        self.assertNotIn("max_coeff", history.print_order)
+        self.assertNotIn('x', history.values)
+
+    def test_history_solver(self):
+        """...Test that a solver records its history without storing its
+        iterates if asked to
+        """
+        np.random.seed(238924)
+        X, y = np.random.randn(100, 10), np.random.randn(100)
+        model = ModelLinReg(fit_intercept=False).fit(X, y)
+
+        solver = GD(max_iter=20, verbose=False, step=1e-1, linesearch=False)
+        solver.set_model(model).set_prox(ProxL1(1e-1))
+        solver.history.iterates_every = 0
+        solver.history.add_metric("spars", spars_func)
+        coeffs = solver.solve()
+
+        self.assertEqual(len(solver.get_history('obj')), 21)
+        self.assertNotIn('x', solver.history.values)
+        self.assertEqual(solver.history.last_values['spars'],
+                         spars_func(coeffs))
+
+
+if __name__ == "__main__":
+    unittest.main()
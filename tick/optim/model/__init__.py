@@ -1,16 +1,16 @@
 import tick.base
+from tick.base.lazy_import import lazy_attributes
 
-from .linreg import ModelLinReg
-from .linreg_with_intercepts import ModelLinRegWithIntercepts
-from .logreg import ModelLogReg
-from .poisreg import ModelPoisReg
-
-from .coxreg_partial_lik import ModelCoxRegPartialLik
-
-from .hawkes_fixed_expkern_loglik import ModelHawkesFixedExpKernLogLik
-from .hawkes_fixed_expkern_leastsq import ModelHawkesFixedExpKernLeastSq
-from .hawkes_fixed_sumexpkern_leastsq import ModelHawkesFixedSumExpKernLeastSq
-
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    ".linreg": ["ModelLinReg"],
+    ".linreg_with_intercepts": ["ModelLinRegWithIntercepts"],
+    ".logreg": ["ModelLogReg"],
+    ".poisreg": ["ModelPoisReg"],
+    ".coxreg_partial_lik": ["ModelCoxRegPartialLik"],
+    ".hawkes_fixed_expkern_loglik": ["ModelHawkesFixedExpKernLogLik"],
+    ".hawkes_fixed_expkern_leastsq": ["ModelHawkesFixedExpKernLeastSq"],
+    ".hawkes_fixed_sumexpkern_leastsq": ["ModelHawkesFixedSumExpKernLeastSq"],
+})
 
 __all__ = ["ModelLinReg",
            "ModelLinRegWithIntercepts",
@@ -33,6 +33,11 @@ class Model(ABC, Base):
     n_passes_over_data : `int` (read-only)
         Number of effective passes through the data
 
+    dtype : `numpy.dtype` (read-only)
+        Floating point type in which the model stores its data and
+        expects the coefficients. Default is ``float64``, ``float32``
+        is supported by some models
+
     Notes
     -----
     This class should be not used by end-users, it is intended for
@@ -58,16 +63,23 @@ class Model(ABC, Base):
         },
         "_model": {
             "writable": False
+        },
+        "dtype": {
+            "writable": False
         }
     }
 
     # The name of the attribute that might contain the C++ model object
     _cpp_obj_name = "_model"
 
+    # Floating point types for which the model has a C++ implementation
+    _dtypes = (np.dtype("float64"),)
+
     def __init__(self):
         Base.__init__(self)
         self._fitted = False
         self._model = None
+        self.dtype = np.dtype("float64")
         setattr(self, N_CALLS_LOSS, 0)
         setattr(self, PASS_OVER_DATA, 0)
 
@@ -127,7 +139,7 @@ class Model(ABC, Base):
         self._inc_attr(N_CALLS_LOSS)
         self._inc_attr(PASS_OVER_DATA,
                        step=self.pass_per_operation[LOSS])
-        return self._loss(coeffs)
+        return self._loss(coeffs.astype(self.dtype, copy=False))
 
     @abstractmethod
     def _loss(self, coeffs: np.ndarray) -> float:
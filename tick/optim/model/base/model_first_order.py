@@ -93,11 +93,11 @@ class ModelFirstOrder(Model):
         if out is not None:
             grad = out
         else:
-            grad = np.empty(self.n_coeffs)
+            grad = np.empty(self.n_coeffs, dtype=self.dtype)
         self._inc_attr(N_CALLS_GRAD)
         self._inc_attr(PASS_OVER_DATA,
                        step=self.pass_per_operation[GRAD])
-        self._grad(coeffs, out=grad)
+        self._grad(coeffs.astype(self.dtype, copy=False), out=grad)
         return grad
 
     @abstractmethod
@@ -151,13 +151,14 @@ class ModelFirstOrder(Model):
         if out is not None:
             grad = out
         else:
-            grad = np.empty(self.n_coeffs)
+            grad = np.empty(self.n_coeffs, dtype=self.dtype)
 
         self._inc_attr(N_CALLS_LOSS_AND_GRAD)
         self._inc_attr(N_CALLS_LOSS)
         self._inc_attr(N_CALLS_GRAD)
         self._inc_attr(PASS_OVER_DATA,
                        step=self.pass_per_operation[LOSS_AND_GRAD])
+        coeffs = coeffs.astype(self.dtype, copy=False)
         loss = self._loss_and_grad(coeffs, out=grad)
         return loss, grad
 
@@ -1,9 +1,51 @@
 
+import weakref
+
 from . import ModelLabelsFeatures
 
 __author__ = 'Stephane Gaiffas'
 
 
+class _FeaturesNormSqCache(object):
+    """Squared norms of the rows of features matrices, kept as long as the
+    features matrix they were computed from is alive
+
+    Features matrices are identified by the object, not by their content:
+    this allows to fit several models on the same features (e.g. when
+    tuning the penalization level) while computing these norms once. A
+    features matrix modified inplace after a fit must be given again as a
+    new object.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def get(self, features):
+        entry = self._entries.get(id(features))
+        if entry is None:
+            return None
+        features_ref, norms = entry
+        if features_ref() is not features:
+            return None
+        return norms
+
+    def set(self, features, norms):
+        key = id(features)
+
+        def remove(_):
+            self._entries.pop(key, None)
+
+        try:
+            features_ref = weakref.ref(features, remove)
+        except TypeError:
+            # This object cannot be weakly referenced, hence is not cached
+            return
+        self._entries[key] = (features_ref, norms)
+
+
+_features_norm_sq_cache = _FeaturesNormSqCache()
+
+
 class ModelGeneralizedLinear(ModelLabelsFeatures):
     """An abstract base class for a generalized linear model (one-class
     supervised learning)
@@ -30,6 +72,10 @@ class ModelGeneralizedLinear(ModelLabelsFeatures):
     n_coeffs : `int` (read-only)
         Total number of coefficients of the model
 
+    features_norm_sq : `numpy.ndarray`, shape=(n_samples,) (read-only)
+        Squared l2 norm of each row of the features matrix. It is computed
+        once per features matrix and shared by all models fitted on it
+
     Notes
     -----
     This class should be not used by end-users, it is intended for
@@ -40,15 +86,48 @@ class ModelGeneralizedLinear(ModelLabelsFeatures):
         "fit_intercept": {
             "writable": True,
             "cpp_setter": "set_fit_intercept"
+        },
+        "_features_norm_sq": {
+            "writable": False
         }
     }
 
     def __init__(self, fit_intercept: bool = True):
         ModelLabelsFeatures.__init__(self)
         self.fit_intercept = fit_intercept
+        self._features_norm_sq = None
+
+    def fit(self, features, labels):
+        self._set("_features_norm_sq", None)
+        return ModelLabelsFeatures.fit(self, features, labels)
 
     def _get_n_coeffs(self):
         if self.fit_intercept:
             return self.n_features + 1
         else:
             return self.n_features
+
+    @property
+    def features_norm_sq(self):
+        if not self._fitted:
+            raise ValueError("call ``fit`` before using "
+                             "``features_norm_sq``")
+        return self._share_features_norm_sq()
+
+    def _share_features_norm_sq(self):
+        """Gives to the C++ model the squared norms of the features rows, that
+        are computed only if no model has computed them on these features yet
+
+        This is done the first time they are needed, not at fit, since many
+        solvers never use them
+        """
+        if self._features_norm_sq is None:
+            norms = _features_norm_sq_cache.get(self.features)
+            if norms is None:
+                # The C++ model computes and keeps them
+                norms = self._model.get_features_norm_sq()
+                _features_norm_sq_cache.set(self.features, norms)
+            else:
+                self._model.set_features_norm_sq(norms)
+            self._set("_features_norm_sq", norms)
+        return self._features_norm_sq
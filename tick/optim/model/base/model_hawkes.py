@@ -1,5 +1,8 @@
+from collections.abc import Iterator
+
 import numpy as np
 
+from tick.base import EventStore
 from .model_first_order import ModelFirstOrder
 from tick.optim.model.base.model import N_CALLS_LOSS, PASS_OVER_DATA
 
@@ -13,6 +16,10 @@ class ModelHawkes(ModelFirstOrder):
     development only.
     """
 
+    # Whether this model can be fitted on an iterator of realizations: only
+    # the weights of each realization are kept, not its timestamps
+    _streamable = False
+
     _attrinfos = {
         "approx": {
             "writable": False
@@ -46,22 +53,76 @@ class ModelHawkes(ModelFirstOrder):
 
         Parameters
         ----------
-        events : `list` of `list` of `np.ndarray`
+        events : `list` of `list` of `np.ndarray`, `EventStore` or iterator
             List of Hawkes processes realizations.
             Each realization of the Hawkes process is a list of n_node for
             each component of the Hawkes. Namely `events[i][j]` contains a
             one-dimensional `numpy.array` of the events' timestamps of
             component j of realization i.
-            If only one realization is given, it will be wrapped into a list
+            If only one realization is given, it will be wrapped into a list.
+            Realizations of an `EventStore` are used without copy.
+            Least-squares models also accept an iterator (such as a
+            generator) of realizations, which are then consumed one at a
+            time and not stored, see notes.
 
         end_times : `np.ndarray` or `float`, default = None
             List of end time of all hawkes processes that will be given to the
-            model. If None, it will be set to each realization's latest time.
+            model. If None, it will be set to each realization's latest time
+            (or to the end times of the `EventStore`).
             If only one realization is provided, then a float can be given.
+
+        Notes
+        -----
+        When realizations are given through an iterator, only the
+        sufficient statistics of each realization are accumulated. Memory
+        then does not depend on the number of realizations. Realizations
+        can be read lazily from disk, for instance with ``iter(store)`` for
+        an `EventStore`. As timestamps are not kept, the model must be
+        fitted again if its decays are changed.
         """
+        if isinstance(data, EventStore):
+            if end_times is None:
+                end_times = data.end_times
+            data = data.timestamps
+
         self._set('_end_times', end_times)
+        if isinstance(data, Iterator):
+            return self._fit_iterator(data)
         return ModelFirstOrder.fit(self, data)
 
+    def _fit_iterator(self, events_iterator):
+        """Fit the model with realizations given one at a time by an iterator
+        """
+        if not self._streamable:
+            raise ValueError("%s cannot be fitted on an iterator of "
+                             "realizations, give a list of realizations "
+                             "instead" % self.__class__.__name__)
+
+        end_times = self._end_times
+        if end_times is not None:
+            end_times = np.array(end_times, dtype=float).ravel()
+
+        self._set("data", None)
+        self._model.clear_data()
+
+        n_realizations = 0
+        for events in events_iterator:
+            end_time = None
+            if end_times is not None:
+                if n_realizations >= len(end_times):
+                    raise ValueError("More realizations than the %d end "
+                                     "times given" % len(end_times))
+                end_time = end_times[n_realizations]
+            self.incremental_fit(events, end_time=end_time)
+            n_realizations += 1
+
+        if n_realizations == 0:
+            raise ValueError("No realization was given by the iterator")
+        if end_times is not None and n_realizations != len(end_times):
+            raise ValueError("%d end times were given for %d realizations"
+                             % (len(end_times), n_realizations))
+        return self
+
     def _set_data(self, events):
         """Set the corresponding realization(s) of the process.
 
@@ -77,6 +77,13 @@ class ModelLabelsFeatures(Model):
         if n_samples != labels.shape[0]:
             raise ValueError(("Features has %i samples while labels "
                               "have %i" % (n_samples, labels.shape[0])))
+        # Data given in single precision is kept as such by models that
+        # have a float32 C++ counterpart
+        if features.dtype == np.float32 and features.dtype in self._dtypes:
+            self._set("dtype", np.dtype("float32"))
+            labels = labels.astype(np.float32, copy=False)
+        else:
+            self._set("dtype", np.dtype("float64"))
         self._set("features", features)
         self._set("labels", labels)
         self._set("n_features", n_features)
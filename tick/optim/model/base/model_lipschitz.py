@@ -42,6 +42,7 @@ class ModelLipschitz(Model):
             The maximum Lipschitz constant
         """
         if self._fitted:
+            self._prepare_lip()
             return self._model.get_lip_max()
         else:
             raise ValueError("call ``fit`` before calling ``get_lip_max``")
@@ -56,6 +57,7 @@ class ModelLipschitz(Model):
             The average Lipschitz constant
         """
         if self._fitted:
+            self._prepare_lip()
             return self._model.get_lip_mean()
         else:
             raise ValueError("call ``fit`` before using ``get_lip_max``")
@@ -80,6 +82,12 @@ class ModelLipschitz(Model):
         else:
             raise ValueError("call ``fit`` before calling ``get_lip_best``")
 
+    def _prepare_lip(self):
+        """Called before the C++ model computes the Lipschitz constants of
+        individual losses, can be overloaded in childs
+        """
+        pass
+
     @abstractmethod
     def _get_lip_best(self) -> float:
         """The method that actually does the computation. Must be overloaded
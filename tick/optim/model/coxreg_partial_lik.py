@@ -1,7 +1,7 @@
 import numpy as np
 from warnings import warn
 
-from tick.optim.model.base import Model, ModelFirstOrder
+from tick.optim.model.base import Model, ModelFirstOrder, LOSS_AND_GRAD
 from tick.optim.model.build.model import ModelCoxRegPartialLik \
     as _ModelCoxRegPartialLik
 
@@ -12,6 +12,17 @@ class ModelCoxRegPartialLik(ModelFirstOrder):
     This class gives first order information (gradient and loss) for
     this model.
 
+    Parameters
+    ----------
+    n_threads : `int`, default=1 (read-only)
+        Number of threads used for parallel computation. Samples are split
+        in as many contiguous blocks whose inner products and risk set sums
+        are computed in parallel.
+
+        * if ``int <= 0``: the number of physical cores available on
+          the CPU
+        * otherwise the desired number of threads
+
     Attributes
     ----------
     features : `numpy.ndarray`, shape=(n_samples, n_features), (read-only)
@@ -44,6 +55,12 @@ class ModelCoxRegPartialLik(ModelFirstOrder):
     There is no intercept in this model
     """
 
+    # Loss and gradient share their inner products and risk set sums, hence
+    # computing both needs only one pass over the data
+    pass_per_operation = \
+        {k: v for d in [ModelFirstOrder.pass_per_operation,
+                        {LOSS_AND_GRAD: 1}] for k, v in d.items()}
+
     _attrinfos = {
         "features": {
             "writable": False
@@ -65,11 +82,15 @@ class ModelCoxRegPartialLik(ModelFirstOrder):
         },
         "censoring_rate": {
             "writable": False
+        },
+        "n_threads": {
+            "writable": False
         }
     }
 
-    def __init__(self):
+    def __init__(self, n_threads: int = 1):
         ModelFirstOrder.__init__(self)
+        self.n_threads = n_threads
         self.features = None
         self.times = None
         self.censoring = None
@@ -124,7 +145,8 @@ class ModelCoxRegPartialLik(ModelFirstOrder):
         self._set("n_features", n_features)
         self._set("_model", _ModelCoxRegPartialLik(self.features,
                                                    self.times,
-                                                   self.censoring))
+                                                   self.censoring,
+                                                   self.n_threads))
 
     def _grad(self, coeffs: np.ndarray, out: np.ndarray) -> None:
         self._model.grad(coeffs, out)
@@ -132,6 +154,9 @@ class ModelCoxRegPartialLik(ModelFirstOrder):
     def _loss(self, coeffs: np.ndarray) -> float:
         return self._model.loss(coeffs)
 
+    def _loss_and_grad(self, coeffs: np.ndarray, out: np.ndarray) -> float:
+        return self._model.loss_and_grad(coeffs, out)
+
     def _get_n_coeffs(self, *args, **kwargs):
         return self.n_features
 
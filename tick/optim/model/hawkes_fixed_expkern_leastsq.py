@@ -76,6 +76,8 @@ class ModelHawkesFixedExpKernLeastSq(ModelHawkes):
         {k: v for d in [ModelHawkes.pass_per_operation,
                         {LOSS_AND_GRAD: 2}] for k, v in d.items()}
 
+    _streamable = True
+
     _attrinfos = {
         "decays": {
             "writable": True,
@@ -139,14 +141,16 @@ class ModelHawkesFixedExpKernLeastSq(ModelHawkes):
         Data is not stored, so this might be useful if the list of all
         realizations does not fit in memory
         """
-        ModelHawkes.incremental_fit(self, events, end_time=end_time)
-
-        # self.n_nodes will have correct value once data has been given to model
+        # Weights are computed right away, hence decays must be set with the
+        # right shape beforehand
         decays = self.decays
         if isinstance(decays, (int, float)):
-            decays_matrix = np.zeros((self.n_nodes, self.n_nodes)) + decays
+            n_nodes = len(events)
+            decays_matrix = np.zeros((n_nodes, n_nodes)) + decays
             self._model.set_decays(decays_matrix)
 
+        ModelHawkes.incremental_fit(self, events, end_time=end_time)
+
     def hessian(self, x):
         """Return model's hessian
 
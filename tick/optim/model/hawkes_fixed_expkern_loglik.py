@@ -57,6 +57,14 @@ class ModelHawkesFixedExpKernLogLik(ModelHawkes,
           the CPU
         * otherwise the desired number of threads
 
+    weights_memory_budget : `int`, default=0
+        Maximum memory, in bytes, that the weights precomputed from the
+        events may use. If they need more, they are not stored and are
+        computed again at each pass over the data instead, which is slower
+        but needs memory that does not grow with the number of events.
+        Stochastic solvers cannot be used in this case, as ``loss_i`` and
+        ``grad_i`` need stored weights. If 0, weights are always stored
+
     Attributes
     ----------
     n_nodes : `int` (read-only)
@@ -76,14 +84,19 @@ class ModelHawkesFixedExpKernLogLik(ModelHawkes,
         "decay": {
             "cpp_setter": "set_decay"
         },
+        "weights_memory_budget": {
+            "cpp_setter": "set_weights_memory_budget"
+        },
     }
 
-    def __init__(self, decay: float, n_threads: int = 1):
+    def __init__(self, decay: float, n_threads: int = 1,
+                 weights_memory_budget: int = 0):
         ModelHawkes.__init__(self, n_threads=1, approx=0)
         ModelSecondOrder.__init__(self)
         ModelSelfConcordant.__init__(self)
         self.decay = decay
         self._model = _ModelHawkesFixedExpKernLogLik(decay, n_threads)
+        self.weights_memory_budget = weights_memory_budget
 
     def fit(self, events, end_times=None):
         """Set the corresponding realization(s) of the process.
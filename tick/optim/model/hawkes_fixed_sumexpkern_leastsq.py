@@ -75,6 +75,8 @@ class ModelHawkesFixedSumExpKernLeastSq(ModelHawkes):
         {k: v for d in [ModelHawkes.pass_per_operation,
                         {LOSS_AND_GRAD: 2}] for k, v in d.items()}
 
+    _streamable = True
+
     _attrinfos = {
         "decays": {
             "writable": True,
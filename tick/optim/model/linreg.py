@@ -1,7 +1,9 @@
 import numpy as np
 from numpy.linalg import svd
-from .base import ModelGeneralizedLinear, ModelFirstOrder, ModelLipschitz
-from .build.model import ModelLinReg as _ModelLinReg
+from .base import ModelGeneralizedLinear, ModelFirstOrder, ModelLipschitz, \
+    LOSS_AND_GRAD
+from .build.model import ModelLinReg as _ModelLinReg, \
+    ModelLinRegFloat as _ModelLinRegFloat
 
 
 __author__ = 'Stephane Gaiffas'
@@ -41,8 +43,19 @@ class ModelLinReg(ModelFirstOrder,
         * if ``int <= 0``: the number of physical cores available on
           the CPU
         * otherwise the desired number of threads
+
+    Notes
+    -----
+    Features given as ``float32`` arrays are handled in single
+    precision, the model ``dtype`` is then ``float32``
     """
 
+    _dtypes = (np.dtype("float64"), np.dtype("float32"))
+
+    pass_per_operation = \
+        {k: v for d in [ModelFirstOrder.pass_per_operation,
+                        {LOSS_AND_GRAD: 1}] for k, v in d.items()}
+
     def __init__(self, fit_intercept: bool = True, n_threads: int = 1):
         ModelFirstOrder.__init__(self)
         ModelGeneralizedLinear.__init__(self, fit_intercept)
@@ -70,18 +83,30 @@ class ModelLinReg(ModelFirstOrder,
         ModelFirstOrder.fit(self, features, labels)
         ModelGeneralizedLinear.fit(self, features, labels)
         ModelLipschitz.fit(self, features, labels)
-        self._set("_model", _ModelLinReg(self.features,
-                                         self.labels,
-                                         self.fit_intercept,
-                                         self.n_threads))
+        if self.dtype == np.float32:
+            model_class = _ModelLinRegFloat
+        else:
+            model_class = _ModelLinReg
+        self._set("_model", model_class(self.features,
+                                        self.labels,
+                                        self.fit_intercept,
+                                        self.n_threads))
         return self
 
+    def _prepare_lip(self):
+        # Lipschitz constants are computed from the squared norms of the
+        # features rows
+        self._share_features_norm_sq()
+
     def _grad(self, coeffs: np.ndarray, out: np.ndarray) -> None:
         self._model.grad(coeffs, out)
 
     def _loss(self, coeffs: np.ndarray) -> float:
         return self._model.loss(coeffs)
 
+    def _loss_and_grad(self, coeffs: np.ndarray, out: np.ndarray) -> float:
+        return self._model.loss_and_grad(coeffs, out)
+
     def _get_lip_best(self):
         # TODO: Use sklearn.decomposition.TruncatedSVD instead?
         s = svd(self.features, full_matrices=False,
@@ -1,7 +1,7 @@
 import numpy as np
 from numpy.linalg import svd
 from .base import ModelGeneralizedLinearWithIntercepts, ModelFirstOrder, \
-    ModelLipschitz
+    ModelLipschitz, LOSS_AND_GRAD
 from .build.model import ModelLinRegWithIntercepts as _ModelLinRegWithIntercepts
 
 
@@ -39,6 +39,10 @@ class ModelLinRegWithIntercepts(ModelFirstOrder,
         * otherwise the desired number of threads
     """
 
+    pass_per_operation = \
+        {k: v for d in [ModelFirstOrder.pass_per_operation,
+                        {LOSS_AND_GRAD: 1}] for k, v in d.items()}
+
     def __init__(self, n_threads: int = 1):
         ModelFirstOrder.__init__(self)
         ModelGeneralizedLinearWithIntercepts.__init__(self)
@@ -76,6 +80,9 @@ class ModelLinRegWithIntercepts(ModelFirstOrder,
     def _loss(self, coeffs: np.ndarray) -> float:
         return self._model.loss(coeffs)
 
+    def _loss_and_grad(self, coeffs: np.ndarray, out: np.ndarray) -> float:
+        return self._model.loss_and_grad(coeffs, out)
+
     def _get_lip_best(self):
         s = svd(self.features, full_matrices=False,
                 compute_uv=False)[0] ** 2
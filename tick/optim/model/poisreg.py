@@ -5,7 +5,7 @@ from .build.model import LinkType_exponential as exponential
 
 import numpy as np
 from .base import ModelGeneralizedLinear, ModelFirstOrder, ModelSecondOrder, \
-    ModelSelfConcordant
+    ModelSelfConcordant, LOSS_AND_GRAD
 
 
 __author__ = 'Stephane Gaiffas'
@@ -70,6 +70,10 @@ class ModelPoisReg(ModelGeneralizedLinear,
     ``link="exponential"``
     """
 
+    pass_per_operation = \
+        {k: v for d in [ModelSecondOrder.pass_per_operation,
+                        {LOSS_AND_GRAD: 1}] for k, v in d.items()}
+
     _attrinfos = {
         "_link_type": {
             "writable": False
@@ -122,6 +126,9 @@ class ModelPoisReg(ModelGeneralizedLinear,
     def _loss(self, coeffs: np.ndarray) -> float:
         return self._model.loss(coeffs)
 
+    def _loss_and_grad(self, coeffs: np.ndarray, out: np.ndarray) -> float:
+        return self._model.loss_and_grad(coeffs, out)
+
     @property
     def link(self):
         return self._link
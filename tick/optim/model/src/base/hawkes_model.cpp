@@ -4,7 +4,7 @@
 ModelHawkes::ModelHawkes(const int max_n_threads,
                          const unsigned int optimization_level) :
     optimization_level(optimization_level),
-    weights_computed(false), n_nodes(0) {
+    weights_computed(false), weights_memory_budget(0), n_nodes(0) {
   set_n_threads(max_n_threads);
   n_jumps_per_node = SArrayULong::new_ptr(n_nodes);
 }
@@ -20,3 +20,8 @@ void ModelHawkes::set_n_threads(const int max_n_threads) {
   this->max_n_threads = max_n_threads >= 1 ? static_cast<unsigned int>(max_n_threads)
                                            : std::thread::hardware_concurrency();
 }
+
+void ModelHawkes::set_weights_memory_budget(const ulong weights_memory_budget) {
+  this->weights_memory_budget = weights_memory_budget;
+  weights_computed = false;
+}
@@ -21,6 +21,10 @@ class ModelHawkes : public Model {
   //! @brief Weather precomputations are up to date of not.
   bool weights_computed;
 
+  //! @brief Maximum memory (in bytes) that precomputed weights may use, 0 meaning no limit.
+  //! Models whose weights would exceed it compute them on the fly when they are needed.
+  ulong weights_memory_budget;
+
   //! @brief n_nodes (number of components in the realization)
   ulong n_nodes;
 
@@ -44,10 +48,21 @@ class ModelHawkes : public Model {
 
   SArrayULongPtr get_n_jumps_per_node() const { return n_jumps_per_node; }
 
+  ulong get_weights_memory_budget() const { return weights_memory_budget; }
+
+  //! @brief Set the maximum memory (in bytes) that precomputed weights may use
+  //! \note Weights will need to be recomputed
+  void set_weights_memory_budget(const ulong weights_memory_budget);
+
  protected:
   //! @brief set n_nodes
   void set_n_nodes(const ulong n_nodes);
 
+  //! @brief Whether weights made of n_values doubles fit in weights_memory_budget
+  bool weights_fit_in_budget(const ulong n_values) const {
+    return weights_memory_budget == 0 || n_values * sizeof(double) <= weights_memory_budget;
+  }
+
   //! @brief Custom exponential function taking into account optimization
   //! level
   //! \param x : The value exponential is computed at
@@ -23,6 +23,8 @@ void ModelHawkesSingle::set_data(const SArrayDoublePtrList1D &timestamps,
   n_total_jumps = n_jumps_per_node->sum();
 
   for (ulong i = 0; i < n_nodes; ++i) {
+    // Nodes might have no jump
+    if (timestamps[i]->size() == 0) continue;
     double last_time_i = (*timestamps[i])[timestamps[i]->size() - 1];
     if (end_time < last_time_i) {
       TICK_ERROR("Provided end_time (" << end_time << ") is smaller than last time of component "
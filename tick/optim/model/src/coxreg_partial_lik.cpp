@@ -11,10 +11,12 @@
 
 ModelCoxRegPartialLik::ModelCoxRegPartialLik(const SBaseArrayDouble2dPtr features,
                                              const SArrayDoublePtr times_,
-                                             const SArrayUShortPtr censoring_) {
+                                             const SArrayUShortPtr censoring_,
+                                             const int n_threads) {
     n_samples = features->n_rows();
     n_features = features->n_cols();
     n_failures = 0;
+    this->n_threads = n_threads >= 1 ? n_threads : std::thread::hardware_concurrency();
 
     // Make copies for times_ and censoring_ (we keep sorted versions of them, but not for
     // the features, as it might get very large)
@@ -24,8 +26,16 @@ ModelCoxRegPartialLik::ModelCoxRegPartialLik(const SBaseArrayDouble2dPtr feature
 
     // Will contain inner products for loss and gradient computations
     inner_prods = ArrayDouble(n_samples);
+    exp_inner_prods = ArrayDouble(n_samples);
+
+    const ulong n_blocks = get_n_blocks();
+    block_max_inner_prod = ArrayDouble(n_blocks);
+    block_s0 = ArrayDouble(n_blocks);
+    block_loss = ArrayDouble(n_blocks);
+    block_sum_inv_s0 = ArrayDouble(n_blocks);
     // Used for gradient computations
-    s1 = ArrayDouble(n_features);
+    block_s1 = ArrayDouble2d(n_blocks, n_features);
+    block_grad = ArrayDouble2d(n_blocks, n_features);
 
     // Get the indices that sort the times by decreasing order in idx
     idx = ArrayULong(n_samples);
@@ -63,91 +73,132 @@ ModelCoxRegPartialLik::ModelCoxRegPartialLik(const SBaseArrayDouble2dPtr feature
 
 
 double ModelCoxRegPartialLik::loss(const ArrayDouble &coeffs) {
-    const ulong n_failures_minus_one = n_failures - 1;
-    // Compute all the inner products and maintain the maximal one
-    double max_inner_prod = -DBL_MAX;
-    for (ulong i = 0; i < n_samples; ++i) {
-        const double inner_prod = get_feature(i).dot(coeffs);
-        inner_prods[i] = inner_prod;
-        if (inner_prod > max_inner_prod) {
-            max_inner_prod = inner_prod;
-        }
-    }
-    double log_lik = 0;
-    double s = DBL_MIN;
-    const ulong idx0 = get_idx_failure(0);
-    for (ulong i = 0; i <= idx0; ++i) {
-        const double diff = inner_prods[i] - max_inner_prod;
-        s += exp(diff);
+    ArrayDouble unused_grad;
+    return compute_loss_and_grad(coeffs, unused_grad, false);
+}
+
+void ModelCoxRegPartialLik::grad(const ArrayDouble &coeffs, ArrayDouble &out) {
+    compute_loss_and_grad(coeffs, out, true);
+}
+
+double ModelCoxRegPartialLik::loss_and_grad(const ArrayDouble &coeffs, ArrayDouble &out) {
+    return compute_loss_and_grad(coeffs, out, true);
+}
+
+ulong ModelCoxRegPartialLik::get_n_blocks() const {
+    return std::max(std::min(static_cast<ulong>(n_threads), n_samples), 1ul);
+}
+
+double ModelCoxRegPartialLik::compute_loss_and_grad(const ArrayDouble &coeffs,
+                                                    ArrayDouble &out,
+                                                    const bool compute_grad) {
+    const ulong n_blocks = get_n_blocks();
+
+    // Compute first all inner products and keep the maximum (to avoid overflow)
+    parallel_run(n_threads, n_blocks,
+                 &ModelCoxRegPartialLik::compute_inner_prods_block, this, coeffs);
+    const double max_inner_prod = block_max_inner_prod.max();
+
+    parallel_run(n_threads, n_blocks,
+                 &ModelCoxRegPartialLik::compute_exp_inner_prods_block, this, max_inner_prod);
+
+    // Sum of exp_inner_prods over the previous blocks, initialized to a very small positive
+    // number (to avoid division by 0 in weird cases)
+    ArrayDouble s0_offsets(n_blocks);
+    s0_offsets[0] = DBL_MIN;
+    for (ulong b = 1; b < n_blocks; ++b) {
+        s0_offsets[b] = s0_offsets[b - 1] + block_s0[b - 1];
     }
-    for (ulong k = 0; k < n_failures; ++k) {
-        const ulong idx = get_idx_failure(k);
-        log_lik += log(s) - inner_prods[idx] + max_inner_prod;
-        if (k != n_failures_minus_one) {
-            const ulong idx_next = get_idx_failure(k + 1) + 1;
-            for (ulong i = idx + 1; i < idx_next; ++i) {
-                const double diff = inner_prods[i] - max_inner_prod;
-                if (diff > DBL_MIN_EXP) {
-                    s += exp(diff);
-                }
-            }
+
+    parallel_run(n_threads, n_blocks,
+                 &ModelCoxRegPartialLik::compute_loss_and_grad_block, this,
+                 s0_offsets, max_inner_prod, compute_grad);
+
+    if (compute_grad) {
+        // The risk sets of the failures of block b also contain the samples of the previous
+        // blocks, whose sum of x_i * exp_inner_prods[i] is accumulated in s1_offset
+        out.init_to_zero();
+        ArrayDouble s1_offset(n_features);
+        s1_offset.init_to_zero();
+        for (ulong b = 0; b < n_blocks; ++b) {
+            out.mult_incr(view_row(block_grad, b), 1.);
+            out.mult_incr(s1_offset, block_sum_inv_s0[b]);
+            s1_offset.mult_incr(view_row(block_s1, b), 1.);
         }
+        out /= n_failures;
     }
-    return log_lik / n_failures;
+
+    return block_loss.sum() / n_failures;
 }
 
-void ModelCoxRegPartialLik::grad(const ArrayDouble &coeffs, ArrayDouble &out) {
-    const ulong n_failures_minus_one = n_failures - 1;
-    // grad must be filled with 0
-    out.init_to_zero();
-    s1.init_to_zero();
-    inner_prods.init_to_zero();
-
-    // Initialize s to a very small positive number (to avoid division by
-    // 0 in weird cases)
-    double s2 = DBL_MIN;
-
-    // Compute first all inner products and keep the maximum
-    // (to avoid overflow)
+void ModelCoxRegPartialLik::compute_inner_prods_block(const ulong b,
+                                                      const ArrayDouble &coeffs) {
+    ulong start, end;
+    std::tie(start, end) = tick::get_thread_indices(b, get_n_blocks(), n_samples);
+
     double max_inner_prod = -DBL_MAX;
-    for (ulong i = 0; i < n_samples; ++i) {
+    for (ulong i = start; i < end; ++i) {
         const double inner_prod = get_feature(i).dot(coeffs);
         inner_prods[i] = inner_prod;
         if (inner_prod > max_inner_prod) {
             max_inner_prod = inner_prod;
         }
     }
+    block_max_inner_prod[b] = max_inner_prod;
+}
+
+void ModelCoxRegPartialLik::compute_exp_inner_prods_block(const ulong b,
+                                                          const double max_inner_prod) {
+    ulong start, end;
+    std::tie(start, end) = tick::get_thread_indices(b, get_n_blocks(), n_samples);
 
-    const ulong idx0 = get_idx_failure(0);
-    for (ulong i = 0; i <= idx0; ++i) {
+    double s0 = 0;
+    for (ulong i = start; i < end; ++i) {
         const double diff = inner_prods[i] - max_inner_prod;
-        const double exp_diff = exp(diff);
-        if (diff > DBL_MIN_EXP) {
-            const BaseArrayDouble x_i = get_feature(i);
-            s1.mult_incr(x_i, exp_diff);
-            s2 += exp_diff;
-        }
+        exp_inner_prods[i] = diff > DBL_MIN_EXP ? exp(diff) : 0;
+        s0 += exp_inner_prods[i];
+    }
+    block_s0[b] = s0;
+}
+
+void ModelCoxRegPartialLik::compute_loss_and_grad_block(const ulong b,
+                                                        const ArrayDouble &s0_offsets,
+                                                        const double max_inner_prod,
+                                                        const bool compute_grad) {
+    ulong start, end;
+    std::tie(start, end) = tick::get_thread_indices(b, get_n_blocks(), n_samples);
+
+    // As times are sorted by decreasing order, the risk set of failure i is made of samples
+    // 0 to i, s0 is the sum of their exp_inner_prods
+    double s0 = s0_offsets[b];
+    double log_lik = 0;
+    double sum_inv_s0 = 0;
+
+    ArrayDouble s1 = view_row(block_s1, b);
+    ArrayDouble grad = view_row(block_grad, b);
+    if (compute_grad) {
+        s1.init_to_zero();
+        grad.init_to_zero();
     }
 
-    for (ulong k = 0; k < n_failures; ++k) {
-        const ulong idx = get_idx_failure(k);
-        const BaseArrayDouble x_idx = get_feature(idx);
-
-        out.mult_add_mult_incr(s1, 1 / s2, x_idx, -1);
-        if (k != n_failures_minus_one) {
-            const ulong idx_next = get_idx_failure(k+1) + 1;
-            for (ulong i = idx + 1; i < idx_next; ++i) {
-                const BaseArrayDouble x_i = get_feature(i);
-                double diff = inner_prods[i] - max_inner_prod;
-                if (diff > DBL_MIN_EXP) {
-                    const double exp_diff = exp(diff);
-                    s1.mult_incr(x_i, exp_diff);
-                    s2 += exp_diff;
-                }
+    for (ulong i = start; i < end; ++i) {
+        const double exp_inner_prod = exp_inner_prods[i];
+        s0 += exp_inner_prod;
+        if (compute_grad && exp_inner_prod > 0) {
+            s1.mult_incr(get_feature(i), exp_inner_prod);
+        }
+
+        if (get_censoring(i) != 0) {
+            log_lik += log(s0) - inner_prods[i] + max_inner_prod;
+            if (compute_grad) {
+                // s1 only sums the samples of this block, the previous ones are added by
+                // compute_loss_and_grad through sum_inv_s0
+                grad.mult_add_mult_incr(s1, 1 / s0, get_feature(i), -1);
+                sum_inv_s0 += 1 / s0;
             }
         }
     }
-    for (ulong j = 0; j < n_features; ++j) {
-        out[j] /= n_failures;
-    }
+
+    block_loss[b] = log_lik;
+    block_sum_inv_s0[b] = sum_inv_s0;
 }
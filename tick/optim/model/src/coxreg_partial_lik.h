@@ -11,12 +11,23 @@
 class ModelCoxRegPartialLik : public Model {
  private:
     ArrayDouble inner_prods;
-    ArrayDouble s1;
+    ArrayDouble exp_inner_prods;
     ArrayULong idx;
 
+    //! @brief Per block buffers: maximal inner product, sum of exp_inner_prods, loss, sum of
+    //! the inverse risk set sums of its failures
+    ArrayDouble block_max_inner_prod, block_s0, block_loss, block_sum_inv_s0;
+
+    //! @brief Per block buffers: sum of x_i * exp_inner_prods[i] and gradient computed as if
+    //! the block was the first one
+    ArrayDouble2d block_s1, block_grad;
+
  protected:
     ulong n_samples, n_features, n_failures;
 
+    //! @brief Number of threads, samples are split in as many contiguous blocks
+    unsigned int n_threads;
+
     SBaseArrayDouble2dPtr features;
     ArrayDouble times;
     ArrayUShort censoring;
@@ -41,7 +52,8 @@ class ModelCoxRegPartialLik : public Model {
  public:
     ModelCoxRegPartialLik(const SBaseArrayDouble2dPtr features,
                           const SArrayDoublePtr times,
-                          const SArrayUShortPtr censoring);
+                          const SArrayUShortPtr censoring,
+                          const int n_threads = 1);
 
     const char *get_class_name() const override {
         return "ModelCoxRegPartialLik";
@@ -63,6 +75,36 @@ class ModelCoxRegPartialLik : public Model {
     double loss(const ArrayDouble &coeffs) override;
 
     void grad(const ArrayDouble &coeffs, ArrayDouble &out) override;
+
+    /**
+     * \brief Computation of the loss and of its gradient at point coeffs with a single
+     * computation of the inner products and of the risk set sums
+     *
+     * \param coeffs : The vector at which the loss and the gradient are computed
+     * \param out : The array in which the gradient is stored
+     * \return The value of the loss
+     */
+    double loss_and_grad(const ArrayDouble &coeffs, ArrayDouble &out);
+
+ private:
+    /**
+     * \brief Computes the loss and, if compute_grad is true, its gradient.
+     *
+     * Samples are split in n_threads contiguous blocks. Each block computes its inner products
+     * and risk set sums in parallel, as if it was the first block, and the contribution of the
+     * previous blocks is added afterwards from their totals (a prefix sum over blocks).
+     */
+    double compute_loss_and_grad(const ArrayDouble &coeffs, ArrayDouble &out,
+                                 const bool compute_grad);
+
+    ulong get_n_blocks() const;
+
+    void compute_inner_prods_block(const ulong b, const ArrayDouble &coeffs);
+
+    void compute_exp_inner_prods_block(const ulong b, const double max_inner_prod);
+
+    void compute_loss_and_grad_block(const ulong b, const ArrayDouble &s0_offsets,
+                                     const double max_inner_prod, const bool compute_grad);
 };
 
 
@@ -7,6 +7,7 @@ ModelHawkesFixedExpKernLogLik::ModelHawkesFixedExpKernLogLik(
     decay(decay) {}
 
 void ModelHawkesFixedExpKernLogLik::compute_weights() {
+  weights_stored = weights_fit_in_budget(get_weights_size());
   allocate_weights();
   parallel_run(get_n_threads(), n_nodes, &ModelHawkesFixedExpKernLogLik::compute_weights_dim_i, this);
   weights_computed = true;
@@ -19,17 +20,38 @@ void ModelHawkesFixedExpKernLogLik::allocate_weights() {
   g = ArrayDouble2dList1D(n_nodes);
   G = ArrayDouble2dList1D(n_nodes);
   sum_G = ArrayDoubleList1D(n_nodes);
+  cum_n_jumps_per_node = cumulative_counts(*n_jumps_per_node);
 
   for (ulong i = 0; i < n_nodes; i++) {
-    g[i] = ArrayDouble2d((*n_jumps_per_node)[i], n_nodes);
-    g[i].init_to_zero();
-    G[i] = ArrayDouble2d((*n_jumps_per_node)[i] + 1, n_nodes);
-    G[i].init_to_zero();
+    if (weights_stored) {
+      g[i] = ArrayDouble2d((*n_jumps_per_node)[i], n_nodes);
+      g[i].init_to_zero();
+      G[i] = ArrayDouble2d((*n_jumps_per_node)[i] + 1, n_nodes);
+      G[i].init_to_zero();
+    }
     sum_G[i] = ArrayDouble(n_nodes);
   }
 }
 
+ulong ModelHawkesFixedExpKernLogLik::get_weights_size() const {
+  // g has n_jumps_per_node[i] rows and G one more, for all nodes i
+  return (2 * n_total_jumps + n_nodes) * n_nodes;
+}
+
 void ModelHawkesFixedExpKernLogLik::compute_weights_dim_i(const ulong i) {
+  if (!weights_stored) {
+    // sum_G[i][j] is the integral of the kernel sums of node j between 0 and end_time
+    ArrayDouble sum_G_i = view(sum_G[i]);
+    for (ulong j = 0; j < n_nodes; j++) {
+      const ArrayDouble t_j = view(*timestamps[j]);
+      sum_G_i[j] = 0;
+      for (ulong ij = 0; (ij < (*n_jumps_per_node)[j]) && (t_j[ij] < end_time); ij++) {
+        sum_G_i[j] += 1 - std::exp(-decay * (end_time - t_j[ij]));
+      }
+    }
+    return;
+  }
+
   const ArrayDouble t_i = view(*timestamps[i]);
   ArrayDouble2d g_i = view(g[i]);
   ArrayDouble2d G_i = view(G[i]);
@@ -48,7 +70,8 @@ void ModelHawkesFixedExpKernLogLik::compute_weights_dim_i(const ulong i) {
         if (k < n_jumps_i) g_i[k * n_nodes + j] = g_i[(k - 1) * n_nodes + j] * ebt;
         G_i[k * n_nodes + j] = g_i[(k - 1) * n_nodes + j] * (1 - ebt) / decay;
       } else {
-        g_i[k * n_nodes + j] = 0;
+        // g_i is empty if node i has no jump
+        if (k < n_jumps_i) g_i[k * n_nodes + j] = 0;
         G_i[k * n_nodes + j] = 0;
         sum_G[i][j] = 0.;
       }
@@ -78,6 +101,9 @@ double ModelHawkesFixedExpKernLogLik::loss(const ArrayDouble &coeffs) {
 double ModelHawkesFixedExpKernLogLik::loss_i(const ulong sampled_i,
                                              const ArrayDouble &coeffs) {
   if (!weights_computed) compute_weights();
+  if (!weights_stored) {
+    TICK_ERROR("loss_i needs weights that do not fit in weights_memory_budget");
+  }
   ulong i;
   ulong k;
   sampled_i_to_index(sampled_i, &i, &k);
@@ -99,6 +125,9 @@ void ModelHawkesFixedExpKernLogLik::grad_i(const ulong sampled_i,
                                            const ArrayDouble &coeffs,
                                            ArrayDouble &out) {
   if (!weights_computed) compute_weights();
+  if (!weights_stored) {
+    TICK_ERROR("grad_i needs weights that do not fit in weights_memory_budget");
+  }
 
   ulong i;
   ulong k;
@@ -145,15 +174,8 @@ double ModelHawkesFixedExpKernLogLik::hessian_norm(const ArrayDouble &coeffs,
 void ModelHawkesFixedExpKernLogLik::sampled_i_to_index(const ulong sampled_i,
                                                        ulong *i,
                                                        ulong *k) {
-  ulong cum_N_i = 0;
-  for (ulong d = 0; d < n_nodes; d++) {
-    cum_N_i += (*n_jumps_per_node)[d];
-    if (sampled_i < cum_N_i) {
-      *i = d;
-      *k = sampled_i - cum_N_i + (*n_jumps_per_node)[d];
-      break;
-    }
-  }
+  *i = cumulative_counts_index(cum_n_jumps_per_node, sampled_i);
+  *k = sampled_i - cum_n_jumps_per_node[*i];
 }
 
 double ModelHawkesFixedExpKernLogLik::loss_dim_i(const ulong i,
@@ -164,8 +186,9 @@ double ModelHawkesFixedExpKernLogLik::loss_dim_i(const ulong i,
   double loss = 0;
   loss += end_time * mu[i];
 
+  HawkesExpKernSums kernel_sums(timestamps, i, decay);
   for (ulong k = 0; k < (*n_jumps_per_node)[i]; ++k) {
-    const ArrayDouble g_i_k = view_row(g[i], k);
+    const ArrayDouble g_i_k = weights_stored ? view_row(g[i], k) : view(kernel_sums.next());
 
     double s = mu[i];
     for (ulong j = 0; j < n_nodes; j++) {
@@ -231,8 +254,9 @@ void ModelHawkesFixedExpKernLogLik::grad_dim_i(const ulong i,
 
   grad_mu[i] += end_time;
 
+  HawkesExpKernSums kernel_sums(timestamps, i, decay);
   for (ulong k = 0; k < (*n_jumps_per_node)[i]; ++k) {
-    const ArrayDouble g_i_k = view_row(g[i], k);
+    const ArrayDouble g_i_k = weights_stored ? view_row(g[i], k) : view(kernel_sums.next());
     double s = mu[i];
 
     for (ulong j = 0; j < n_nodes; j++) {
@@ -295,8 +319,9 @@ double ModelHawkesFixedExpKernLogLik::loss_and_grad_dim_i(const ulong i,
 
   grad_mu[i] += end_time;
   loss += end_time * mu[i];
+  HawkesExpKernSums kernel_sums(timestamps, i, decay);
   for (ulong k = 0; k < (*n_jumps_per_node)[i]; k++) {
-    const ArrayDouble g_i_k = view_row(g[i], k);
+    const ArrayDouble g_i_k = weights_stored ? view_row(g[i], k) : view(kernel_sums.next());
 
     double s = mu[i];
     for (ulong j = 0; j < n_nodes; j++) {
@@ -334,8 +359,9 @@ double ModelHawkesFixedExpKernLogLik::hessian_norm_dim_i(const ulong i,
 
   double hess_norm = 0;
 
+  HawkesExpKernSums kernel_sums(timestamps, i, decay);
   for (ulong k = 0; k < (*n_jumps_per_node)[i]; k++) {
-    const ArrayDouble g_i_k = view_row(g[i], k);
+    const ArrayDouble g_i_k = weights_stored ? view_row(g[i], k) : view(kernel_sums.next());
 
     double S = d_mu[i];
     double s = mu[i];
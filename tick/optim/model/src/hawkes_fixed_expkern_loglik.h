@@ -8,6 +8,7 @@
 #include "base.h"
 
 #include "base/hawkes_single.h"
+#include "hawkes_utils.h"
 
 class ModelHawkesFixedExpKernLogLikList;
 
@@ -27,6 +28,15 @@ class ModelHawkesFixedExpKernLogLik : public ModelHawkesSingle {
   ArrayDouble2dList1D G;
   ArrayDoubleList1D sum_G;
 
+  //! @brief Whether g and G are stored. If they do not fit in weights_memory_budget, only sum_G
+  //! is stored and g is computed on the fly by loss and grad (loss_i and grad_i are then not
+  //! available)
+  bool weights_stored = true;
+
+  //! @brief Cumulative number of jumps of the nodes (size n_nodes + 1), used to find the node a
+  //! sampled timestamp belongs to
+  ArrayULong cum_n_jumps_per_node;
+
  public:
   //! @brief Default constructor
   //! @note This constructor is only used to create vectors of ModelHawkesFixedExpKernLeastSq
@@ -97,6 +107,10 @@ class ModelHawkesFixedExpKernLogLik : public ModelHawkesSingle {
 
  private:
   void allocate_weights();
+
+  //! @brief Number of doubles g and G are made of
+  ulong get_weights_size() const;
+
   /**
    * @brief Precomputations of intermediate values for component i
    * \param i : selected component
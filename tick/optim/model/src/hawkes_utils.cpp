@@ -1,6 +1,8 @@
 
 #include "hawkes_utils.h"
 
+#include <algorithm>
+
 
 TimestampListDescriptor describe_timestamps_list(const SArrayDoublePtrList2D &timestamps_list) {
   // Check the number of realizations
@@ -54,9 +56,11 @@ TimestampListDescriptor describe_timestamps_list(const SArrayDoublePtrList2D &ti
   for (ulong r = 0; r < timestamps_list_descriptor.n_realizations; r++) {
     SArrayDoublePtrList1D realization_r = timestamps_list[r];
     for (ulong i = 0; i < timestamps_list_descriptor.n_nodes; i++) {
+      // Nodes might have no jump
+      if (realization_r[i]->size() == 0) continue;
       double last_time_i = (*realization_r[i])[realization_r[i]->size() - 1];
       if ((*end_times)[r] < last_time_i) {
-        TICK_ERROR("Provided end_time (" << (*end_times)[i] << ") is smaller than last "
+        TICK_ERROR("Provided end_time (" << (*end_times)[r] << ") is smaller than last "
             "time of component " << i << " (" << last_time_i << ")")
       }
     }
@@ -64,3 +68,52 @@ TimestampListDescriptor describe_timestamps_list(const SArrayDoublePtrList2D &ti
 
   return timestamps_list_descriptor;
 }
+
+ArrayULong cumulative_counts(const ArrayULong &counts) {
+  ArrayULong cum_counts(counts.size() + 1);
+  cum_counts[0] = 0;
+  for (ulong d = 0; d < counts.size(); ++d) {
+    cum_counts[d + 1] = cum_counts[d] + counts[d];
+  }
+  return cum_counts;
+}
+
+ulong cumulative_counts_index(const ArrayULong &cum_counts, const ulong index) {
+  if (index >= cum_counts[cum_counts.size() - 1]) {
+    TICK_ERROR("index " << index << " out of range, total count is "
+                        << cum_counts[cum_counts.size() - 1]);
+  }
+  // The last d such that cum_counts[d] <= index, counts equal to 0 being skipped
+  const ulong *begin = cum_counts.data();
+  return std::upper_bound(begin, begin + cum_counts.size(), index) - begin - 1;
+}
+
+HawkesExpKernSums::HawkesExpKernSums(const SArrayDoublePtrList1D &timestamps, const ulong u,
+                                     const double decay, const unsigned int optimization_level)
+    : timestamps(timestamps), u(u), decay(decay), optimization_level(optimization_level), k(0),
+      ij(timestamps.size()), sums(timestamps.size()) {
+  ij.init_to_zero();
+  sums.init_to_zero();
+}
+
+ArrayDouble &HawkesExpKernSums::next() {
+  const ArrayDouble &timestamps_u = *timestamps[u];
+  const double t_u_k = timestamps_u[k];
+
+  if (k > 0) {
+    const double ebt = optimized_exp(-decay * (t_u_k - timestamps_u[k - 1]), optimization_level);
+    sums *= ebt;
+  }
+
+  for (ulong v = 0; v < timestamps.size(); ++v) {
+    const ArrayDouble &timestamps_v = *timestamps[v];
+    ulong &ij_v = ij[v];
+    while ((ij_v < timestamps_v.size()) && (timestamps_v[ij_v] < t_u_k)) {
+      sums[v] += decay * optimized_exp(-decay * (t_u_k - timestamps_v[ij_v]), optimization_level);
+      ij_v++;
+    }
+  }
+
+  k++;
+  return sums;
+}
@@ -16,4 +16,47 @@ TimestampListDescriptor describe_timestamps_list(const SArrayDoublePtrList2D &ti
 TimestampListDescriptor describe_timestamps_list(const SArrayDoublePtrList2D &timestamps_list,
                                                  const VArrayDoublePtr end_times);
 
+/**
+ * @brief Cumulative sums of counts, used to find in O(log n) which count a sampled index falls in
+ * \return An array of size counts.size() + 1 starting with 0
+ */
+ArrayULong cumulative_counts(const ArrayULong &counts);
+
+/**
+ * @brief Find d such that cum_counts[d] <= index < cum_counts[d + 1] by binary search
+ * \param cum_counts : cumulative counts, as returned by cumulative_counts
+ * \param index : the index to look for, it must be lower than the total count
+ */
+ulong cumulative_counts_index(const ArrayULong &cum_counts, const ulong index);
+
+/**
+ * \class HawkesExpKernSums
+ * \brief Computes, event after event of a node u, the sums of exponential kernels
+ * \f$ g_k^v = \sum_{t^v_j < t^u_k} \beta e^{-\beta (t^u_k - t^v_j)} \f$ for all nodes v.
+ * These are the weights stored for each event by Hawkes models with exponential kernels, this
+ * class computes them on the fly with O(n_nodes) memory when they cannot all be stored.
+ */
+class HawkesExpKernSums {
+ private:
+  const SArrayDoublePtrList1D &timestamps;
+  const ulong u;
+  const double decay;
+  const unsigned int optimization_level;
+
+  //! @brief Index of the next event of node u
+  ulong k;
+
+  //! @brief For each node v, index of its first event not yet taken into account
+  ArrayULong ij;
+
+  ArrayDouble sums;
+
+ public:
+  HawkesExpKernSums(const SArrayDoublePtrList1D &timestamps, const ulong u, const double decay,
+                    const unsigned int optimization_level = 0);
+
+  //! @brief Moves to the next event of node u and returns its kernel sums \f$ (g_k^v)_v \f$
+  ArrayDouble &next();
+};
+
 #endif  // TICK_OPTIM_MODEL_SRC_HAWKES_UTILS_H_
@@ -4,58 +4,72 @@
 
 #include "linreg.h"
 
-ModelLinReg::ModelLinReg(const SBaseArrayDouble2dPtr features,
-                         const SArrayDoublePtr labels,
-                         const bool fit_intercept,
-                         const int n_threads)
+template <class T>
+TModelLinReg<T>::TModelLinReg(const std::shared_ptr<BaseArray2d<T>> features,
+                              const std::shared_ptr<SArray<T>> labels,
+                              const bool fit_intercept,
+                              const int n_threads)
 
-    : ModelGeneralizedLinear(features,
-                             labels,
-                             fit_intercept,
-                             n_threads),
-      ModelLipschitz() {}
+    : TModelGeneralizedLinear<T>(features,
+                                 labels,
+                                 fit_intercept,
+                                 n_threads),
+      TModelLipschitz<T>() {}
 
-const char *ModelLinReg::get_class_name() const {
+template <class T>
+const char *TModelLinReg<T>::get_class_name() const {
   return "ModelLinReg";
 }
 
-double ModelLinReg::sdca_dual_min_i(const ulong i,
-                                    const ArrayDouble &dual_vector,
-                                    const ArrayDouble &primal_vector,
-                                    const ArrayDouble &previous_delta_dual,
-                                    const double l_l2sq) {
+template <class T>
+T TModelLinReg<T>::sdca_dual_min_i(const ulong i,
+                                   const Array<T> &dual_vector,
+                                   const Array<T> &primal_vector,
+                                   const Array<T> &previous_delta_dual,
+                                   const T l_l2sq) {
   compute_features_norm_sq();
-  double normalized_features_norm = features_norm_sq[i] / (l_l2sq * n_samples);
+  T normalized_features_norm = features_norm_sq[i] / (l_l2sq * n_samples);
   if (use_intercept()) {
     normalized_features_norm += 1. / (l_l2sq * n_samples);
   }
-  const double primal_dot_features = get_inner_prod(i, primal_vector);
-  const double dual = dual_vector[i];
-  const double label = get_label(i);
-  const double delta_dual = -(dual + primal_dot_features - label) / (1 + normalized_features_norm);
+  const T primal_dot_features = get_inner_prod(i, primal_vector);
+  const T dual = dual_vector[i];
+  const T label = get_label(i);
+  const T delta_dual = -(dual + primal_dot_features - label) / (1 + normalized_features_norm);
   return delta_dual;
 }
 
-double ModelLinReg::loss_i(const ulong i,
-                           const ArrayDouble &coeffs) {
+template <class T>
+T TModelLinReg<T>::loss_i(const ulong i,
+                          const Array<T> &coeffs) {
   // Compute x_i^T \beta + b
-  const double z = get_inner_prod(i, coeffs);
-  const double d = get_label(i) - z;
+  return loss_i_from_inner_prod(i, get_inner_prod(i, coeffs));
+}
+
+template <class T>
+T TModelLinReg<T>::loss_i_from_inner_prod(const ulong i, const T inner_prod) {
+  const T d = get_label(i) - inner_prod;
   return d * d / 2;
 }
 
-double ModelLinReg::grad_i_factor(const ulong i,
-                                  const ArrayDouble &coeffs) {
-  const double z = get_inner_prod(i, coeffs);
-  return z - get_label(i);
+template <class T>
+T TModelLinReg<T>::grad_i_factor(const ulong i,
+                                 const Array<T> &coeffs) {
+  return grad_i_factor_from_inner_prod(i, get_inner_prod(i, coeffs));
 }
 
-void ModelLinReg::compute_lip_consts() {
+template <class T>
+T TModelLinReg<T>::grad_i_factor_from_inner_prod(const ulong i, const T inner_prod) {
+  return inner_prod - get_label(i);
+}
+
+template <class T>
+void TModelLinReg<T>::compute_lip_consts() {
   if (ready_lip_consts) {
     return;
   } else {
     compute_features_norm_sq();
-    lip_consts = ArrayDouble(n_samples);
+    lip_consts = Array<T>(n_samples);
     for (ulong i = 0; i < n_samples; ++i) {
       if (fit_intercept) {
         lip_consts[i] = features_norm_sq[i] + 1;
@@ -65,3 +79,6 @@ void ModelLinReg::compute_lip_consts() {
     }
   }
 }
+
+template class TModelLinReg<double>;
+template class TModelLinReg<float>;
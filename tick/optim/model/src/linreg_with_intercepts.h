@@ -21,6 +21,10 @@ class ModelLinRegWithIntercepts : public ModelGeneralizedLinearWithIntercepts,
 
   double grad_i_factor(const ulong i, const ArrayDouble &coeffs) override;
 
+  double loss_i_from_inner_prod(const ulong i, const double inner_prod) override;
+
+  double grad_i_factor_from_inner_prod(const ulong i, const double inner_prod) override;
+
   void compute_lip_consts() override;
 };
 
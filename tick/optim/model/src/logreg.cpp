@@ -4,49 +4,66 @@
 
 #include "logreg.h"
 
-ModelLogReg::ModelLogReg(const SBaseArrayDouble2dPtr features,
-                         const SArrayDoublePtr labels,
-                         const bool fit_intercept,
-                         const int n_threads)
-    : ModelGeneralizedLinear(features, labels, fit_intercept, n_threads),
-      ModelLipschitz() {}
-
-const char *ModelLogReg::get_class_name() const {
+template <class T>
+TModelLogReg<T>::TModelLogReg(const std::shared_ptr<BaseArray2d<T>> features,
+                              const std::shared_ptr<SArray<T>> labels,
+                              const bool fit_intercept,
+                              const int n_threads)
+    : TModelGeneralizedLinear<T>(features, labels, fit_intercept, n_threads),
+      TModelLipschitz<T>() {}
+
+template <class T>
+const char *TModelLogReg<T>::get_class_name() const {
   return "ModelLogReg";
 }
 
-void ModelLogReg::sigmoid(const ArrayDouble &x, ArrayDouble &out) {
+template <class T>
+void TModelLogReg<T>::sigmoid(const Array<T> &x, Array<T> &out) {
   for (ulong i = 0; i < x.size(); ++i) {
     out[i] = sigmoid(x[i]);
   }
 }
 
-void ModelLogReg::logistic(const ArrayDouble &x, ArrayDouble &out) {
+template <class T>
+void TModelLogReg<T>::logistic(const Array<T> &x, Array<T> &out) {
   for (ulong i = 0; i < x.size(); ++i) {
     out[i] = logistic(x[i]);
   }
 }
 
-double ModelLogReg::loss_i(const ulong i, const ArrayDouble &coeffs) {
-  double z_i = get_inner_prod(i, coeffs);
+template <class T>
+T TModelLogReg<T>::loss_i(const ulong i, const Array<T> &coeffs) {
+  return loss_i_from_inner_prod(i, get_inner_prod(i, coeffs));
+}
+
+template <class T>
+T TModelLogReg<T>::loss_i_from_inner_prod(const ulong i, const T inner_prod) {
+  double z_i = inner_prod;
   z_i *= get_label(i);
   return logistic(z_i);
 }
 
-double ModelLogReg::grad_i_factor(const ulong i, const ArrayDouble &coeffs) {
+template <class T>
+T TModelLogReg<T>::grad_i_factor(const ulong i, const Array<T> &coeffs) {
+  return grad_i_factor_from_inner_prod(i, get_inner_prod(i, coeffs));
+}
+
+template <class T>
+T TModelLogReg<T>::grad_i_factor_from_inner_prod(const ulong i, const T inner_prod) {
   // The label in { -1, 1 }
   const double y_i = get_label(i);
   // Contains x_i^T w + b
-  const double z_i = get_inner_prod(i, coeffs);
+  const double z_i = inner_prod;
 
   return y_i * (sigmoid(y_i * z_i) - 1);
 }
 
-double ModelLogReg::sdca_dual_min_i(const ulong i,
-                                    const ArrayDouble &dual_vector,
-                                    const ArrayDouble &primal_vector,
-                                    const ArrayDouble &previous_delta_dual,
-                                    const double l_l2sq) {
+template <class T>
+T TModelLogReg<T>::sdca_dual_min_i(const ulong i,
+                                   const Array<T> &dual_vector,
+                                   const Array<T> &primal_vector,
+                                   const Array<T> &previous_delta_dual,
+                                   const T l_l2sq) {
   compute_features_norm_sq();
   double epsilon = 1e-1;
   double normalized_features_norm = features_norm_sq[i] / (l_l2sq * n_samples);
@@ -111,12 +128,13 @@ double ModelLogReg::sdca_dual_min_i(const ulong i,
   return delta_dual;
 }
 
-void ModelLogReg::compute_lip_consts() {
+template <class T>
+void TModelLogReg<T>::compute_lip_consts() {
   if (ready_lip_consts) {
     return;
   } else {
     compute_features_norm_sq();
-    lip_consts = ArrayDouble(n_samples);
+    lip_consts = Array<T>(n_samples);
     for (ulong i = 0; i < n_samples; ++i) {
       if (fit_intercept) {
         lip_consts[i] = (features_norm_sq[i] + 1) / 4;
@@ -126,3 +144,6 @@ void ModelLogReg::compute_lip_consts() {
     }
   }
 }
+
+template class TModelLogReg<double>;
+template class TModelLogReg<float>;
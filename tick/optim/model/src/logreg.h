@@ -8,15 +8,30 @@
 #include "model_generalized_linear.h"
 #include "model_lipschitz.h"
 
+#include <cereal/types/base_class.hpp>
+
 
 // TODO: labels should be a ArrayInt
 
-class ModelLogReg : public ModelGeneralizedLinear, public ModelLipschitz {
+template <class T>
+class TModelLogReg : public TModelGeneralizedLinear<T>, public TModelLipschitz<T> {
+ protected:
+  using TModelGeneralizedLinear<T>::features_norm_sq;
+  using TModelGeneralizedLinear<T>::compute_features_norm_sq;
+  using TModelGeneralizedLinear<T>::n_samples;
+  using TModelGeneralizedLinear<T>::fit_intercept;
+  using TModelLipschitz<T>::ready_lip_consts;
+  using TModelLipschitz<T>::lip_consts;
+
  public:
-  ModelLogReg(const SBaseArrayDouble2dPtr features,
-              const SArrayDoublePtr labels,
-              const bool fit_intercept,
-              const int n_threads = 1);
+  using TModelGeneralizedLinear<T>::get_inner_prod;
+  using TModelGeneralizedLinear<T>::get_label;
+  using TModelGeneralizedLinear<T>::use_intercept;
+
+  TModelLogReg(const std::shared_ptr<BaseArray2d<T>> features,
+               const std::shared_ptr<SArray<T>> labels,
+               const bool fit_intercept,
+               const int n_threads = 1);
 
   const char *get_class_name() const override;
 
@@ -38,21 +53,37 @@ class ModelLogReg : public ModelGeneralizedLinear, public ModelLipschitz {
     }
   }
 
-  static void sigmoid(const ArrayDouble &x, ArrayDouble &out);
+  static void sigmoid(const Array<T> &x, Array<T> &out);
+
+  static void logistic(const Array<T> &x, Array<T> &out);
+
+  T loss_i(const ulong i, const Array<T> &coeffs) override;
 
-  static void logistic(const ArrayDouble &x, ArrayDouble &out);
+  T grad_i_factor(const ulong i, const Array<T> &coeffs) override;
 
-  double loss_i(const ulong i, const ArrayDouble &coeffs) override;
+  T loss_i_from_inner_prod(const ulong i, const T inner_prod) override;
 
-  double grad_i_factor(const ulong i, const ArrayDouble &coeffs) override;
+  T grad_i_factor_from_inner_prod(const ulong i, const T inner_prod) override;
 
-  double sdca_dual_min_i(const ulong i,
-                         const ArrayDouble &dual_vector,
-                         const ArrayDouble &primal_vector,
-                         const ArrayDouble &previous_delta_dual,
-                         const double l_l2sq) override;
+  T sdca_dual_min_i(const ulong i,
+                    const Array<T> &dual_vector,
+                    const Array<T> &primal_vector,
+                    const Array<T> &previous_delta_dual,
+                    const T l_l2sq) override;
 
   void compute_lip_consts() override;
+
+  template<class Archive>
+  void serialize(Archive & ar) {
+    ar(cereal::make_nvp("ModelGeneralizedLinear", cereal::base_class<TModelGeneralizedLinear<T>>(this)));
+    ar(cereal::make_nvp("ModelLipschitz", cereal::base_class<TModelLipschitz<T>>(this)));
+  }
 };
 
+typedef TModelLogReg<double> ModelLogReg;
+typedef TModelLogReg<float> ModelLogRegFloat;
+
+CEREAL_SPECIALIZE_FOR_ALL_ARCHIVES(ModelLogReg, cereal::specialization::member_serialize)
+CEREAL_SPECIALIZE_FOR_ALL_ARCHIVES(ModelLogRegFloat, cereal::specialization::member_serialize)
+
 #endif  // TICK_OPTIM_MODEL_SRC_LOGREG_H_
@@ -14,33 +14,35 @@
 // TODO: Model "data" : ModeLabelsFeatures, Model,Model pour les Hawkes
 
 /**
- * @class Model
+ * @class TModel
  * @brief The main Model class from which all models inherit.
+ * @tparam T : The type of the coefficients and of the data (double or float)
  * @note This class has all methods ever used by any model, hence solvers which are using a
  * pointer on a model should be able to call all methods they need. This is certainly not the
  * best possible design but it is sufficient at the moment.
  */
-class Model {
+template <class T>
+class TModel {
  public:
-  Model() {}
+  TModel() {}
 
   virtual const char *get_class_name() const {
     return "Model";
   }
 
-  virtual double loss_i(const ulong i, const ArrayDouble &coeffs) {
+  virtual T loss_i(const ulong i, const Array<T> &coeffs) {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
   }
 
-  virtual void grad_i(const ulong i, const ArrayDouble &coeffs, ArrayDouble &out) {
+  virtual void grad_i(const ulong i, const Array<T> &coeffs, Array<T> &out) {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
   }
 
-  virtual void grad(const ArrayDouble &coeffs, ArrayDouble &out) {
+  virtual void grad(const Array<T> &coeffs, Array<T> &out) {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
   }
 
-  virtual double loss(const ArrayDouble &coeffs) {
+  virtual T loss(const Array<T> &coeffs) {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
   }
 
@@ -62,15 +64,15 @@ class Model {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
   }
 
-  virtual double sdca_dual_min_i(ulong i,
-                                 const ArrayDouble &dual_vector,
-                                 const ArrayDouble &primal_vector,
-                                 const ArrayDouble &previous_delta_dual,
-                                 double l_l2sq) {
+  virtual T sdca_dual_min_i(ulong i,
+                            const Array<T> &dual_vector,
+                            const Array<T> &primal_vector,
+                            const Array<T> &previous_delta_dual,
+                            T l_l2sq) {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
   }
 
-  virtual BaseArrayDouble get_features(const ulong i) const {
+  virtual BaseArray<T> get_features(const ulong i) const {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
   }
 
@@ -82,7 +84,7 @@ class Model {
     return false;
   }
 
-  virtual double grad_i_factor(const ulong i, const ArrayDouble &coeffs) {
+  virtual T grad_i_factor(const ulong i, const Array<T> &coeffs) {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
   }
 
@@ -107,7 +109,10 @@ class Model {
   }
 };
 
+typedef TModel<double> Model;
+typedef TModel<float> ModelFloat;
+
 typedef std::shared_ptr<Model> ModelPtr;
+typedef std::shared_ptr<ModelFloat> ModelFloatPtr;
 
 #endif  // TICK_OPTIM_MODEL_SRC_MODEL_H_
-
@@ -4,44 +4,87 @@
 
 #include "model_generalized_linear.h"
 
-ModelGeneralizedLinear::ModelGeneralizedLinear(const SBaseArrayDouble2dPtr features,
-                                               const SArrayDoublePtr labels,
-                                               const bool fit_intercept,
-                                               const int n_threads)
-    : ModelLabelsFeatures(features, labels),
+#include <algorithm>
+
+template <class T>
+TModelGeneralizedLinear<T>::TModelGeneralizedLinear(
+    const std::shared_ptr<BaseArray2d<T>> features,
+    const std::shared_ptr<SArray<T>> labels,
+    const bool fit_intercept,
+    const int n_threads)
+    : TModelLabelsFeatures<T>(features, labels),
       n_threads(n_threads >= 1 ? n_threads : std::thread::hardware_concurrency()),
       fit_intercept(fit_intercept),
-      ready_features_norm_sq(false) {}
+      ready_features_norm_sq(false),
+      blocked_dense(true),
+      inner_prods_cache_size(2) {}
 
-void ModelGeneralizedLinear::compute_features_norm_sq() {
+template <class T>
+void TModelGeneralizedLinear<T>::compute_features_norm_sq() {
   if (!ready_features_norm_sq) {
-    features_norm_sq = ArrayDouble(n_samples);
-    // TODO: How to do it in parallel ? (I'm not sure of how to do it)
-    for (ulong i = 0; i < n_samples; ++i) {
-      features_norm_sq[i] = view_row(*features, i).norm_sq();
-    }
+    features_norm_sq = Array<T>(n_samples);
+    parallel_run(n_threads, n_samples,
+                 &TModelGeneralizedLinear<T>::compute_features_norm_sq_i, this);
     ready_features_norm_sq = true;
   }
 }
 
-const char *ModelGeneralizedLinear::get_class_name() const {
+template <class T>
+void TModelGeneralizedLinear<T>::compute_features_norm_sq_i(const ulong i) {
+  features_norm_sq[i] = view_row(*features, i).norm_sq();
+}
+
+template <class T>
+std::shared_ptr<SArray<T>> TModelGeneralizedLinear<T>::get_features_norm_sq() {
+  compute_features_norm_sq();
+  return SArray<T>::new_ptr(features_norm_sq);
+}
+
+template <class T>
+void TModelGeneralizedLinear<T>::set_features_norm_sq(const Array<T> &features_norm_sq) {
+  if (features_norm_sq.size() != n_samples) {
+    TICK_ERROR("features_norm_sq has size " << features_norm_sq.size() << " while features have "
+                                            << n_samples << " rows");
+  }
+  this->features_norm_sq = features_norm_sq;
+  ready_features_norm_sq = true;
+}
+
+template <class T>
+const char *TModelGeneralizedLinear<T>::get_class_name() const {
   return "ModelGeneralizedLinear";
 }
 
-double ModelGeneralizedLinear::grad_i_factor(const ulong i,
-                                             const ArrayDouble &coeffs) {
+template <class T>
+T TModelGeneralizedLinear<T>::grad_i_factor(const ulong i,
+                                            const Array<T> &coeffs) {
+  std::stringstream ss;
+  ss << get_class_name() << " does not implement " << __func__;
+  throw std::runtime_error(ss.str());
+}
+
+template <class T>
+T TModelGeneralizedLinear<T>::loss_i_from_inner_prod(const ulong i, const T inner_prod) {
+  std::stringstream ss;
+  ss << get_class_name() << " does not implement " << __func__;
+  throw std::runtime_error(ss.str());
+}
+
+template <class T>
+T TModelGeneralizedLinear<T>::grad_i_factor_from_inner_prod(const ulong i, const T inner_prod) {
   std::stringstream ss;
   ss << get_class_name() << " does not implement " << __func__;
   throw std::runtime_error(ss.str());
 }
 
-void ModelGeneralizedLinear::compute_grad_i(const ulong i, const ArrayDouble &coeffs,
-                                            ArrayDouble &out, const bool fill) {
-  const BaseArrayDouble x_i = get_features(i);
-  const double alpha_i = grad_i_factor(i, coeffs);
+template <class T>
+void TModelGeneralizedLinear<T>::compute_grad_i(const ulong i, const Array<T> &coeffs,
+                                                Array<T> &out, const bool fill) {
+  const BaseArray<T> x_i = get_features(i);
+  const T alpha_i = grad_i_factor(i, coeffs);
 
   if (fit_intercept) {
-    ArrayDouble out_no_interc = view(out, 0, n_features);
+    Array<T> out_no_interc = view(out, 0, n_features);
 
     if (fill) {
       out_no_interc.mult_fill(x_i, alpha_i);
@@ -60,47 +103,246 @@ void ModelGeneralizedLinear::compute_grad_i(const ulong i, const ArrayDouble &co
   }
 }
 
-void ModelGeneralizedLinear::grad_i(const ulong i, const ArrayDouble &coeffs,
-                                    ArrayDouble &out) {
+template <class T>
+void TModelGeneralizedLinear<T>::grad_i(const ulong i, const Array<T> &coeffs,
+                                        Array<T> &out) {
   compute_grad_i(i, coeffs, out, true);
 }
 
-void ModelGeneralizedLinear::inc_grad_i(const ulong i, ArrayDouble &out,
-                                        const ArrayDouble &coeffs) {
+template <class T>
+void TModelGeneralizedLinear<T>::inc_grad_i(const ulong i, Array<T> &out,
+                                            const Array<T> &coeffs) {
   compute_grad_i(i, coeffs, out, false);
 }
 
-void ModelGeneralizedLinear::grad(const ArrayDouble &coeffs,
-                                  ArrayDouble &out) {
-  out.fill(0.0);
+template <class T>
+std::vector<ulong> TModelGeneralizedLinear<T>::get_block_starts() const {
+  // Blocks of about 256KB of doubles
+  const ulong block_n_elements = 1 << 15;
+  // Sparse features without any non-zero have no row indices
+  const auto row_indices = features->row_indices();
+  const bool sparse = features->is_sparse() && row_indices != nullptr;
+  const ulong n_elements = sparse ? row_indices[n_samples] : n_samples * n_features;
 
-  parallel_map_array<ArrayDouble>(n_threads,
-                                  n_samples,
-                                  [](ArrayDouble &r, const ArrayDouble &s) { r.mult_incr(s, 1.0); },
-                                  &ModelGeneralizedLinear::inc_grad_i,
-                                  this,
-                                  out,
-                                  coeffs);
+  ulong n_blocks = std::max(static_cast<ulong>(n_threads),
+                            (n_elements + block_n_elements - 1) / block_n_elements);
+  n_blocks = std::max(std::min(n_blocks, n_samples), ulong{1});
 
-  double one_over_n_samples = 1.0 / n_samples;
+  std::vector<ulong> block_starts(n_blocks + 1);
+  for (ulong b = 0; b < n_blocks; ++b) {
+    if (sparse) {
+      // First row whose non-zeros start after the first b / n_blocks of them
+      const ulong first_element = (b * n_elements) / n_blocks;
+      block_starts[b] = std::lower_bound(row_indices, row_indices + n_samples, first_element)
+          - row_indices;
+    } else {
+      block_starts[b] = (b * n_samples) / n_blocks;
+    }
+  }
+  block_starts[n_blocks] = n_samples;
+  // Rows with many non-zeros can leave blocks empty, they are removed
+  block_starts.erase(std::unique(block_starts.begin() + 1, block_starts.end()),
+                     block_starts.end());
+  return block_starts;
+}
 
-  out *= one_over_n_samples;
+template <class T>
+void TModelGeneralizedLinear<T>::features_dot_block(const ulong first_row,
+                                                    const Array<T> &coeffs,
+                                                    Array<T> &out) const {
+  if (use_blocks()) {
+    cblas_wrappers<T>().gemv(false, out.size(), n_features, T{1},
+                             features->data() + first_row * n_features, coeffs.data(), T{0},
+                             out.data());
+  } else {
+    const Array<T> w = view(coeffs, 0, n_features);
+    for (ulong k = 0; k < out.size(); ++k) {
+      out[k] = get_features(first_row + k).dot(w);
+    }
+  }
 }
 
-double ModelGeneralizedLinear::loss(const ArrayDouble &coeffs) {
-  return parallel_map_additive_reduce(n_threads, n_samples, &ModelGeneralizedLinear::loss_i,
-                                      this, coeffs)
-      / n_samples;
+template <class T>
+void TModelGeneralizedLinear<T>::compute_inner_prods_block(const ulong first_row,
+                                                           const Array<T> &coeffs,
+                                                           Array<T> &out) const {
+  features_dot_block(first_row, coeffs, out);
+  if (fit_intercept) {
+    // The last coefficient of coeffs is the intercept
+    const T intercept = coeffs[n_features];
+    for (ulong k = 0; k < out.size(); ++k) {
+      out[k] += intercept;
+    }
+  }
 }
 
-double ModelGeneralizedLinear::get_inner_prod(const ulong i, const ArrayDouble &coeffs) const {
-  const BaseArrayDouble x_i = get_features(i);
+template <class T>
+void TModelGeneralizedLinear<T>::inc_intercept_grad_block(const ulong first_row,
+                                                          const Array<T> &grad_factors,
+                                                          Array<T> &out) const {
+  if (fit_intercept) {
+    out[n_features] += grad_factors.sum();
+  }
+}
+
+template <class T>
+void TModelGeneralizedLinear<T>::loss_and_grad_block(const ulong block, Array<T> &out,
+                                                     const std::vector<ulong> &block_starts,
+                                                     const Array<T> &coeffs,
+                                                     Array<T> &inner_prods,
+                                                     Array<T> &block_losses,
+                                                     const bool compute_inner_prods,
+                                                     const bool compute_loss,
+                                                     const bool compute_grad) {
+  const ulong first_row = block_starts[block];
+  const ulong last_row = block_starts[block + 1];
+  Array<T> block_inner_prods = view(inner_prods, first_row, last_row);
+  if (compute_inner_prods) {
+    compute_inner_prods_block(first_row, coeffs, block_inner_prods);
+  }
+
+  if (compute_loss) {
+    T loss{0};
+    for (ulong k = 0; k < block_inner_prods.size(); ++k) {
+      loss += loss_i_from_inner_prod(first_row + k, block_inner_prods[k]);
+    }
+    block_losses[block] = loss;
+  }
+
+  if (compute_grad) {
+    Array<T> grad_factors(block_inner_prods.size());
+    for (ulong k = 0; k < grad_factors.size(); ++k) {
+      grad_factors[k] = grad_i_factor_from_inner_prod(first_row + k, block_inner_prods[k]);
+    }
+
+    if (use_blocks()) {
+      // The block is still in cache, out[:n_features] += block^T grad_factors
+      cblas_wrappers<T>().gemv(true, grad_factors.size(), n_features, T{1},
+                               features->data() + first_row * n_features, grad_factors.data(),
+                               T{1}, out.data());
+    } else {
+      Array<T> out_no_interc = view(out, 0, n_features);
+      for (ulong k = 0; k < grad_factors.size(); ++k) {
+        out_no_interc.mult_incr(get_features(first_row + k), grad_factors[k]);
+      }
+    }
+    inc_intercept_grad_block(first_row, grad_factors, out);
+  }
+}
+
+template <class T>
+Array<T> *TModelGeneralizedLinear<T>::find_cached_inner_prods(const Array<T> &coeffs) {
+  for (ulong c = 0; c < cached_coeffs.size(); ++c) {
+    const Array<T> &cached = cached_coeffs[c];
+    if (cached.size() != coeffs.size()) continue;
+
+    ulong j = 0;
+    while (j < coeffs.size() && cached[j] == coeffs[j]) ++j;
+    if (j == coeffs.size()) {
+      std::rotate(cached_coeffs.begin(), cached_coeffs.begin() + c,
+                  cached_coeffs.begin() + c + 1);
+      std::rotate(cached_inner_prods.begin(), cached_inner_prods.begin() + c,
+                  cached_inner_prods.begin() + c + 1);
+      return &cached_inner_prods[0];
+    }
+  }
+  return nullptr;
+}
+
+template <class T>
+T TModelGeneralizedLinear<T>::compute_loss_and_grad(const Array<T> &coeffs, Array<T> &out,
+                                                    const bool compute_loss,
+                                                    const bool compute_grad) {
+  Array<T> *cached = find_cached_inner_prods(coeffs);
+  const bool compute_inner_prods = cached == nullptr;
+
+  Array<T> inner_prods;
+  if (compute_inner_prods) {
+    inner_prods = Array<T>(n_samples);
+  } else {
+    inner_prods = view(*cached);
+  }
+
+  std::vector<ulong> block_starts = get_block_starts();
+  const ulong n_blocks = block_starts.size() - 1;
+  Array<T> block_losses(n_blocks);
+  // The gradient is reduced over the threads, an empty array is enough if it is not needed
+  Array<T> grad(compute_grad ? out.size() : 0);
+  grad.init_to_zero();
+
+  parallel_map_array<Array<T>>(n_threads,
+                               n_blocks,
+                               [](Array<T> &r, const Array<T> &s) { r.mult_incr(s, 1.0); },
+                               &TModelGeneralizedLinear<T>::loss_and_grad_block,
+                               this,
+                               grad,
+                               block_starts,
+                               coeffs,
+                               inner_prods,
+                               block_losses,
+                               compute_inner_prods,
+                               compute_loss,
+                               compute_grad);
+
+  if (compute_inner_prods && inner_prods_cache_size > 0) {
+    if (cached_coeffs.size() == inner_prods_cache_size) {
+      cached_coeffs.pop_back();
+      cached_inner_prods.pop_back();
+    }
+    cached_coeffs.insert(cached_coeffs.begin(), coeffs);
+    cached_inner_prods.insert(cached_inner_prods.begin(), std::move(inner_prods));
+  }
+
+  if (compute_grad) {
+    out.mult_fill(grad, T{1} / n_samples);
+  }
+  return compute_loss ? block_losses.sum() / n_samples : T{0};
+}
+
+template <class T>
+void TModelGeneralizedLinear<T>::grad(const Array<T> &coeffs,
+                                      Array<T> &out) {
+  compute_loss_and_grad(coeffs, out, false, true);
+}
+
+template <class T>
+T TModelGeneralizedLinear<T>::loss(const Array<T> &coeffs) {
+  Array<T> unused_grad;
+  return compute_loss_and_grad(coeffs, unused_grad, true, false);
+}
+
+template <class T>
+T TModelGeneralizedLinear<T>::loss_and_grad(const Array<T> &coeffs, Array<T> &out) {
+  return compute_loss_and_grad(coeffs, out, true, true);
+}
+
+template <class T>
+void TModelGeneralizedLinear<T>::set_inner_prods_cache_size(const ulong inner_prods_cache_size) {
+  this->inner_prods_cache_size = inner_prods_cache_size;
+  if (cached_coeffs.size() > inner_prods_cache_size) {
+    cached_coeffs.resize(inner_prods_cache_size);
+    cached_inner_prods.resize(inner_prods_cache_size);
+  }
+}
+
+template <class T>
+void TModelGeneralizedLinear<T>::clear_inner_prods_cache() {
+  cached_coeffs.clear();
+  cached_inner_prods.clear();
+}
+
+template <class T>
+T TModelGeneralizedLinear<T>::get_inner_prod(const ulong i, const Array<T> &coeffs) const {
+  const BaseArray<T> x_i = get_features(i);
   if (fit_intercept) {
     // The last coefficient of coeffs is the intercept
     const ulong size = coeffs.size();
-    const ArrayDouble w = view(coeffs, 0, size - 1);
+    const Array<T> w = view(coeffs, 0, size - 1);
     return x_i.dot(w) + coeffs[size - 1];
   } else {
     return x_i.dot(coeffs);
   }
 }
+
+template class TModelGeneralizedLinear<double>;
+template class TModelGeneralizedLinear<float>;
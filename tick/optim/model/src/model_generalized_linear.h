@@ -4,11 +4,18 @@
 #ifndef TICK_OPTIM_MODEL_SRC_MODEL_GENERALIZED_LINEAR_H_
 #define TICK_OPTIM_MODEL_SRC_MODEL_GENERALIZED_LINEAR_H_
 
+#include <vector>
+
 #include "model_labels_features.h"
 
-class ModelGeneralizedLinear : public ModelLabelsFeatures {
+template <class T>
+class TModelGeneralizedLinear : public TModelLabelsFeatures<T> {
  protected:
-  ArrayDouble features_norm_sq;
+  using TModelLabelsFeatures<T>::features;
+  using TModelLabelsFeatures<T>::n_samples;
+  using TModelLabelsFeatures<T>::n_features;
+
+  Array<T> features_norm_sq;
 
   unsigned int n_threads;
 
@@ -22,36 +29,133 @@ class ModelGeneralizedLinear : public ModelLabelsFeatures {
    * @param fill : If `true` out will be filled by the gradient value, otherwise out will be
    * inceremented by the gradient value.
    */
-  virtual void compute_grad_i(const ulong i, const ArrayDouble &coeffs,
-                              ArrayDouble &out, const bool fill);
+  virtual void compute_grad_i(const ulong i, const Array<T> &coeffs,
+                              Array<T> &out, const bool fill);
 
     bool ready_features_norm_sq;
 
+    /**
+     * Computes the squared norm of each row of the features (in parallel over the samples) if
+     * they have not been computed or set yet
+     */
     void compute_features_norm_sq();
 
+    void compute_features_norm_sq_i(const ulong i);
+
+  /**
+   * If true, loss and grad process dense features by blocks of rows: inner products of a block
+   * are computed at once with a matrix-vector product (BLAS gemv if available) and so is its
+   * gradient contribution, with the transposed block
+   */
+  bool blocked_dense;
+
+  bool use_blocks() const {
+    return blocked_dense && !features->is_sparse();
+  }
+
+  /**
+   * Boundaries of the blocks of rows processed by loss and grad, block b contains the rows
+   * block_starts[b], ..., block_starts[b + 1] - 1. Blocks hold about the same number of features
+   * values (non-zero ones for sparse features), few enough for a dense block to stay in cache
+   * between the computation of its inner products and of its gradient contribution, and there
+   * are at least n_threads of them
+   */
+  std::vector<ulong> get_block_starts() const;
+
+  /**
+   * Computes the inner products of the features rows first_row, ..., first_row + out.size() - 1
+   * with the first n_features coefficients of coeffs
+   */
+  void features_dot_block(const ulong first_row, const Array<T> &coeffs, Array<T> &out) const;
+
+  /**
+   * Computes the inner products of a block of samples with coeffs, as get_inner_prod does
+   */
+  virtual void compute_inner_prods_block(const ulong first_row, const Array<T> &coeffs,
+                                         Array<T> &out) const;
+
+  /**
+   * Increments the gradient of the intercept with the gradient factors of a block of samples
+   */
+  virtual void inc_intercept_grad_block(const ulong first_row, const Array<T> &grad_factors,
+                                        Array<T> &out) const;
+
+  /**
+   * Coefficients given to the last calls of loss, grad and loss_and_grad (most recent first) and
+   * the inner products of all samples with them. A new call with one of these coefficients
+   * reuses the inner products, e.g. when a solver computes the loss at the point it has just
+   * accepted after a linesearch and then the loss and gradient at this same point
+   */
+  std::vector<Array<T>> cached_coeffs;
+  std::vector<Array<T>> cached_inner_prods;
+
+  ulong inner_prods_cache_size;
+
+  /**
+   * Returns the cached inner products at coeffs, moved to the front of the cache, or nullptr
+   */
+  Array<T> *find_cached_inner_prods(const Array<T> &coeffs);
+
+  /**
+   * Computes loss and / or gradient in a single pass over the features, each inner product
+   * being computed only once (or not at all if it is cached)
+   */
+  T compute_loss_and_grad(const Array<T> &coeffs, Array<T> &out, const bool compute_loss,
+                          const bool compute_grad);
+
+  /**
+   * Stores the loss of a block of samples in block_losses and increments out with its gradient,
+   * inner products of the block are stored in inner_prods if compute_inner_prods is true and
+   * read from it otherwise
+   */
+  void loss_and_grad_block(const ulong block, Array<T> &out,
+                           const std::vector<ulong> &block_starts, const Array<T> &coeffs,
+                           Array<T> &inner_prods, Array<T> &block_losses,
+                           const bool compute_inner_prods, const bool compute_loss,
+                           const bool compute_grad);
+
  public:
-  ModelGeneralizedLinear(const SBaseArrayDouble2dPtr features,
-                         const SArrayDoublePtr labels,
-                         const bool fit_intercept,
-                         const int n_threads = 1);
+  using TModelLabelsFeatures<T>::get_features;
+
+  TModelGeneralizedLinear(const std::shared_ptr<BaseArray2d<T>> features,
+                          const std::shared_ptr<SArray<T>> labels,
+                          const bool fit_intercept,
+                          const int n_threads = 1);
 
   const char *get_class_name() const override;
 
-  double grad_i_factor(const ulong i, const ArrayDouble &coeffs) override;
+  T grad_i_factor(const ulong i, const Array<T> &coeffs) override;
+
+  /**
+   * Loss of sample i given its inner product with the coefficients
+   */
+  virtual T loss_i_from_inner_prod(const ulong i, const T inner_prod);
+
+  /**
+   * Gradient factor of sample i (see grad_i_factor) given its inner product with the
+   * coefficients
+   */
+  virtual T grad_i_factor_from_inner_prod(const ulong i, const T inner_prod);
 
-  void grad_i(const ulong i, const ArrayDouble &coeffs, ArrayDouble &out) override;
+  void grad_i(const ulong i, const Array<T> &coeffs, Array<T> &out) override;
 
   /**
-   * To be used by grad(ArrayDouble&, ArrayDouble&) to calculate grad by incrementally
+   * To be used by grad(Array<T>&, Array<T>&) to calculate grad by incrementally
    * updating 'out'
    * out and coeffs are not in the same order as in grad_i as this is necessary for
    * parallel_map_array
    */
-  virtual void inc_grad_i(const ulong i, ArrayDouble &out, const ArrayDouble &coeffs);
+  virtual void inc_grad_i(const ulong i, Array<T> &out, const Array<T> &coeffs);
 
-  void grad(const ArrayDouble &coeffs, ArrayDouble &out) override;
+  void grad(const Array<T> &coeffs, Array<T> &out) override;
 
-  double loss(const ArrayDouble &coeffs) override;
+  T loss(const Array<T> &coeffs) override;
+
+  /**
+   * Computes loss and gradient at once, inner products of the samples with coeffs are computed
+   * only once
+   */
+  T loss_and_grad(const Array<T> &coeffs, Array<T> &out);
 
   bool use_intercept() const override {
     return fit_intercept;
@@ -62,28 +166,74 @@ class ModelGeneralizedLinear : public ModelLabelsFeatures {
   }
 
   ulong get_n_coeffs() const override {
-    return get_n_features() + static_cast<int>(fit_intercept);
+    return this->get_n_features() + static_cast<int>(fit_intercept);
   }
 
-  virtual double get_inner_prod(const ulong i, const ArrayDouble &coeffs) const;
+  virtual T get_inner_prod(const ulong i, const Array<T> &coeffs) const;
+
+  /**
+   * @brief Squared norms of the rows of the features, computed if needed
+   */
+  std::shared_ptr<SArray<T>> get_features_norm_sq();
+
+  /**
+   * @brief Set the squared norms of the rows of the features, typically computed by another model
+   * fitted on the same features, so that they are not computed again
+   */
+  void set_features_norm_sq(const Array<T> &features_norm_sq);
 
   virtual void set_fit_intercept(const bool fit_intercept) {
     this->fit_intercept = fit_intercept;
+    clear_inner_prods_cache();
   }
 
   virtual bool get_fit_intercept() const {
     return fit_intercept;
   }
 
+  void set_blocked_dense(const bool blocked_dense) {
+    this->blocked_dense = blocked_dense;
+  }
+
+  bool get_blocked_dense() const {
+    return blocked_dense;
+  }
+
+  /**
+   * Number of blocks of rows loss and grad are split into, over the threads
+   */
+  ulong get_n_blocks() const {
+    return get_block_starts().size() - 1;
+  }
+
+  /**
+   * @brief Set the number of coefficients whose inner products with the samples are kept, 0
+   * disables the cache
+   */
+  void set_inner_prods_cache_size(const ulong inner_prods_cache_size);
+
+  ulong get_inner_prods_cache_size() const {
+    return inner_prods_cache_size;
+  }
+
+  void clear_inner_prods_cache();
+
   template<class Archive>
   void serialize(Archive & ar) {
-    ar(cereal::make_nvp("ModelLabelsFeatures", cereal::base_class<ModelLabelsFeatures>(this)));
+    ar(cereal::make_nvp("ModelLabelsFeatures",
+                        cereal::base_class<TModelLabelsFeatures<T>>(this)));
     ar(CEREAL_NVP(features_norm_sq));
+    ar(CEREAL_NVP(n_threads));
     ar(CEREAL_NVP(fit_intercept));
     ar(CEREAL_NVP(ready_features_norm_sq));
   }
 };
 
+typedef TModelGeneralizedLinear<double> ModelGeneralizedLinear;
+typedef TModelGeneralizedLinear<float> ModelGeneralizedLinearFloat;
+
 CEREAL_SPECIALIZE_FOR_ALL_ARCHIVES(ModelGeneralizedLinear, cereal::specialization::member_serialize)
+CEREAL_SPECIALIZE_FOR_ALL_ARCHIVES(ModelGeneralizedLinearFloat,
+                                   cereal::specialization::member_serialize)
 
 #endif  // TICK_OPTIM_MODEL_SRC_MODEL_GENERALIZED_LINEAR_H_
@@ -39,24 +39,19 @@ void ModelGeneralizedLinearWithIntercepts::compute_grad_i(const ulong i, const A
   }
 }
 
-void ModelGeneralizedLinearWithIntercepts::grad(const ArrayDouble &coeffs,
-                                                ArrayDouble &out) {
-  out.fill(0.0);
-  parallel_map_array<ArrayDouble>(n_threads,
-                                  n_samples,
-                                  [](ArrayDouble &r, const ArrayDouble &s) { r.mult_incr(s, 1.0); },
-                                  &ModelGeneralizedLinearWithIntercepts::inc_grad_i,
-                                  this,
-                                  out,
-                                  coeffs);
-
-  const double one_over_n_samples = 1.0 / n_samples;
-  out *= one_over_n_samples;
+void ModelGeneralizedLinearWithIntercepts::compute_inner_prods_block(const ulong first_row,
+                                                                     const ArrayDouble &coeffs,
+                                                                     ArrayDouble &out) const {
+  features_dot_block(first_row, coeffs, out);
+  // Each sample has its own intercept, after the n_features first coefficients
+  for (ulong k = 0; k < out.size(); ++k) {
+    out[k] += coeffs[n_features + first_row + k];
+  }
 }
 
-double ModelGeneralizedLinearWithIntercepts::loss(const ArrayDouble &coeffs) {
-  return parallel_map_additive_reduce(n_threads, n_samples,
-                                      &ModelGeneralizedLinearWithIntercepts::loss_i,
-                                      this, coeffs)
-      / n_samples;
+void ModelGeneralizedLinearWithIntercepts::inc_intercept_grad_block(
+    const ulong first_row, const ArrayDouble &grad_factors, ArrayDouble &out) const {
+  for (ulong k = 0; k < grad_factors.size(); ++k) {
+    out[n_features + first_row + k] += grad_factors[k];
+  }
 }
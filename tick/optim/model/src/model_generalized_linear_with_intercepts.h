@@ -20,6 +20,12 @@ class ModelGeneralizedLinearWithIntercepts : public ModelGeneralizedLinear {
   void compute_grad_i(const ulong i, const ArrayDouble &coeffs,
                       ArrayDouble &out, const bool fill) override;
 
+  void compute_inner_prods_block(const ulong first_row, const ArrayDouble &coeffs,
+                                 ArrayDouble &out) const override;
+
+  void inc_intercept_grad_block(const ulong first_row, const ArrayDouble &grad_factors,
+                                ArrayDouble &out) const override;
+
  public:
   ModelGeneralizedLinearWithIntercepts(const SBaseArrayDouble2dPtr features,
                                        const SArrayDoublePtr labels,
@@ -27,10 +33,6 @@ class ModelGeneralizedLinearWithIntercepts : public ModelGeneralizedLinear {
 
   const char *get_class_name() const override;
 
-  void grad(const ArrayDouble &coeffs, ArrayDouble &out) override;
-
-  double loss(const ArrayDouble &coeffs) override;
-
   double get_inner_prod(const ulong i, const ArrayDouble &coeffs) const override;
 
   ulong get_n_coeffs() const override {
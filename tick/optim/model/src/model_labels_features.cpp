@@ -4,8 +4,9 @@
 
 #include "model_labels_features.h"
 
-ModelLabelsFeatures::ModelLabelsFeatures(SBaseArrayDouble2dPtr features,
-                                         SArrayDoublePtr labels)
+template <class T>
+TModelLabelsFeatures<T>::TModelLabelsFeatures(std::shared_ptr<BaseArray2d<T>> features,
+                                              std::shared_ptr<SArray<T>> labels)
     : n_samples(labels.get() ? labels->size() : 0),
       n_features(features.get() ? features->n_cols() : 0),
       labels(labels),
@@ -17,3 +18,6 @@ ModelLabelsFeatures::ModelLabelsFeatures(SBaseArrayDouble2dPtr features,
     throw std::invalid_argument(ss.str());
   }
 }
+
+template class TModelLabelsFeatures<double>;
+template class TModelLabelsFeatures<float>;
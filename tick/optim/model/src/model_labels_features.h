@@ -8,19 +8,20 @@
 #include <iostream>
 #include "model.h"
 
-class ModelLabelsFeatures : public virtual Model {
+template <class T>
+class TModelLabelsFeatures : public virtual TModel<T> {
  protected:
   ulong n_samples, n_features;
 
   //! Labels vector
-  SArrayDoublePtr labels;
+  std::shared_ptr<SArray<T>> labels;
 
   //! Features matrix (either sparse or not)
-  SBaseArrayDouble2dPtr features;
+  std::shared_ptr<BaseArray2d<T>> features;
 
  public:
-  ModelLabelsFeatures(SBaseArrayDouble2dPtr features,
-                      SArrayDoublePtr labels);
+  TModelLabelsFeatures(std::shared_ptr<BaseArray2d<T>> features,
+                       std::shared_ptr<SArray<T>> labels);
 
   const char *get_class_name() const override {
     return "ModelLabelsFeatures";
@@ -35,11 +36,11 @@ class ModelLabelsFeatures : public virtual Model {
   }
 
   // TODO: add consts
-  BaseArrayDouble get_features(ulong i) const override {
+  BaseArray<T> get_features(ulong i) const override {
     return view_row(*features, i);
   }
 
-  virtual double get_label(ulong i) const {
+  virtual T get_label(ulong i) const {
     return (*labels)[i];
   }
 
@@ -55,13 +56,14 @@ class ModelLabelsFeatures : public virtual Model {
   void load(Archive & ar) {
     ar(CEREAL_NVP(n_samples) );
 
-    ArrayDouble temp_labels;
-    ArrayDouble2d temp_features;
+    Array<T> temp_labels;
+    Array2d<T> temp_features;
     ar(cereal::make_nvp("labels", temp_labels));
     ar(cereal::make_nvp("features", temp_features));
 
     labels = temp_labels.as_sarray_ptr();
     features = temp_features.as_sarray2d_ptr();
+    n_features = features->n_cols();
   }
 
   template<class Archive>
@@ -72,4 +74,7 @@ class ModelLabelsFeatures : public virtual Model {
   }
 };
 
+typedef TModelLabelsFeatures<double> ModelLabelsFeatures;
+typedef TModelLabelsFeatures<float> ModelLabelsFeaturesFloat;
+
 #endif  // TICK_OPTIM_MODEL_SRC_MODEL_LABELS_FEATURES_H_
@@ -76,7 +76,10 @@ double ModelPoisReg::sdca_dual_min_i(const ulong i,
 }
 
 double ModelPoisReg::loss_i(const ulong i, const ArrayDouble &coeffs) {
-  const double z = get_inner_prod(i, coeffs);
+  return loss_i_from_inner_prod(i, get_inner_prod(i, coeffs));
+}
+
+double ModelPoisReg::loss_i_from_inner_prod(const ulong i, const double z) {
   switch (link_type) {
     case LinkType::exponential: {
       return exp(z) - get_label(i) * z;
@@ -89,7 +92,10 @@ double ModelPoisReg::loss_i(const ulong i, const ArrayDouble &coeffs) {
 }
 
 double ModelPoisReg::grad_i_factor(const ulong i, const ArrayDouble &coeffs) {
-  const double z = get_inner_prod(i, coeffs);
+  return grad_i_factor_from_inner_prod(i, get_inner_prod(i, coeffs));
+}
+
+double ModelPoisReg::grad_i_factor_from_inner_prod(const ulong i, const double z) {
   switch (link_type) {
     case LinkType::exponential: {
       return exp(z) - get_label(i);
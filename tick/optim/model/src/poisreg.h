@@ -40,6 +40,10 @@ class ModelPoisReg : public ModelGeneralizedLinear {
 
   double grad_i_factor(const ulong i, const ArrayDouble &coeffs) override;
 
+  double loss_i_from_inner_prod(const ulong i, const double inner_prod) override;
+
+  double grad_i_factor_from_inner_prod(const ulong i, const double inner_prod) override;
+
   virtual void set_link_type(const LinkType link_type) {
     this->link_type = link_type;
   }
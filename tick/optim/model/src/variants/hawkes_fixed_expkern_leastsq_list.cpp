@@ -59,6 +59,12 @@ void ModelHawkesFixedExpKernLeastSqList::compute_weights_timestamps(
 }
 
 void ModelHawkesFixedExpKernLeastSqList::allocate_weights() {
+  if (decays->n_rows() != n_nodes || decays->n_cols() != n_nodes) {
+    TICK_ERROR("decays must be (" << n_nodes << ", " << n_nodes << ") array"
+                                  << " but received a (" << decays->n_rows() << ", "
+                                  << decays->n_cols() << ") array");
+  }
+
   Dg = ArrayDouble2d(n_nodes, n_nodes);
   Dg.init_to_zero();
   Dg2 = ArrayDouble2d(n_nodes, n_nodes);
@@ -41,7 +41,8 @@ class ModelHawkesFixedExpKernLeastSqList : public ModelHawkesLeastSqList {
    */
   void set_decays(const SArrayDouble2dPtr decays) {
     weights_computed = false;
-    if (decays->n_rows() != n_nodes || decays->n_cols() != n_nodes) {
+    // Before any realization is given, the shape is checked when weights are allocated
+    if (n_realizations > 0 && (decays->n_rows() != n_nodes || decays->n_cols() != n_nodes)) {
       TICK_ERROR("decays must be (" << n_nodes << ", " << n_nodes << ") array"
                                     << " but recevied a (" << decays->n_rows() << ", "
                                     << decays->n_cols() << ") array");
@@ -33,10 +33,21 @@ void ModelHawkesFixedExpKernLogLikList::incremental_set_data(
   }
   n_jumps_per_realization->append1(n_total_jumps);
 
+  ulong stored_weights_size = 0;
+  for (auto &model : model_list) {
+    if (model.weights_stored) stored_weights_size += model.get_weights_size();
+  }
+
   auto model = ModelHawkesFixedExpKernLogLik(decay, get_n_threads());
   model.set_data(timestamps, end_time);
-  model.compute_weights();
+  // This realization's weights are stored if they fit in what remains of the budget
+  model.weights_stored = weights_fit_in_budget(stored_weights_size + model.get_weights_size());
+  model.allocate_weights();
+  parallel_run(get_n_threads(), n_nodes,
+               &ModelHawkesFixedExpKernLogLik::compute_weights_dim_i, &model);
+  model.weights_computed = true;
   model_list.push_back(model);
+  cum_n_jumps_per_realization = cumulative_counts(*n_jumps_per_realization);
 
   weights_computed = true;
 }
@@ -44,10 +55,19 @@ void ModelHawkesFixedExpKernLogLikList::incremental_set_data(
 void ModelHawkesFixedExpKernLogLikList::compute_weights() {
   model_list = std::vector<ModelHawkesFixedExpKernLogLik>(n_realizations);
 
+  ulong weights_size = 0;
   for (ulong r = 0; r < n_realizations; ++r) {
     model_list[r] = ModelHawkesFixedExpKernLogLik(decay, 1);
     model_list[r].set_data(timestamps_list[r], (*end_times)[r]);
-    model_list[r].allocate_weights();
+    weights_size += model_list[r].get_weights_size();
+  }
+
+  cum_n_jumps_per_realization = cumulative_counts(*n_jumps_per_realization);
+
+  const bool weights_stored = weights_fit_in_budget(weights_size);
+  for (auto &model : model_list) {
+    model.weights_stored = weights_stored;
+    model.allocate_weights();
   }
 
   parallel_run(get_n_threads(), n_realizations * n_nodes,
@@ -150,15 +170,8 @@ double ModelHawkesFixedExpKernLogLikList::hessian_norm(const ArrayDouble &coeffs
 
 std::pair<ulong, ulong> ModelHawkesFixedExpKernLogLikList::sampled_i_to_realization(
     const ulong sampled_i) {
-  ulong cum_n_jumps = 0;
-  for (ulong r = 0; r < n_realizations; r++) {
-    cum_n_jumps += (*n_jumps_per_realization)[r];
-    if (sampled_i < cum_n_jumps) {
-      const ulong i_in_realization_r = sampled_i - cum_n_jumps + (*n_jumps_per_realization)[r];
-      return std::pair<ulong, ulong>(r, i_in_realization_r);
-    }
-  }
-  TICK_ERROR("sampled_i out of range");
+  const ulong r = cumulative_counts_index(cum_n_jumps_per_realization, sampled_i);
+  return std::pair<ulong, ulong>(r, sampled_i - cum_n_jumps_per_realization[r]);
 }
 
 ulong ModelHawkesFixedExpKernLogLikList::get_n_coeffs() const {
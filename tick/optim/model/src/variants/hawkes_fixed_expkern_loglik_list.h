@@ -16,6 +16,10 @@ class ModelHawkesFixedExpKernLogLikList : public ModelHawkesList {
 
   std::vector<ModelHawkesFixedExpKernLogLik> model_list;
 
+  //! @brief Cumulative number of jumps of the realizations (size n_realizations + 1), used to
+  //! find the realization a sampled timestamp belongs to
+  ArrayULong cum_n_jumps_per_realization;
+
  public:
   /**
    * @brief Constructor
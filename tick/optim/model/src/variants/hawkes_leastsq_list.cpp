@@ -31,6 +31,10 @@ double ModelHawkesLeastSqList::loss(const ArrayDouble &coeffs) {
 // Full initialization of the arrays H, Dg, Dg2 and C
 // Must be performed just once
 void ModelHawkesLeastSqList::compute_weights() {
+  if (timestamps_list.size() != n_realizations) {
+    TICK_ERROR("Timestamps given through incremental_set_data are not kept, hence weights "
+                   "cannot be recomputed. Please give all realizations again.");
+  }
   allocate_weights();
 
   compute_weights_timestamps_list();
@@ -73,3 +77,13 @@ void ModelHawkesLeastSqList::incremental_set_data(const SArrayDoublePtrList1D &t
   weights_computed = true;
   synchronize_aggregated_model();
 }
+
+void ModelHawkesLeastSqList::clear_data() {
+  timestamps_list.clear();
+  n_realizations = 0;
+  end_times = VArrayDouble::new_ptr(0);
+  n_jumps_per_realization = VArrayULong::new_ptr(0);
+
+  weights_allocated = false;
+  weights_computed = false;
+}
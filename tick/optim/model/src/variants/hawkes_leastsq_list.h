@@ -25,8 +25,19 @@ class ModelHawkesLeastSqList : public ModelHawkesList {
   ModelHawkesLeastSqList(const int max_n_threads = 1,
                   const unsigned int optimization_level = 0);
 
+  /**
+   * @brief Add a realization to the model
+   * Only the weights (sufficient statistics) of the realization are accumulated, its
+   * timestamps are not kept. Hence the weights cannot be recomputed afterwards.
+   * \param timestamps : timestamps of the realization, one array per node
+   * \param end_time : end time of the realization
+   */
   void incremental_set_data(const SArrayDoublePtrList1D &timestamps, double end_time);
 
+  //! @brief Forget all realizations given so far, the next one given to
+  //! incremental_set_data starts a new dataset
+  void clear_data();
+
   /**
    * @brief Precomputations of intermediate values
    * They will be used to compute faster loss and gradient
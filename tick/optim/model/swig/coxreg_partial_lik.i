@@ -8,5 +8,8 @@ class ModelCoxRegPartialLik : public Model {
 
   ModelCoxRegPartialLik(const SBaseArrayDouble2dPtr features,
                         const SArrayDoublePtr times,
-                        const SArrayUShortPtr censoring);
+                        const SArrayUShortPtr censoring,
+                        const int n_threads = 1);
+
+  double loss_and_grad(const ArrayDouble &coeffs, ArrayDouble &out);
 };
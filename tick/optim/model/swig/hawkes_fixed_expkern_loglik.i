@@ -24,6 +24,9 @@ class ModelHawkesFixedExpKernLogLik : public Model {
   unsigned int get_n_threads() const;
   void set_n_threads(unsigned int n_threads);
 
+  ulong get_weights_memory_budget() const;
+  void set_weights_memory_budget(const ulong weights_memory_budget);
+
   ulong get_n_total_jumps() const;
   ulong get_n_coeffs() const;
   ulong get_n_nodes() const;
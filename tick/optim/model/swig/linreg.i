@@ -13,3 +13,19 @@ class ModelLinReg : public ModelGeneralizedLinear,
               const int n_threads);
 
 };
+
+TICK_MAKE_PICKLABLE(ModelLinReg, _empty_features(), _empty_labels(), False, 1);
+
+class ModelLinRegFloat : public ModelGeneralizedLinearFloat,
+                         public ModelLipschitzFloat {
+ public:
+
+  ModelLinRegFloat(const SBaseArrayFloat2dPtr features,
+                   const SArrayFloatPtr labels,
+                   const bool fit_intercept,
+                   const int n_threads);
+
+};
+
+TICK_MAKE_PICKLABLE(ModelLinRegFloat, _empty_features('float32'),
+                    _empty_labels('float32'), False, 1);
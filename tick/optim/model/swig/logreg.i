@@ -15,3 +15,17 @@ class ModelLogReg : public ModelGeneralizedLinear, public ModelLipschitz {
 
   static void logistic(const ArrayDouble &x, ArrayDouble &out);
 };
+
+TICK_MAKE_PICKLABLE(ModelLogReg, _empty_features(), _empty_labels(), False, 1);
+
+class ModelLogRegFloat : public ModelGeneralizedLinearFloat, public ModelLipschitzFloat {
+ public:
+
+  ModelLogRegFloat(const SBaseArrayFloat2dPtr features,
+                   const SArrayFloatPtr labels,
+                   const bool fit_intercept,
+                   const int n_threads);
+};
+
+TICK_MAKE_PICKLABLE(ModelLogRegFloat, _empty_features('float32'),
+                    _empty_labels('float32'), False, 1);
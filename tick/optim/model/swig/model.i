@@ -18,3 +18,17 @@ class Model {
 };
 
 typedef std::shared_ptr<Model> ModelPtr;
+
+class ModelFloat {
+
+ public:
+
+  ModelFloat() { }
+
+  virtual void grad(const ArrayFloat& coeffs, ArrayFloat& out);
+  virtual float loss(const ArrayFloat& coeffs);
+
+  virtual unsigned long get_epoch_size() const;
+};
+
+typedef std::shared_ptr<ModelFloat> ModelFloatPtr;
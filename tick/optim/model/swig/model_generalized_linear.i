@@ -13,4 +13,42 @@ class ModelGeneralizedLinear : public ModelLabelsFeatures {
   unsigned long get_n_coeffs() const override;
 
   virtual void set_fit_intercept(bool fit_intercept);
+
+  SArrayDoublePtr get_features_norm_sq();
+  void set_features_norm_sq(const ArrayDouble &features_norm_sq);
+
+  void set_blocked_dense(const bool blocked_dense);
+  bool get_blocked_dense() const;
+  unsigned long get_n_blocks() const;
+
+  double loss_and_grad(const ArrayDouble &coeffs, ArrayDouble &out);
+
+  void set_inner_prods_cache_size(const unsigned long inner_prods_cache_size);
+  unsigned long get_inner_prods_cache_size() const;
+  void clear_inner_prods_cache();
+};
+
+class ModelGeneralizedLinearFloat : public ModelLabelsFeaturesFloat {
+ public:
+  ModelGeneralizedLinearFloat(const SBaseArrayFloat2dPtr features,
+                              const SArrayFloatPtr labels,
+                              const bool fit_intercept,
+                              const int n_threads = 1);
+
+  unsigned long get_n_coeffs() const override;
+
+  virtual void set_fit_intercept(bool fit_intercept);
+
+  SArrayFloatPtr get_features_norm_sq();
+  void set_features_norm_sq(const ArrayFloat &features_norm_sq);
+
+  void set_blocked_dense(const bool blocked_dense);
+  bool get_blocked_dense() const;
+  unsigned long get_n_blocks() const;
+
+  float loss_and_grad(const ArrayFloat &coeffs, ArrayFloat &out);
+
+  void set_inner_prods_cache_size(const unsigned long inner_prods_cache_size);
+  unsigned long get_inner_prods_cache_size() const;
+  void clear_inner_prods_cache();
 };
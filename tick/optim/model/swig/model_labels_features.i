@@ -13,3 +13,30 @@ class ModelLabelsFeatures : public virtual Model {
   virtual unsigned long get_n_samples() const;
   virtual unsigned long get_n_features() const;
 };
+
+class ModelLabelsFeaturesFloat : public virtual ModelFloat {
+
+ public:
+  ModelLabelsFeaturesFloat(const SBaseArrayFloat2dPtr features,
+                           const SArrayFloatPtr labels);
+
+  virtual unsigned long get_n_samples() const;
+  virtual unsigned long get_n_features() const;
+};
+
+%pythoncode %{
+def _empty_features(dtype='float64'):
+    """Features given to the constructor of a model before its state is
+    restored from a pickle
+    """
+    import numpy as np
+    return np.zeros((0, 0), dtype=dtype)
+
+
+def _empty_labels(dtype='float64'):
+    """Labels given to the constructor of a model before its state is
+    restored from a pickle
+    """
+    import numpy as np
+    return np.zeros(0, dtype=dtype)
+%}
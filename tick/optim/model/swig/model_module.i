@@ -1,6 +1,7 @@
 %module model
 
 %include defs.i
+%include serialization.i
 %include std_shared_ptr.i
 
 %shared_ptr(Model);
@@ -13,6 +14,13 @@
 %shared_ptr(ModelLogReg);
 %shared_ptr(ModelPoisReg);
 
+%shared_ptr(ModelFloat);
+%shared_ptr(ModelLabelsFeaturesFloat);
+%shared_ptr(ModelGeneralizedLinearFloat);
+%shared_ptr(ModelLipschitzFloat);
+%shared_ptr(ModelLinRegFloat);
+%shared_ptr(ModelLogRegFloat);
+
 %shared_ptr(ModelHawkes);
 
 %shared_ptr(ModelHawkesSingle);
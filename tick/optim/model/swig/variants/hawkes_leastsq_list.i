@@ -11,5 +11,7 @@ class ModelHawkesLeastSqList : public ModelHawkesList {
 
   void incremental_set_data(const SArrayDoublePtrList1D &timestamps, double end_time);
 
+  void clear_data();
+
   void compute_weights();
 };
@@ -20,4 +20,7 @@ class ModelHawkesList : public Model {
   SArrayULongPtr get_n_jumps_per_realization() const;
 
   void set_n_threads(const int max_n_threads);
+
+  ulong get_weights_memory_budget() const;
+  void set_weights_memory_budget(const ulong weights_memory_budget);
 };
@@ -24,6 +24,33 @@ class Test(TestGLM):
         model_spars.fit(csr_matrix(features), times, censoring)
         self.run_test_for_glm(model, model_spars, 1e-5, 1e-4)
 
+    def test_ModelCoxRegPartialLik_n_threads(self):
+        """...Test that loss and gradient of Cox Regression computed on
+        several threads, separately or together, are the same
+        """
+        np.random.seed(123)
+        n_samples, n_features = 100, 5
+        w0 = np.random.randn(n_features)
+        features, times, censoring = SimuCoxReg(w0, n_samples=n_samples,
+                                                verbose=False,
+                                                seed=1234).simulate()
+        coeffs = np.random.randn(n_features)
+
+        model = ModelCoxRegPartialLik().fit(features, times, censoring)
+        for n_threads in [2, 3, 7]:
+            model_threads = ModelCoxRegPartialLik(n_threads=n_threads)
+            model_threads.fit(csr_matrix(features), times, censoring)
+            self.assertEqual(model_threads.n_threads, n_threads)
+
+            loss, grad = model_threads.loss_and_grad(coeffs)
+            self.assertAlmostEqual(loss, model.loss(coeffs), places=10)
+            np.testing.assert_array_almost_equal(grad, model.grad(coeffs),
+                                                 decimal=10)
+            self.assertAlmostEqual(model_threads.loss(coeffs), loss,
+                                   places=10)
+            np.testing.assert_array_almost_equal(
+                model_threads.grad(coeffs), grad, decimal=10)
+
 
 if __name__ == '__main__':
     unittest.main()
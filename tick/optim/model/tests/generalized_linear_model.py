@@ -23,6 +23,14 @@ class TestGLM(unittest.TestCase):
         self.assertAlmostEqual(norm(model.grad(coeffs_min)),
                                .0, delta=delta_model_grad)
 
+    def _test_loss_and_grad(self, model, coeffs):
+        """Test that loss and gradient computed together are the same as
+        the ones computed separately
+        """
+        loss, grad = model.loss_and_grad(coeffs)
+        self.assertAlmostEqual(loss, model.loss(coeffs), places=10)
+        np.testing.assert_almost_equal(grad, model.grad(coeffs), decimal=10)
+
     def run_test_for_glm(self, model, model_spars=None,
                          delta_check_grad=1e-5,
                          delta_model_grad=1e-4):
@@ -34,11 +42,13 @@ class TestGLM(unittest.TestCase):
         self._test_grad(model, coeffs,
                         delta_check_grad=delta_check_grad,
                         delta_model_grad=delta_model_grad)
+        self._test_loss_and_grad(model, coeffs)
         # sparse case
         if model_spars is not None:
             self._test_grad(model_spars, coeffs,
                             delta_check_grad=delta_check_grad,
                             delta_model_grad=delta_model_grad)
+            self._test_loss_and_grad(model_spars, coeffs)
 
             # Check that loss computed in the dense and sparse case are
             # the same
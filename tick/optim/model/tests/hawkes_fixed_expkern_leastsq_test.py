@@ -92,6 +92,42 @@ class Test(unittest.TestCase):
         self.assertEqual(model_incremental_fit.loss(self.coeffs),
                          self.model_list.loss(self.coeffs))
 
+    def test_model_hawkes_least_sq_fit_iterator(self):
+        """...Test that ModelHawkesFixedExpKernLeastSq fitted on an iterator
+        of realizations is consistent with a fit on the list of realizations
+        """
+        end_times = np.array([max(map(max, e)) for e in self.timestamps_list])
+        end_times += 1.
+        self.model_list.fit(self.timestamps_list, end_times=end_times)
+
+        model_iterator = ModelHawkesFixedExpKernLeastSq(decays=self.decays)
+        # Fitting twice checks that previous realizations are forgotten
+        for _ in range(2):
+            model_iterator.fit(iter(self.timestamps_list),
+                               end_times=end_times)
+
+        self.assertIsNone(model_iterator.data)
+        self.assertEqual(model_iterator.n_jumps, self.model_list.n_jumps)
+        self.assertAlmostEqual(model_iterator.loss(self.coeffs),
+                               self.model_list.loss(self.coeffs), places=12)
+
+        # With a float decay, decays are set before any realization is read
+        model_float = ModelHawkesFixedExpKernLeastSq(decays=2.)
+        model_float.fit(iter(self.timestamps_list))
+        model_float_list = ModelHawkesFixedExpKernLeastSq(decays=2.)
+        model_float_list.fit(self.timestamps_list)
+        self.assertAlmostEqual(model_float.loss(self.coeffs),
+                               model_float_list.loss(self.coeffs), places=12)
+
+        # Timestamps are not kept, weights cannot be recomputed
+        model_iterator.decays = self.decays + 1
+        with self.assertRaisesRegex(RuntimeError, "cannot be recomputed"):
+            model_iterator.loss(self.coeffs)
+
+        with self.assertRaisesRegex(ValueError, "given for 1 realizations"):
+            model_iterator.fit(iter(self.timestamps_list[:1]),
+                               end_times=end_times)
+
     def test_model_hawkes_least_sq_grad(self):
         """...Test that ModelHawkesFixedExpKernLeastSq gradient is consistent
         with loss
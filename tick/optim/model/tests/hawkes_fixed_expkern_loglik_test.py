@@ -1,7 +1,10 @@
+import shutil
+import tempfile
 import unittest
 import numpy as np
 from scipy.optimize import check_grad
 
+from tick.base import EventStore
 from tick.optim.model import ModelHawkesFixedExpKernLogLik
 from tick.optim.model.tests.hawkes_utils import hawkes_log_likelihood, \
     hawkes_exp_kernel_intensities
@@ -92,6 +95,47 @@ class Test(unittest.TestCase):
         self.assertEqual(model_incremental_fit.loss(self.coeffs),
                          self.model_list.loss(self.coeffs))
 
+    def test_model_hawkes_loglik_weights_memory_budget(self):
+        """...Test that ModelHawkesFixedExpKernLogLik gives the same results
+        when its weights do not fit in weights_memory_budget
+        """
+        model_budget = ModelHawkesFixedExpKernLogLik(
+            self.decay, weights_memory_budget=8)
+        model_budget.fit(self.timestamps_list)
+        self.assertEqual(model_budget.weights_memory_budget, 8)
+
+        self.assertAlmostEqual(model_budget.loss(self.coeffs),
+                               self.model_list.loss(self.coeffs), places=12)
+        np.testing.assert_array_almost_equal(
+            model_budget.grad(self.coeffs), self.model_list.grad(self.coeffs),
+            decimal=12)
+        self.assertAlmostEqual(
+            model_budget.hessian_norm(self.coeffs, self.coeffs),
+            self.model_list.hessian_norm(self.coeffs, self.coeffs), places=12)
+
+    def test_model_hawkes_loglik_event_store(self):
+        """...Test that ModelHawkesFixedExpKernLogLik fitted on an EventStore
+        is the same as the one fitted on its realizations
+        """
+        end_times = np.array([max(map(max, e)) for e in self.timestamps_list])
+        end_times += 1.
+
+        path = tempfile.mkdtemp()
+        try:
+            store = EventStore.write(path, self.timestamps_list,
+                                     end_times=end_times)
+            model_store = ModelHawkesFixedExpKernLogLik(self.decay)
+            model_store.fit(store)
+            self.model_list.fit(self.timestamps_list, end_times=end_times)
+
+            np.testing.assert_array_equal(model_store.end_times, end_times)
+            self.assertEqual(model_store.loss(self.coeffs),
+                             self.model_list.loss(self.coeffs))
+            np.testing.assert_array_equal(model_store.grad(self.coeffs),
+                                          self.model_list.grad(self.coeffs))
+        finally:
+            shutil.rmtree(path)
+
     def test_model_hawkes_loglik_grad(self):
         """...Test that ModelHawkesFixedExpKernLeastSq gradient is consistent
         with loss
@@ -100,6 +100,18 @@ class Test(unittest.TestCase):
         self.assertEqual(model_incremental_fit.loss(self.coeffs),
                          self.model_list.loss(self.coeffs))
 
+    def test_model_hawkes_least_sq_fit_iterator(self):
+        """...Test that ModelHawkesFixedSumExpKernLeastSq fitted on an
+        iterator of realizations is consistent with a fit on the list of
+        realizations
+        """
+        model_iterator = \
+            ModelHawkesFixedSumExpKernLeastSq(decays=self.decays)
+        model_iterator.fit(timestamps for timestamps in self.timestamps_list)
+
+        self.assertAlmostEqual(model_iterator.loss(self.coeffs),
+                               self.model_list.loss(self.coeffs), places=12)
+
     def test_model_hawkes_least_sq_grad(self):
         """...Test that ModelHawkesFixedExpKernLeastSq gradient is consistent
         with loss
@@ -33,5 +33,31 @@ class Test(TestGLM):
         self.assertAlmostEqual(model.get_lip_mean(), model_spars.get_lip_mean())
         self.assertAlmostEqual(model.get_lip_max(), model_spars.get_lip_max())
 
+    def test_ModelLinRegWithIntercepts_blocked_dense(self):
+        """...Test that loss and gradient computed on dense features by
+        blocks of rows are the same as the ones computed row by row
+        """
+        np.random.seed(12)
+        n_samples, n_features = 5000, 10
+        w0 = np.random.randn(n_features)
+        intercept0 = 50 * weights_sparse_gauss(n_weights=n_samples, nnz=30)
+        X, y = SimuLinReg(w0, None, n_samples=n_samples,
+                          verbose=False, seed=2038).simulate()
+        y += intercept0
+        coeffs = np.random.randn(n_features + n_samples)
+
+        for n_threads in [1, 3]:
+            model = ModelLinRegWithIntercepts(n_threads=n_threads).fit(X, y)
+            self.assertTrue(model._model.get_blocked_dense())
+            blocked_loss = model.loss(coeffs)
+            blocked_grad = model.grad(coeffs)
+
+            model._model.set_blocked_dense(False)
+            self.assertAlmostEqual(model.loss(coeffs), blocked_loss,
+                                   places=10)
+            np.testing.assert_array_almost_equal(model.grad(coeffs),
+                                                 blocked_grad, decimal=12)
+
+
 if __name__ == '__main__':
     unittest.main()
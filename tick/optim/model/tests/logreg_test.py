@@ -1,8 +1,10 @@
+import pickle
 import unittest
 
 import numpy as np
 from scipy.sparse import csr_matrix
 
+from tick.base import set_pickle_format
 from tick.optim.model import ModelLogReg
 from tick.optim.model.tests.generalized_linear_model import TestGLM
 from tick.simulation import SimuLogReg
@@ -52,6 +54,150 @@ class Test(TestGLM):
         self.assertAlmostEqual(model_spars.get_lip_mean(), model.get_lip_mean())
         self.assertAlmostEqual(model_spars.get_lip_max(), model.get_lip_max())
 
+    def test_ModelLogReg_pickle(self):
+        """...Test pickling of ModelLogReg in binary and JSON formats
+        """
+        np.random.seed(12)
+        n_samples, n_features = 200, 5
+        w0 = np.random.randn(n_features)
+        X, y = SimuLogReg(w0, -1., n_samples=n_samples,
+                          verbose=False, seed=2038).simulate()
+        coeffs = np.random.randn(n_features + 1)
+        model = ModelLogReg(fit_intercept=True, n_threads=2).fit(X, y)
+
+        for pickle_format in ['binary', 'json']:
+            set_pickle_format(pickle_format)
+            try:
+                pickled = pickle.loads(pickle.dumps(model))
+            finally:
+                set_pickle_format('binary')
+
+            np.testing.assert_array_equal(model.grad(coeffs),
+                                          pickled.grad(coeffs))
+            self.assertEqual(model.loss(coeffs), pickled.loss(coeffs))
+            self.assertEqual(model.get_lip_max(), pickled.get_lip_max())
+
+    def test_ModelLogReg_features_norm_sq(self):
+        """...Test that squared norms of features rows are computed in
+        parallel and shared by models fitted on the same features
+        """
+        np.random.seed(12)
+        n_samples, n_features = 300, 5
+        w0 = np.random.randn(n_features)
+        X, y = SimuLogReg(w0, -1., n_samples=n_samples,
+                          verbose=False, seed=2038).simulate()
+        X_spars = csr_matrix(X)
+
+        model = ModelLogReg(fit_intercept=True, n_threads=3).fit(X, y)
+        # Norms are not computed at fit
+        self.assertIsNone(model._features_norm_sq)
+        np.testing.assert_almost_equal(model.features_norm_sq,
+                                       (X ** 2).sum(axis=1))
+
+        model_spars = ModelLogReg(fit_intercept=True).fit(X_spars, y)
+        np.testing.assert_almost_equal(model_spars.features_norm_sq,
+                                       model.features_norm_sq)
+
+        # A new fit on the same features reuses the norms, when Lipschitz
+        # constants are computed
+        other_model = ModelLogReg(fit_intercept=False).fit(X, y)
+        self.assertAlmostEqual(other_model.get_lip_max(),
+                               ((X ** 2).sum(axis=1) / 4).max())
+        self.assertIs(other_model._features_norm_sq, model.features_norm_sq)
+        self.assertIs(other_model.features_norm_sq, model.features_norm_sq)
+
+        # But not on a copy of them
+        copied_model = ModelLogReg(fit_intercept=True).fit(X.copy(), y)
+        self.assertIsNot(copied_model.features_norm_sq,
+                         model.features_norm_sq)
+        self.assertAlmostEqual(copied_model.get_lip_max(), model.get_lip_max())
+
+    def test_ModelLogReg_blocked_dense(self):
+        """...Test that loss and gradient computed on dense features by
+        blocks of rows are the same as the ones computed row by row
+        """
+        np.random.seed(12)
+        n_samples, n_features = 5000, 10
+        w0 = np.random.randn(n_features)
+        X, y = SimuLogReg(w0, -1., n_samples=n_samples,
+                          verbose=False, seed=2038).simulate()
+        coeffs = np.random.randn(n_features + 1)
+
+        for n_threads in [1, 3]:
+            model = ModelLogReg(fit_intercept=True, n_threads=n_threads)
+            model.fit(X, y)
+            self.assertTrue(model._model.get_blocked_dense())
+            blocked_loss = model.loss(coeffs)
+            blocked_grad = model.grad(coeffs)
+
+            model._model.set_blocked_dense(False)
+            self.assertAlmostEqual(model.loss(coeffs), blocked_loss,
+                                   places=12)
+            np.testing.assert_array_almost_equal(model.grad(coeffs),
+                                                 blocked_grad, decimal=12)
+
+    def test_ModelLogReg_blocks_n_threads(self):
+        """...Test that loss and gradient are split into at least as many
+        blocks of rows as threads, for dense and sparse features
+        """
+        np.random.seed(12)
+        n_samples, n_features = 500, 10
+        w0 = np.random.randn(n_features)
+        X, y = SimuLogReg(w0, -1., n_samples=n_samples,
+                          verbose=False, seed=2038).simulate()
+        X[np.abs(X) < 1] = 0
+        X_spars = csr_matrix(X)
+        coeffs = np.random.randn(n_features + 1)
+
+        for features in [X, X_spars]:
+            model = ModelLogReg(fit_intercept=True).fit(features, y)
+            self.assertEqual(model._model.get_n_blocks(), 1)
+            loss, grad = model.loss(coeffs), model.grad(coeffs)
+
+            for n_threads in [2, 4]:
+                model = ModelLogReg(fit_intercept=True, n_threads=n_threads)
+                model.fit(features, y)
+                self.assertGreaterEqual(model._model.get_n_blocks(),
+                                        n_threads)
+                self.assertAlmostEqual(model.loss(coeffs), loss, places=12)
+                np.testing.assert_array_almost_equal(model.grad(coeffs),
+                                                     grad, decimal=12)
+
+    def test_ModelLogReg_inner_prods_cache(self):
+        """...Test that inner products cached by ModelLogReg are only reused
+        at the same coefficients
+        """
+        np.random.seed(12)
+        n_samples, n_features = 300, 5
+        w0 = np.random.randn(n_features)
+        X, y = SimuLogReg(w0, -1., n_samples=n_samples,
+                          verbose=False, seed=2038).simulate()
+        coeffs = np.random.randn(n_features + 1)
+
+        model = ModelLogReg(fit_intercept=True).fit(X, y)
+        model_no_cache = ModelLogReg(fit_intercept=True).fit(X, y)
+        model_no_cache._model.set_inner_prods_cache_size(0)
+        self.assertEqual(model._model.get_inner_prods_cache_size(), 2)
+
+        for _ in range(3):
+            loss, grad = model.loss_and_grad(coeffs)
+            self.assertEqual(model.loss(coeffs), loss)
+            np.testing.assert_array_equal(model.grad(coeffs), grad)
+
+            self.assertAlmostEqual(loss, model_no_cache.loss(coeffs),
+                                   places=12)
+            np.testing.assert_array_almost_equal(
+                grad, model_no_cache.grad(coeffs), decimal=12)
+
+            # Coefficients modified inplace are not found in the cache
+            coeffs[1] += 0.5
+
+        # Neither are coefficients of a model whose intercept is removed
+        model.fit_intercept = False
+        self.assertAlmostEqual(model.loss(coeffs[:-1]),
+                               ModelLogReg(fit_intercept=False).fit(X, y)
+                               .loss(coeffs[:-1]), places=12)
+
 
 if __name__ == '__main__':
     unittest.main()
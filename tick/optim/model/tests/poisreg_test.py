@@ -56,6 +56,40 @@ class Test(TestGLM):
         self.assertAlmostEqual(model._sc_constant, 2.)
         self.assertAlmostEqual(model_sparse._sc_constant, 2.)
 
+    def test_ModelPoisReg_blocked_dense(self):
+        """...Test that loss and gradient computed on dense features by
+        blocks of rows are the same as the ones computed row by row
+        """
+        np.random.seed(12)
+        n_samples, n_features = 5000, 10
+        w0 = np.random.randn(n_features) / n_features
+        X, y = SimuPoisReg(w0, -1., n_samples=n_samples,
+                           verbose=False, seed=1234).simulate()
+        X /= n_features
+
+        for link, fit_intercept in [('exponential', True),
+                                    ('identity', False)]:
+            if link == 'identity':
+                # Inner products must be positive with identity link
+                X_link = np.abs(X)
+                coeffs = np.random.rand(n_features)
+            else:
+                X_link = X
+                coeffs = np.random.randn(n_features + 1)
+
+            for n_threads in [1, 3]:
+                model = ModelPoisReg(fit_intercept=fit_intercept, link=link,
+                                     n_threads=n_threads).fit(X_link, y)
+                self.assertTrue(model._model.get_blocked_dense())
+                blocked_loss = model.loss(coeffs)
+                blocked_grad = model.grad(coeffs)
+
+                model._model.set_blocked_dense(False)
+                self.assertAlmostEqual(model.loss(coeffs), blocked_loss,
+                                       places=10)
+                np.testing.assert_array_almost_equal(
+                    model.grad(coeffs), blocked_grad, decimal=10)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -10,6 +10,7 @@
 #include "hawkes_fixed_expkern_loglik.h"
 #include "hawkes_fixed_expkern_leastsq.h"
 #include "hawkes_fixed_sumexpkern_leastsq.h"
+#include "hawkes_utils.h"
 
 #include "variants/hawkes_fixed_expkern_leastsq_list.h"
 #include "variants/hawkes_fixed_sumexpkern_leastsq_list.h"
@@ -30,6 +31,99 @@ class HawkesModelTest : public ::testing::Test {
   }
 };
 
+TEST(HawkesUtilsTest, cumulative_counts_index){
+  // Counts 0 and 3 are empty
+  ArrayULong counts {2, 1, 0, 0, 3};
+  ArrayULong cum_counts = cumulative_counts(counts);
+
+  ArrayULong expected_cum_counts {0, 2, 3, 3, 3, 6};
+  EXPECT_EQ(cum_counts.size(), expected_cum_counts.size());
+  for (ulong d = 0; d < expected_cum_counts.size(); ++d) {
+    SCOPED_TRACE(d);
+    EXPECT_EQ(cum_counts[d], expected_cum_counts[d]);
+  }
+
+  // First and last index of each non empty count
+  ArrayULong expected_d {0, 0, 1, 4, 4, 4};
+  for (ulong index = 0; index < expected_d.size(); ++index) {
+    SCOPED_TRACE(index);
+    EXPECT_EQ(cumulative_counts_index(cum_counts, index), expected_d[index]);
+  }
+
+  // Empty first count
+  ArrayULong cum_counts_empty_first = cumulative_counts(ArrayULong {0, 2});
+  EXPECT_EQ(cumulative_counts_index(cum_counts_empty_first, 0), 1ul);
+  EXPECT_EQ(cumulative_counts_index(cum_counts_empty_first, 1), 1ul);
+
+  EXPECT_THROW(cumulative_counts_index(cum_counts, 6), std::runtime_error);
+  EXPECT_THROW(cumulative_counts_index(cum_counts, 100), std::runtime_error);
+  EXPECT_THROW(cumulative_counts_index(cumulative_counts(ArrayULong {0, 0}), 0),
+               std::runtime_error);
+}
+
+TEST_F(HawkesModelTest, sampled_i_to_index_loglikelihood){
+  // Node 1 has no jump
+  SArrayDoublePtrList1D timestamps_empty_node = SArrayDoublePtrList1D(0);
+  timestamps_empty_node.push_back(timestamps[0]);
+  timestamps_empty_node.push_back(ArrayDouble(0).as_sarray_ptr());
+  timestamps_empty_node.push_back(timestamps[1]);
+
+  ModelHawkesFixedExpKernLogLik model(2);
+  model.set_data(timestamps_empty_node, 4.5);
+  const ulong n_nodes = 3;
+  EXPECT_EQ(model.get_rand_max(), 11ul);
+
+  ArrayDouble coeffs(n_nodes + n_nodes * n_nodes);
+  coeffs.fill(1.);
+  ArrayDouble grad_i(coeffs.size());
+
+  // The gradient of a sample only involves the baseline and the adjacency
+  // of its node
+  for (ulong sampled_i = 0; sampled_i < model.get_rand_max(); ++sampled_i) {
+    SCOPED_TRACE(sampled_i);
+    const ulong expected_node = sampled_i < 5 ? 0 : 2;
+    model.grad_i(sampled_i, coeffs, grad_i);
+    for (ulong node = 0; node < n_nodes; ++node) {
+      EXPECT_EQ(grad_i[node] != 0, node == expected_node);
+    }
+  }
+
+  EXPECT_THROW(model.loss_i(11, coeffs), std::runtime_error);
+  EXPECT_THROW(model.grad_i(11, coeffs, grad_i), std::runtime_error);
+}
+
+TEST_F(HawkesModelTest, sampled_i_to_realization_loglikelihood){
+  const double decay = 2.;
+
+  // Second realization has only 3 jumps, all on node 1
+  SArrayDoublePtrList1D timestamps_short = SArrayDoublePtrList1D(0);
+  timestamps_short.push_back(ArrayDouble(0).as_sarray_ptr());
+  timestamps_short.push_back(ArrayDouble {0.5, 1.5, 2.5}.as_sarray_ptr());
+
+  ModelHawkesFixedExpKernLogLikList model(decay, 1);
+  model.incremental_set_data(timestamps, 5.65);
+  model.incremental_set_data(timestamps_short, 3.);
+  model.incremental_set_data(timestamps, 5.87);
+  EXPECT_EQ(model.get_rand_max(), 25ul);
+
+  ModelHawkesFixedExpKernLogLik model_0(decay), model_1(decay), model_2(decay);
+  model_0.set_data(timestamps, 5.65);
+  model_1.set_data(timestamps_short, 3.);
+  model_2.set_data(timestamps, 5.87);
+
+  ArrayDouble coeffs = ArrayDouble {1., 3., 2., 3., 4., 1};
+
+  // First and last sample of each realization
+  EXPECT_DOUBLE_EQ(model.loss_i(0, coeffs), model_0.loss_i(0, coeffs));
+  EXPECT_DOUBLE_EQ(model.loss_i(10, coeffs), model_0.loss_i(10, coeffs));
+  EXPECT_DOUBLE_EQ(model.loss_i(11, coeffs), model_1.loss_i(0, coeffs));
+  EXPECT_DOUBLE_EQ(model.loss_i(13, coeffs), model_1.loss_i(2, coeffs));
+  EXPECT_DOUBLE_EQ(model.loss_i(14, coeffs), model_2.loss_i(0, coeffs));
+  EXPECT_DOUBLE_EQ(model.loss_i(24, coeffs), model_2.loss_i(10, coeffs));
+
+  EXPECT_THROW(model.loss_i(25, coeffs), std::runtime_error);
+}
+
 TEST_F(HawkesModelTest, compute_weights_loglikelihood){
   ModelHawkesFixedExpKernLogLik model(2);
   model.set_data(timestamps, 4.25);
@@ -9,6 +9,8 @@
 
 #include <array.h>
 #include <linreg.h>
+#include <logreg.h>
+#include <serialization.h>
 
 #include <cereal/types/unordered_map.hpp>
 #include <cereal/types/memory.hpp>
@@ -121,3 +123,61 @@ TEST(Model, SerializationBinary) {
   SCOPED_TRACE("");
   ::TestModelLinRegSerialization<cereal::BinaryInputArchive, cereal::BinaryOutputArchive>();
 }
+
+TEST(Model, SerializationBinaryString) {
+  ArrayDouble y({-1, 1, 1, -1, 1});
+  ArrayDouble2d x(5, 2);
+  for (ulong i = 0; i < x.size(); ++i) x[i] = 0.3 * i - 1;
+
+  ModelLogReg model(x.as_sarray2d_ptr(), y.as_sarray_ptr(), true, 2);
+
+  ArrayDouble coeffs({-2, 5.2, 0.5});
+  ArrayDouble out_grad(3);
+  model.grad(coeffs, out_grad);
+
+  const std::string binary_state = tick::object_to_binary_string(&model);
+  const std::string json_state = tick::object_to_string(&model);
+
+  for (const bool binary : {true, false}) {
+    ModelLogReg restored_model(nullptr, nullptr, false);
+    if (binary)
+      tick::object_from_binary_string(&restored_model, binary_state);
+    else
+      tick::object_from_string(&restored_model, json_state);
+
+    EXPECT_EQ(model.get_n_features(), restored_model.get_n_features());
+    EXPECT_EQ(model.get_n_coeffs(), restored_model.get_n_coeffs());
+
+    ArrayDouble out_grad_restored(3);
+    restored_model.grad(coeffs, out_grad_restored);
+
+    for (ulong i = 0; i < out_grad.size(); ++i) ASSERT_DOUBLE_EQ(out_grad[i], out_grad_restored[i]);
+    EXPECT_DOUBLE_EQ(model.loss(coeffs), restored_model.loss(coeffs));
+  }
+}
+
+TEST(Model, FloatVsDouble) {
+  ArrayDouble y({-1, 1, 1, -1, 1});
+  ArrayDouble2d x(5, 2);
+  for (ulong i = 0; i < x.size(); ++i) x[i] = 0.3 * i - 1;
+
+  ArrayFloat y_float(y.size());
+  ArrayFloat2d x_float(5, 2);
+  for (ulong i = 0; i < y.size(); ++i) y_float[i] = static_cast<float>(y[i]);
+  for (ulong i = 0; i < x.size(); ++i) x_float[i] = static_cast<float>(x[i]);
+
+  ModelLogReg model(x.as_sarray2d_ptr(), y.as_sarray_ptr(), true, 1);
+  ModelLogRegFloat model_float(x_float.as_sarray2d_ptr(), y_float.as_sarray_ptr(), true, 1);
+
+  ArrayDouble coeffs({-2, 5.2, 0.5});
+  ArrayFloat coeffs_float({-2, 5.2, 0.5});
+
+  ArrayDouble out_grad(3);
+  ArrayFloat out_grad_float(3);
+  model.grad(coeffs, out_grad);
+  model_float.grad(coeffs_float, out_grad_float);
+
+  for (ulong i = 0; i < out_grad.size(); ++i) EXPECT_NEAR(out_grad[i], out_grad_float[i], 1e-5);
+  EXPECT_NEAR(model.loss(coeffs), model_float.loss(coeffs_float), 1e-5);
+  EXPECT_NEAR(model.get_lip_max(), model_float.get_lip_max(), 1e-5);
+}
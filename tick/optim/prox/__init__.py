@@ -1,16 +1,18 @@
 import tick.base
+from tick.base.lazy_import import lazy_attributes
 
-from .prox_zero import ProxZero
-from .prox_positive import ProxPositive
-from .prox_l2sq import ProxL2Sq
-from .prox_l1 import ProxL1
-from .prox_l1w import ProxL1w
-from .prox_tv import ProxTV
-from .prox_nuclear import ProxNuclear
-from .prox_sortedl1 import ProxSortedL1
-from .prox_elasticnet import ProxElasticNet
-from .prox_multi import ProxMulti
-
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    ".prox_zero": ["ProxZero"],
+    ".prox_positive": ["ProxPositive"],
+    ".prox_l2sq": ["ProxL2Sq"],
+    ".prox_l1": ["ProxL1"],
+    ".prox_l1w": ["ProxL1w"],
+    ".prox_tv": ["ProxTV"],
+    ".prox_nuclear": ["ProxNuclear"],
+    ".prox_sortedl1": ["ProxSortedL1"],
+    ".prox_elasticnet": ["ProxElasticNet"],
+    ".prox_multi": ["ProxMulti"],
+})
 
 __all__ = ["ProxZero",
            "ProxPositive",
@@ -10,6 +10,12 @@ class Prox(ABC, Base):
     ----------
     range : `tuple` of two `int`, default=`None`
         Range on which the prox is applied
+
+    Attributes
+    ----------
+    dtype : `numpy.dtype` (read-only)
+        Floating point type of the vectors the prox is applied on. It is
+        set by the solver to match the model it is used with
     """
 
     _attrinfos = {
@@ -18,6 +24,9 @@ class Prox(ABC, Base):
         },
         "_range": {
             "writable": False
+        },
+        "dtype": {
+            "writable": False
         }
     }
 
@@ -28,6 +37,7 @@ class Prox(ABC, Base):
         Base.__init__(self)
         self._range = None
         self._prox = None
+        self.dtype = np.dtype("float64")
         self.range = range
 
     @property
@@ -48,6 +58,22 @@ class Prox(ABC, Base):
             if _prox is not None:
                 _prox.set_start_end(val[0], val[1])
 
+    def _set_dtype(self, dtype):
+        """Switch the C++ prox object to the given floating point type,
+        keeping its parameters
+        """
+        dtype = np.dtype(dtype)
+        if dtype != self.dtype:
+            self._set("_prox", self._build_cpp_prox(dtype))
+            self._set("dtype", dtype)
+
+    def _build_cpp_prox(self, dtype):
+        """Build the C++ prox object working with the given floating
+        point type. Must be overloaded by proxes available in ``float32``
+        """
+        raise ValueError("%s is not available for dtype %s"
+                         % (self.__class__.__name__, np.dtype(dtype)))
+
     def call(self, coeffs, step=1., out=None):
         """Apply proximal operator on a vector.
         It computes:
@@ -84,6 +110,7 @@ class Prox(ABC, Base):
         `None`, or a size matching the one given by the range
         otherwise
         """
+        coeffs = coeffs.astype(self.dtype, copy=False)
         if out is None:
             # We don't have an output vector, we create a fresh copy
             out = coeffs.copy()
@@ -2,7 +2,8 @@
 
 import numpy as np
 from .base import Prox
-from .build.prox import ProxElasticNet as _ProxElasticNet
+from .build.prox import ProxElasticNet as _ProxElasticNet, \
+    ProxElasticNetFloat as _ProxElasticNetFloat
 
 __author__ = 'Maryan Morel'
 
@@ -50,14 +51,21 @@ class ProxElasticNet(Prox):
     def __init__(self, strength: float, ratio: float, range: tuple=None,
                  positive=False):
         Prox.__init__(self, range)
-        if range is None:
-            self._prox = _ProxElasticNet(strength, ratio, positive)
-        else:
-            self._prox = _ProxElasticNet(strength, ratio, range[0],
-                                         range[1], positive)
         self.positive = positive
         self.strength = strength
         self.ratio = ratio
+        self._prox = self._build_cpp_prox("float64")
+
+    def _build_cpp_prox(self, dtype):
+        if dtype == "float32":
+            prox_class = _ProxElasticNetFloat
+        else:
+            prox_class = _ProxElasticNet
+        if self.range is None:
+            return prox_class(self.strength, self.ratio, self.positive)
+        else:
+            return prox_class(self.strength, self.ratio, self.range[0],
+                              self.range[1], self.positive)
 
     def _call(self, coeffs: np.ndarray, step: object, out: np.ndarray):
         self._prox.call(coeffs, step, out)
@@ -2,7 +2,8 @@
 
 import numpy as np
 from .base import Prox
-from .build.prox import ProxL1 as _ProxL1
+from .build.prox import ProxL1 as _ProxL1, \
+    ProxL1Float as _ProxL1Float
 
 __author__ = 'Stephane Gaiffas'
 
@@ -38,12 +39,17 @@ class ProxL1(Prox):
     def __init__(self, strength: float, range: tuple=None,
                  positive: bool=False):
         Prox.__init__(self, range)
-        if range is None:
-            self._prox = _ProxL1(strength, positive)
-        else:
-            self._prox = _ProxL1(strength, range[0], range[1], positive)
         self.positive = positive
         self.strength = strength
+        self._prox = self._build_cpp_prox("float64")
+
+    def _build_cpp_prox(self, dtype):
+        prox_class = _ProxL1Float if dtype == "float32" else _ProxL1
+        if self.range is None:
+            return prox_class(self.strength, self.positive)
+        else:
+            return prox_class(self.strength, self.range[0], self.range[1],
+                              self.positive)
 
     def _call(self, coeffs: np.ndarray, step: object, out: np.ndarray):
         self._prox.call(coeffs, step, out)
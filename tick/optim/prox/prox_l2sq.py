@@ -2,7 +2,8 @@
 
 import numpy as np
 from .base import Prox
-from .build.prox import ProxL2Sq as _ProxL2sq
+from .build.prox import ProxL2Sq as _ProxL2sq, \
+    ProxL2SqFloat as _ProxL2sqFloat
 
 
 __author__ = 'Stephane Gaiffas'
@@ -39,12 +40,17 @@ class ProxL2Sq(Prox):
     def __init__(self, strength: float, range: tuple=None,
                  positive: bool=False):
         Prox.__init__(self, range)
-        if range is None:
-            self._prox = _ProxL2sq(strength, positive)
-        else:
-            self._prox = _ProxL2sq(strength, range[0], range[1], positive)
         self.positive = positive
         self.strength = strength
+        self._prox = self._build_cpp_prox("float64")
+
+    def _build_cpp_prox(self, dtype):
+        prox_class = _ProxL2sqFloat if dtype == "float32" else _ProxL2sq
+        if self.range is None:
+            return prox_class(self.strength, self.positive)
+        else:
+            return prox_class(self.strength, self.range[0], self.range[1],
+                              self.positive)
 
     def _call(self, coeffs: np.ndarray, step: object, out: np.ndarray):
         self._prox.call(coeffs, step, out)
@@ -2,7 +2,8 @@
 
 import numpy as np
 from .base import Prox
-from .build.prox import ProxZero as _ProxZero
+from .build.prox import ProxZero as _ProxZero, \
+    ProxZeroFloat as _ProxZeroFloat
 
 
 __author__ = 'Stephane Gaiffas'
@@ -24,10 +25,14 @@ class ProxZero(Prox):
 
     def __init__(self, range: tuple=None):
         Prox.__init__(self, range)
-        if range is None:
-            self._prox = _ProxZero(0.)
+        self._prox = self._build_cpp_prox("float64")
+
+    def _build_cpp_prox(self, dtype):
+        prox_class = _ProxZeroFloat if dtype == "float32" else _ProxZero
+        if self.range is None:
+            return prox_class(0.)
         else:
-            self._prox = _ProxZero(0., range[0], range[1])
+            return prox_class(0., self.range[0], self.range[1])
 
     def _call(self, coeffs: np.ndarray, step: object, out: np.ndarray):
         self._prox.call(coeffs, step, out)
@@ -4,14 +4,16 @@
 
 #include "prox.h"
 
-Prox::Prox(double strength) {
+template <class T>
+TProx<T>::TProx(T strength) {
     has_range = false;
     this->strength = strength;
 }
 
-Prox::Prox(double strength,
-           ulong start,
-           ulong end) {
+template <class T>
+TProx<T>::TProx(T strength,
+                ulong start,
+                ulong end) {
     set_start_end(start, end);
     this->strength = strength;
 
@@ -19,11 +21,13 @@ Prox::Prox(double strength,
         TICK_ERROR(get_class_name() << " can't have start(" << start << ") greater than end(" << end << ")");
 }
 
-const std::string Prox::get_class_name() const {
+template <class T>
+const std::string TProx<T>::get_class_name() const {
     return "Prox";
 }
 
-double Prox::value(ArrayDouble &coeffs) {
+template <class T>
+T TProx<T>::value(Array<T> &coeffs) {
     if (has_range) {
         if (end > coeffs.size())
             TICK_ERROR(get_class_name() << " of range [" << start << ", " << end << "] cannot get value of a vector of size " << coeffs.size());
@@ -37,15 +41,17 @@ double Prox::value(ArrayDouble &coeffs) {
     return _value(coeffs, start, end);
 }
 
-double Prox::_value(ArrayDouble &coeffs,
-                    ulong start,
-                    ulong end) {
+template <class T>
+T TProx<T>::_value(Array<T> &coeffs,
+                   ulong start,
+                   ulong end) {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
 }
 
-void Prox::call(ArrayDouble &coeffs,
-                double step,
-                ArrayDouble &out) {
+template <class T>
+void TProx<T>::call(Array<T> &coeffs,
+                    T step,
+                    Array<T> &out) {
     if (has_range) {
         if (end > coeffs.size())
             TICK_ERROR(get_class_name() << " of range [" << start << ", " << end << "] cannot be called on a vector of size " << coeffs.size());
@@ -59,41 +65,65 @@ void Prox::call(ArrayDouble &coeffs,
     _call(coeffs, step, out, start, end);
 }
 
-void Prox::_call(ArrayDouble &coeffs,
-                 double step,
-                 ArrayDouble &out,
-                 ulong start,
-                 ulong end) {
+template <class T>
+void TProx<T>::_call(Array<T> &coeffs,
+                     T step,
+                     Array<T> &out,
+                     ulong start,
+                     ulong end) {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
 }
 
-void Prox::call(ArrayDouble &coeffs,
-                ArrayDouble &step,
-                ArrayDouble &out) {
+template <class T>
+void TProx<T>::call(Array<T> &coeffs,
+                    Array<T> &step,
+                    Array<T> &out) {
     // This is overloaded in ProxSeparable.
     // If the child class does not inherit from ProxSeparable, it cannot use this method.
     TICK_WARNING() << "Method not implemented since this prox is not separable.";
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
 }
 
-void Prox::set_strength(double strength) {
+template <class T>
+bool TProx<T>::has_lazy_updates() const {
+    return false;
+}
+
+template <class T>
+T TProx<T>::call_single_lazy(ulong i,
+                             T x,
+                             T shift,
+                             T step,
+                             ulong n_steps) const {
+    TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
+}
+
+template <class T>
+void TProx<T>::set_strength(T strength) {
     this->strength = strength;
 }
 
-double Prox::get_strength() const {
+template <class T>
+T TProx<T>::get_strength() const {
     return strength;
 }
 
-void Prox::set_start_end(ulong start, ulong end) {
+template <class T>
+void TProx<T>::set_start_end(ulong start, ulong end) {
     this->has_range = true;
     this->start = start;
     this->end = end;
 }
 
-ulong Prox::get_start() {
+template <class T>
+ulong TProx<T>::get_start() {
     return start;
 }
 
-ulong Prox::get_end() {
+template <class T>
+ulong TProx<T>::get_end() {
     return end;
 }
+
+template class TProx<double>;
+template class TProx<float>;
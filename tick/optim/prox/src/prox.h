@@ -8,10 +8,11 @@
 #include "base.h"
 #include <string>
 
-class Prox {
+template <class T>
+class TProx {
  protected:
     // Weight of the proximal operator
-    double strength;
+    T strength;
 
     // Flag to know if proximal operator concerns only a part of the vector
     bool has_range;
@@ -20,35 +21,52 @@ class Prox {
     ulong start, end;
 
  public:
-    explicit Prox(double strength);
+    explicit TProx(T strength);
 
-    Prox(double strength, ulong start, ulong end);
+    TProx(T strength, ulong start, ulong end);
 
     virtual const std::string get_class_name() const;
 
-    virtual double value(ArrayDouble &coeffs);
+    virtual T value(Array<T> &coeffs);
 
-    virtual double _value(ArrayDouble &coeffs,
-                          ulong start,
-                          ulong end);
+    virtual T _value(Array<T> &coeffs,
+                     ulong start,
+                     ulong end);
 
-    virtual void call(ArrayDouble &coeffs,
-                      double step,
-                      ArrayDouble &out);
+    virtual void call(Array<T> &coeffs,
+                      T step,
+                      Array<T> &out);
 
-    virtual void call(ArrayDouble &coeffs,
-                      ArrayDouble &step,
-                      ArrayDouble &out);
+    virtual void call(Array<T> &coeffs,
+                      Array<T> &step,
+                      Array<T> &out);
 
-    virtual void _call(ArrayDouble &coeffs,
-                       double step,
-                       ArrayDouble &out,
+    virtual void _call(Array<T> &coeffs,
+                       T step,
+                       Array<T> &out,
                        ulong start,
                        ulong end);
 
-    virtual void set_strength(double strength);
+    /**
+     * @brief Whether call_single_lazy is available. Sparse stochastic solvers then update
+     * only the coordinates of the iterate that are in the support of the sampled features.
+     */
+    virtual bool has_lazy_updates() const;
 
-    virtual double get_strength() const;
+    /**
+     * @brief Apply n_steps times the update x <- prox(x - shift) with the given step to the
+     * coordinate x of index i of the full vector, in closed form.
+     * This is used to catch up with the steps during which the coordinate was not updated.
+     */
+    virtual T call_single_lazy(ulong i,
+                               T x,
+                               T shift,
+                               T step,
+                               ulong n_steps) const;
+
+    virtual void set_strength(T strength);
+
+    virtual T get_strength() const;
 
     virtual void set_start_end(ulong start, ulong end);
 
@@ -56,6 +74,10 @@ class Prox {
     ulong get_end();
 };
 
+typedef TProx<double> Prox;
+typedef TProx<float> ProxFloat;
+
 typedef std::shared_ptr<Prox> ProxPtr;
+typedef std::shared_ptr<ProxFloat> ProxFloatPtr;
 
 #endif  // TICK_OPTIM_PROX_SRC_PROX_H_
@@ -4,10 +4,11 @@
 
 #include "prox_elasticnet.h"
 
-ProxElasticNet::ProxElasticNet(double strength,
-                               double ratio,
-                               bool positive)
-    : ProxSeparable(strength) {
+template <class T>
+TProxElasticNet<T>::TProxElasticNet(T strength,
+                                    T ratio,
+                                    bool positive)
+    : TProxSeparable<T>(strength) {
     if (ratio < 0 || ratio > 1)
         TICK_ERROR("Ratio should be in the [0, 1] interval");
 
@@ -15,12 +16,13 @@ ProxElasticNet::ProxElasticNet(double strength,
     this->ratio = ratio;
 }
 
-ProxElasticNet::ProxElasticNet(double strength,
-                               double ratio,
-                               ulong start,
-                               ulong end,
-                               bool positive)
-    : ProxSeparable(strength, start, end) {
+template <class T>
+TProxElasticNet<T>::TProxElasticNet(T strength,
+                                    T ratio,
+                                    ulong start,
+                                    ulong end,
+                                    bool positive)
+    : TProxSeparable<T>(strength, start, end) {
     if (ratio < 0 || ratio > 1)
         TICK_ERROR("Ratio should be in the [0, 1] interval");
 
@@ -28,13 +30,15 @@ ProxElasticNet::ProxElasticNet(double strength,
     this->ratio = ratio;
 }
 
-const std::string ProxElasticNet::get_class_name() const {
+template <class T>
+const std::string TProxElasticNet<T>::get_class_name() const {
     return "ProxElasticNet";
 }
 
-double ProxElasticNet::_value_i(ulong i, ArrayDouble &coeffs) const {
-    double coeffs_i = coeffs[i];
-    double value = (1 - ratio) * 0.5 * coeffs_i * coeffs_i;
+template <class T>
+T TProxElasticNet<T>::_value_i(ulong i, Array<T> &coeffs) const {
+    T coeffs_i = coeffs[i];
+    T value = (1 - ratio) * 0.5 * coeffs_i * coeffs_i;
     if (coeffs_i > 0) {
         value += ratio * coeffs_i;
     } else {
@@ -43,12 +47,13 @@ double ProxElasticNet::_value_i(ulong i, ArrayDouble &coeffs) const {
     return value;
 }
 
-void ProxElasticNet::_call_i(ulong i,
-                             ArrayDouble &coeffs,
-                             double step,
-                             ArrayDouble &out) const {
-    double thresh = step * ratio * strength;
-    double coeffs_i = coeffs[i];
+template <class T>
+void TProxElasticNet<T>::_call_i(ulong i,
+                                 Array<T> &coeffs,
+                                 T step,
+                                 Array<T> &out) const {
+    T thresh = step * ratio * strength;
+    T coeffs_i = coeffs[i];
     if (coeffs_i > 0) {
         if (coeffs_i > thresh) {
             out[i] = (coeffs_i - thresh) / (1 + step * strength * (1 - ratio));
@@ -69,3 +74,21 @@ void ProxElasticNet::_call_i(ulong i,
         }
     }
 }
+
+template <class T>
+bool TProxElasticNet<T>::has_lazy_updates() const {
+    return true;
+}
+
+template <class T>
+T TProxElasticNet<T>::_call_single_lazy(ulong i,
+                                        T x,
+                                        T shift,
+                                        T step,
+                                        ulong n_steps) const {
+    return this->repeated_shrinkage(x, shift, step * ratio * strength,
+                                    step * strength * (1 - ratio), positive, n_steps);
+}
+
+template class TProxElasticNet<double>;
+template class TProxElasticNet<float>;
@@ -7,36 +7,50 @@
 
 #include "prox_separable.h"
 
-class ProxElasticNet : public ProxSeparable {
+template <class T>
+class TProxElasticNet : public TProxSeparable<T> {
  protected:
+    using TProxSeparable<T>::strength;
+
     bool positive;
-    double ratio;
+    T ratio;
 
  public:
-    ProxElasticNet(double strength, double ratio, bool positive);
+    TProxElasticNet(T strength, T ratio, bool positive);
 
-    ProxElasticNet(double strength, double ratio, ulong start, ulong end, bool positive);
+    TProxElasticNet(T strength, T ratio, ulong start, ulong end, bool positive);
 
     const std::string get_class_name() const;
 
-    double _value_i(ulong i, ArrayDouble &coeffs) const;
+    T _value_i(ulong i, Array<T> &coeffs) const;
+
+    void _call_i(ulong i, Array<T> &coeffs, T step, Array<T> &out) const;
 
-    void _call_i(ulong i, ArrayDouble &coeffs, double step, ArrayDouble &out) const;
+    bool has_lazy_updates() const override;
+
+    T _call_single_lazy(ulong i,
+                        T x,
+                        T shift,
+                        T step,
+                        ulong n_steps) const override;
 
     inline virtual void set_positive(bool positive) {
         this->positive = positive;
     }
 
-    inline virtual void set_ratio(double ratio) {
+    inline virtual void set_ratio(T ratio) {
         if (ratio < 0 || ratio > 1)
             TICK_ERROR("Ratio should be in the [0, 1] interval");
 
         this->ratio = ratio;
     }
 
-    inline virtual double get_ratio() const {
+    inline virtual T get_ratio() const {
         return ratio;
     }
 };
 
+typedef TProxElasticNet<double> ProxElasticNet;
+typedef TProxElasticNet<float> ProxElasticNetFloat;
+
 #endif  // TICK_OPTIM_PROX_SRC_PROX_ELASTICNET_H_
@@ -4,27 +4,31 @@
 
 #include "prox_l1.h"
 
-ProxL1::ProxL1(double strength,
-               bool positive)
-    : ProxSeparable(strength) {
+template <class T>
+TProxL1<T>::TProxL1(T strength,
+                    bool positive)
+    : TProxSeparable<T>(strength) {
     this->positive = positive;
 }
 
-ProxL1::ProxL1(double strength,
-               ulong start,
-               ulong end,
-               bool positive)
-    : ProxSeparable(strength, start, end) {
+template <class T>
+TProxL1<T>::TProxL1(T strength,
+                    ulong start,
+                    ulong end,
+                    bool positive)
+    : TProxSeparable<T>(strength, start, end) {
     this->positive = positive;
 }
 
-const std::string ProxL1::get_class_name() const {
+template <class T>
+const std::string TProxL1<T>::get_class_name() const {
     return "ProxL1";
 }
 
-double ProxL1::_value_i(ulong i,
-                        ArrayDouble &coeffs) const {
-    double coeffs_i = coeffs[i];
+template <class T>
+T TProxL1<T>::_value_i(ulong i,
+                       Array<T> &coeffs) const {
+    T coeffs_i = coeffs[i];
     if (coeffs_i > 0) {
         return coeffs_i;
     } else {
@@ -32,12 +36,13 @@ double ProxL1::_value_i(ulong i,
     }
 }
 
-void ProxL1::_call_i(ulong i,
-                     ArrayDouble &coeffs,
-                     double step,
-                     ArrayDouble &out) const {
-    double thresh = step * strength;
-    double coeffs_i = coeffs[i];
+template <class T>
+void TProxL1<T>::_call_i(ulong i,
+                         Array<T> &coeffs,
+                         T step,
+                         Array<T> &out) const {
+    T thresh = step * strength;
+    T coeffs_i = coeffs[i];
     if (coeffs_i > 0) {
         if (coeffs_i > thresh) {
             out[i] = coeffs_i - thresh;
@@ -59,3 +64,19 @@ void ProxL1::_call_i(ulong i,
     }
 }
 
+template <class T>
+bool TProxL1<T>::has_lazy_updates() const {
+    return true;
+}
+
+template <class T>
+T TProxL1<T>::_call_single_lazy(ulong i,
+                                T x,
+                                T shift,
+                                T step,
+                                ulong n_steps) const {
+    return this->repeated_shrinkage(x, shift, step * strength, 0, positive, n_steps);
+}
+
+template class TProxL1<double>;
+template class TProxL1<float>;
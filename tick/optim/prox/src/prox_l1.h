@@ -7,28 +7,42 @@
 
 #include "prox_separable.h"
 
-class ProxL1 : public ProxSeparable {
+template <class T>
+class TProxL1 : public TProxSeparable<T> {
  protected:
+    using TProxSeparable<T>::strength;
+
     bool positive;
 
  public:
-    ProxL1(double strength, bool positive);
+    TProxL1(T strength, bool positive);
 
-    ProxL1(double strength, ulong start, ulong end, bool positive);
+    TProxL1(T strength, ulong start, ulong end, bool positive);
 
     const std::string get_class_name() const;
 
-    virtual double _value_i(ulong i,
-                            ArrayDouble &coeffs) const;
+    virtual T _value_i(ulong i,
+                       Array<T> &coeffs) const;
 
     virtual void _call_i(ulong i,
-                         ArrayDouble &coeffs,
-                         double step,
-                         ArrayDouble &out) const;
+                         Array<T> &coeffs,
+                         T step,
+                         Array<T> &out) const;
+
+    bool has_lazy_updates() const override;
+
+    T _call_single_lazy(ulong i,
+                        T x,
+                        T shift,
+                        T step,
+                        ulong n_steps) const override;
 
     inline virtual void set_positive(bool positive) {
         this->positive = positive;
     }
 };
 
+typedef TProxL1<double> ProxL1;
+typedef TProxL1<float> ProxL1Float;
+
 #endif  // TICK_OPTIM_PROX_SRC_PROX_L1_H_
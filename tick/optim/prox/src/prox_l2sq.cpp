@@ -4,41 +4,63 @@
 
 #include "prox_l2sq.h"
 
-ProxL2Sq::ProxL2Sq(double strength,
-                   bool positive)
+template <class T>
+TProxL2Sq<T>::TProxL2Sq(T strength,
+                        bool positive)
 
-    : ProxSeparable(strength) {
+    : TProxSeparable<T>(strength) {
     this->positive = positive;
 }
 
-ProxL2Sq::ProxL2Sq(double strength,
-                   ulong start,
-                   ulong end,
-                   bool positive)
+template <class T>
+TProxL2Sq<T>::TProxL2Sq(T strength,
+                        ulong start,
+                        ulong end,
+                        bool positive)
 
-    : ProxSeparable(strength, start, end) {
+    : TProxSeparable<T>(strength, start, end) {
     this->positive = positive;
 }
 
-const std::string ProxL2Sq::get_class_name() const {
+template <class T>
+const std::string TProxL2Sq<T>::get_class_name() const {
     return "ProxL2Sq";
 }
 
-double ProxL2Sq::_value_i(ulong i,
-                          ArrayDouble &coeffs) const {
-    double coeffs_i = coeffs[i];
+template <class T>
+T TProxL2Sq<T>::_value_i(ulong i,
+                         Array<T> &coeffs) const {
+    T coeffs_i = coeffs[i];
     return 0.5 * coeffs_i * coeffs_i;
 }
 
 // Compute the prox on the i-th coordinate only
-void ProxL2Sq::_call_i(ulong i,
-                       ArrayDouble &coeffs,
-                       double step,
-                       ArrayDouble &out) const {
-    double coeffs_i = coeffs[i];
+template <class T>
+void TProxL2Sq<T>::_call_i(ulong i,
+                           Array<T> &coeffs,
+                           T step,
+                           Array<T> &out) const {
+    T coeffs_i = coeffs[i];
     if (positive && coeffs_i < 0) {
         out[i] = 0;
     } else {
         out[i] = coeffs_i / (1 + step * strength);
     }
 }
+
+template <class T>
+bool TProxL2Sq<T>::has_lazy_updates() const {
+    return true;
+}
+
+template <class T>
+T TProxL2Sq<T>::_call_single_lazy(ulong i,
+                                  T x,
+                                  T shift,
+                                  T step,
+                                  ulong n_steps) const {
+    return this->repeated_shrinkage(x, shift, 0, step * strength, positive, n_steps);
+}
+
+template class TProxL2Sq<double>;
+template class TProxL2Sq<float>;
@@ -7,14 +7,17 @@
 
 #include "prox_separable.h"
 
-class ProxL2Sq : public ProxSeparable {
+template <class T>
+class TProxL2Sq : public TProxSeparable<T> {
  protected:
+    using TProxSeparable<T>::strength;
+
     bool positive;
 
  public:
-    ProxL2Sq(double strength, bool positive);
+    TProxL2Sq(T strength, bool positive);
 
-    ProxL2Sq(double strength, ulong start, ulong end, bool positive);
+    TProxL2Sq(T strength, ulong start, ulong end, bool positive);
 
     const std::string get_class_name() const;
 
@@ -22,13 +25,24 @@ class ProxL2Sq : public ProxSeparable {
         this->positive = positive;
     }
 
-    virtual double _value_i(ulong i,
-                            ArrayDouble &coeffs) const;
+    virtual T _value_i(ulong i,
+                       Array<T> &coeffs) const;
 
     virtual void _call_i(ulong i,
-                         ArrayDouble &coeffs,
-                         double step,
-                         ArrayDouble &out) const;
+                         Array<T> &coeffs,
+                         T step,
+                         Array<T> &out) const;
+
+    bool has_lazy_updates() const override;
+
+    T _call_single_lazy(ulong i,
+                        T x,
+                        T shift,
+                        T step,
+                        ulong n_steps) const override;
 };
 
+typedef TProxL2Sq<double> ProxL2Sq;
+typedef TProxL2Sq<float> ProxL2SqFloat;
+
 #endif  // TICK_OPTIM_PROX_SRC_PROX_L2SQ_H_
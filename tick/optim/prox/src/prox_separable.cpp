@@ -4,32 +4,65 @@
 
 #include "prox_separable.h"
 
-ProxSeparable::ProxSeparable(double strength)
-    : Prox(strength) {}
-
-ProxSeparable::ProxSeparable(double strength,
-                             ulong start,
-                             ulong end)
-    : Prox(strength, start, end) {}
-
-double ProxSeparable::_value(ArrayDouble &coeffs,
-                             ulong start,
-                             ulong end) {
-    double value = 0;
+#include <cmath>
+
+namespace {
+
+// Apply n times z <- (z - d) / (1 + s) to x
+double affine_steps(double x, double d, double s, ulong n) {
+    if (s == 0) return x - n * d;
+    const double log_scale = -static_cast<double>(n) * std::log1p(s);
+    return std::exp(log_scale) * x + d * std::expm1(log_scale) / s;
+}
+
+// Number of times, at most n, z <- (z - d) / (1 + s) can be applied starting from x > d while
+// z stays above d before each application
+ulong steps_above(double x, double d, double s, ulong n) {
+    // The sequence is non-decreasing or converges to a point above d
+    if (d <= 0) return n;
+
+    double bound;
+    if (s == 0) {
+        bound = (x - d) / d;
+    } else {
+        bound = std::log((s * x + d) / (d * (1 + s))) / std::log1p(s);
+    }
+    if (bound >= n) return n;
+    return std::max(static_cast<ulong>(std::ceil(bound)), ulong(1));
+}
+
+}  // namespace
+
+template <class T>
+TProxSeparable<T>::TProxSeparable(T strength)
+    : TProx<T>(strength) {}
+
+template <class T>
+TProxSeparable<T>::TProxSeparable(T strength,
+                                  ulong start,
+                                  ulong end)
+    : TProx<T>(strength, start, end) {}
+
+template <class T>
+T TProxSeparable<T>::_value(Array<T> &coeffs,
+                            ulong start,
+                            ulong end) {
+    T value = 0;
     // We work on a view, so that sub_coeffs and weights are "aligned"
     // (namely both ranging between 0 and end - start).
     // This is particularly convenient for Prox classes with weights for each
     // coordinate
-    ArrayDouble sub_coeffs = view(coeffs, start, end);
+    Array<T> sub_coeffs = view(coeffs, start, end);
     for (ulong i = 0; i < end - start; ++i) {
         value += _value_i(i, sub_coeffs);
     }
     return strength * value;
 }
 
-void ProxSeparable::call(ArrayDouble &coeffs,
-                         ArrayDouble &step,
-                         ArrayDouble &out) {
+template <class T>
+void TProxSeparable<T>::call(Array<T> &coeffs,
+                             Array<T> &step,
+                             Array<T> &out) {
     if (has_range) {
         if (end > coeffs.size())
             TICK_ERROR("Range [" << start << ", " << end << "] cannot be called on a vector of size " << coeffs.size());
@@ -46,40 +79,104 @@ void ProxSeparable::call(ArrayDouble &coeffs,
     }
 }
 
-void ProxSeparable::_call(ArrayDouble &coeffs,
-                          double step,
-                          ArrayDouble &out,
-                          ulong start,
-                          ulong end) {
-    ArrayDouble sub_coeffs = view(coeffs, start, end);
-    ArrayDouble sub_out = view(out, start, end);
+template <class T>
+void TProxSeparable<T>::_call(Array<T> &coeffs,
+                              T step,
+                              Array<T> &out,
+                              ulong start,
+                              ulong end) {
+    Array<T> sub_coeffs = view(coeffs, start, end);
+    Array<T> sub_out = view(out, start, end);
     for (ulong i = 0; i < end - start; ++i) {
         // Call the prox on each coordinate
         _call_i(i, sub_coeffs, step, sub_out);
     }
 }
 
-void ProxSeparable::_call(ArrayDouble &coeffs,
-                          ArrayDouble &step,
-                          ArrayDouble &out,
-                          ulong start,
-                          ulong end) {
-    ArrayDouble sub_coeffs = view(coeffs, start, end);
-    ArrayDouble sub_out = view(out, start, end);
+template <class T>
+void TProxSeparable<T>::_call(Array<T> &coeffs,
+                              Array<T> &step,
+                              Array<T> &out,
+                              ulong start,
+                              ulong end) {
+    Array<T> sub_coeffs = view(coeffs, start, end);
+    Array<T> sub_out = view(out, start, end);
     for (ulong i = 0; i < end - start; ++i) {
         _call_i(i, sub_coeffs, step[i], sub_out);
     }
 }
 
-double ProxSeparable::_value_i(ulong i,
-                               ArrayDouble &coeffs) const {
+template <class T>
+T TProxSeparable<T>::_value_i(ulong i,
+                              Array<T> &coeffs) const {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
 }
 
 // Compute the prox on the i-th coordinate only
-void ProxSeparable::_call_i(ulong i,
-                            ArrayDouble &coeffs,
-                            double t,
-                            ArrayDouble &out) const {
+template <class T>
+void TProxSeparable<T>::_call_i(ulong i,
+                                Array<T> &coeffs,
+                                T t,
+                                Array<T> &out) const {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
 }
+
+template <class T>
+T TProxSeparable<T>::call_single_lazy(ulong i,
+                                      T x,
+                                      T shift,
+                                      T step,
+                                      ulong n_steps) const {
+    if (has_range) {
+        if (i < start || i >= end) return x - n_steps * shift;
+        return _call_single_lazy(i - start, x, shift, step, n_steps);
+    }
+    return _call_single_lazy(i, x, shift, step, n_steps);
+}
+
+template <class T>
+T TProxSeparable<T>::_call_single_lazy(ulong i,
+                                       T x,
+                                       T shift,
+                                       T step,
+                                       ulong n_steps) const {
+    TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
+}
+
+template <class T>
+T TProxSeparable<T>::repeated_shrinkage(T x,
+                                        T shift,
+                                        T thresh,
+                                        T shrink,
+                                        bool positive,
+                                        ulong n_steps) {
+    // The update is non-decreasing in x, hence the iterates are monotone and go through the
+    // regions where it is affine (above thresh, between -thresh and thresh, below -thresh) at
+    // most once each. Computations are done in double precision whatever T is.
+    double z = x;
+    while (n_steps > 0) {
+        const double v = z - shift;
+        if (v > thresh) {
+            // z <- (z - shift - thresh) / (1 + shrink)
+            const double d = static_cast<double>(shift) + thresh;
+            const ulong n = steps_above(z, d, shrink, n_steps);
+            z = affine_steps(z, d, shrink, n);
+            n_steps -= n;
+        } else if (v < -thresh && !positive) {
+            // z <- (z - shift + thresh) / (1 + shrink), computed on -z
+            const double d = static_cast<double>(thresh) - shift;
+            const ulong n = steps_above(-z, d, shrink, n_steps);
+            z = -affine_steps(-z, d, shrink, n);
+            n_steps -= n;
+        } else {
+            z = 0;
+            n_steps -= 1;
+            // Stop if 0 is a fixed point
+            if (-shift <= thresh && (positive || shift <= thresh)) break;
+        }
+    }
+    return static_cast<T>(z);
+}
+
+template class TProxSeparable<double>;
+template class TProxSeparable<float>;
@@ -7,44 +7,82 @@
 
 #include "prox.h"
 
-class ProxSeparable : public Prox {
+template <class T>
+class TProxSeparable : public TProx<T> {
+ protected:
+    using TProx<T>::strength;
+    using TProx<T>::has_range;
+    using TProx<T>::start;
+    using TProx<T>::end;
+
  public:
-    explicit ProxSeparable(double strength);
+    using TProx<T>::get_class_name;
+
+    explicit TProxSeparable(T strength);
 
-    ProxSeparable(double strength,
-                  ulong start,
-                  ulong end);
+    TProxSeparable(T strength,
+                   ulong start,
+                   ulong end);
 
-    virtual double _value(ArrayDouble &coeffs,
-                          ulong start,
-                          ulong end);
+    virtual T _value(Array<T> &coeffs,
+                     ulong start,
+                     ulong end);
 
-    virtual void _call(ArrayDouble &coeffs,
-                       double step,
-                       ArrayDouble &out,
+    virtual void _call(Array<T> &coeffs,
+                       T step,
+                       Array<T> &out,
                        ulong start,
                        ulong end);
 
-    virtual void call(ArrayDouble &coeffs,
-                      ArrayDouble &step,
-                      ArrayDouble &out);
+    virtual void call(Array<T> &coeffs,
+                      Array<T> &step,
+                      Array<T> &out);
 
-    virtual void _call(ArrayDouble &coeffs,
-                       ArrayDouble &step,
-                       ArrayDouble &out,
+    virtual void _call(Array<T> &coeffs,
+                       Array<T> &step,
+                       Array<T> &out,
                        ulong start,
                        ulong end);
 
     // Compute the value given by the i-th coordinate only (multiplication by lambda must
     // not be done here)
-    virtual double _value_i(ulong i,
-                            ArrayDouble &coeffs) const;
+    virtual T _value_i(ulong i,
+                       Array<T> &coeffs) const;
 
     // Compute the prox on the i-th coordinate only
     virtual void _call_i(ulong i,
-                         ArrayDouble &coeffs,
-                         double step,
-                         ArrayDouble &out) const;
+                         Array<T> &coeffs,
+                         T step,
+                         Array<T> &out) const;
+
+    // Coordinates outside of the range are only shifted, the others are given to
+    // _call_single_lazy
+    T call_single_lazy(ulong i,
+                       T x,
+                       T shift,
+                       T step,
+                       ulong n_steps) const override;
+
+    // Lazy update of the i-th coordinate of the range
+    virtual T _call_single_lazy(ulong i,
+                                T x,
+                                T shift,
+                                T step,
+                                ulong n_steps) const;
+
+ protected:
+    // Apply n_steps times x <- soft_threshold(x - shift, thresh) / (1 + shrink), followed by a
+    // projection onto the non-negative half-line if positive is true. This covers the updates of
+    // ProxZero, ProxL1, ProxL2Sq and ProxElasticNet, and is computed in O(1) whatever n_steps
+    static T repeated_shrinkage(T x,
+                                T shift,
+                                T thresh,
+                                T shrink,
+                                bool positive,
+                                ulong n_steps);
 };
 
+typedef TProxSeparable<double> ProxSeparable;
+typedef TProxSeparable<float> ProxSeparableFloat;
+
 #endif  // TICK_OPTIM_PROX_SRC_PROX_SEPARABLE_H_
@@ -4,46 +4,69 @@
 
 #include "prox_zero.h"
 
-ProxZero::ProxZero(double strength)
-    : ProxSeparable(strength) {}
+template <class T>
+TProxZero<T>::TProxZero(T strength)
+    : TProxSeparable<T>(strength) {}
 
-ProxZero::ProxZero(double strength,
-                   ulong start,
-                   ulong end)
-    : ProxSeparable(strength, start, end) {}
+template <class T>
+TProxZero<T>::TProxZero(T strength,
+                        ulong start,
+                        ulong end)
+    : TProxSeparable<T>(strength, start, end) {}
 
-const std::string ProxZero::get_class_name() const {
+template <class T>
+const std::string TProxZero<T>::get_class_name() const {
     return "ProxZero";
 }
 
-double ProxZero::_value(ArrayDouble &coeffs,
-                        ulong start,
-                        ulong end) {
+template <class T>
+T TProxZero<T>::_value(Array<T> &coeffs,
+                       ulong start,
+                       ulong end) {
     return 0.;
 }
 
-void ProxZero::_call(ArrayDouble &coeffs,
-                     double step,
-                     ArrayDouble &out,
-                     ulong start,
-                     ulong end) {
+template <class T>
+void TProxZero<T>::_call(Array<T> &coeffs,
+                         T step,
+                         Array<T> &out,
+                         ulong start,
+                         ulong end) {
     // We copy the contents of coeffs into out
-    ArrayDouble sub_coeffs = view(coeffs, start, end);
-    ArrayDouble sub_out = view(out, start, end);
+    Array<T> sub_coeffs = view(coeffs, start, end);
+    Array<T> sub_out = view(out, start, end);
     for (unsigned int i = 0; i < sub_coeffs.size(); ++i) {
         sub_out[i] = sub_coeffs[i];
     }
 }
 
-void ProxZero::_call(ArrayDouble &coeffs,
-                     ArrayDouble &step,
-                     ArrayDouble &out,
-                     ulong start,
-                     ulong end) {
+template <class T>
+void TProxZero<T>::_call(Array<T> &coeffs,
+                         Array<T> &step,
+                         Array<T> &out,
+                         ulong start,
+                         ulong end) {
     // We copy the contents of coeffs into out
-    ArrayDouble sub_coeffs = view(coeffs, start, end);
-    ArrayDouble sub_out = view(out, start, end);
+    Array<T> sub_coeffs = view(coeffs, start, end);
+    Array<T> sub_out = view(out, start, end);
     for (unsigned int i = 0; i < sub_coeffs.size(); ++i) {
         sub_out[i] = sub_coeffs[i];
     }
 }
+
+template <class T>
+bool TProxZero<T>::has_lazy_updates() const {
+    return true;
+}
+
+template <class T>
+T TProxZero<T>::_call_single_lazy(ulong i,
+                                  T x,
+                                  T shift,
+                                  T step,
+                                  ulong n_steps) const {
+    return x - n_steps * shift;
+}
+
+template class TProxZero<double>;
+template class TProxZero<float>;
@@ -7,29 +7,41 @@
 
 #include "prox_separable.h"
 
-class ProxZero : public ProxSeparable {
+template <class T>
+class TProxZero : public TProxSeparable<T> {
  public:
-    explicit ProxZero(double strength);
+    explicit TProxZero(T strength);
 
-    ProxZero(double strength, ulong start, ulong end);
+    TProxZero(T strength, ulong start, ulong end);
 
     const std::string get_class_name() const;
 
-    double _value(ArrayDouble &coeffs,
-                  ulong start,
-                  ulong end);
+    T _value(Array<T> &coeffs,
+             ulong start,
+             ulong end);
 
-    virtual void _call(ArrayDouble &coeffs,
-                       double step,
-                       ArrayDouble &out,
+    virtual void _call(Array<T> &coeffs,
+                       T step,
+                       Array<T> &out,
                        ulong start,
                        ulong end);
 
-    virtual void _call(ArrayDouble &coeffs,
-                       ArrayDouble &step,
-                       ArrayDouble &out,
+    virtual void _call(Array<T> &coeffs,
+                       Array<T> &step,
+                       Array<T> &out,
                        ulong start,
                        ulong end);
+
+    bool has_lazy_updates() const override;
+
+    T _call_single_lazy(ulong i,
+                        T x,
+                        T shift,
+                        T step,
+                        ulong n_steps) const override;
 };
 
+typedef TProxZero<double> ProxZero;
+typedef TProxZero<float> ProxZeroFloat;
+
 #endif  // TICK_OPTIM_PROX_SRC_PROX_ZERO_H_
@@ -30,3 +30,32 @@ public:
 };
 
 typedef std::shared_ptr<Prox> ProxPtr;
+
+
+class ProxFloat {
+
+public:
+
+    ProxFloat(float strength);
+
+    ProxFloat(float strength,
+              unsigned long start,
+              unsigned long end);
+
+    virtual float value(ArrayFloat &coeffs);
+
+    virtual void call(ArrayFloat &coeffs,
+                      float step,
+                      ArrayFloat &out);
+
+    virtual void call(ArrayFloat &coeffs,
+                      ArrayFloat &step,
+                      ArrayFloat &out);
+
+    inline virtual void set_strength(float strength);
+
+    inline virtual void set_start_end(unsigned long start,
+                                      unsigned long end);
+};
+
+typedef std::shared_ptr<ProxFloat> ProxFloatPtr;
@@ -19,3 +19,21 @@ public:
     inline virtual double get_ratio() const;
 
 };
+
+
+class ProxElasticNetFloat : public ProxSeparableFloat {
+
+
+public:
+
+    ProxElasticNetFloat(float strength, float ratio, bool positive);
+
+    ProxElasticNetFloat(float strength, float ratio, unsigned long start, unsigned long end, bool positive);
+
+    inline virtual void set_positive(bool positive);
+
+    inline virtual void set_ratio(float ratio);
+
+    inline virtual float get_ratio() const;
+
+};
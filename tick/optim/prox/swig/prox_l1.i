@@ -15,3 +15,17 @@ public:
 
     inline virtual void set_positive(bool positive);
 };
+
+
+class ProxL1Float : public ProxFloat {
+
+
+public:
+
+    ProxL1Float(float strength, bool positive);
+
+    ProxL1Float(float strength, unsigned long start, unsigned long end,
+                bool positive);
+
+    inline virtual void set_positive(bool positive);
+};
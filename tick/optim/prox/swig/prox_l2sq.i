@@ -15,3 +15,17 @@ public:
 
     inline virtual void set_positive(bool positive);
 };
+
+
+class ProxL2SqFloat : public ProxSeparableFloat {
+
+
+public:
+
+    ProxL2SqFloat(float strength, bool positive);
+
+    ProxL2SqFloat(float strength, unsigned long start, unsigned long end,
+                  bool positive);
+
+    inline virtual void set_positive(bool positive);
+};
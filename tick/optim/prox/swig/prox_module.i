@@ -15,6 +15,13 @@
 %shared_ptr(ProxSortedL1);
 %shared_ptr(ProxMulti);
 
+%shared_ptr(ProxFloat);
+%shared_ptr(ProxSeparableFloat);
+%shared_ptr(ProxZeroFloat);
+%shared_ptr(ProxL2SqFloat);
+%shared_ptr(ProxL1Float);
+%shared_ptr(ProxElasticNetFloat);
+
 %{
 #include "tick_python.h"
 %}
@@ -13,3 +13,15 @@ public:
                   unsigned long start,
                   unsigned long end);
 };
+
+
+class ProxSeparableFloat : public ProxFloat {
+
+public:
+
+    ProxSeparableFloat(float strength);
+
+    ProxSeparableFloat(float strength,
+                       unsigned long start,
+                       unsigned long end);
+};
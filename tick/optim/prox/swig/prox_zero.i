@@ -13,3 +13,15 @@ public:
              unsigned long start,
              unsigned long end);
 };
+
+
+class ProxZeroFloat : public ProxFloat {
+
+public:
+
+    ProxZeroFloat(float strength);
+
+    ProxZeroFloat(float strength,
+                  unsigned long start,
+                  unsigned long end);
+};
@@ -1,5 +1,6 @@
 import unittest
 
+import numpy as np
 from numpy.testing import assert_almost_equal
 
 from tick.optim.prox import ProxElasticNet, ProxL1, ProxL2Sq
@@ -41,6 +42,27 @@ class Test(TestProx):
         prox_l2.call(out, t, out)
         assert_almost_equal(prox_enet.call(coeffs, step=t), out, decimal=10)
 
+    def test_ProxElasticNet_float32(self):
+        """...Test of ProxElasticNet in single precision
+        """
+        coeffs = self.coeffs.copy()
+        t = 1.7
+        prox = ProxElasticNet(3e-2, ratio=.3, range=(3, 8))
+        out_64 = prox.call(coeffs, step=t)
+        value_64 = prox.value(coeffs)
+
+        prox._set_dtype('float32')
+        self.assertEqual(prox.dtype, np.float32)
+        out_32 = prox.call(coeffs, step=t)
+        self.assertEqual(out_32.dtype, np.float32)
+        assert_almost_equal(out_32, out_64, decimal=6)
+        self.assertAlmostEqual(prox.value(coeffs.astype(np.float32)),
+                               value_64, places=6)
+
+        # Parameters are still forwarded to the C++ prox
+        prox.strength = 0.
+        assert_almost_equal(prox.call(coeffs), coeffs, decimal=6)
+
 
 if __name__ == '__main__':
     unittest.main()
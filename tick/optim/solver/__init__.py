@@ -1,14 +1,17 @@
 import tick.base
+from tick.base.lazy_import import lazy_attributes
 
-from .gd import GD
-from .agd import AGD
-from .bfgs import BFGS
-from .scpg import SCPG
-from .sgd import SGD
-from .svrg import SVRG
-from .sdca import SDCA
-from .gfb import GFB
-from .adagrad import AdaGrad
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    ".gd": ["GD"],
+    ".agd": ["AGD"],
+    ".bfgs": ["BFGS"],
+    ".scpg": ["SCPG"],
+    ".sgd": ["SGD"],
+    ".svrg": ["SVRG"],
+    ".sdca": ["SDCA"],
+    ".gfb": ["GFB"],
+    ".adagrad": ["AdaGrad"],
+})
 
 __all__ = ["GD", "AGD", "BFGS", "SCPG", "SGD", "SVRG", "SDCA", "GFB",
            "AdaGrad"]
@@ -54,6 +54,13 @@ class AdaGrad(SolverFirstOrderSto):
         The seed of the random sampling. If it is negative then a random seed
         (different at each run) will be chosen.
 
+    stopping_criterion : {'objective', 'iterate'}, default='objective'
+        If ``'objective'``, the solver stops when the relative change of the
+        objective is smaller than ``tol``. If ``'iterate'``, it stops when
+        the relative change of the iterate is smaller than ``tol``, in which
+        case the objective is only computed on iterations that are recorded
+        in history or printed
+
     Attributes
     ----------
     model : `Solver`
@@ -67,11 +74,12 @@ class AdaGrad(SolverFirstOrderSto):
                  rand_type: str = "unif", tol: float = 0.,
                  max_iter: int = 100, verbose: bool = True,
                  print_every: int = 10, record_every: int = 1,
-                 seed: int = -1):
+                 seed: int = -1, stopping_criterion: str = "objective"):
 
         SolverFirstOrderSto.__init__(self, step, epoch_size, rand_type,
                                      tol, max_iter, verbose,
-                                     print_every, record_every, seed)
+                                     print_every, record_every, seed,
+                                     stopping_criterion)
         # Type mapping None to unsigned long and double does not work...
         step = self.step
         if step is None:
@@ -104,6 +104,8 @@ class SolverFirstOrder(Solver):
             The same instance with given model
         """
         self._set("model", model)
+        if self.prox is not None:
+            self.prox._set_dtype(model.dtype)
         return self
 
     def _initialize_values(self, x0: np.ndarray = None, step: float = None,
@@ -146,13 +148,14 @@ class SolverFirstOrder(Solver):
         else:
             self.step = step
         if x0 is None:
-            x0 = np.zeros(self.model.n_coeffs)
-        iterate = x0.copy()
+            iterate = np.zeros(self.model.n_coeffs, dtype=self.model.dtype)
+        else:
+            iterate = x0.astype(self.model.dtype)
         obj = self.objective(iterate)
 
         result = [step, obj, iterate]
         for _ in range(n_empty_vectors):
-            result.append(np.zeros_like(x0))
+            result.append(np.zeros_like(iterate))
 
         return tuple(result)
 
@@ -174,6 +177,8 @@ class SolverFirstOrder(Solver):
         In some solvers, ``set_model`` must be called before
         ``set_prox``, otherwise and error might be raised.
         """
+        if self.model is not None:
+            prox._set_dtype(self.model.dtype)
         self._set("prox", prox)
         return self
 
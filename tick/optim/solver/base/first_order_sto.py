@@ -3,7 +3,6 @@ import numpy as np
 from tick.optim.model.base import Model
 from tick.optim.prox.base import Prox
 from tick.optim.solver.base import SolverFirstOrder, SolverSto
-from tick.optim.solver.base.utils import relative_distance
 
 __author__ = 'stephanegaiffas'
 
@@ -52,6 +51,17 @@ class SolverFirstOrderSto(SolverFirstOrder, SolverSto):
         The seed of the random sampling. If it is negative then a random seed
         (different at each run) will be chosen.
 
+    stopping_criterion : {'objective', 'iterate'}, default='objective'
+        Quantity compared to ``tol`` after each epoch
+
+        * if ``'objective'``, the relative change of the objective, which
+          requires a full pass over the data after each epoch when ``tol`` is
+          positive
+        * if ``'iterate'``, the relative change of the iterate, which is
+          computed by the C++ solver. Epochs are then run in a row and the
+          objective is only computed for iterations that are recorded in
+          history or printed
+
     Attributes
     ----------
     model : `Solver`
@@ -69,6 +79,10 @@ class SolverFirstOrderSto(SolverFirstOrder, SolverSto):
     time_end : `str`
         End date of the call to solve()
 
+    dtype : `numpy.dtype` (read-only)
+        Floating point type of the C++ solver, it follows the one of the
+        model given to ``set_model``
+
     Notes
     -----
     This class should not be used by end-users
@@ -77,14 +91,26 @@ class SolverFirstOrderSto(SolverFirstOrder, SolverSto):
     _attrinfos = {
         "_step": {
             "writable": False
+        },
+        "_stopping_criterion": {
+            "writable": False
+        },
+        "dtype": {
+            "writable": False
         }
     }
 
+    _stopping_criteria = ["objective", "iterate"]
+
     def __init__(self, step: float = None, epoch_size: int = None,
                  rand_type="unif", tol=0., max_iter=100, verbose=True,
-                 print_every=10, record_every=1, seed=-1):
+                 print_every=10, record_every=1, seed=-1,
+                 stopping_criterion="objective"):
 
         self._step = None
+        self._stopping_criterion = None
+        self.dtype = np.dtype("float64")
+        self.stopping_criterion = stopping_criterion
 
         # We must first construct SolverSto (otherwise self.step won't
         # work in SolverFirstOrder)
@@ -109,10 +135,25 @@ class SolverFirstOrderSto(SolverFirstOrder, SolverSto):
         output : `Solver`
             The `Solver` with given model
         """
+        if model.dtype != self.dtype:
+            self._set("_solver", self._build_cpp_solver(model.dtype))
+            self._set("dtype", model.dtype)
         SolverFirstOrder.set_model(self, model)
         SolverSto.set_model(self, model)
+        if self.prox is not None:
+            # The prox might have been converted to the model dtype, or the
+            # C++ solver rebuilt
+            SolverSto.set_prox(self, self.prox)
         return self
 
+    def _build_cpp_solver(self, dtype):
+        """Build the C++ solver working with the given floating point
+        type, with the current parameters of the solver. Must be overloaded
+        by solvers available in ``float32``
+        """
+        raise ValueError("%s is not available for dtype %s"
+                         % (self.__class__.__name__, np.dtype(dtype)))
+
     def set_prox(self, prox: Prox):
         """Set prox in the solver
 
@@ -143,6 +184,30 @@ class SolverFirstOrderSto(SolverFirstOrder, SolverSto):
         if self._solver is not None:
             self._solver.set_step(val)
 
+    @property
+    def stopping_criterion(self):
+        return self._stopping_criterion
+
+    @stopping_criterion.setter
+    def stopping_criterion(self, val):
+        if val not in self._stopping_criteria:
+            raise ValueError("``stopping_criterion`` must be one of %s, "
+                             "got %s" % (self._stopping_criteria, val))
+        self._set("_stopping_criterion", val)
+
+    def _next_needed_iteration(self, n_iter):
+        """Returns the first iteration from ``n_iter`` whose objective must be
+        computed, either to record it in history or to check convergence
+        """
+        if self.tol > 0 and self.stopping_criterion == "objective":
+            return n_iter
+        next_iter = n_iter
+        while next_iter < self.max_iter \
+                and next_iter % self.print_every != 0 \
+                and next_iter % self.record_every != 0:
+            next_iter += 1
+        return next_iter
+
     def _solve(self, x0: np.array = None, step: float = None):
         """
         Launch the solver
@@ -163,29 +228,48 @@ class SolverFirstOrderSto(SolverFirstOrder, SolverSto):
         if step is not None:
             self.step = step
 
-        step, obj, minimizer, prev_minimizer = self._initialize_values(x0, step,
-                                                                   n_empty_vectors=1)
+        step, obj, minimizer = self._initialize_values(x0, step)
         self._solver.set_starting_iterate(minimizer)
-        # At each iteration we call self._solver.solve that does a full
-        # epoch
-        for n_iter in range(self.max_iter + 1):
-            prev_minimizer[:] = minimizer
-            prev_obj = obj
-            # Launch one epoch using the wrapped C++ solver
-            self._solver.solve()
+
+        if self.stopping_criterion == "iterate":
+            iterate_tol = self.tol
+        else:
+            iterate_tol = 0.
+
+        # Epochs are run in a row by the wrapped C++ solver until an
+        # iteration whose objective is needed is reached
+        n_iter = 0
+        while n_iter <= self.max_iter:
+            next_iter = self._next_needed_iteration(n_iter)
+            n_epochs = self._solver.solve_epochs(next_iter - n_iter + 1,
+                                                 iterate_tol)
+            n_iter += n_epochs - 1
+            rel_delta = self._solver.get_iterate_change()
             self._solver.get_minimizer(minimizer)
-            # The step might be modified by the C++ solver
-            # step = self._solver.get_step()
-            obj = self.objective(minimizer)
-            rel_delta = relative_distance(minimizer, prev_minimizer)
-            rel_obj = abs(obj - prev_obj) / abs(prev_obj)
-            converged = rel_obj < self.tol
-            # If converged, we stop the loop and record the last step
-            # in history
-            self._handle_history(n_iter, force=converged, obj=obj,
-                                 x=minimizer.copy(), rel_delta=rel_delta,
-                                 rel_obj=rel_obj)
+
+            if iterate_tol > 0:
+                converged = rel_delta < iterate_tol
+            else:
+                converged = False
+
+            should_record = n_iter % self.print_every == 0 or \
+                n_iter % self.record_every == 0 or n_iter == self.max_iter
+            if should_record or converged or \
+                    (self.tol > 0 and self.stopping_criterion == "objective"):
+                # rel_obj is computed with respect to the previous computed
+                # objective
+                prev_obj = obj
+                obj = self.objective(minimizer)
+                rel_obj = abs(obj - prev_obj) / abs(prev_obj)
+                if self.stopping_criterion == "objective":
+                    converged = rel_obj < self.tol
+                # If converged, we stop the loop and record the last step
+                # in history
+                self._handle_history(n_iter, force=converged, obj=obj,
+                                     x=minimizer, rel_delta=rel_delta,
+                                     rel_obj=rel_obj)
             if converged:
                 break
+            n_iter += 1
         self._set("solution", minimizer)
         return minimizer
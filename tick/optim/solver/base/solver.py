@@ -117,7 +117,9 @@ class Solver(Base):
             The current iteration (will determine if we record it or
             not)
         force : `bool`
-            If True, we will record no matter the value of ``n_iter``
+            If True, we will record no matter the value of ``n_iter``. The
+            last iteration (``n_iter`` equal to ``max_iter``) is always
+            recorded
 
         **kwargs : `dict`
             key, value pairs of the values to record in the History of
@@ -129,12 +131,14 @@ class Solver(Base):
         print_every = self.print_every
         record_every = self.record_every
         should_print = verbose and (force or n_iter % print_every == 0)
-        should_record = force or n_iter % print_every == 0 or \
+        # Last record of the solver, iterates are stored in history
+        last_record = force or n_iter == self.max_iter
+        should_record = last_record or n_iter % print_every == 0 or \
                         n_iter % record_every == 0
         if should_record:
             self.history._update(n_iter=n_iter,
                                  time=time() - self._time_start,
-                                 **kwargs)
+                                 force=last_record, **kwargs)
         if should_print:
             self.history._print_history()
 
@@ -174,11 +178,12 @@ class Solver(Base):
 
         Returns
         -------
-        output : `list` or `dict`
+        output : `numpy.ndarray` or `dict`
             * If ``key`` is None or ``key`` is not in history then
               output is a dict containing history of all keys
             * If ``key`` is the name of an element in the history,
-              output is a `list` containing the history of this element
+              output is a `numpy.ndarray` containing the history of this
+              element
         """
         val = self.history.values.get(key, None)
         if val is None:
@@ -141,7 +141,7 @@ class BFGS(SolverFirstOrder):
             rel_obj = abs(obj - prev_obj[0]) / abs(prev_obj[0])
             prev_obj[0] = obj
             self._handle_history(n_iter[0], force=False, obj=obj,
-                                 x=xk.copy(),
+                                 x=xk,
                                  rel_delta=rel_delta,
                                  rel_obj=rel_obj)
             n_iter[0] += 1
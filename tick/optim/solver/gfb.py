@@ -41,6 +41,11 @@ class CompositeProx(Prox):
         self.prox_list = prox_list
         self.n_proxs = len(self.prox_list)
 
+    def _set_dtype(self, dtype):
+        for prox in self.prox_list:
+            prox._set_dtype(dtype)
+        self._set("dtype", np.dtype(dtype))
+
     def _call(self, coeffs: np.ndarray, step: object,
               out: np.ndarray):
         raise ValueError("You cannot call globally a CompositeProx")
@@ -154,7 +159,7 @@ class GFB(SolverFirstOrder):
             # if converged, we stop the loop and record the last step
             # in history
             self._handle_history(n_iter, force=converged, obj=obj,
-                                 x=x.copy(), rel_delta=rel_delta,
+                                 x=x, rel_delta=rel_delta,
                                  step=step, rel_obj=rel_obj)
             if converged:
                 break
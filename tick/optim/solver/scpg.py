@@ -337,7 +337,7 @@ class SCPG(SolverFirstOrder):
             converged = rel_obj < self.tol
             # if converged, we stop the loop and record the last step in history
 
-            self._handle_history(n_iter, force=converged, obj=obj, x=x.copy(),
+            self._handle_history(n_iter, force=converged, obj=obj, x=x,
                                  rel_delta=rel_delta, step=alpha_k,
                                  rel_obj=rel_obj, l_k=l_k, beta_k=beta_k,
                                  lambda_k=lambda_k, th_gain=self._th_gain,
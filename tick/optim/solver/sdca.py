@@ -43,6 +43,13 @@ class SDCA(SolverFirstOrderSto):
         Information along iteration is recorded in history each time the
         iteration number of a multiple of ``record_every``
 
+    stopping_criterion : {'objective', 'iterate'}, default='objective'
+        If ``'objective'``, the solver stops when the relative change of the
+        objective is smaller than ``tol``. If ``'iterate'``, it stops when
+        the relative change of the iterate is smaller than ``tol``, in which
+        case the objective is only computed on iterations that are recorded
+        in history or printed
+
     Attributes
     ----------
     model : `Solver`
@@ -61,13 +68,14 @@ class SDCA(SolverFirstOrderSto):
                  rand_type: str = "unif", tol: float = 0.,
                  max_iter: int = 100, verbose: bool = True,
                  print_every: int = 10, record_every: int = 1,
-                 seed: int = -1):
+                 seed: int = -1, stopping_criterion: str = "objective"):
 
         SolverFirstOrderSto.__init__(self, step=0, epoch_size=epoch_size,
                                      rand_type=rand_type, tol=tol,
                                      max_iter=max_iter, verbose=verbose,
                                      print_every=print_every,
-                                     record_every=record_every, seed=seed)
+                                     record_every=record_every, seed=seed,
+                                     stopping_criterion=stopping_criterion)
         self.l_l2sq = l_l2sq
         epoch_size = self.epoch_size
         if epoch_size is None:
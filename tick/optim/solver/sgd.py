@@ -1,5 +1,6 @@
 from tick.optim.solver.base import SolverFirstOrderSto
-from tick.optim.solver.build.solver import SGD as _SGD
+from tick.optim.solver.build.solver import SGD as _SGD, \
+    SGDFloat as _SGDFloat
 
 __author__ = "Stephane Gaiffas"
 
@@ -48,6 +49,24 @@ class SGD(SolverFirstOrderSto):
         The seed of the random sampling. If it is negative then a random seed
         (different at each run) will be chosen.
 
+    stopping_criterion : {'objective', 'iterate'}, default='objective'
+        If ``'objective'``, the solver stops when the relative change of the
+        objective is smaller than ``tol``. If ``'iterate'``, it stops when
+        the relative change of the iterate is smaller than ``tol``, in which
+        case the objective is only computed on iterations that are recorded
+        in history or printed
+
+    n_threads : `int`, default=1
+        Number of threads running the iterations of an epoch concurrently
+        on a shared iterate, without locks (Hogwild! style). It requires a
+        separable prox (`ProxZero`, `ProxL1`, `ProxL2Sq` or
+        `ProxElasticNet`). On sparse features, the prox is only applied
+        to the support of the sampled features, with a strength reweighted
+        by the inverse frequency of each feature
+
+        * if ``int <= 0``: the number of cores available on the CPU
+        * otherwise the desired number of threads
+
     Attributes
     ----------
     model : `Solver`
@@ -57,15 +76,28 @@ class SGD(SolverFirstOrderSto):
         Proximal operator to solve
     """
 
+    _attrinfos = {
+        "n_threads": {
+            "cpp_setter": "set_n_threads"
+        }
+    }
+
     def __init__(self, step: float = None, epoch_size: int = None,
                  rand_type: str = "unif", tol: float = 0.,
                  max_iter: int = 100, verbose: bool = True,
                  print_every: int = 10, record_every: int = 1,
-                 seed: int = -1):
+                 seed: int = -1, stopping_criterion: str = "objective",
+                 n_threads: int = 1):
 
         SolverFirstOrderSto.__init__(self, step, epoch_size, rand_type,
                                      tol, max_iter, verbose,
-                                     print_every, record_every, seed)
+                                     print_every, record_every, seed,
+                                     stopping_criterion)
+        self.n_threads = n_threads
+        # Construct the wrapped C++ SGD solver
+        self._solver = self._build_cpp_solver("float64")
+
+    def _build_cpp_solver(self, dtype):
         # Type mapping None to unsigned long and double does not work...
         step = self.step
         if step is None:
@@ -73,6 +105,8 @@ class SGD(SolverFirstOrderSto):
         epoch_size = self.epoch_size
         if epoch_size is None:
             epoch_size = 0
-        # Construct the wrapped C++ SGD solver
-        self._solver = _SGD(epoch_size, self.tol,
-                            self._rand_type, step, self.seed)
+        solver_class = _SGDFloat if dtype == "float32" else _SGD
+        solver = solver_class(epoch_size, self.tol, self._rand_type, step,
+                              self.seed)
+        solver.set_n_threads(self.n_threads)
+        return solver
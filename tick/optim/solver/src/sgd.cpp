@@ -4,20 +4,24 @@
 
 #include "sgd.h"
 
-SGD::SGD(ulong epoch_size,
-         double tol,
-         RandType rand_type,
-         double step,
-         int seed)
-    : StoSolver(epoch_size, tol, rand_type, seed),
+template <class T>
+TSGD<T>::TSGD(ulong epoch_size,
+              double tol,
+              RandType rand_type,
+              T step,
+              int seed)
+    : TStoSolver<T>(epoch_size, tol, rand_type, seed),
       step(step) {}
 
-void SGD::solve() {
-    if (model->is_sparse()) {
+template <class T>
+void TSGD<T>::solve() {
+    if (n_threads > 1) {
+        solve_concurrent();
+    } else if (model->is_sparse()) {
         solve_sparse();
     } else {
         // Dense case
-        ArrayDouble grad(iterate.size());
+        Array<T> grad(iterate.size());
         grad.init_to_zero();
 
         const ulong start_t = t;
@@ -31,7 +35,8 @@ void SGD::solve() {
     }
 }
 
-void SGD::solve_sparse() {
+template <class T>
+void TSGD<T>::solve_sparse() {
     // The model is sparse, so it is a ModelGeneralizedLinear and the iteration looks a
     // little bit different
     ulong n_features = model->get_n_features();
@@ -41,15 +46,15 @@ void SGD::solve_sparse() {
     for (t = start_t; t < start_t + epoch_size; ++t) {
         ulong i = get_next_i();
         // Sparse features vector
-        BaseArrayDouble x_i = model->get_features(i);
+        BaseArray<T> x_i = model->get_features(i);
         // Gradient factor
-        double alpha_i = model->grad_i_factor(i, iterate);
+        T alpha_i = model->grad_i_factor(i, iterate);
         // Update the step
-        double step_t = get_step_t();
-        double delta = -step_t * alpha_i;
+        T step_t = get_step_t();
+        T delta = -step_t * alpha_i;
         if (use_intercept) {
             // Get the features vector, which is sparse here
-            ArrayDouble iterate_no_interc = view(iterate, 0, n_features);
+            Array<T> iterate_no_interc = view(iterate, 0, n_features);
             iterate_no_interc.mult_incr(x_i, delta);
             iterate[n_features] += delta;
         } else {
@@ -61,6 +66,49 @@ void SGD::solve_sparse() {
     }
 }
 
-inline double SGD::get_step_t() {
+template <class T>
+void TSGD<T>::solve_concurrent() {
+    check_concurrent_prox();
+
+    const ulong n_features = model->get_n_features();
+    const bool use_intercept = model->use_intercept();
+    const bool sparse = model->is_sparse();
+    // On sparse features only the support of x_i is updated, the prox being reweighted
+    Array<T> weights = sparse ? view(get_sparse_weights()) : Array<T>();
+
+    const ulong start_t = t;
+    run_concurrent_epoch([&](ulong first, ulong last, const ArrayULong &samples) {
+        Array<T> grad(sparse ? 0 : iterate.size());
+        for (ulong k = first; k < last; ++k) {
+            const ulong i = samples[k];
+            const T step_k = step / (start_t + k + 1);
+            if (sparse) {
+                BaseArray<T> x_i = model->get_features(i);
+                const T alpha_i = model->grad_i_factor(i, iterate);
+                for (ulong l = 0; l < x_i.size_sparse(); ++l) {
+                    const ulong j = x_i.indices()[l];
+                    iterate[j] = prox->call_single_lazy(j, iterate[j], step_k * alpha_i * x_i.data()[l],
+                                                        step_k * weights[j], 1);
+                }
+                if (use_intercept) {
+                    iterate[n_features] = prox->call_single_lazy(n_features, iterate[n_features],
+                                                                 step_k * alpha_i, step_k, 1);
+                }
+            } else {
+                model->grad_i(i, iterate, grad);
+                for (ulong j = 0; j < iterate.size(); ++j) {
+                    iterate[j] = prox->call_single_lazy(j, iterate[j], step_k * grad[j], step_k, 1);
+                }
+            }
+        }
+    });
+    t = start_t + epoch_size;
+}
+
+template <class T>
+inline T TSGD<T>::get_step_t() {
     return step / (t + 1);
 }
+
+template class TSGD<double>;
+template class TSGD<float>;
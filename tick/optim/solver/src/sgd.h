@@ -13,27 +13,40 @@
 #include "../../prox/src/prox.h"
 #include "sto_solver.h"
 
-class SGD : public StoSolver {
+template <class T>
+class TSGD : public TStoSolver<T> {
+ protected:
+    using TStoSolver<T>::t;
+    using TStoSolver<T>::model;
+    using TStoSolver<T>::prox;
+    using TStoSolver<T>::iterate;
+    using TStoSolver<T>::epoch_size;
+    using TStoSolver<T>::get_next_i;
+    using TStoSolver<T>::n_threads;
+    using TStoSolver<T>::run_concurrent_epoch;
+    using TStoSolver<T>::get_sparse_weights;
+    using TStoSolver<T>::check_concurrent_prox;
+
  private:
-    double step_t;
-    double step;
+    T step_t;
+    T step;
 
  public:
-    SGD(ulong epoch_size = 0,
-        double tol = 0.,
-        RandType rand_type = RandType::unif,
-        double step = 0.,
-        int seed = -1);
+    TSGD(ulong epoch_size = 0,
+         double tol = 0.,
+         RandType rand_type = RandType::unif,
+         T step = 0.,
+         int seed = -1);
 
-    inline double get_step_t() const {
+    inline T get_step_t() const {
         return step_t;
     }
 
-    inline double get_step() const {
+    inline T get_step() const {
         return step;
     }
 
-    inline void set_step(double step) {
+    inline void set_step(T step) {
         this->step = step;
     }
 
@@ -41,7 +54,13 @@ class SGD : public StoSolver {
 
     void solve_sparse();
 
-    inline double get_step_t();
+    // Iterations of an epoch run on n_threads threads, see TStoSolver::run_concurrent_epoch
+    void solve_concurrent();
+
+    inline T get_step_t();
 };
 
+typedef TSGD<double> SGD;
+typedef TSGD<float> SGDFloat;
+
 #endif  // TICK_OPTIM_SOLVER_SRC_SGD_H_
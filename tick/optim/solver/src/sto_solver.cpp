@@ -6,17 +6,21 @@
 
 #include <prox_zero.h>
 
-StoSolver::StoSolver(int seed)
+#include "parallel/parallel.h"
+
+template <class T>
+TStoSolver<T>::TStoSolver(int seed)
     : seed(seed) {
     set_seed(seed);
     permutation_ready = false;
 }
 
-StoSolver::StoSolver(ulong epoch_size,
-                     double tol,
-                     RandType rand_type,
-                     int seed)
-    : prox(std::make_shared<ProxZero>(0.0)),
+template <class T>
+TStoSolver<T>::TStoSolver(ulong epoch_size,
+                          double tol,
+                          RandType rand_type,
+                          int seed)
+    : prox(std::make_shared<TProxZero<T>>(0.0)),
       epoch_size(epoch_size),
       tol(tol),
       rand_type(rand_type) {
@@ -24,7 +28,8 @@ StoSolver::StoSolver(ulong epoch_size,
     permutation_ready = false;
 }
 
-void StoSolver::init_permutation() {
+template <class T>
+void TStoSolver<T>::init_permutation() {
     if ((rand_type == RandType::perm) && (rand_max > 0)) {
         permutation = ArrayULong(rand_max);
         for (ulong i = 0; i < rand_max; ++i)
@@ -32,7 +37,8 @@ void StoSolver::init_permutation() {
     }
 }
 
-void StoSolver::reset() {
+template <class T>
+void TStoSolver<T>::reset() {
     t = 1;
     if (rand_type == RandType::perm) {
         i_perm = 0;
@@ -40,7 +46,8 @@ void StoSolver::reset() {
     }
 }
 
-ulong StoSolver::get_next_i() {
+template <class T>
+ulong TStoSolver<T>::get_next_i() {
     ulong i = 0;
     if (rand_type == RandType::unif) {
         i = rand_unif(rand_max - 1);
@@ -59,7 +66,8 @@ ulong StoSolver::get_next_i() {
 }
 
 // Simulation of a random permutation using Knuth's algorithm
-void StoSolver::shuffle() {
+template <class T>
+void TStoSolver<T>::shuffle() {
     if (rand_type == RandType::perm) {
         // A secure check
         if (permutation.size() != rand_max) {
@@ -80,17 +88,113 @@ void StoSolver::shuffle() {
     permutation_ready = true;
 }
 
-void StoSolver::get_minimizer(ArrayDouble &out) {
+template <class T>
+ulong TStoSolver<T>::solve_epochs(ulong n_epochs, double tol) {
+    Array<T> minimizer(iterate.size());
+    Array<T> prev_minimizer(iterate.size());
+    get_minimizer(prev_minimizer);
+
+    ulong n_epoch = 0;
+    while (n_epoch < n_epochs) {
+        solve();
+        n_epoch++;
+        get_minimizer(minimizer);
+
+        // Same as relative_distance in Python
+        double diff_norm_sq = 0;
+        double prev_norm_sq = 0;
+        for (ulong j = 0; j < minimizer.size(); ++j) {
+            const double diff_j = minimizer[j] - prev_minimizer[j];
+            diff_norm_sq += diff_j * diff_j;
+            prev_norm_sq += prev_minimizer[j] * prev_minimizer[j];
+            prev_minimizer[j] = minimizer[j];
+        }
+        if (prev_norm_sq == 0) prev_norm_sq = 1.;
+        iterate_change = std::sqrt(diff_norm_sq / prev_norm_sq);
+
+        if (tol > 0 && iterate_change < tol) break;
+    }
+    return n_epoch;
+}
+
+template <class T>
+void TStoSolver<T>::set_n_threads(int n_threads) {
+    if (n_threads <= 0) {
+        n_threads = std::max(std::thread::hardware_concurrency(), 1u);
+    }
+    this->n_threads = n_threads;
+}
+
+template <class T>
+void TStoSolver<T>::run_concurrent_epoch(
+    const std::function<void(ulong, ulong, const ArrayULong &)> &iterations) {
+    // Sampling is not thread-safe, hence it is done here
+    ArrayULong samples(epoch_size);
+    for (ulong k = 0; k < epoch_size; ++k) samples[k] = get_next_i();
+
+    const ulong n_chunks = std::min(static_cast<ulong>(n_threads), epoch_size);
+    tick::ThreadPool::instance().run(n_chunks, [&](ulong chunk) {
+        ulong first, last;
+        std::tie(first, last) = tick::get_thread_indices(chunk, n_chunks, epoch_size);
+        iterations(first, last, samples);
+    });
+}
+
+template <class T>
+Array<T> &TStoSolver<T>::get_sparse_weights() {
+    if (sparse_weights.size() != model->get_n_coeffs()) {
+        const ulong n_samples = model->get_n_samples();
+        const ulong n_features = model->get_n_features();
+
+        sparse_weights = Array<T>(model->get_n_coeffs());
+        sparse_weights.init_to_zero();
+        for (ulong i = 0; i < n_samples; ++i) {
+            BaseArray<T> x_i = model->get_features(i);
+            if (x_i.is_sparse()) {
+                for (ulong k = 0; k < x_i.size_sparse(); ++k) {
+                    if (x_i.data()[k] != 0) sparse_weights[x_i.indices()[k]] += 1;
+                }
+            } else {
+                for (ulong j = 0; j < n_features; ++j) {
+                    if (x_i.value(j) != 0) sparse_weights[j] += 1;
+                }
+            }
+        }
+        // Features that never appear are never updated, their weight does not matter
+        for (ulong j = 0; j < n_features; ++j) {
+            sparse_weights[j] = sparse_weights[j] > 0 ? n_samples / sparse_weights[j] : 1;
+        }
+        if (model->use_intercept()) sparse_weights[n_features] = 1;
+    }
+    return sparse_weights;
+}
+
+template <class T>
+void TStoSolver<T>::check_concurrent_prox() const {
+    if (!prox->has_lazy_updates()) {
+        TICK_ERROR("Iterations cannot run on several threads with " << prox->get_class_name()
+                   << ", only separable proxes such as ProxL1, ProxL2Sq, ProxElasticNet or "
+                      "ProxZero are supported");
+    }
+}
+
+template <class T>
+void TStoSolver<T>::get_minimizer(Array<T> &out) {
     for (ulong i = 0; i < iterate.size(); ++i)
         out[i] = iterate[i];
 }
 
-void StoSolver::get_iterate(ArrayDouble &out) {
+template <class T>
+void TStoSolver<T>::get_iterate(Array<T> &out) {
     for (ulong i = 0; i < iterate.size(); ++i)
         out[i] = iterate[i];
 }
 
-void StoSolver::set_starting_iterate(ArrayDouble &new_iterate) {
+template <class T>
+void TStoSolver<T>::set_starting_iterate(Array<T> &new_iterate) {
     for (ulong i = 0; i < new_iterate.size(); ++i)
         iterate[i] = new_iterate[i];
 }
+
+template class TStoSolver<double>;
+template class TStoSolver<float>;
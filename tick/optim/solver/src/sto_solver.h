@@ -6,6 +6,7 @@
 #define TICK_OPTIM_SOLVER_SRC_STO_SOLVER_H_
 
 #include "base.h"
+#include <functional>
 #include <rand.h>
 #include "model.h"
 #include "prox.h"
@@ -22,12 +23,13 @@ enum class RandType {
 };
 
 // Base abstract for a stochastic solver
-class StoSolver {
+template <class T>
+class TStoSolver {
  protected:
     // Model object
-    ModelPtr model;
+    std::shared_ptr<TModel<T>> model;
 
-    ProxPtr prox;
+    std::shared_ptr<TProx<T>> prox;
 
     Rand rand;
 
@@ -35,7 +37,7 @@ class StoSolver {
     ulong t = 1;
 
     // Iterate
-    ArrayDouble iterate;
+    Array<T> iterate;
 
     // sampling is done in {0, ..., rand_max-1}
     // This is useful to know in what range random sampling must be done
@@ -66,24 +68,57 @@ class StoSolver {
     // Seed of the random sampling
     int seed;
 
+    // Relative change of the iterate during the last epoch run by solve_epochs
+    double iterate_change = 0.;
+
+    // Number of threads running the iterations of an epoch concurrently
+    int n_threads = 1;
+
+    // Inverse of the frequency of each feature among samples (1 for the intercept), see
+    // get_sparse_weights
+    Array<T> sparse_weights;
+
+    /**
+     * @brief Runs the iterations of an epoch on n_threads threads sharing the iterate
+     * (Hogwild! style, updates are not synchronized).
+     * The samples of the epoch are drawn beforehand, and each thread is given a contiguous block
+     * [first, last) of them.
+     * \param iterations : function called as iterations(first, last, samples) on each thread
+     */
+    void run_concurrent_epoch(
+        const std::function<void(ulong, ulong, const ArrayULong &)> &iterations);
+
+    /**
+     * @brief Inverse of the frequency of each feature among samples, the last one being 1 if
+     * the model uses an intercept.
+     * When updates are restricted to the support of the sampled features, weighting the full
+     * gradient and the prox by these keeps them unbiased. This is computed on first call after
+     * the model has been set.
+     */
+    Array<T> &get_sparse_weights();
+
+    // Throws if the prox cannot be applied coordinate-wise by concurrent iterations
+    void check_concurrent_prox() const;
+
  public:
-    explicit StoSolver(int seed = -1);
+    explicit TStoSolver(int seed = -1);
 
-    StoSolver(ulong epoch_size = 0,
-              double tol = 0.,
-              RandType rand_type = RandType::unif,
-              int seed = -1);
+    TStoSolver(ulong epoch_size = 0,
+               double tol = 0.,
+               RandType rand_type = RandType::unif,
+               int seed = -1);
 
-    virtual ~StoSolver() = default;
+    virtual ~TStoSolver() = default;
 
-    virtual void set_model(ModelPtr model) {
+    virtual void set_model(std::shared_ptr<TModel<T>> model) {
         this->model = model;
         permutation_ready = false;
-        iterate = ArrayDouble(model->get_n_coeffs());
+        iterate = Array<T>(model->get_n_coeffs());
         iterate.init_to_zero();
+        sparse_weights = Array<T>();
     }
 
-    virtual void set_prox(ProxPtr prox) {
+    virtual void set_prox(std::shared_ptr<TProx<T>> prox) {
         this->prox = prox;
     }
 
@@ -100,11 +135,28 @@ class StoSolver {
 
     virtual void solve() {}
 
-    virtual void get_minimizer(ArrayDouble &out);
+    /**
+     * @brief Runs several epochs (calls to solve) in a row
+     * \param n_epochs : The maximum number of epochs to run
+     * \param tol : If positive, epochs stop as soon as the relative change
+     * of the iterate during an epoch is below tol
+     * \return The number of epochs that have been run
+     */
+    ulong solve_epochs(ulong n_epochs, double tol = 0.);
+
+    /**
+     * @brief Returns the relative change (in l2 norm) of the minimizer during
+     * the last epoch run by solve_epochs
+     */
+    inline double get_iterate_change() const {
+        return iterate_change;
+    }
+
+    virtual void get_minimizer(Array<T> &out);
 
-    virtual void get_iterate(ArrayDouble &out);
+    virtual void get_iterate(Array<T> &out);
 
-    virtual void set_starting_iterate(ArrayDouble &new_iterate);
+    virtual void set_starting_iterate(Array<T> &new_iterate);
 
     // Returns a uniform integer in the set {0, ..., m - 1}
     inline ulong rand_unif(ulong m) {
@@ -131,6 +183,16 @@ class StoSolver {
         return t;
     }
 
+    inline int get_n_threads() const {
+        return n_threads;
+    }
+
+    /**
+     * @brief Set the number of threads running the iterations of an epoch concurrently.
+     * If n_threads <= 0, the number of cores available is used.
+     */
+    void set_n_threads(int n_threads);
+
     inline RandType get_rand_type() const {
         return rand_type;
     }
@@ -149,4 +211,7 @@ class StoSolver {
     }
 };
 
+typedef TStoSolver<double> StoSolver;
+typedef TStoSolver<float> StoSolverFloat;
+
 #endif  // TICK_OPTIM_SOLVER_SRC_STO_SOLVER_H_
@@ -4,28 +4,37 @@
 
 #include "svrg.h"
 
-SVRG::SVRG(ulong epoch_size,
-           double tol,
-           RandType rand_type,
-           double step,
-           int seed,
-           VarianceReductionMethod variance_reduction
+template <class T>
+TSVRG<T>::TSVRG(ulong epoch_size,
+                double tol,
+                RandType rand_type,
+                T step,
+                int seed,
+                VarianceReductionMethod variance_reduction
 )
-    : StoSolver(epoch_size, tol, rand_type, seed),
+    : TStoSolver<T>(epoch_size, tol, rand_type, seed),
       step(step), variance_reduction(variance_reduction) {
 }
 
-void SVRG::solve() {
-    ArrayDouble mu(iterate.size());
-    ArrayDouble fixed_w = next_iterate;
-    model->grad(fixed_w, mu);
-
-    if (model->is_sparse()) {
-        solve_sparse();
+template <class T>
+void TSVRG<T>::solve() {
+    if (n_threads > 1) {
+        solve_concurrent();
+    } else if (model->is_sparse()) {
+        // Lazy updates cannot compute the average of the iterates of the epoch
+        if (prox->has_lazy_updates() && variance_reduction != VarianceReductionMethod::Average) {
+            solve_sparse_lazy();
+        } else {
+            solve_sparse();
+        }
     } else {
         // Dense case
-        ArrayDouble grad_i(iterate.size());
-        ArrayDouble grad_i_fixed_w(iterate.size());
+        Array<T> mu(iterate.size());
+        Array<T> fixed_w = next_iterate;
+        model->grad(fixed_w, mu);
+
+        Array<T> grad_i(iterate.size());
+        Array<T> grad_i_fixed_w(iterate.size());
 
         ulong rand_index{0};
 
@@ -61,17 +70,15 @@ void SVRG::solve() {
     t += epoch_size;
 }
 
-void SVRG::solve_sparse() {
-    // TODO: once lazy updates will be implemented in prox we will be able to
-    // do lazy updating with mu vector
-
+template <class T>
+void TSVRG<T>::solve_sparse() {
     // The model is sparse, so it is a ModelGeneralizedLinear and the iteration looks a
     // little bit different
     ulong n_features = model->get_n_features();
     bool use_intercept = model->use_intercept();
 
-    ArrayDouble mu(iterate.size());
-    ArrayDouble fixed_w = iterate;
+    Array<T> mu(iterate.size());
+    Array<T> fixed_w = next_iterate;
     model->grad(fixed_w, mu);
 
     ulong rand_index{0};
@@ -88,14 +95,14 @@ void SVRG::solve_sparse() {
     for (ulong t = 0; t < epoch_size; ++t) {
         ulong i = get_next_i();
         // Sparse features vector
-        BaseArrayDouble x_i = model->get_features(i);
+        BaseArray<T> x_i = model->get_features(i);
         // Gradients factor
-        double alpha_i_iterate = model->grad_i_factor(i, iterate);
-        double alpha_i_fixed_w = model->grad_i_factor(i, fixed_w);
-        double delta = -step * (alpha_i_iterate - alpha_i_fixed_w);
+        T alpha_i_iterate = model->grad_i_factor(i, iterate);
+        T alpha_i_fixed_w = model->grad_i_factor(i, fixed_w);
+        T delta = -step * (alpha_i_iterate - alpha_i_fixed_w);
         if (use_intercept) {
             // Get the features vector, which is sparse here
-            ArrayDouble iterate_no_interc = view(iterate, 0, n_features);
+            Array<T> iterate_no_interc = view(iterate, 0, n_features);
             //
             iterate_no_interc.mult_incr(x_i, delta);
             iterate[n_features] += delta;
@@ -118,8 +125,132 @@ void SVRG::solve_sparse() {
         next_iterate = iterate;
 }
 
-void SVRG::set_starting_iterate(ArrayDouble &new_iterate) {
-    StoSolver::set_starting_iterate(new_iterate);
+template <class T>
+void TSVRG<T>::solve_sparse_lazy() {
+    // Same iterations as solve_sparse, but a step only updates the coordinates in the support of
+    // the sampled features (and the intercept). The steps missed by the other coordinates only
+    // involve mu, and are caught up in closed form by the prox when the coordinate is needed
+    // again, or at the end of the epoch
+    ulong n_features = model->get_n_features();
+    bool use_intercept = model->use_intercept();
+
+    Array<T> mu(iterate.size());
+    Array<T> fixed_w = next_iterate;
+    model->grad(fixed_w, mu);
+
+    // Number of steps already applied to each coordinate of the iterate
+    ArrayULong last_step(iterate.size());
+    last_step.init_to_zero();
+
+    auto catch_up = [&](ulong j, ulong t) {
+        if (last_step[j] < t) {
+            iterate[j] = prox->call_single_lazy(j, iterate[j], step * mu[j], step, t - last_step[j]);
+            last_step[j] = t;
+        }
+    };
+
+    ulong rand_index{0};
+    if (variance_reduction == VarianceReductionMethod::Random) {
+        next_iterate.init_to_zero();
+        rand_index = rand_unif(epoch_size);
+    }
+
+    for (ulong t = 0; t < epoch_size; ++t) {
+        ulong i = get_next_i();
+        // Sparse features vector
+        BaseArray<T> x_i = model->get_features(i);
+        const ulong n_non_zeros = x_i.size_sparse();
+        const INDICE_TYPE *indices = x_i.indices();
+        const T *values = x_i.data();
+
+        // Coordinates in the support are brought up to date before computing the inner product
+        for (ulong k = 0; k < n_non_zeros; ++k) catch_up(indices[k], t);
+
+        T alpha_i_iterate = model->grad_i_factor(i, iterate);
+        T alpha_i_fixed_w = model->grad_i_factor(i, fixed_w);
+        T delta = -step * (alpha_i_iterate - alpha_i_fixed_w);
+
+        for (ulong k = 0; k < n_non_zeros; ++k) {
+            const ulong j = indices[k];
+            iterate[j] = prox->call_single_lazy(j, iterate[j], step * mu[j] - delta * values[k],
+                                                step, 1);
+            last_step[j] = t + 1;
+        }
+        if (use_intercept) {
+            iterate[n_features] = prox->call_single_lazy(n_features, iterate[n_features],
+                                                         step * mu[n_features] - delta, step, 1);
+            last_step[n_features] = t + 1;
+        }
+
+        if (variance_reduction == VarianceReductionMethod::Random && t == rand_index) {
+            for (ulong j = 0; j < iterate.size(); ++j) catch_up(j, t + 1);
+            next_iterate = iterate;
+        }
+    }
+
+    for (ulong j = 0; j < iterate.size(); ++j) catch_up(j, epoch_size);
+
+    if (variance_reduction == VarianceReductionMethod::Last)
+        next_iterate = iterate;
+}
+
+template <class T>
+void TSVRG<T>::solve_concurrent() {
+    if (variance_reduction != VarianceReductionMethod::Last) {
+        TICK_ERROR("Iterations of SVRG can run on several threads only with variance_reduction "
+                   "'last'");
+    }
+    check_concurrent_prox();
+
+    const ulong n_features = model->get_n_features();
+    const bool use_intercept = model->use_intercept();
+    const bool sparse = model->is_sparse();
+    Array<T> weights = sparse ? view(get_sparse_weights()) : Array<T>();
+
+    Array<T> mu(iterate.size());
+    Array<T> fixed_w = next_iterate;
+    model->grad(fixed_w, mu);
+
+    run_concurrent_epoch([&](ulong first, ulong last, const ArrayULong &samples) {
+        Array<T> grad_i(sparse ? 0 : iterate.size());
+        Array<T> grad_i_fixed_w(sparse ? 0 : iterate.size());
+        for (ulong k = first; k < last; ++k) {
+            const ulong i = samples[k];
+            if (sparse) {
+                BaseArray<T> x_i = model->get_features(i);
+                T alpha_i_iterate = model->grad_i_factor(i, iterate);
+                T alpha_i_fixed_w = model->grad_i_factor(i, fixed_w);
+                T delta = -step * (alpha_i_iterate - alpha_i_fixed_w);
+                for (ulong l = 0; l < x_i.size_sparse(); ++l) {
+                    const ulong j = x_i.indices()[l];
+                    iterate[j] = prox->call_single_lazy(
+                        j, iterate[j], step * weights[j] * mu[j] - delta * x_i.data()[l],
+                        step * weights[j], 1);
+                }
+                if (use_intercept) {
+                    iterate[n_features] = prox->call_single_lazy(
+                        n_features, iterate[n_features], step * mu[n_features] - delta, step, 1);
+                }
+            } else {
+                model->grad_i(i, iterate, grad_i);
+                model->grad_i(i, fixed_w, grad_i_fixed_w);
+                for (ulong j = 0; j < iterate.size(); ++j) {
+                    iterate[j] = prox->call_single_lazy(
+                        j, iterate[j], step * (grad_i[j] - grad_i_fixed_w[j] + mu[j]), step, 1);
+                }
+            }
+        }
+    });
+
+    next_iterate = iterate;
+}
+
+template <class T>
+void TSVRG<T>::set_starting_iterate(Array<T> &new_iterate) {
+    TStoSolver<T>::set_starting_iterate(new_iterate);
 
     next_iterate = iterate;
 }
+
+template class TSVRG<double>;
+template class TSVRG<float>;
@@ -9,7 +9,8 @@
 #include "sgd.h"
 #include "../../prox/src/prox.h"
 
-class SVRG : public StoSolver {
+template <class T>
+class TSVRG : public TStoSolver<T> {
  public:
     enum class VarianceReductionMethod {
         Last    = 1,
@@ -17,27 +18,40 @@ class SVRG : public StoSolver {
         Random  = 3,
     };
 
+ protected:
+    using TStoSolver<T>::t;
+    using TStoSolver<T>::model;
+    using TStoSolver<T>::prox;
+    using TStoSolver<T>::iterate;
+    using TStoSolver<T>::epoch_size;
+    using TStoSolver<T>::get_next_i;
+    using TStoSolver<T>::rand_unif;
+    using TStoSolver<T>::n_threads;
+    using TStoSolver<T>::run_concurrent_epoch;
+    using TStoSolver<T>::get_sparse_weights;
+    using TStoSolver<T>::check_concurrent_prox;
+
  private:
-    double step;
+    T step;
     VarianceReductionMethod variance_reduction;
-    ArrayDouble next_iterate;
+    Array<T> next_iterate;
 
  public:
-    SVRG(ulong epoch_size,
-         double tol,
-         RandType rand_type,
-         double step,
-         int seed = -1,
-         VarianceReductionMethod variance_reduction = VarianceReductionMethod::Last);
+    TSVRG(ulong epoch_size,
+          double tol,
+          RandType rand_type,
+          T step,
+          int seed = -1,
+          VarianceReductionMethod variance_reduction = VarianceReductionMethod::Last);
 
     void solve() override;
 
-    double get_step() const {
+    T get_step() const {
         return step;
     }
 
-    void set_step(double step) {
-        SVRG::step = step;
+    void set_step(T step) {
+        TSVRG::step = step;
     }
 
     VarianceReductionMethod get_variance_reduction() const {
@@ -45,12 +59,24 @@ class SVRG : public StoSolver {
     }
 
     void set_variance_reduction(VarianceReductionMethod variance_reduction) {
-        SVRG::variance_reduction = variance_reduction;
+        TSVRG::variance_reduction = variance_reduction;
     }
 
-    void set_starting_iterate(ArrayDouble &new_iterate) override;
+    void set_starting_iterate(Array<T> &new_iterate) override;
 
     void solve_sparse();
+
+    // Sparse iterations with lazy updates, each step costs O(nnz(x_i)) instead of
+    // O(n_features). Requires a prox with lazy updates
+    void solve_sparse_lazy();
+
+    // Iterations of an epoch run on n_threads threads, see TStoSolver::run_concurrent_epoch.
+    // On sparse features, the full gradient and the prox are reweighted on the support of x_i
+    // so that a step costs O(nnz(x_i)), as in proximal asynchronous SAGA
+    void solve_concurrent();
 };
 
+typedef TSVRG<double> SVRG;
+typedef TSVRG<float> SVRGFloat;
+
 #endif  // TICK_OPTIM_SOLVER_SRC_SVRG_H_
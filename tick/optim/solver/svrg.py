@@ -1,5 +1,6 @@
 from tick.optim.solver.base import SolverFirstOrderSto
-from tick.optim.solver.build.solver import SVRG as _SVRG
+from tick.optim.solver.build.solver import SVRG as _SVRG, \
+    SVRGFloat as _SVRGFloat
 
 __author__ = "Stephane Gaiffas"
 
@@ -57,6 +58,25 @@ class SVRG(SolverFirstOrderSto):
           epoch
         * 'rand': the phase iterate is a random iterate of the previous epoch
 
+    stopping_criterion : {'objective', 'iterate'}, default='objective'
+        If ``'objective'``, the solver stops when the relative change of the
+        objective is smaller than ``tol``. If ``'iterate'``, it stops when
+        the relative change of the iterate is smaller than ``tol``, in which
+        case the objective is only computed on iterations that are recorded
+        in history or printed
+
+    n_threads : `int`, default=1
+        Number of threads running the iterations of an epoch concurrently
+        on a shared iterate, without locks (Hogwild! style). It requires a
+        separable prox (`ProxZero`, `ProxL1`, `ProxL2Sq` or
+        `ProxElasticNet`) and ``variance_reduction='last'``. On sparse
+        features, the full gradient and the prox are only applied to the
+        support of the sampled features, reweighted by the inverse
+        frequency of each feature
+
+        * if ``int <= 0``: the number of cores available on the CPU
+        * otherwise the desired number of threads
+
     Attributes
     ----------
     model : `Solver`
@@ -66,15 +86,30 @@ class SVRG(SolverFirstOrderSto):
         Proximal operator to solve
     """
 
+    _attrinfos = {
+        "n_threads": {
+            "cpp_setter": "set_n_threads"
+        }
+    }
+
     def __init__(self, step: float = None, epoch_size: int = None,
                  rand_type: str = "unif", tol: float = 0.,
                  max_iter: int = 100, verbose: bool = True,
                  print_every: int = 10, record_every: int = 1,
-                 seed: int = -1, variance_reduction: str = "last"):
+                 seed: int = -1, variance_reduction: str = "last",
+                 stopping_criterion: str = "objective", n_threads: int = 1):
 
         SolverFirstOrderSto.__init__(self, step, epoch_size, rand_type,
                                      tol, max_iter, verbose,
-                                     print_every, record_every, seed=seed)
+                                     print_every, record_every, seed=seed,
+                                     stopping_criterion=stopping_criterion)
+        self.n_threads = n_threads
+        # Construct the wrapped C++ SVRG solver
+        self._solver = self._build_cpp_solver("float64")
+
+        self.variance_reduction = variance_reduction
+
+    def _build_cpp_solver(self, dtype):
         step = self.step
         if step is None:
             step = 0.
@@ -83,11 +118,15 @@ class SVRG(SolverFirstOrderSto):
         if epoch_size is None:
             epoch_size = 0
 
-        # Construct the wrapped C++ SGD solver
-        self._solver = _SVRG(epoch_size, self.tol,
-                             self._rand_type, step, self.seed)
-
-        self.variance_reduction = variance_reduction
+        solver_class = _SVRGFloat if dtype == "float32" else _SVRG
+        solver = solver_class(epoch_size, self.tol, self._rand_type, step,
+                              self.seed)
+        solver.set_n_threads(self.n_threads)
+        if self._solver is not None:
+            # Keep the variance reduction method of the solver we replace
+            solver.set_variance_reduction(
+                self._solver.get_variance_reduction())
+        return solver
 
     @property
     def variance_reduction(self):
@@ -21,3 +21,20 @@ public:
 
     void solve();
 };
+
+class SGDFloat : public StoSolverFloat {
+
+public:
+
+    SGDFloat(unsigned long epoch_size,
+             double tol,
+             RandType rand_type,
+             float step,
+             int seed);
+
+    inline void set_step(float step);
+
+    inline float get_step() const;
+
+    void solve();
+};
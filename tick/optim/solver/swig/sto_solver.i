@@ -25,6 +25,10 @@ public:
 
     virtual void solve();
 
+    unsigned long solve_epochs(unsigned long n_epochs, double tol = 0.);
+
+    inline double get_iterate_change() const;
+
     virtual void get_minimizer(ArrayDouble &out);
 
     virtual void get_iterate(ArrayDouble &out);
@@ -43,6 +47,9 @@ public:
     inline void set_rand_max(unsigned long rand_max);
     inline unsigned long get_rand_max() const;
 
+    void set_n_threads(int n_threads);
+    inline int get_n_threads() const;
+
     virtual void set_model(std::shared_ptr<Model> model);
 
     virtual void set_prox(std::shared_ptr<Prox> prox);
@@ -50,3 +57,48 @@ public:
     void set_seed(int seed);
 
 };
+
+
+class StoSolverFloat {
+    // Base abstract for a stochastic solver working on float data
+
+public:
+
+    StoSolverFloat(unsigned long epoch_size,
+                   double tol,
+                   RandType rand_type);
+
+    virtual void solve();
+
+    unsigned long solve_epochs(unsigned long n_epochs, double tol = 0.);
+
+    inline double get_iterate_change() const;
+
+    virtual void get_minimizer(ArrayFloat &out);
+
+    virtual void get_iterate(ArrayFloat &out);
+
+    virtual void set_starting_iterate(ArrayFloat &new_iterate);
+
+    inline void set_tol(double tol);
+    inline double get_tol() const;
+
+    inline void set_epoch_size(unsigned long epoch_size);
+    inline unsigned long get_epoch_size() const;
+
+    inline void set_rand_type(RandType rand_type);
+    inline RandType get_rand_type() const;
+
+    inline void set_rand_max(unsigned long rand_max);
+    inline unsigned long get_rand_max() const;
+
+    void set_n_threads(int n_threads);
+    inline int get_n_threads() const;
+
+    virtual void set_model(std::shared_ptr<ModelFloat> model);
+
+    virtual void set_prox(std::shared_ptr<ProxFloat> prox);
+
+    void set_seed(int seed);
+
+};
@@ -29,3 +29,28 @@ public:
 
     void set_variance_reduction(VarianceReductionMethod variance_reduction);
 };
+
+class SVRGFloat : public StoSolverFloat {
+
+public:
+    enum class VarianceReductionMethod {
+        Last    = 1,
+        Average = 2,
+        Random  = 3
+    };
+
+    SVRGFloat(unsigned long epoch_size,
+              double tol,
+              RandType rand_type,
+              float step,
+              int seed,
+              VarianceReductionMethod variance_reduction = VarianceReductionMethod::Last);
+
+    void solve();
+
+    void set_step(float step);
+
+    VarianceReductionMethod get_variance_reduction();
+
+    void set_variance_reduction(VarianceReductionMethod variance_reduction);
+};
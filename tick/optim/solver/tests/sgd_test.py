@@ -25,5 +25,37 @@ class Test(TestSolver):
         self._test_solver_sparse_and_dense_consistency(create_solver)
 
 
+    def test_sgd_lazy_objective(self):
+        """...Test SGD computes the objective only on recorded iterations
+        """
+
+        def create_solver(**kwargs):
+            return SGD(max_iter=30, verbose=False, step=1e-1,
+                       seed=TestSolver.sto_seed, **kwargs)
+
+        self._test_solver_lazy_objective(create_solver)
+
+    def test_sgd_float32(self):
+        """...Test SGD runs in single precision on float32 data
+        """
+
+        def create_solver():
+            return SGD(max_iter=30, verbose=False, step=1e-1,
+                       seed=TestSolver.sto_seed)
+
+        self._test_solver_float32(create_solver)
+
+    def test_sgd_n_threads(self):
+        """...Test that SGD running on several threads reaches the
+        minimizer
+        """
+
+        def create_solver(n_threads):
+            return SGD(step=200, max_iter=100, verbose=False,
+                       seed=TestSolver.sto_seed, n_threads=n_threads)
+
+        self._test_solver_n_threads(create_solver, tol=1e-2)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,13 +3,14 @@ import unittest
 import itertools
 import numpy as np
 from tick.optim.model import ModelLogReg, ModelPoisReg, ModelLinReg
-from tick.optim.prox import ProxL2Sq, ProxZero, ProxL1
+from tick.optim.prox import ProxL2Sq, ProxZero, ProxL1, ProxTV, \
+    ProxElasticNet
 from tick.optim.solver import SVRG, AGD, SGD, SDCA, GD, BFGS
 from scipy.linalg import norm
 
 from tick.simulation import SimuPoisReg
 
-from scipy.sparse import csr_matrix
+from scipy.sparse import csr_matrix, random as sparse_random
 
 from tick.simulation import weights_sparse_gauss, SimuLinReg, SimuLogReg
 
@@ -191,6 +192,103 @@ class TestSolver(unittest.TestCase):
                                            iterate_sparse,
                                            err_msg=error_msg)
 
+    def _test_solver_lazy_objective(self, create_solver):
+        """...Test that stochastic solvers compute the objective only on
+        recorded iterations and can stop on the iterate change
+        """
+        y, X, coeffs0, interc0 = self.generate_logistic_data(
+            n_features=10, n_samples=200)
+
+        def run_solver(**kwargs):
+            solver = create_solver(**kwargs)
+            model = ModelLogReg(fit_intercept=False).fit(X, y)
+            solver.set_model(model).set_prox(ProxL2Sq(1e-2))
+            return solver, model, solver.solve()
+
+        solver_1, model_1, coeffs_1 = run_solver(record_every=1)
+        solver_10, model_10, coeffs_10 = run_solver(record_every=10)
+
+        # The iterates do not depend on which iterations are recorded
+        np.testing.assert_array_equal(coeffs_1, coeffs_10)
+        np.testing.assert_array_equal(solver_10.history.values['n_iter'],
+                                      list(range(0, 31, 10)))
+        np.testing.assert_almost_equal(
+            solver_10.history.values['obj'],
+            solver_1.history.values['obj'][::10])
+        self.assertLess(model_10.n_calls_loss, model_1.n_calls_loss)
+
+        solver, _, _ = run_solver(record_every=10, tol=1e-1,
+                                  stopping_criterion='iterate')
+        last_n_iter = solver.history.last_values['n_iter']
+        self.assertLess(last_n_iter, 30)
+        self.assertLess(solver.history.last_values['rel_delta'], 1e-1)
+
+        with self.assertRaises(ValueError):
+            create_solver(stopping_criterion='wrong_name')
+
+    def _test_solver_float32(self, create_solver):
+        """...Test that stochastic solvers run in single precision when
+        the model is given float32 data, and agree with double precision
+        """
+        y, X, coeffs0, interc0 = self.generate_logistic_data(
+            n_features=10, n_samples=200)
+
+        def run_solver(dtype, sparse):
+            features = X.astype(dtype)
+            if sparse:
+                features = csr_matrix(features)
+            model = ModelLogReg(fit_intercept=True).fit(features,
+                                                        y.astype(dtype))
+            prox = ProxL1(1e-3, range=(0, X.shape[1]))
+            solver = create_solver()
+            solver.set_model(model).set_prox(prox)
+            return solver, prox, solver.solve()
+
+        for sparse in [False, True]:
+            solver_64, prox_64, coeffs_64 = run_solver('float64', sparse)
+            solver_32, prox_32, coeffs_32 = run_solver('float32', sparse)
+
+            self.assertEqual(coeffs_64.dtype, np.float64)
+            self.assertEqual(coeffs_32.dtype, np.float32)
+            self.assertEqual(solver_32.dtype, np.float32)
+            self.assertEqual(prox_32.dtype, np.float32)
+            np.testing.assert_array_almost_equal(coeffs_32, coeffs_64,
+                                                 decimal=3)
+
+        # Proxes without a float32 implementation are rejected
+        model = ModelLogReg().fit(X.astype('float32'), y)
+        solver = create_solver().set_model(model)
+        with self.assertRaises(ValueError):
+            solver.set_prox(ProxTV(1e-3))
+
+    def _test_solver_n_threads(self, create_solver, tol):
+        """...Test that stochastic solvers running on several threads reach
+        the objective of the minimizer up to tol, on dense and sparse features
+        """
+        n_samples, n_features = 200, 30
+        np.random.seed(12)
+        X = sparse_random(n_samples, n_features, density=0.2, format='csr',
+                          random_state=12)
+        y = np.sign(np.random.randn(n_samples))
+        prox = ProxElasticNet(1e-2, ratio=0.5)
+
+        for features in [X, X.toarray()]:
+            model = ModelLogReg(fit_intercept=True).fit(features, y)
+            # Objective of the minimizer, reached by a deterministic solver
+            agd = AGD(max_iter=2000, tol=1e-14, verbose=False)
+            agd.set_model(model).set_prox(prox)
+            objective_min = agd.objective(agd.solve())
+
+            for n_threads in [1, 4]:
+                solver = create_solver(n_threads=n_threads)
+                solver.set_model(model).set_prox(prox)
+                objective = solver.objective(solver.solve())
+                self.assertLess(objective - objective_min, tol,
+                                "with n_threads=%i" % n_threads)
+
+        self.assertEqual(create_solver(n_threads=3)._solver.get_n_threads(),
+                         3)
+
     @staticmethod
     def evaluate_model(coeffs, w, c=None):
         if c is None:
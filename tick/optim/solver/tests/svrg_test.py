@@ -1,5 +1,10 @@
 import unittest
 
+import numpy as np
+from scipy import sparse
+
+from tick.optim.model import ModelLogReg
+from tick.optim.prox import ProxElasticNet, ProxL1, ProxL2Sq, ProxZero
 from tick.optim.solver import SVRG
 from tick.optim.solver.tests.solver import TestSolver
 from tick.optim.solver.build.solver import SVRG as _SVRG
@@ -24,6 +29,45 @@ class Test(TestSolver):
 
         self._test_solver_sparse_and_dense_consistency(create_solver)
 
+    def test_svrg_sparse_lazy_updates(self):
+        """...Test that lazy updates of SVRG on sparse features give the
+        same iterates as the dense iterations
+        """
+        n_samples, n_features = 100, 30
+        np.random.seed(12)
+        X = sparse.random(n_samples, n_features, density=0.1,
+                          format='csr', random_state=12)
+        y = np.sign(np.random.randn(n_samples))
+
+        proxs = [
+            ProxZero(),
+            ProxL1(1e-2),
+            ProxL2Sq(1e-1, positive=True),
+            ProxElasticNet(5e-2, ratio=0.5, range=(0, 20)),
+        ]
+        for prox in proxs:
+            for variance_reduction in ['last', 'rand']:
+                iterates = []
+                for features in [X, X.toarray()]:
+                    model = ModelLogReg(fit_intercept=True).fit(features, y)
+                    solver = SVRG(step=0.5, max_iter=5, verbose=False,
+                                  seed=TestSolver.sto_seed,
+                                  variance_reduction=variance_reduction)
+                    solver.set_model(model).set_prox(prox)
+                    iterates.append(solver.solve())
+                np.testing.assert_array_almost_equal(*iterates, decimal=8)
+
+    def test_svrg_n_threads(self):
+        """...Test that SVRG running on several threads reaches the
+        minimizer
+        """
+
+        def create_solver(n_threads):
+            return SVRG(step=0.5, max_iter=100, verbose=False,
+                        seed=TestSolver.sto_seed, n_threads=n_threads)
+
+        self._test_solver_n_threads(create_solver, tol=1e-6)
+
     def test_variance_reduction_setting(self):
         """...Test SVRG variance_reduction parameter is correctly set
         """
@@ -55,5 +99,26 @@ class Test(TestSolver):
         with self.assertRaises(ValueError):
             svrg.variance_reduction = 'wrong_name'
 
+    def test_svrg_lazy_objective(self):
+        """...Test SVRG computes the objective only on recorded iterations
+        """
+
+        def create_solver(**kwargs):
+            return SVRG(max_iter=30, verbose=False, step=1e-1,
+                        seed=TestSolver.sto_seed, **kwargs)
+
+        self._test_solver_lazy_objective(create_solver)
+
+    def test_svrg_float32(self):
+        """...Test SVRG runs in single precision on float32 data
+        """
+
+        def create_solver():
+            return SVRG(max_iter=30, verbose=False, step=1e-1,
+                        seed=TestSolver.sto_seed)
+
+        self._test_solver_float32(create_solver)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,26 @@
 import tick.base
 
+
+def _set_mpl_backend():
+    """Make sure that we don't get DISPLAY problems when running without X
+    on unices
+    Code imported from nilearn (nilearn/nilearn/plotting/__init__.py)
+    """
+    # We are doing local imports here to avoid polluting our namespace
+    import matplotlib
+    import os
+    import sys
+    # Set the backend to a non-interactive one for unices without X
+    if (os.name == 'posix' and 'DISPLAY' not in os.environ
+        and not (sys.platform == 'darwin'
+                 and matplotlib.get_backend() == 'MacOSX'
+                 )):
+        matplotlib.use('Agg')
+
+
+# The backend must be set before pyplot is imported by plot functions
+_set_mpl_backend()
+
 from .plot_stem import stem, stems
 from .plot_history import plot_history
 from .plot_hawkes import plot_hawkes_kernels, plot_hawkes_kernel_norms, \
@@ -20,12 +20,14 @@ class Test(unittest.TestCase):
 
         self.solver1 = GD()
         history1 = History()
-        history1._set("values", {'n_iter': self.n_iter1, 'obj': self.obj1})
+        for n_iter, obj in zip(self.n_iter1, self.obj1):
+            history1._update(n_iter=n_iter, obj=obj)
         self.solver1._set("history", history1)
 
         self.solver2 = AGD()
         history2 = History()
-        history2._set("values", {'n_iter': self.n_iter2, 'obj': self.obj2})
+        for n_iter, obj in zip(self.n_iter2, self.obj2):
+            history2._update(n_iter=n_iter, obj=obj)
         self.solver2._set("history", history2)
 
     def test_plot_history_solver(self):
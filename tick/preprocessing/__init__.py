@@ -1,3 +1,8 @@
-from .features_binarizer import FeaturesBinarizer
+import tick.base
+from tick.base.lazy_import import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    ".features_binarizer": ["FeaturesBinarizer"],
+})
 
 __all__ = ["FeaturesBinarizer"]
@@ -1,8 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
+from scipy.sparse import csr_matrix
 
 from sklearn.base import BaseEstimator, TransformerMixin
-from sklearn.preprocessing import OneHotEncoder
 
 from tick.base import Base
 
@@ -38,11 +40,19 @@ class FeaturesBinarizer(Base, BaseEstimator, TransformerMixin):
         If `True`, first column of each binarized continuous feature block is
         removed.
 
+    n_threads : `int`, default=1
+        Number of threads used to binarize the features, each thread
+        processes a different column.
+
+        * if `int <= 0`: the number of physical cores available on the CPU
+        * otherwise the desired number of threads
+
+    chunk_size : `int`, default=1000000
+        Number of rows binarized at once by `transform`. It bounds the memory
+        used by intermediate arrays, besides the output matrix.
+
     Attributes
     ----------
-    one_hot_encoder : `OneHotEncoder`
-        OneHotEncoders for continuous and discrete features.
-
     bins_boundaries : `list`
         Bins boundaries for continuous features.
 
@@ -93,28 +103,32 @@ class FeaturesBinarizer(Base, BaseEstimator, TransformerMixin):
     """
 
     _attrinfos = {
-        "one_hot_encoder": {"writable": False},
         "bins_boundaries": {"writable": False},
         "mapper": {"writable": False},
         "feature_type": {"writable": False},
+        "_active_intervals": {"writable": False},
         "_fitted": {"writable": False}
     }
 
     def __init__(self, method="quantile", n_cuts=10, detect_column_type="auto",
-                 remove_first=False):
+                 remove_first=False, n_threads=1, chunk_size=1000000):
         Base.__init__(self)
 
         self.method = method
         self.n_cuts = n_cuts
         self.detect_column_type = detect_column_type
         self.remove_first = remove_first
+        self.n_threads = n_threads
+        self.chunk_size = chunk_size
         self.reset()
 
     def reset(self):
-        self._set("one_hot_encoder", OneHotEncoder(sparse=True))
         self._set("bins_boundaries", {})
         self._set("mapper", {})
         self._set("feature_type", {})
+        # For each feature, intervals that were seen during fit, only those
+        # are binarized
+        self._set("_active_intervals", [])
         self._set("_fitted", False)
 
     @property
@@ -129,8 +143,7 @@ class FeaturesBinarizer(Base, BaseEstimator, TransformerMixin):
         if not self._fitted:
             raise ValueError("cannot get feature_indices if object has not "
                              "been fitted")
-        # construct from encoder
-        return self.one_hot_encoder.feature_indices_
+        return np.hstack((0, np.cumsum(self.n_values)))
 
     @property
     def n_values(self):
@@ -144,8 +157,7 @@ class FeaturesBinarizer(Base, BaseEstimator, TransformerMixin):
         if not self._fitted:
             raise ValueError("cannot get n_values if object has not been "
                              "fitted")
-        # construct from encoder
-        return self.one_hot_encoder.n_values_
+        return np.array([np.sum(active) for active in self._active_intervals])
 
     @staticmethod
     def cast_to_array(X):
@@ -164,6 +176,36 @@ class FeaturesBinarizer(Base, BaseEstimator, TransformerMixin):
 
         return X, columns
 
+    @staticmethod
+    def _get_columns(X):
+        """Get the columns of the input matrix as `np.ndarray`, without
+        casting the whole matrix.
+
+        Returns
+        -------
+        output : `list`, `list`
+            The columns of the input matrix and their names.
+        """
+        if X.__class__ == pd.DataFrame:
+            columns = [X.iloc[:, i].values for i in range(X.shape[1])]
+            return columns, X.columns
+        else:
+            return [X[:, i] for i in range(X.shape[1])], \
+                   [str(i) for i in range(X.shape[1])]
+
+    def _map(self, func, *iterables):
+        """Map func over the features, with n_threads threads
+        """
+        n_threads = self.n_threads
+        if n_threads <= 0:
+            import multiprocessing
+            n_threads = multiprocessing.cpu_count()
+
+        if n_threads == 1:
+            return list(map(func, *iterables))
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            return list(executor.map(func, *iterables))
+
     def fit(self, X):
         """Fit the binarization using the features matrix.
 
@@ -178,15 +220,23 @@ class FeaturesBinarizer(Base, BaseEstimator, TransformerMixin):
             The fitted current instance.
         """
         self.reset()
-        X, columns = FeaturesBinarizer.cast_to_array(X)
+        features, columns = FeaturesBinarizer._get_columns(X)
 
-        categorical_X = np.empty_like(X)
-        for i, column in enumerate(columns):
-            feature = X[:, i]
-            binarized_feat = self._assign_interval(column, feature, fit=True)
-            categorical_X[:, i] = binarized_feat
+        def fit_feature(column, feature):
+            intervals = self._assign_interval(column, feature, fit=True)
+            n_intervals = self._n_intervals(column)
+            self._check_intervals(column, intervals, n_intervals)
+            return np.bincount(intervals, minlength=n_intervals) > 0
 
-        self.one_hot_encoder.fit(categorical_X)
+        active_intervals = self._map(fit_feature, columns, features)
+
+        # Features are fitted concurrently, dictionaries are ordered back
+        # as the columns
+        for attr in ["feature_type", "bins_boundaries", "mapper"]:
+            fitted = getattr(self, attr)
+            self._set(attr, {column: fitted[column] for column in columns
+                             if column in fitted})
+        self._set("_active_intervals", active_intervals)
 
         self._set("_fitted", True)
         return self
@@ -201,29 +251,62 @@ class FeaturesBinarizer(Base, BaseEstimator, TransformerMixin):
 
         Returns
         -------
-        output : `pd.DataFrame`
+        output : `scipy.sparse.csr_matrix`
             The binarized features matrix. The number of columns is
             larger than n_features, smaller than n_cuts * n_features,
             depending on the actual number of columns that have been
             binarized.
         """
-        X, columns = FeaturesBinarizer.cast_to_array(X)
-
-        categorical_X = np.empty_like(X)
-        for i, column in enumerate(columns):
-            feature = X[:, i]
-            binarized_feat = self._assign_interval(columns[i], feature,
-                                                   fit=False)
-            categorical_X[:, i] = binarized_feat
-
-        binarized_X = self.one_hot_encoder.transform(categorical_X)
-
-        if self.remove_first:
-            mask = np.ones(binarized_X.shape[1], dtype=bool)
-            mask[self.feature_indices[:-1]] = False
-            binarized_X = binarized_X[:, mask]
-
-        return binarized_X
+        if not self._fitted:
+            raise ValueError("cannot call transform if object has not been "
+                             "fitted")
+        features, columns = FeaturesBinarizer._get_columns(X)
+        n_samples, n_features = X.shape
+
+        # For each feature, maps its intervals to the columns of the
+        # binarized matrix (-1 if the interval has no column)
+        interval_columns = []
+        n_binarized_columns = 0
+        for active in self._active_intervals:
+            active_columns = np.flatnonzero(active)
+            if self.remove_first:
+                active_columns = active_columns[1:]
+            interval_column = np.full(len(active), -1, dtype=np.int32)
+            interval_column[active_columns] = np.arange(
+                n_binarized_columns,
+                n_binarized_columns + len(active_columns), dtype=np.int32)
+            interval_columns += [interval_column]
+            n_binarized_columns += len(active_columns)
+
+        # Each row has at most one non zero in each feature block, which are
+        # ordered as the features, hence indices are stored row by row
+        indices = np.empty((n_samples, n_features), dtype=np.int32)
+
+        def transform_feature(column, feature, interval_column):
+            intervals = self._assign_interval(column, feature, fit=False)
+            self._check_intervals(column, intervals, len(interval_column))
+            return interval_column[intervals]
+
+        chunk_size = max(self.chunk_size, 1)
+        for start in range(0, n_samples, chunk_size):
+            rows = slice(start, min(start + chunk_size, n_samples))
+            chunk_indices = self._map(
+                transform_feature, columns,
+                [feature[rows] for feature in features], interval_columns)
+            if n_features > 0:
+                indices[rows] = np.vstack(chunk_indices).T
+
+        indices = indices.ravel()
+        is_nonzero = indices >= 0
+        if not is_nonzero.all():
+            indices = indices[is_nonzero]
+        indptr = np.zeros(n_samples + 1, dtype=np.int32)
+        np.cumsum(is_nonzero.reshape(n_samples, n_features).sum(axis=1),
+                  out=indptr[1:])
+
+        data = np.ones(len(indices), dtype=float)
+        return csr_matrix((data, indices, indptr),
+                          shape=(n_samples, n_binarized_columns))
 
     def fit_transform(self, X, y=None, **kwargs):
         """Fit and apply the binarization using the features matrix.
@@ -452,27 +535,23 @@ class FeaturesBinarizer(Base, BaseEstimator, TransformerMixin):
         Returns
         -------
         output : `np.ndarray`, shape=(n_samples,)
-            The discretized feature.
+            The discretized feature, categories that were not seen during fit
+            are assigned -1.
         """
         if fit:
-            uniques = np.unique(feature)
-            uniques.sort()
+            uniques, intervals = np.unique(feature, return_inverse=True)
 
             mapper = {category: interval
                       for interval, category in enumerate(uniques)}
 
             self.mapper[feature_name] = mapper
+            return intervals.ravel()
 
         else:
-            mapper = self.mapper[feature_name]
-
-        def category_to_interval(category):
-            if category in mapper:
-                return mapper.get(category)
-            else:
-                return len(list(mapper.keys())) + 1
-
-        return np.vectorize(category_to_interval)(feature)
+            # Categories are the keys of the mapper, in the order of their
+            # intervals
+            categories = pd.Index(list(self.mapper[feature_name].keys()))
+            return categories.get_indexer(feature)
 
     def _assign_interval(self, feature_name, feature, fit=False):
         """Assign intervals to a single feature.
@@ -502,10 +581,28 @@ class FeaturesBinarizer(Base, BaseEstimator, TransformerMixin):
             # Compute bins boundaries for the feature
             boundaries = self._get_boundaries(feature_name, feature, fit)
 
-            # Discretize feature
-            feature = pd.cut(feature, boundaries, labels=False)
+            # Discretize feature, intervals are closed on the right
+            feature = np.searchsorted(boundaries, feature, side='left') - 1
 
         else:
             feature = self._categorical_to_interval(feature, feature_name,
                                                     fit=fit)
         return feature
+
+    def _n_intervals(self, feature_name):
+        """Number of intervals a fitted feature is discretized into
+        """
+        if self.feature_type[feature_name] == "continuous":
+            return len(self.bins_boundaries[feature_name]) - 1
+        else:
+            return len(self.mapper[feature_name])
+
+    @staticmethod
+    def _check_intervals(feature_name, intervals, n_intervals):
+        """Check that all values of a feature fell into one of its intervals
+        """
+        if len(intervals) > 0 and (intervals.min() < 0 or
+                                   intervals.max() >= n_intervals):
+            raise ValueError("feature '%s' contains values that cannot be "
+                             "binarized (unknown category or missing value)"
+                             % feature_name)
@@ -187,6 +187,43 @@ class Test(unittest.TestCase):
 
         return
 
+    def test_binarizer_n_threads_chunk_size(self):
+        """...Test binarizer gives the same binarization when features are
+        processed by several threads and rows by chunks
+        """
+        n_cuts = 3
+        enc = OneHotEncoder(sparse=True)
+        expected_binarization = enc.fit_transform(
+            self.default_expected_intervals)
+
+        for n_threads, chunk_size in [(2, 3), (4, 1), (0, 100)]:
+            binarizer = FeaturesBinarizer(method='quantile', n_cuts=n_cuts,
+                                          detect_column_type="auto",
+                                          n_threads=n_threads,
+                                          chunk_size=chunk_size)
+            binarized_df = binarizer.fit_transform(self.df_features)
+            self.assertEqual(binarized_df.__class__, csr.csr_matrix)
+            self.assertEqual(list(binarizer.feature_type.keys()),
+                             self.columns)
+            np.testing.assert_array_equal(expected_binarization.toarray(),
+                                          binarized_df.toarray())
+            np.testing.assert_array_equal(binarizer.n_values, [4, 4, 2, 5])
+            np.testing.assert_array_equal(binarizer.feature_indices,
+                                          [0, 4, 8, 10, 15])
+
+    def test_binarizer_unknown_category(self):
+        """...Test binarizer raises an error when transforming a category
+        that was not seen during fit
+        """
+        binarizer = FeaturesBinarizer(n_cuts=3)
+        binarizer.fit(self.features)
+
+        features = self.features.copy()
+        features[0, 3] = 'y'
+        msg = "^feature '3' contains values that cannot be binarized"
+        with self.assertRaisesRegex(ValueError, msg):
+            binarizer.transform(features)
+
 
 if __name__ == "__main__":
     unittest.main()
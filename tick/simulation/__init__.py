@@ -1,21 +1,23 @@
 import tick.base
+from tick.base.lazy_import import lazy_attributes
 
-from .base import features_normal_cov_uniform, \
-    features_normal_cov_toeplitz, \
-    weights_sparse_exp, weights_sparse_gauss
-
-from .linreg import SimuLinReg
-from .logreg import SimuLogReg
-from .poisreg import SimuPoisReg
-from .coxreg import SimuCoxReg
-
-from .poisson_process import SimuPoissonProcess
-from .inhomogeneous_poisson import SimuInhomogeneousPoisson
-from .hawkes_kernels import *
-from .hawkes import SimuHawkes
-from .hawkes_exp_kernels import SimuHawkesExpKernels
-from .hawkes_sumexp_kernels import SimuHawkesSumExpKernels
-from .hawkes_multi import SimuHawkesMulti
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    ".base": ["features_normal_cov_uniform", "features_normal_cov_toeplitz",
+              "weights_sparse_exp", "weights_sparse_gauss"],
+    ".linreg": ["SimuLinReg"],
+    ".logreg": ["SimuLogReg"],
+    ".poisreg": ["SimuPoisReg"],
+    ".coxreg": ["SimuCoxReg"],
+    ".poisson_process": ["SimuPoissonProcess"],
+    ".inhomogeneous_poisson": ["SimuInhomogeneousPoisson"],
+    ".hawkes_kernels": ["HawkesKernelExp", "HawkesKernelSumExp",
+                        "HawkesKernelPowerLaw", "HawkesKernelTimeFunc",
+                        "HawkesKernel0"],
+    ".hawkes": ["SimuHawkes"],
+    ".hawkes_exp_kernels": ["SimuHawkesExpKernels"],
+    ".hawkes_sumexp_kernels": ["SimuHawkesSumExpKernels"],
+    ".hawkes_multi": ["SimuHawkesMulti"],
+})
 
 __all__ = ["SimuLinReg",
            "SimuLogReg",
@@ -53,6 +53,13 @@ class SimuHawkes(SimuPointProcess):
         the L1 norm of kernels has a spectral radius greater or equal to 1 as
         it would be unstable
 
+    event_driven : `bool`, default = False
+        If True, a bound of the intensity of each node is kept in a sum tree,
+        candidate jumps are drawn node by node in O(log n_nodes) and only the
+        intensities of the nodes excited by a jump are updated. This is much
+        faster for processes with many nodes and sparse kernels. It is not
+        used when intensity is tracked.
+
     Attributes
     ----------
     timestamps : `list` of `np.ndarray`, size=n_nodes
@@ -85,7 +92,7 @@ class SimuHawkes(SimuPointProcess):
 
     def __init__(self, kernels=None, baseline=None, n_nodes=None,
                  end_time=None, max_jumps=None, seed=None, verbose=True,
-                 force_simulation=False):
+                 force_simulation=False, event_driven=False):
         SimuPointProcess.__init__(self, end_time=end_time, max_jumps=max_jumps,
                                   seed=seed, verbose=verbose)
 
@@ -114,6 +121,7 @@ class SimuHawkes(SimuPointProcess):
         if n_nodes <= 0:
             raise ValueError("n_nodes must be positive but equals %i" % n_nodes)
         self._pp = _Hawkes(n_nodes, self._pp_init_seed)
+        self.event_driven = event_driven
 
         if kernels is not None:
             if kernels.shape != (self.n_nodes, self.n_nodes):
@@ -175,6 +183,14 @@ class SimuHawkes(SimuPointProcess):
                              "kernels has length %i, whereas baseline has "
                              "length %i." % (len(kernels), len(baseline)))
 
+    @property
+    def event_driven(self):
+        return self._pp.get_event_driven()
+
+    @event_driven.setter
+    def event_driven(self, val):
+        self._pp.set_event_driven(bool(val))
+
     def set_kernel(self, i, j, kernel):
         if isinstance(kernel, (int, float)) and kernel == 0:
             self.kernels[i, j] = self._kernel_0
@@ -190,6 +206,12 @@ class SimuHawkes(SimuPointProcess):
     def _simulate(self):
         """Launch simulation of the Hawkes process by thinning
         """
+        self._check_stability()
+        SimuPointProcess._simulate(self)
+
+    def _check_stability(self):
+        """Warn if this process cannot jump and raise if it is not stable
+        """
         if np.linalg.norm(self.baseline) == 0:
             warnings.warn("Baselines have not been set, hence this hawkes "
                           "process won't jump")
@@ -202,8 +224,6 @@ class SimuHawkes(SimuPointProcess):
                              "really want to simulate it"
                              % self.spectral_radius())
 
-        SimuPointProcess._simulate(self)
-
     def spectral_radius(self):
         """Compute the spectral radius of the matrix of l1 norm of Hawkes
         kernels.
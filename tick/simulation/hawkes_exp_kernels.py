@@ -57,6 +57,13 @@ class SimuHawkesExpKernels(SimuHawkes):
         the L1 norm of kernels has a spectral radius greater or equal to 1 as
         it would be unstable
 
+    event_driven : `bool`, default = False
+        If True, a bound of the intensity of each node is kept in a sum tree,
+        candidate jumps are drawn node by node in O(log n_nodes) and only the
+        intensities of the nodes excited by a jump are updated. This is much
+        faster for processes with many nodes and sparse kernels. It is not
+        used when intensity is tracked.
+
     Attributes
     ----------
     timestamps : `list` of `np.ndarray`, size=n_nodes
@@ -89,7 +96,7 @@ class SimuHawkesExpKernels(SimuHawkes):
 
     def __init__(self, adjacency, decays, baseline=None,
                  end_time=None, max_jumps=None, seed=None, verbose=True,
-                 force_simulation=False):
+                 force_simulation=False, event_driven=False):
 
         if isinstance(adjacency, list):
             adjacency = np.array(adjacency)
@@ -118,7 +125,8 @@ class SimuHawkesExpKernels(SimuHawkes):
         SimuHawkes.__init__(self, kernels=kernels, baseline=baseline,
                             end_time=end_time, max_jumps=max_jumps,
                             seed=seed, verbose=verbose,
-                            force_simulation=force_simulation)
+                            force_simulation=force_simulation,
+                            event_driven=event_driven)
 
     def _build_exp_kernels(self):
         """Build exponential kernels from adjacency and decays
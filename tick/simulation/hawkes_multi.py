@@ -1,11 +1,14 @@
 import copy
 import multiprocessing
+import sys
 
 import numpy as np
 
 from multiprocessing import Pool
 
+from tick.base import EventStore
 from tick.simulation.base import Simu
+from tick.simulation.build.simulation import HawkesMulti as _HawkesMulti
 
 
 def simulate_single(simulation):
@@ -20,6 +23,13 @@ class SimuHawkesMulti(Simu):
     simulation time, the replicated Hawkes processes are run in parallel on a
     number of threads specified by n_threads.
 
+    With the ``'multiprocessing'`` engine, each replication is a copy of the
+    Hawkes simulation that is sent to (and retrieved from) a pool of processes.
+    With the ``'native'`` engine, all replications are run by C++ threads, on
+    clones of the underlying Hawkes process, and their timestamps are written
+    in a single flat array (see `flat_timestamps`), hence nothing is copied nor
+    pickled. The native engine does not track intensities.
+
     Attributes
     ----------
     hawkes_simu : 'SimuHawkes'
@@ -33,6 +43,9 @@ class SimuHawkesMulti(Simu):
         is negative or zero, the number of threads is set to the number of
         system available CPU cores.
 
+    engine : {'multiprocessing', 'native'}, default='multiprocessing'
+        How the simulations are run
+
     n_total_jumps : `list` of `int`
         List of the total number of jumps simulated for each process
 
@@ -58,15 +71,27 @@ class SimuHawkesMulti(Simu):
     mean_intensity : `list` of `float`
         List of the mean intensities of the Hawkes processes
 
+    flat_timestamps : `tuple` of two `np.ndarray`
+        Only available with the native engine. Offsets and values of the
+        timestamps of all simulations, the timestamps of node j of
+        simulation i being
+        ``values[offsets[i * n_nodes + j]:offsets[i * n_nodes + j + 1]]``
     """
 
     _attrinfos = {
         "_simulations": {},
+        "_seeds": {},
+        "_end_times": {},
+        "_batch": {},
         "hawkes_simu": {"writable": False},
         "n_simulations": {"writable": False},
+        "engine": {"writable": False},
     }
 
-    def __init__(self, hawkes_simu, n_simulations, n_threads=1):
+    _engines = ['multiprocessing', 'native']
+
+    def __init__(self, hawkes_simu, n_simulations, n_threads=1,
+                 engine='multiprocessing'):
         self.hawkes_simu = hawkes_simu
         self.n_simulations = n_simulations
 
@@ -78,9 +103,22 @@ class SimuHawkesMulti(Simu):
         if n_simulations <= 0:
             raise ValueError("n_simulations must be greater or equal to 1")
 
-        self._simulations = [
-            copy.deepcopy(hawkes_simu) for _ in range(n_simulations)
-            ]
+        if engine not in self._engines:
+            raise ValueError("engine must be one of %s, got %s"
+                             % (self._engines, engine))
+        self.engine = engine
+
+        self._simulations = None
+        self._batch = None
+        if engine == 'native':
+            # Replications only differ by their seed and end time
+            self._seeds = np.empty(n_simulations, dtype='int32')
+            self._seeds.fill(hawkes_simu.seed)
+            self._end_times = [hawkes_simu.end_time] * n_simulations
+        else:
+            self._simulations = [
+                copy.deepcopy(hawkes_simu) for _ in range(n_simulations)
+                ]
 
         Simu.__init__(self, seed=self.seed, verbose=hawkes_simu.verbose)
 
@@ -116,19 +154,47 @@ class SimuHawkesMulti(Simu):
         else:
             new_seeds = np.ones(self.n_simulations, dtype='int32') * seed
 
-        for simu, seed in zip(self._simulations, new_seeds):
-            simu.seed = seed.item()
+        if self.engine == 'native':
+            self._seeds[:] = new_seeds
+        else:
+            for simu, seed in zip(self._simulations, new_seeds):
+                simu.seed = seed.item()
 
     @property
     def n_total_jumps(self):
+        if self.engine == 'native':
+            if self._batch is None:
+                return [0] * self.n_simulations
+            return self._batch.get_n_total_jumps().tolist()
         return [simu.n_total_jumps for simu in self._simulations]
 
     @property
     def timestamps(self):
+        if self.engine == 'native':
+            n_nodes = self.hawkes_simu.n_nodes
+            if self._batch is None:
+                return [[np.zeros(0) for _ in range(n_nodes)]
+                        for _ in range(self.n_simulations)]
+            offsets, values = self.flat_timestamps
+            return [[values[offsets[i * n_nodes + j]:
+                            offsets[i * n_nodes + j + 1]]
+                     for j in range(n_nodes)]
+                    for i in range(self.n_simulations)]
         return [simu.timestamps for simu in self._simulations]
 
+    @property
+    def flat_timestamps(self):
+        if self.engine != 'native':
+            raise ValueError("flat_timestamps is only available with the "
+                             "native engine")
+        if self._batch is None:
+            raise ValueError("Simulations have not been launched yet")
+        return self._batch.get_offsets(), self._batch.get_timestamps()
+
     @property
     def end_time(self):
+        if self.engine == 'native':
+            return list(self._end_times)
         return [simu.end_time for simu in self._simulations]
 
     @end_time.setter
@@ -136,35 +202,102 @@ class SimuHawkesMulti(Simu):
         if len(end_times) != self.n_simulations:
             raise ValueError('end_time must have length {}'
                              .format(self.n_simulations))
+        if self.engine == 'native':
+            self._end_times = list(end_times)
+            return
         for i, simu in enumerate(self._simulations):
             simu.end_time = end_times[i]
 
     @property
     def max_jumps(self):
+        if self.engine == 'native':
+            return [self.hawkes_simu.max_jumps] * self.n_simulations
         return [simu.max_jumps for simu in self._simulations]
 
     @property
     def simulation_time(self):
+        if self.engine == 'native':
+            if self._batch is None:
+                return [0.] * self.n_simulations
+            return self._batch.get_simulation_time().tolist()
         return [simu.simulation_time for simu in self._simulations]
 
     @property
     def n_nodes(self):
+        if self.engine == 'native':
+            return [self.hawkes_simu.n_nodes] * self.n_simulations
         return [simu.n_nodes for simu in self._simulations]
 
     @property
     def spectral_radius(self):
+        if self.engine == 'native':
+            return [self.hawkes_simu.spectral_radius()] * self.n_simulations
         return [simu.spectral_radius() for simu in self._simulations]
 
     @property
     def mean_intensity(self):
+        if self.engine == 'native':
+            return [self.hawkes_simu.mean_intensity()] * self.n_simulations
         return [simu.mean_intensity() for simu in self._simulations]
 
+    def write_event_store(self, path):
+        """Write simulated timestamps to an `EventStore`, each simulation
+        ending at its simulation time
+
+        With the native engine, the flat timestamps are written as they are,
+        without building the list of timestamps arrays of each simulation.
+
+        Parameters
+        ----------
+        path : `str`
+            Directory of the store, created if it does not exist
+
+        Returns
+        -------
+        output : `EventStore`
+            The written store, to be read with memory-mapping
+        """
+        if self.engine == 'native':
+            offsets, values = self.flat_timestamps
+            return EventStore.write_flat(path, offsets, values,
+                                         self.simulation_time)
+        return EventStore.write(path, self.timestamps,
+                                end_times=self.simulation_time)
+
     def get_single_simulation(self, i):
+        if self.engine == 'native':
+            raise ValueError("Single simulations are not kept by the native "
+                             "engine, use timestamps instead")
         return self._simulations[i]
 
     def _simulate(self):
         """ Launches a series of n_simulations Hawkes simulation in a thread
         pool
         """
-        p = Pool(self.n_threads)
-        self._simulations = p.map(simulate_single, self._simulations)
+        if self.engine == 'native':
+            self._simulate_native()
+        else:
+            p = Pool(self.n_threads)
+            self._simulations = p.map(simulate_single, self._simulations)
+
+    def _simulate_native(self):
+        """Runs all simulations with C++ threads, the GIL being released
+        """
+        max_jumps = self.hawkes_simu.max_jumps
+        if max_jumps is None and None in self._end_times:
+            raise ValueError('Either end_time or max_jumps must be set')
+
+        self.hawkes_simu._check_stability()
+
+        end_times = np.array([sys.float_info.max if end_time is None
+                              else end_time for end_time in self._end_times],
+                             dtype=float)
+
+        batch = _HawkesMulti()
+        if max_jumps is None:
+            batch.simulate(self.hawkes_simu._pp, self._seeds, end_times,
+                           self.n_threads)
+        else:
+            batch.simulate(self.hawkes_simu._pp, self._seeds, end_times,
+                           self.n_threads, int(max_jumps))
+        self._batch = batch
@@ -5,13 +5,17 @@
 #define _USE_MATH_DEFINES
 
 #include "hawkes.h"
+#include "math/sum_tree.h"
 
 /// HAWKES
 
 Hawkes::Hawkes(unsigned int dimension1, int seed)
     : PP(dimension1, seed)
     , kernels(n_nodes * n_nodes)
-    , mus(n_nodes) {
+    , mus(n_nodes)
+    , event_driven(false)
+    , parents(n_nodes)
+    , children(n_nodes) {
     for (unsigned int i = 0; i < n_nodes; i++) {
         mus[i] = std::make_shared<HawkesMu>();
 
@@ -35,16 +39,15 @@ bool Hawkes::update_time_shift_(double delay, ArrayDouble &intensity, double *to
     if (total_intensity_bound1) *total_intensity_bound1 = 0;
     bool flag_negative_intensity1 = false;
 
-    // We loop on the contributions
+    // We loop on the contributions of non zero kernels
     for (unsigned int i = 0; i < n_nodes; i++) {
         intensity[i] = get_mu(i);
         if (total_intensity_bound1)
             *total_intensity_bound1 += intensity[i];
 
-        for (unsigned int j = 0; j < n_nodes; j++) {
+        for (unsigned int j : parents[i]) {
             HawkesKernelPtr &k = kernels[i * n_nodes + j];
 
-            if (k->get_support() == 0) continue;
             double bound = 0;
             intensity[i] += k->get_convolution(get_time() + delay, *timestamps[j], &bound);
 
@@ -57,6 +60,95 @@ bool Hawkes::update_time_shift_(double delay, ArrayDouble &intensity, double *to
     return flag_negative_intensity1;
 }
 
+double Hawkes::compute_intensity(unsigned int i, double *bound) {
+    double node_intensity = get_mu(i);
+    *bound = node_intensity;
+
+    for (unsigned int j : parents[i]) {
+        double kernel_bound = 0;
+        node_intensity += kernels[i * n_nodes + j]->get_convolution(get_time(), *timestamps[j],
+                                                                   &kernel_bound);
+        *bound += kernel_bound;
+    }
+    return node_intensity;
+}
+
+void Hawkes::simulate_(double end_time, ulong n_points) {
+    for (unsigned int i = 0; i < n_nodes; i++) {
+        parents[i].clear();
+        children[i].clear();
+    }
+    for (unsigned int i = 0; i < n_nodes; i++) {
+        for (unsigned int j = 0; j < n_nodes; j++) {
+            if (kernels[i * n_nodes + j]->is_zero()) continue;
+            parents[i].push_back(j);
+            children[j].push_back(i);
+        }
+    }
+
+    if (event_driven && !itr_on()) {
+        simulate_event_driven(end_time, n_points);
+    } else {
+        PP::simulate_(end_time, n_points);
+    }
+}
+
+void Hawkes::simulate_event_driven(double end_time, ulong n_points) {
+    // Bounds of the intensity of each node, valid until one of its parents jumps
+    SumTree bounds(n_nodes);
+
+    auto update_node = [this, &bounds](unsigned int i) {
+        double bound;
+        intensity[i] = compute_intensity(i, &bound);
+        if (intensity[i] < 0) flag_negative_intensity = true;
+        bounds.set(i, std::max(bound, 0.));
+    };
+
+    for (unsigned int i = 0; i < n_nodes; i++) update_node(i);
+
+    while (time < end_time && n_total_jumps < n_points && !flag_negative_intensity) {
+        total_intensity_bound = bounds.total();
+        if (max_total_intensity_bound < total_intensity_bound)
+            max_total_intensity_bound = total_intensity_bound;
+
+        // Nothing can happen anymore
+        if (total_intensity_bound <= 0) {
+            time = end_time;
+            break;
+        }
+
+        // We compute the time of the potential next random jump
+        const double time_of_next_jump = time + rand.exponential(total_intensity_bound);
+
+        // Are we done ?
+        if (time_of_next_jump >= end_time) {
+            time = end_time;
+            break;
+        }
+        time = time_of_next_jump;
+
+        // The candidate node is sampled proportionally to its bound and accepted
+        // with probability intensity / bound
+        const unsigned int i = bounds.find(rand.uniform() * total_intensity_bound);
+        const double node_bound = bounds.get(i);
+
+        update_node(i);
+        if (flag_negative_intensity) break;
+
+        if (rand.uniform() * node_bound < intensity[i]) {
+            update_jump(i);
+
+            // Only the nodes excited by i see their intensity changed
+            for (unsigned int child : children[i]) update_node(child);
+        }
+    }
+    total_intensity_bound = bounds.total();
+}
+
+void Hawkes::set_event_driven(bool event_driven) {
+    this->event_driven = event_driven;
+}
+
 void Hawkes::reset() {
     for (unsigned int i = 0; i < n_nodes; i++) {
         for (unsigned int j = 0; j < n_nodes; j++) {
@@ -110,4 +202,16 @@ double Hawkes::get_mu(unsigned int i) {
     return mus[i]->get_value();
 }
 
+std::shared_ptr<Hawkes> Hawkes::clone(int seed) const {
+    auto hawkes = std::make_shared<Hawkes>(n_nodes, seed);
+    hawkes->flag_threshold_negative_intensity = flag_threshold_negative_intensity;
+    hawkes->event_driven = event_driven;
 
+    for (unsigned int i = 0; i < n_nodes; i++) {
+        hawkes->mus[i] = mus[i];
+    }
+    for (ulong k = 0; k < kernels.size(); k++) {
+        hawkes->kernels[k] = kernels[k]->duplicate_if_necessary(kernels[k]);
+    }
+    return hawkes;
+}
@@ -81,6 +81,16 @@ class Hawkes : public PP {
     /// @brief The mus
     std::vector<HawkesMuPtr> mus;
 
+ private:
+    // If true, simulations use the event driven algorithm (see simulate_)
+    bool event_driven;
+
+    // For each node i, the nodes j such that kernel (i, j) is not zero
+    std::vector<std::vector<unsigned int>> parents;
+
+    // For each node j, the nodes i such that kernel (i, j) is not zero
+    std::vector<std::vector<unsigned int>> children;
+
  public :
     /**
      * @brief A constructor for an empty multidimensional Hawkes process
@@ -134,6 +144,29 @@ class Hawkes : public PP {
      */
     double get_mu(unsigned int i);
 
+    /**
+     * @brief Creates a new Hawkes process, not simulated yet, with the same
+     * kernels and mus as this one
+     * \param seed : The seed of the random generator of the new process
+     * \note Kernels that have their own memory (e.g HawkesKernelExp) are
+     * copied, the other ones are shared with this process.
+     */
+    std::shared_ptr<Hawkes> clone(int seed) const;
+
+    /**
+     * @brief Selects the simulation algorithm
+     * \param event_driven : If false (default), Ogata's thinning algorithm is
+     * run on the total intensity and all intensities are updated at each
+     * candidate jump. If true, a bound of the intensity of each node is kept
+     * in a sum tree: the candidate node is sampled in O(log n_nodes), only its
+     * intensity is computed, and only the nodes it excites are updated when it
+     * jumps. This is much faster for processes with many nodes and sparse
+     * kernels. This algorithm is not used if intensity is tracked.
+     */
+    void set_event_driven(bool event_driven);
+
+    bool get_event_driven() const { return event_driven; }
+
  private :
     /**
      * @brief Virtual method called once (at startup) to set the initial
@@ -158,6 +191,25 @@ class Hawkes : public PP {
                                     ArrayDouble &intensity,
                                     double *total_intensity_bound);
 
+    /**
+     * @brief Builds parents and children of each node from non zero kernels
+     * and runs the selected simulation algorithm
+     */
+    void simulate_(double end_time, ulong n_points) override;
+
+    /**
+     * @brief Event driven thinning algorithm, see set_event_driven
+     */
+    void simulate_event_driven(double end_time, ulong n_points);
+
+    /**
+     * @brief Computes the intensity of node i at current time
+     * \param i : the node
+     * \param bound : Set to a bound of the intensity of node i until one of
+     * its parents jumps
+     */
+    double compute_intensity(unsigned int i, double *bound);
+
  public:
   template <class Archive>
   void serialize(Archive & ar) {
@@ -165,6 +217,7 @@ class Hawkes : public PP {
 
       ar(CEREAL_NVP(mus));
       ar(CEREAL_NVP(kernels));
+      ar(CEREAL_NVP(event_driven));
   }
 };
 
@@ -0,0 +1,126 @@
+#ifdef PYTHON_LINK
+#include <Python.h>
+#endif
+
+#include <atomic>
+#include <cstring>
+
+#include "hawkes_multi.h"
+#include "parallel/thread_pool.h"
+
+namespace {
+
+// Runs the realizations and gathers their results in newly allocated arrays.
+// This does not touch any Python object hence it can run without the GIL.
+void simulate_realizations(Hawkes &hawkes,
+                           const ArrayInt &seeds,
+                           const ArrayDouble &end_times,
+                           unsigned int n_threads,
+                           ulong max_jumps,
+                           SArrayDoublePtr &timestamps,
+                           SArrayULongPtr &offsets,
+                           SArrayULongPtr &n_total_jumps,
+                           SArrayDoublePtr &simulation_time) {
+    const ulong n_simulations = seeds.size();
+    const unsigned int n_nodes = hawkes.get_n_nodes();
+    const ulong n_chunks = std::max(1u, n_threads);
+
+    std::vector<std::shared_ptr<Hawkes>> realizations(n_simulations);
+
+    // Realizations may have very different lengths, hence each thread picks
+    // the next one to simulate as soon as it is done with the previous one
+    std::atomic<ulong> next_realization(0);
+    tick::ThreadPool::instance().run(n_chunks, [&](ulong) {
+        ulong r;
+        while ((r = next_realization.fetch_add(1)) < n_simulations) {
+            auto realization = hawkes.clone(seeds[r]);
+            realization->simulate(end_times[r], max_jumps);
+            realizations[r] = realization;
+        }
+    });
+
+    offsets = SArrayULong::new_ptr(n_simulations * n_nodes + 1);
+    n_total_jumps = SArrayULong::new_ptr(n_simulations);
+    simulation_time = SArrayDouble::new_ptr(n_simulations);
+
+    ArrayULong &offsets_ref = *offsets;
+    offsets_ref[0] = 0;
+    for (ulong r = 0; r < n_simulations; ++r) {
+        for (unsigned int j = 0; j < n_nodes; ++j) {
+            const ulong k = r * n_nodes + j;
+            offsets_ref[k + 1] = offsets_ref[k] + realizations[r]->timestamps[j]->size();
+        }
+        (*n_total_jumps)[r] = realizations[r]->get_n_total_jumps();
+        (*simulation_time)[r] = realizations[r]->get_time();
+    }
+
+    timestamps = SArrayDouble::new_ptr(offsets_ref[n_simulations * n_nodes]);
+
+    // Each realization is released as soon as it has been copied
+    next_realization = 0;
+    tick::ThreadPool::instance().run(n_chunks, [&](ulong) {
+        ulong r;
+        while ((r = next_realization.fetch_add(1)) < n_simulations) {
+            for (unsigned int j = 0; j < n_nodes; ++j) {
+                const ulong k = r * n_nodes + j;
+                const ulong size = offsets_ref[k + 1] - offsets_ref[k];
+                if (size > 0) {
+                    memcpy(timestamps->data() + offsets_ref[k],
+                           realizations[r]->timestamps[j]->data(),
+                           size * sizeof(double));
+                }
+            }
+            realizations[r].reset();
+        }
+    });
+}
+
+}  // namespace
+
+HawkesMulti::HawkesMulti()
+    : n_simulations(0), n_nodes(0) {
+    timestamps = SArrayDouble::new_ptr();
+    offsets = SArrayULong::new_ptr(1);
+    (*offsets)[0] = 0;
+    n_total_jumps = SArrayULong::new_ptr();
+    simulation_time = SArrayDouble::new_ptr();
+}
+
+void HawkesMulti::simulate(Hawkes &hawkes,
+                           const ArrayInt &seeds,
+                           const ArrayDouble &end_times,
+                           unsigned int n_threads,
+                           ulong max_jumps) {
+    if (seeds.size() != end_times.size()) {
+        TICK_ERROR("seeds and end_times must have the same size but have sizes "
+                       << seeds.size() << " and " << end_times.size());
+    }
+
+    SArrayDoublePtr new_timestamps, new_simulation_time;
+    SArrayULongPtr new_offsets, new_n_total_jumps;
+
+    std::exception_ptr eptr;
+#ifdef PYTHON_LINK
+    Py_BEGIN_ALLOW_THREADS;
+#endif
+    try {
+        simulate_realizations(hawkes, seeds, end_times, n_threads, max_jumps,
+                              new_timestamps, new_offsets, new_n_total_jumps,
+                              new_simulation_time);
+    } catch (...) {
+        eptr = std::current_exception();
+    }
+#ifdef PYTHON_LINK
+    Py_END_ALLOW_THREADS;
+#endif
+    if (eptr != nullptr) std::rethrow_exception(eptr);
+
+    // Previous results might be owned by numpy arrays, hence they are only
+    // released once the GIL is held again
+    n_simulations = seeds.size();
+    n_nodes = hawkes.get_n_nodes();
+    timestamps = new_timestamps;
+    offsets = new_offsets;
+    n_total_jumps = new_n_total_jumps;
+    simulation_time = new_simulation_time;
+}
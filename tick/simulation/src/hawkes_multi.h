@@ -0,0 +1,63 @@
+#ifndef TICK_SIMULATION_SRC_HAWKES_MULTI_H_
+#define TICK_SIMULATION_SRC_HAWKES_MULTI_H_
+
+#include <limits>
+
+#include "hawkes.h"
+
+/*! \class HawkesMulti
+ * \brief Simulates many independent realizations of a Hawkes process
+ *
+ * Realizations are simulated by the threads of the process-wide thread pool,
+ * each of them on its own clone of the Hawkes process (see Hawkes::clone) with
+ * its own seed. The GIL is released during the whole simulation.
+ *
+ * Once all realizations are done, their timestamps are gathered in a single
+ * flat array (CSR-like layout): the timestamps of node j of realization r are
+ * stored in timestamps[offsets[r * n_nodes + j] : offsets[r * n_nodes + j + 1]]
+ */
+class HawkesMulti {
+    ulong n_simulations;
+    unsigned int n_nodes;
+
+    SArrayDoublePtr timestamps;
+    SArrayULongPtr offsets;
+    SArrayULongPtr n_total_jumps;
+    SArrayDoublePtr simulation_time;
+
+ public:
+    HawkesMulti();
+
+    /**
+     * @brief Simulates seeds.size() realizations of the given Hawkes process
+     * \param hawkes : The Hawkes process that is replicated, it is left untouched
+     * \param seeds : The seed used for each realization
+     * \param end_times : The time until which each realization is simulated
+     * \param n_threads : The number of threads used to run the realizations
+     * \param max_jumps : Each realization stops once this number of jumps is reached
+     */
+    void simulate(Hawkes &hawkes,
+                  const ArrayInt &seeds,
+                  const ArrayDouble &end_times,
+                  unsigned int n_threads,
+                  ulong max_jumps = std::numeric_limits<ulong>::max());
+
+    ulong get_n_simulations() const { return n_simulations; }
+
+    unsigned int get_n_nodes() const { return n_nodes; }
+
+    /// @brief Timestamps of all realizations, concatenated
+    SArrayDoublePtr get_timestamps() const { return timestamps; }
+
+    /// @brief Offsets of each (realization, node) pair in the timestamps array
+    SArrayULongPtr get_offsets() const { return offsets; }
+
+    /// @brief Total number of jumps of each realization
+    SArrayULongPtr get_n_total_jumps() const { return n_total_jumps; }
+
+    /// @brief Time until which each realization has been simulated
+    SArrayDoublePtr get_simulation_time() const { return simulation_time; }
+
+};
+
+#endif  // TICK_SIMULATION_SRC_HAWKES_MULTI_H_
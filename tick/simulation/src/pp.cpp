@@ -113,6 +113,19 @@ void PP::simulate(double end_time, ulong n_points) {
         itr_process();
     }
 
+    simulate_(end_time, n_points);
+
+    // This causes deadlock, see MLPP-334 - Investigate deadlock in PP
+    // #ifdef PYTHON_LINK
+    //    Py_END_ALLOW_THREADS;
+    // #endif
+
+    if (flag_negative_intensity)
+        TICK_ERROR(
+            "Stopped because intensity went negative (you could set the field ``thresholdNegativeIntensity`` to True)");
+}
+
+void PP::simulate_(double end_time, ulong n_points) {
     // We loop till we reach the endTime
     while (time < end_time && n_total_jumps < n_points && !flag_negative_intensity) {
         // We compute the time of the potential next random jump
@@ -164,15 +177,6 @@ void PP::simulate(double end_time, ulong n_points) {
 
         if (flag_negative_intensity) break;
     }
-
-    // This causes deadlock, see MLPP-334 - Investigate deadlock in PP
-    // #ifdef PYTHON_LINK
-    //    Py_END_ALLOW_THREADS;
-    // #endif
-
-    if (flag_negative_intensity)
-        TICK_ERROR(
-            "Stopped because intensity went negative (you could set the field ``thresholdNegativeIntensity`` to True)");
 }
 
 // Update the process component 'index' with current time
@@ -23,7 +23,7 @@ class PP {
      */
     VArrayDoublePtrList1D timestamps;
 
- private :
+ protected :
     // Thread safe random generator
     Rand rand;
 
@@ -46,12 +46,13 @@ class PP {
     // Current total intensity
     double total_intensity;
 
-    // Current Intensity of each component
-    ArrayDouble intensity;
-
     // Called to init the intensities at start
     void init_intensity();
 
+ protected:
+    // Current Intensity of each component
+    ArrayDouble intensity;
+
     // Set to true if negative intensities is encountered
     bool flag_negative_intensity;
 
@@ -139,6 +140,17 @@ class PP {
      void reseed_random_generator(int seed);
 
  protected :
+    /**
+     * @brief Runs the thinning algorithm from current time until end_time is
+     * reached or n_points jumps have occurred. Intensities have already been
+     * initialized when this is called.
+     * \param end_time : Time until the realization is performed
+     * \param n_points : The number of points until we keep simulating
+     * \note Processes whose intensities have a particular structure might
+     * override this with a faster algorithm
+     */
+    virtual void simulate_(double end_time, ulong n_points);
+
     /**
      * @brief Updates the current time so that it goes forward of delay seconds
      * The intensities must be updated and track recorded if needed
@@ -14,6 +14,9 @@ class Hawkes : public PP {
   void set_mu(int i, HawkesMuPtr mu);
   void set_mu(int i, double mu);
   double get_mu(int i);
+
+  void set_event_driven(bool event_driven);
+  bool get_event_driven() const;
 };
 
 TICK_MAKE_PICKLABLE(Hawkes, 0);
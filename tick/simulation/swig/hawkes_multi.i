@@ -0,0 +1,25 @@
+
+%{
+#include "hawkes_multi.h"
+%}
+
+
+class HawkesMulti {
+ public :
+
+  HawkesMulti();
+
+  void simulate(Hawkes &hawkes, const ArrayInt &seeds,
+                const ArrayDouble &end_times, unsigned int n_threads);
+  void simulate(Hawkes &hawkes, const ArrayInt &seeds,
+                const ArrayDouble &end_times, unsigned int n_threads,
+                ulong max_jumps);
+
+  ulong get_n_simulations() const;
+  unsigned int get_n_nodes() const;
+
+  SArrayDoublePtr get_timestamps() const;
+  SArrayULongPtr get_offsets() const;
+  SArrayULongPtr get_n_total_jumps() const;
+  SArrayDoublePtr get_simulation_time() const;
+};
@@ -45,5 +45,6 @@ class PP {
 %include poisson.i
 %include inhomogeneous_poisson.i
 %include hawkes.i
+%include hawkes_multi.i
 
 %include hawkes_kernels.i
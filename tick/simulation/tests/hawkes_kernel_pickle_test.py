@@ -3,7 +3,7 @@ import unittest
 import pickle
 
 import numpy as np
-from tick.base import TimeFunction
+from tick.base import TimeFunction, set_pickle_format
 from tick.simulation.hawkes_kernels import HawkesKernel0, HawkesKernelExp, \
     HawkesKernelSumExp, HawkesKernelPowerLaw, HawkesKernelTimeFunc
 
@@ -81,6 +81,32 @@ class Test(unittest.TestCase):
         np.testing.assert_array_equal(obj.get_values(self.random_times),
                                       obj.get_values(self.random_times))
 
+    def test_pickle_formats(self):
+        """...Test that kernels pickled as binary or JSON are restored, and
+        that binary format is the default one
+        """
+        obj = HawkesKernelSumExp(decays=np.arange(1., 2., 0.2),
+                                 intensities=np.arange(0.3, 2.3, .4))
+
+        self.assertIsInstance(obj.__getstate__(), bytes)
+
+        set_pickle_format('json')
+        try:
+            self.assertIsInstance(obj.__getstate__(), str)
+            json_pickled = pickle.loads(pickle.dumps(obj))
+        finally:
+            set_pickle_format('binary')
+
+        binary_pickled = pickle.loads(pickle.dumps(obj))
+
+        for pickled in [json_pickled, binary_pickled]:
+            self.assertTrue(str(obj) == str(pickled))
+            np.testing.assert_array_equal(obj.get_values(self.random_times),
+                                          pickled.get_values(self.random_times))
+
+        with self.assertRaisesRegex(ValueError, "Unknown pickle format"):
+            set_pickle_format('xml')
+
 
 if __name__ == "__main__":
     unittest.main()
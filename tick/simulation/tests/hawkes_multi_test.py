@@ -1,3 +1,6 @@
+import os
+import shutil
+import tempfile
 import unittest
 
 import numpy as np
@@ -143,6 +146,114 @@ class Test(unittest.TestCase):
         hawkes_multi = SimuHawkesMulti(hawkes, n_simulations=5, n_threads=4)
         hawkes_multi.simulate()
 
+    def test_simu_hawkes_multi_native(self):
+        """...Test native engine gives the same results as multiprocessing
+        """
+        hawkes = SimuHawkes(kernels=self.kernels, baseline=self.baseline,
+                            end_time=10, verbose=False, seed=504)
+
+        multi = SimuHawkesMulti(hawkes, n_threads=4, n_simulations=10)
+        native = SimuHawkesMulti(hawkes, n_threads=4, n_simulations=10,
+                                 engine='native')
+        end_times = np.arange(10, 20)
+        multi.end_time = end_times
+        native.end_time = end_times
+
+        multi.simulate()
+        native.simulate()
+
+        np.testing.assert_array_equal(multi.n_total_jumps,
+                                      native.n_total_jumps)
+        np.testing.assert_array_equal(multi.simulation_time,
+                                      native.simulation_time)
+        np.testing.assert_array_equal(multi.end_time, native.end_time)
+        np.testing.assert_array_equal(multi.n_nodes, native.n_nodes)
+        np.testing.assert_array_equal(multi.spectral_radius,
+                                      native.spectral_radius)
+
+        for t_multi, t_native in zip(multi.timestamps, native.timestamps):
+            self.assertEqual(len(t_multi), len(t_native))
+            for t_multi_node, t_native_node in zip(t_multi, t_native):
+                np.testing.assert_array_equal(t_multi_node, t_native_node)
+
+        # The original simulation is left untouched
+        self.assertEqual(hawkes.n_total_jumps, 0)
+
+    def test_simu_hawkes_multi_native_flat_timestamps(self):
+        """...Test layout of timestamps simulated by the native engine
+        """
+        hawkes = SimuHawkes(kernels=self.kernels, baseline=self.baseline,
+                            end_time=100, verbose=False, seed=2093)
+
+        native = SimuHawkesMulti(hawkes, n_threads=2, n_simulations=4,
+                                 engine='native')
+
+        self.assertRaises(ValueError, lambda: native.flat_timestamps)
+        native.simulate()
+
+        offsets, values = native.flat_timestamps
+        self.assertEqual(offsets.shape, (4 * 2 + 1,))
+        self.assertEqual(offsets[0], 0)
+        self.assertEqual(offsets[-1], len(values))
+        np.testing.assert_array_equal(
+            np.diff(offsets).reshape(4, 2).sum(axis=1), native.n_total_jumps)
+
+        timestamps = native.timestamps
+        for i in range(4):
+            for j in range(2):
+                np.testing.assert_array_equal(
+                    timestamps[i][j],
+                    values[offsets[i * 2 + j]:offsets[i * 2 + j + 1]])
+                self.assertTrue(np.all(np.diff(timestamps[i][j]) >= 0))
+
+    def test_simu_hawkes_multi_write_event_store(self):
+        """...Test that simulated timestamps written to an EventStore are the
+        same for both engines
+        """
+        hawkes = SimuHawkes(kernels=self.kernels, baseline=self.baseline,
+                            end_time=50, verbose=False, seed=2093)
+
+        multi = SimuHawkesMulti(hawkes, n_threads=2, n_simulations=3)
+        native = SimuHawkesMulti(hawkes, n_threads=2, n_simulations=3,
+                                 engine='native')
+        multi.simulate()
+        native.simulate()
+
+        path = tempfile.mkdtemp()
+        try:
+            store = multi.write_event_store(os.path.join(path, 'multi'))
+            native_store = native.write_event_store(
+                os.path.join(path, 'native'))
+
+            for s in [store, native_store]:
+                self.assertEqual(s.n_realizations, 3)
+                self.assertEqual(s.n_nodes, 2)
+                np.testing.assert_array_equal(s.end_times,
+                                              native.simulation_time)
+                for timestamps, stored_timestamps in zip(native.timestamps,
+                                                         s):
+                    for t, stored_t in zip(timestamps, stored_timestamps):
+                        np.testing.assert_array_equal(stored_t, t)
+        finally:
+            shutil.rmtree(path)
+
+    def test_simu_hawkes_multi_native_errors(self):
+        """...Test errors raised by SimuHawkesMulti engines
+        """
+        hawkes = SimuHawkes(kernels=self.kernels, baseline=self.baseline,
+                            end_time=10, verbose=False)
+
+        with self.assertRaisesRegex(ValueError, "engine must be one of"):
+            SimuHawkesMulti(hawkes, n_simulations=2, engine='unknown')
+
+        native = SimuHawkesMulti(hawkes, n_simulations=2, engine='native')
+        with self.assertRaisesRegex(ValueError, "native engine"):
+            native.get_single_simulation(0)
+
+        multi = SimuHawkesMulti(hawkes, n_simulations=2)
+        with self.assertRaisesRegex(ValueError, "native engine"):
+            multi.flat_timestamps
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -72,6 +72,24 @@ class Test(unittest.TestCase):
             self.assertAlmostEqual(np.mean(hawkes.tracked_intensity[i]),
                                    mean_intensity[i], delta=0.3)
 
+    def test_hawkes_event_driven(self):
+        """...Test that event driven simulation gives consistent mean intensity
+        """
+        hawkes = SimuHawkes(kernels=self.kernels, baseline=self.baseline,
+                            seed=308, end_time=3000, verbose=False,
+                            event_driven=True)
+        self.assertTrue(hawkes.event_driven)
+        hawkes.simulate()
+
+        mean_intensity = hawkes.mean_intensity()
+        for i in range(hawkes.n_nodes):
+            self.assertAlmostEqual(len(hawkes.timestamps[i]) / 3000,
+                                   mean_intensity[i], delta=0.1)
+            self.assertTrue(np.all(np.diff(hawkes.timestamps[i]) >= 0))
+
+        hawkes.event_driven = False
+        self.assertFalse(hawkes.event_driven)
+
     def test_simu_hawkes_constructor(self):
         """...Test SimuHawkes constructor
         """
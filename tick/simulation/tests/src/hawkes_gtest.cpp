@@ -0,0 +1,72 @@
+#include <gtest/gtest.h>
+#include <hawkes.h>
+
+class HawkesTest : public ::testing::TestWithParam<bool> {
+ protected:
+  std::unique_ptr<Hawkes> hawkes;
+
+  void SetUp() override {
+    hawkes = std::unique_ptr<Hawkes>(new Hawkes(3, 12));
+    HawkesKernelPtr kernel_exp = std::make_shared<HawkesKernelExp>(0.3, 2.);
+    HawkesKernelPtr kernel_sum_exp = std::make_shared<HawkesKernelSumExp>(
+        ArrayDouble {0.1, 0.2}, ArrayDouble {1., 3.});
+    hawkes->set_kernel(0, 0, kernel_exp);
+    hawkes->set_kernel(0, 1, kernel_sum_exp);
+    hawkes->set_kernel(1, 1, kernel_exp);
+    hawkes->set_kernel(2, 2, kernel_exp);
+    hawkes->set_mu(0, 0.5);
+    hawkes->set_mu(1, 0.8);
+    hawkes->set_mu(2, 0.);
+    hawkes->set_event_driven(GetParam());
+  }
+};
+
+TEST_P(HawkesTest, mean_intensity) {
+  const double end_time = 10000;
+  hawkes->simulate(end_time);
+
+  // mean intensity is (I - ||phi||)^-1 mu
+  const double mean_intensity_1 = 0.8 / 0.7;
+  const double mean_intensity_0 = (0.5 + 0.3 * mean_intensity_1) / 0.7;
+
+  EXPECT_NEAR(hawkes->timestamps[0]->size() / end_time, mean_intensity_0, 0.05);
+  EXPECT_NEAR(hawkes->timestamps[1]->size() / end_time, mean_intensity_1, 0.05);
+  EXPECT_EQ(hawkes->timestamps[2]->size(), 0u);
+  EXPECT_DOUBLE_EQ(hawkes->get_time(), end_time);
+}
+
+TEST_P(HawkesTest, sorted_timestamps) {
+  hawkes->simulate(100.);
+  hawkes->simulate(200.);
+
+  for (ulong i = 0; i < 3; ++i) {
+    ArrayDouble &timestamps_i = *hawkes->timestamps[i];
+    for (ulong k = 1; k < timestamps_i.size(); ++k) {
+      EXPECT_LE(timestamps_i[k - 1], timestamps_i[k]);
+    }
+    if (timestamps_i.size() > 0) {
+      EXPECT_LT(timestamps_i[timestamps_i.size() - 1], 200.);
+    }
+  }
+}
+
+TEST_P(HawkesTest, max_jumps) {
+  hawkes->simulate(std::numeric_limits<double>::max(), 100);
+  EXPECT_EQ(hawkes->get_n_total_jumps(), 100u);
+}
+
+TEST_P(HawkesTest, reproducible) {
+  hawkes->simulate(100.);
+
+  auto other = hawkes->clone(12);
+  other->simulate(100.);
+
+  for (ulong i = 0; i < 3; ++i) {
+    ASSERT_EQ(hawkes->timestamps[i]->size(), other->timestamps[i]->size());
+    for (ulong k = 0; k < hawkes->timestamps[i]->size(); ++k) {
+      EXPECT_DOUBLE_EQ((*hawkes->timestamps[i])[k], (*other->timestamps[i])[k]);
+    }
+  }
+}
+
+INSTANTIATE_TEST_CASE_P(AllHawkesTests, HawkesTest, ::testing::Values(false, true));
@@ -0,0 +1,76 @@
+#include <gtest/gtest.h>
+#include <hawkes_multi.h>
+
+class HawkesMultiTest : public ::testing::Test {
+ protected:
+  std::unique_ptr<Hawkes> hawkes;
+
+  void SetUp() override {
+    hawkes = std::unique_ptr<Hawkes>(new Hawkes(2, 1));
+    HawkesKernelPtr kernel_exp = std::make_shared<HawkesKernelExp>(0.3, 2.);
+    HawkesKernelPtr kernel_sum_exp = std::make_shared<HawkesKernelSumExp>(
+        ArrayDouble {0.1, 0.2}, ArrayDouble {1., 3.});
+    hawkes->set_kernel(0, 0, kernel_exp);
+    hawkes->set_kernel(0, 1, kernel_sum_exp);
+    hawkes->set_kernel(1, 1, kernel_exp);
+    hawkes->set_mu(0, 0.5);
+    hawkes->set_mu(1, 0.8);
+  }
+};
+
+TEST_F(HawkesMultiTest, same_as_single_simulations) {
+  ArrayInt seeds {3, 17, 1024, 9, 3};
+  ArrayDouble end_times {50., 100., 20., 0., 50.};
+
+  for (unsigned int n_threads : {1u, 2u, 4u}) {
+    HawkesMulti multi;
+    multi.simulate(*hawkes, seeds, end_times, n_threads);
+
+    ASSERT_EQ(multi.get_n_simulations(), seeds.size());
+    ASSERT_EQ(multi.get_n_nodes(), 2u);
+
+    SArrayULongPtr offsets = multi.get_offsets();
+    SArrayDoublePtr timestamps = multi.get_timestamps();
+    ASSERT_EQ(offsets->size(), seeds.size() * 2 + 1);
+    EXPECT_EQ((*offsets)[seeds.size() * 2], timestamps->size());
+
+    for (ulong r = 0; r < seeds.size(); ++r) {
+      auto single = hawkes->clone(seeds[r]);
+      single->simulate(end_times[r]);
+
+      EXPECT_EQ((*multi.get_n_total_jumps())[r], single->get_n_total_jumps());
+      EXPECT_DOUBLE_EQ((*multi.get_simulation_time())[r], single->get_time());
+
+      for (ulong j = 0; j < 2; ++j) {
+        const ulong start = (*offsets)[r * 2 + j];
+        const ulong end = (*offsets)[r * 2 + j + 1];
+        ASSERT_EQ(end - start, single->timestamps[j]->size());
+        for (ulong k = start; k < end; ++k) {
+          EXPECT_DOUBLE_EQ((*timestamps)[k], (*single->timestamps[j])[k - start]);
+        }
+      }
+    }
+  }
+
+  // The original process has not been simulated
+  EXPECT_EQ(hawkes->get_n_total_jumps(), 0u);
+}
+
+TEST_F(HawkesMultiTest, max_jumps) {
+  ArrayInt seeds {3, 17};
+  ArrayDouble end_times {1e6, 1e6};
+
+  HawkesMulti multi;
+  multi.simulate(*hawkes, seeds, end_times, 2, 10);
+
+  EXPECT_EQ((*multi.get_offsets())[4], 10u * 2);
+}
+
+TEST_F(HawkesMultiTest, bad_sizes) {
+  ArrayInt seeds {3, 17};
+  ArrayDouble end_times {10.};
+
+  HawkesMulti multi;
+  EXPECT_THROW(multi.simulate(*hawkes, seeds, end_times, 2), std::runtime_error);
+}
+
@@ -0,0 +1,56 @@
+"""
+============================================================
+Python overhead of tick objects construction and small calls
+============================================================
+
+Measures the time needed to construct models, proxs and solvers, and to call
+`ModelLogReg.loss` and `ModelLogReg.grad` in a tight loop on a tiny dataset,
+where the time spent in the Python layer (attributes handling of `Base`,
+calls counters) dominates the computation itself.
+"""
+
+import timeit
+
+import numpy as np
+
+from tick.optim.model import ModelLogReg, ModelLinReg
+from tick.optim.prox import ProxL2Sq, ProxElasticNet
+from tick.optim.solver import GD, AGD, SVRG
+from tick.simulation import SimuLogReg, weights_sparse_gauss
+
+
+def time_call(func, n_calls):
+    """Best time of a call to func, in microseconds
+    """
+    return 1e6 * min(timeit.repeat(func, number=n_calls, repeat=5)) / n_calls
+
+
+def run_benchmark(n_calls=2000, n_samples=10, n_features=5):
+    w0 = weights_sparse_gauss(n_features, nnz=2)
+    features, labels = SimuLogReg(w0, n_samples=n_samples, verbose=False,
+                                  seed=123).simulate()
+    model = ModelLogReg(fit_intercept=True).fit(features, labels)
+    coeffs = np.random.randn(model.n_coeffs)
+    out = np.empty(model.n_coeffs)
+
+    calls = [
+        ("ModelLogReg()", lambda: ModelLogReg(fit_intercept=True)),
+        ("ModelLinReg().fit", lambda: ModelLinReg().fit(features, labels)),
+        ("ProxL2Sq()", lambda: ProxL2Sq(1e-3)),
+        ("ProxElasticNet()", lambda: ProxElasticNet(1e-3, ratio=0.5)),
+        ("GD()", lambda: GD(verbose=False)),
+        ("AGD()", lambda: AGD(verbose=False)),
+        ("SVRG()", lambda: SVRG(verbose=False)),
+        ("model.loss", lambda: model.loss(coeffs)),
+        ("model.grad", lambda: model.grad(coeffs, out=out)),
+        ("model.loss_and_grad", lambda: model.loss_and_grad(coeffs, out=out)),
+        ("model.n_coeffs", lambda: model.n_coeffs),
+    ]
+
+    print("{:>22} {:>12}".format("operation", "time (us)"))
+    for name, func in calls:
+        print("{:>22} {:>12.2f}".format(name, time_call(func, n_calls)))
+
+
+if __name__ == '__main__':
+    run_benchmark()
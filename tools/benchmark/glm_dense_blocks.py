@@ -0,0 +1,66 @@
+"""
+===========================================================
+Dense generalized linear models computed by blocks of rows
+===========================================================
+
+Compares the time needed to compute the loss and gradient of generalized
+linear models on dense features when samples are processed one by one and
+when they are processed by blocks of rows with two matrix-vector products
+(BLAS gemv if tick is built with CBLAS).
+"""
+
+import time
+
+import numpy as np
+
+from tick.optim.model import ModelLogReg, ModelLinReg, ModelPoisReg, \
+    ModelLinRegWithIntercepts
+
+
+def time_loss_grad(model, coeffs, n_calls):
+    out = np.empty(model.n_coeffs)
+    # Inner products must be computed at each call
+    model._model.set_inner_prods_cache_size(0)
+    start = time.perf_counter()
+    for _ in range(n_calls):
+        model._model.loss_and_grad(coeffs, out)
+    return (time.perf_counter() - start) / n_calls
+
+
+def run_benchmark(shapes=((100000, 20), (10000, 1000), (100, 100000)),
+                  n_calls=20):
+    models = [
+        ('logreg', lambda: ModelLogReg(fit_intercept=True)),
+        ('linreg', lambda: ModelLinReg(fit_intercept=True)),
+        ('poisreg', lambda: ModelPoisReg(fit_intercept=False)),
+        ('linreg_intercepts', lambda: ModelLinRegWithIntercepts()),
+    ]
+
+    print("{:>18} {:>10} {:>10} {:>12} {:>12} {:>8}".format(
+        "model", "n_samples", "n_features", "rows (ms)", "blocks (ms)",
+        "speedup"))
+
+    for n_samples, n_features in shapes:
+        np.random.seed(123)
+        features = np.random.randn(n_samples, n_features) / n_features
+        labels = np.random.randint(0, 2, n_samples).astype(float)
+        for name, build in models:
+            if name == 'logreg':
+                model_labels = 2 * labels - 1
+            else:
+                model_labels = labels
+            model = build().fit(features, model_labels)
+            coeffs = 0.1 * np.random.rand(model.n_coeffs)
+
+            model._model.set_blocked_dense(False)
+            rows_time = time_loss_grad(model, coeffs, n_calls)
+            model._model.set_blocked_dense(True)
+            blocks_time = time_loss_grad(model, coeffs, n_calls)
+
+            print("{:>18} {:>10} {:>10} {:>12.3f} {:>12.3f} {:>8.2f}".format(
+                name, n_samples, n_features, 1e3 * rows_time,
+                1e3 * blocks_time, rows_time / blocks_time))
+
+
+if __name__ == '__main__':
+    run_benchmark()
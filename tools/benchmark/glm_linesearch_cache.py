@@ -0,0 +1,52 @@
+"""
+====================================================
+Cached inner products in solvers with linesearch
+====================================================
+
+Measures the time needed by `GD` and `AGD` with linesearch to fit a logistic
+regression when the model keeps the inner products of the samples with the
+last coefficients it was given (default) and when it recomputes them at each
+call (cache size set to 0). Solvers with linesearch compute the loss at a
+point they have just accepted and then the loss and gradient at this same
+point, which the cache computes without a pass over the features.
+"""
+
+import time
+
+from tick.optim.model import ModelLogReg
+from tick.optim.prox import ProxL2Sq
+from tick.optim.solver import GD, AGD
+from tick.simulation import SimuLogReg, weights_sparse_gauss
+
+
+def run_benchmark(n_samples=200000, n_features=50, max_iter=50):
+    w0 = weights_sparse_gauss(n_features, nnz=10)
+    features, labels = SimuLogReg(w0, n_samples=n_samples, verbose=False,
+                                  seed=123).simulate()
+    model = ModelLogReg(fit_intercept=True).fit(features, labels)
+    prox = ProxL2Sq(1. / n_samples)
+
+    print("{:>8} {:>12} {:>12} {:>8} {:>14}".format(
+        "solver", "no cache (s)", "cache (s)", "speedup", "objective"))
+
+    for solver_class in [GD, AGD]:
+        times = []
+        for cache_size in [0, 2]:
+            model._model.set_inner_prods_cache_size(cache_size)
+            solver = solver_class(max_iter=max_iter, tol=0, verbose=False,
+                                  linesearch=True)
+            solver.set_model(model).set_prox(prox)
+
+            start = time.perf_counter()
+            coeffs = solver.solve()
+            times.append(time.perf_counter() - start)
+
+        print("{:>8} {:>12.3f} {:>12.3f} {:>8.2f} {:>14.8f}".format(
+            solver_class.__name__, times[0], times[1], times[0] / times[1],
+            solver.objective(coeffs)))
+
+    model._model.set_inner_prods_cache_size(2)
+
+
+if __name__ == '__main__':
+    run_benchmark()
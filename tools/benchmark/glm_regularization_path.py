@@ -0,0 +1,60 @@
+"""
+=========================================================
+Regularization path of a l1 penalized logistic regression
+=========================================================
+
+Measures the time needed to fit a `LogisticRegression` with l1 penalization
+for all the values of ``C`` of a regularization path: with a plain loop over
+these values (each fit starting from zero), with `LearnerGLM.fit_path` (each
+fit starting from the previous solution) and with `LearnerGLM.fit_path` using
+strong rules (each fit restricted to the features likely to be active, the
+restricted models being fitted once per set of active features).
+"""
+
+import time
+
+import numpy as np
+
+from tick.inference import LogisticRegression
+from tick.simulation import SimuLogReg, weights_sparse_gauss
+
+
+def run_benchmark(n_samples=20000, n_features=1000, n_Cs=20):
+    w0 = weights_sparse_gauss(n_features, nnz=20)
+    features, labels = SimuLogReg(w0, n_samples=n_samples, verbose=False,
+                                  seed=123).simulate()
+    learner_kwargs = {'penalty': 'l1', 'solver': 'agd', 'max_iter': 500,
+                      'tol': 1e-8, 'verbose': False}
+
+    # Default path, from the smallest C for which all weights are zero
+    start = time.perf_counter()
+    Cs, path = LogisticRegression(**learner_kwargs).fit_path(
+        features, labels, n_Cs=n_Cs)
+    path_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    loop_path = np.empty_like(path)
+    for k, C in enumerate(Cs):
+        learner = LogisticRegression(C=C, **learner_kwargs)
+        learner.fit(features, labels)
+        loop_path[k] = np.hstack((learner.weights, learner.intercept))
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _, strong_path = LogisticRegression(**learner_kwargs).fit_path(
+        features, labels, Cs=Cs, strong_rules=True)
+    strong_time = time.perf_counter() - start
+
+    print("{:>16} {:>10} {:>10} {:>14}".format(
+        "method", "time (s)", "speedup", "max deviation"))
+    for name, elapsed, coeffs_path in [
+            ("loop over Cs", loop_time, loop_path),
+            ("fit_path", path_time, path),
+            ("fit_path strong", strong_time, strong_path)]:
+        print("{:>16} {:>10.3f} {:>10.2f} {:>14.2e}".format(
+            name, elapsed, loop_time / elapsed,
+            np.abs(coeffs_path - loop_path).max()))
+
+
+if __name__ == '__main__':
+    run_benchmark()
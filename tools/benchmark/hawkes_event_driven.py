@@ -0,0 +1,50 @@
+"""
+=============================================
+Dense and event driven simulation of Hawkes
+=============================================
+
+Compares the time needed to simulate multivariate Hawkes processes with sparse
+exponential kernels (each node excites itself and a few other nodes) with the
+default thinning algorithm, which updates all intensities at each candidate
+jump, and with the event driven one (``event_driven=True``).
+"""
+
+import time
+
+import numpy as np
+
+from tick.simulation import SimuHawkesExpKernels
+
+
+def build_adjacency(n_nodes, n_neighbors=3, seed=2039):
+    np.random.seed(seed)
+    adjacency = np.zeros((n_nodes, n_nodes))
+    for j in range(n_nodes):
+        excited = np.random.choice(n_nodes, n_neighbors, replace=False)
+        adjacency[excited, j] = 0.6 / n_neighbors
+    return adjacency
+
+
+def time_simulation(n_nodes, event_driven, n_jumps_per_node=50):
+    adjacency = build_adjacency(n_nodes)
+    hawkes = SimuHawkesExpKernels(adjacency, 2., baseline=np.ones(n_nodes),
+                                  end_time=0.4 * n_jumps_per_node,
+                                  verbose=False, seed=1039,
+                                  event_driven=event_driven)
+    start = time.perf_counter()
+    hawkes.simulate()
+    return time.perf_counter() - start, hawkes.n_total_jumps
+
+
+def run_benchmark():
+    print("{:>8} {:>14} {:>10} {:>10}".format(
+        "n_nodes", "event_driven", "n_jumps", "time (s)"))
+    for n_nodes in [10, 100, 1000]:
+        for event_driven in [False, True]:
+            elapsed, n_jumps = time_simulation(n_nodes, event_driven)
+            print("{:>8} {:>14} {:>10} {:>10.3f}".format(
+                n_nodes, str(event_driven), n_jumps, elapsed))
+
+
+if __name__ == '__main__':
+    run_benchmark()
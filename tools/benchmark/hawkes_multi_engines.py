@@ -0,0 +1,53 @@
+"""
+===============================================
+Multiprocessing and native SimuHawkesMulti runs
+===============================================
+
+Compares the time needed by SimuHawkesMulti to run many replications of a
+multivariate Hawkes process with its two engines: ``'multiprocessing'`` which
+pickles every replication to and from a pool of processes, and ``'native'``
+which runs all replications on C++ threads and stores their timestamps in a
+single flat array.
+"""
+
+import time
+
+import numpy as np
+
+from tick.simulation import SimuHawkesExpKernels, SimuHawkesMulti
+
+
+def build_hawkes(n_nodes=5, end_time=1000):
+    np.random.seed(2039)
+    adjacency = np.random.uniform(0, 1, (n_nodes, n_nodes))
+    hawkes = SimuHawkesExpKernels(adjacency, 3., baseline=np.ones(n_nodes),
+                                  end_time=end_time, verbose=False, seed=1039)
+    hawkes.adjust_spectral_radius(0.8)
+    return hawkes
+
+
+def time_engine(hawkes, engine, n_simulations, n_threads):
+    start = time.perf_counter()
+    multi = SimuHawkesMulti(hawkes, n_simulations=n_simulations,
+                            n_threads=n_threads, engine=engine)
+    multi.simulate()
+    timestamps = multi.timestamps
+    elapsed = time.perf_counter() - start
+    return elapsed, sum(multi.n_total_jumps), len(timestamps)
+
+
+def run_benchmark(n_threads=4):
+    hawkes = build_hawkes()
+
+    print("{:>13} {:>16} {:>12} {:>10}".format(
+        "n_simulations", "engine", "n_jumps", "time (s)"))
+    for n_simulations in [10, 100, 1000]:
+        for engine in ['multiprocessing', 'native']:
+            elapsed, n_jumps, _ = time_engine(hawkes, engine, n_simulations,
+                                              n_threads)
+            print("{:>13} {:>16} {:>12} {:>10.3f}".format(
+                n_simulations, engine, n_jumps, elapsed))
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,72 @@
+"""
+==============================================================
+Truncated Gaussian functions in HawkesSumGaussians weights
+==============================================================
+
+Compares the time needed by `HawkesSumGaussians` to precompute its weights
+on simulated Hawkes processes with increasing numbers of events, without
+truncation (every pair of events is considered) and with Gaussian functions
+truncated to a few standard deviations (``truncation_n_std``). The error
+made by the truncation is measured on the baseline and amplitudes obtained
+after a few iterations started from the same point.
+"""
+
+import time
+
+import numpy as np
+
+from tick.inference import HawkesSumGaussians
+from tick.simulation import SimuHawkesExpKernels
+
+
+def simulate_events(n_jumps_per_node, n_nodes=2, seed=2039):
+    adjacency = np.full((n_nodes, n_nodes), 0.5 / n_nodes)
+    baseline = np.ones(n_nodes)
+    hawkes = SimuHawkesExpKernels(adjacency, 1., baseline=baseline,
+                                  end_time=0.5 * n_jumps_per_node,
+                                  verbose=False, seed=seed)
+    hawkes.simulate()
+    return hawkes.timestamps
+
+
+def fit(events, truncation_n_std, n_gaussians=10, max_mean_gaussian=5.):
+    learner = HawkesSumGaussians(max_mean_gaussian, n_gaussians=n_gaussians,
+                                 max_iter=5, em_max_iter=5, verbose=False,
+                                 truncation_n_std=truncation_n_std)
+    learner._set_data(events)
+
+    start = time.perf_counter()
+    learner._learner.compute_weights()
+    elapsed = time.perf_counter() - start
+
+    n_nodes = len(events)
+    learner.solve(baseline_start=np.ones(n_nodes),
+                  amplitudes_start=np.full((n_nodes, n_nodes, n_gaussians),
+                                           0.1))
+    return elapsed, learner.baseline, learner.amplitudes
+
+
+def run_benchmark(truncations=(3, 5, 8)):
+    print("{:>10} {:>12} {:>12} {:>10} {:>16}".format(
+        "n_events", "truncation", "time (s)", "speedup", "max abs error"))
+
+    for n_jumps_per_node in [1000, 4000, 16000]:
+        events = simulate_events(n_jumps_per_node)
+        n_events = sum(map(len, events))
+
+        reference_time, baseline, amplitudes = fit(events, 0)
+        print("{:>10} {:>12} {:>12.3f} {:>10} {:>16}".format(
+            n_events, "none", reference_time, "", ""))
+
+        for truncation_n_std in truncations:
+            elapsed, baseline_truncated, amplitudes_truncated = fit(
+                events, truncation_n_std)
+            error = max(np.abs(baseline_truncated - baseline).max(),
+                        np.abs(amplitudes_truncated - amplitudes).max())
+            print("{:>10} {:>12} {:>12.3f} {:>10.1f} {:>16.2e}".format(
+                n_events, truncation_n_std, elapsed,
+                reference_time / elapsed, error))
+
+
+if __name__ == '__main__':
+    run_benchmark()
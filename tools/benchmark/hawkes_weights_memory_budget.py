@@ -0,0 +1,91 @@
+"""
+==============================================================
+Memory used by Hawkes weights with a weights_memory_budget
+==============================================================
+
+Compares the peak memory and the time needed by `HawkesADM4` and
+`HawkesSumGaussians` to fit simulated Hawkes processes with increasing
+numbers of events, when their precomputed weights are stored (no budget) and
+when they do not fit in ``weights_memory_budget`` and are computed on the fly
+at each iteration instead.
+
+Each fit runs in its own process, whose peak resident memory is reported
+along with the memory it used before fitting.
+"""
+
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from tick.inference import HawkesADM4, HawkesSumGaussians
+from tick.simulation import SimuHawkesExpKernels
+
+
+def simulate_events(n_jumps_per_node, n_nodes=10, seed=2039):
+    adjacency = np.full((n_nodes, n_nodes), 0.5 / n_nodes)
+    baseline = np.ones(n_nodes)
+    hawkes = SimuHawkesExpKernels(adjacency, 1., baseline=baseline,
+                                  end_time=0.5 * n_jumps_per_node,
+                                  verbose=False, seed=seed)
+    hawkes.simulate()
+    return hawkes.timestamps
+
+
+def max_rss_mb():
+    # ru_maxrss is given in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def fit(learner_name, n_jumps_per_node, weights_memory_budget):
+    events = simulate_events(n_jumps_per_node)
+    n_nodes = len(events)
+
+    if learner_name == 'ADM4':
+        learner = HawkesADM4(1., max_iter=10, em_max_iter=5, verbose=False,
+                             weights_memory_budget=weights_memory_budget)
+        start_kwargs = {'adjacency_start': np.full((n_nodes, n_nodes), 0.1)}
+    else:
+        learner = HawkesSumGaussians(
+            5., n_gaussians=5, max_iter=10, em_max_iter=5, verbose=False,
+            truncation_n_std=5, weights_memory_budget=weights_memory_budget)
+        start_kwargs = {
+            'amplitudes_start': np.full((n_nodes, n_nodes, 5), 0.1)}
+
+    memory_before = max_rss_mb()
+    start = time.perf_counter()
+    learner.fit(events, baseline_start=np.ones(n_nodes), **start_kwargs)
+    elapsed = time.perf_counter() - start
+
+    return sum(map(len, events)), elapsed, memory_before, max_rss_mb(), \
+        learner.baseline
+
+
+def run_benchmark(budget=1):
+    print("{:>8} {:>10} {:>8} {:>10} {:>12} {:>12} {:>14}".format(
+        "learner", "n_events", "budget", "time (s)", "before (MB)",
+        "peak (MB)", "max abs error"))
+
+    for learner_name in ['ADM4', 'SumGaussians']:
+        for n_jumps_per_node in [10000, 50000, 200000]:
+            baseline = None
+            for weights_memory_budget in [0, budget]:
+                # A new process per fit, so that peak memory is not shared
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    n_events, elapsed, memory_before, memory_peak, \
+                        fitted_baseline = executor.submit(
+                            fit, learner_name, n_jumps_per_node,
+                            weights_memory_budget).result()
+
+                if baseline is None:
+                    baseline = fitted_baseline
+                error = np.abs(fitted_baseline - baseline).max()
+                print("{:>8} {:>10} {:>8} {:>10.3f} {:>12.1f} {:>12.1f} "
+                      "{:>14.2e}".format(
+                        learner_name, n_events, weights_memory_budget,
+                        elapsed, memory_before, memory_peak, error))
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,68 @@
+"""
+=========================================================
+Scaling of stochastic solvers with the number of threads
+=========================================================
+
+Measures the time needed by `SVRG` and `SGD` to run their epochs on a sparse
+logistic regression when their iterations run concurrently on 1 to
+``n_cores`` threads (``n_threads`` parameter), and the objective reached.
+"""
+
+import multiprocessing
+import time
+
+import numpy as np
+from scipy import sparse
+
+from tick.optim.model import ModelLogReg
+from tick.optim.prox import ProxElasticNet
+from tick.optim.solver import SGD, SVRG
+
+
+def simulate_sparse_logreg(n_samples, n_features, density, seed=123):
+    np.random.seed(seed)
+    features = sparse.random(n_samples, n_features, density=density,
+                             format='csr', random_state=seed)
+    coeffs = np.random.randn(n_features)
+    logits = features.dot(coeffs)
+    labels = np.where(np.random.rand(n_samples) < 1 / (1 + np.exp(-logits)),
+                      1., -1.)
+    return features, labels
+
+
+def run_benchmark(n_samples=200000, n_features=100000, density=1e-4,
+                  max_iter=10):
+    features, labels = simulate_sparse_logreg(n_samples, n_features, density)
+    model = ModelLogReg(fit_intercept=True).fit(features, labels)
+    prox = ProxElasticNet(1. / n_samples, ratio=0.5)
+    step = 1. / model.get_lip_max()
+
+    n_cores = multiprocessing.cpu_count()
+    n_threads_list = sorted({2 ** k for k in range(n_cores.bit_length())} |
+                            {n_cores})
+
+    print("{:>8} {:>10} {:>12} {:>10} {:>14}".format(
+        "solver", "n_threads", "time (s)", "speedup", "objective"))
+
+    for solver_class in [SVRG, SGD]:
+        reference_time = None
+        for n_threads in n_threads_list:
+            # The objective is only computed at the last iteration
+            solver = solver_class(step=step, max_iter=max_iter, tol=0,
+                                  verbose=False, record_every=max_iter,
+                                  seed=123, n_threads=n_threads)
+            solver.set_model(model).set_prox(prox)
+
+            start = time.perf_counter()
+            coeffs = solver.solve()
+            elapsed = time.perf_counter() - start
+            if reference_time is None:
+                reference_time = elapsed
+
+            print("{:>8} {:>10} {:>12.3f} {:>10.2f} {:>14.8f}".format(
+                solver_class.__name__, n_threads, elapsed,
+                reference_time / elapsed, solver.objective(coeffs)))
+
+
+if __name__ == '__main__':
+    run_benchmark()
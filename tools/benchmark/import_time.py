@@ -0,0 +1,44 @@
+"""
+=============================
+Import time of tick packages
+=============================
+
+Measures the time needed to import each tick package in a new interpreter,
+as reported by ``python -X importtime`` (Python 3.7 or later). Packages
+import their objects lazily, hence this does not include the import of
+their submodules and C++ extensions.
+"""
+
+import subprocess
+import sys
+
+
+def import_time(package, n_repeats=5):
+    """Best cumulative import time of a package, in milliseconds
+    """
+    times = []
+    for _ in range(n_repeats):
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import %s' % package],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            universal_newlines=True, check=True)
+        for line in process.stderr.splitlines():
+            if not line.startswith('import time:'):
+                continue
+            _, cumulative, module = line.split('|')
+            if module.strip() == package:
+                times.append(int(cumulative) / 1e3)
+    return min(times)
+
+
+def run_benchmark(packages=('tick', 'tick.optim.model', 'tick.optim.prox',
+                            'tick.optim.solver', 'tick.simulation',
+                            'tick.inference', 'tick.preprocessing',
+                            'tick.dataset', 'tick.plot')):
+    print("{:>20} {:>12}".format("package", "time (ms)"))
+    for package in packages:
+        print("{:>20} {:>12.1f}".format(package, import_time(package)))
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,77 @@
+"""
+===========================================
+Size and speed of binary and JSON pickling
+===========================================
+
+Compares pickle size and pickling / unpickling times of C++ backed objects
+when they are serialized with cereal binary archives (default) and with JSON
+archives (``set_pickle_format('json')``).
+
+Benchmarked objects are a linear model with a large features matrix, a
+simulated multivariate Hawkes process (holding all its timestamps) and the
+kernels of this simulation.
+"""
+
+import pickle
+import time
+
+import numpy as np
+
+from tick.base import set_pickle_format, get_pickle_format
+from tick.optim.model import ModelLogReg
+from tick.simulation import SimuLogReg, SimuHawkesExpKernels, \
+    weights_sparse_gauss
+
+
+def time_pickle(obj, n_repeats):
+    start = time.perf_counter()
+    for _ in range(n_repeats):
+        data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    dump_time = (time.perf_counter() - start) / n_repeats
+
+    start = time.perf_counter()
+    for _ in range(n_repeats):
+        pickle.loads(data)
+    load_time = (time.perf_counter() - start) / n_repeats
+
+    return len(data), dump_time, load_time
+
+
+def build_objects(n_samples=100000, n_features=100, n_nodes=10,
+                  end_time=10000):
+    w0 = weights_sparse_gauss(n_features, nnz=10)
+    features, labels = SimuLogReg(w0, n_samples=n_samples, verbose=False,
+                                  seed=123).simulate()
+    model = ModelLogReg(fit_intercept=True).fit(features, labels)
+    model.get_lip_max()
+
+    adjacency = np.random.uniform(0, 1, (n_nodes, n_nodes))
+    hawkes = SimuHawkesExpKernels(adjacency, 3., baseline=np.ones(n_nodes),
+                                  end_time=end_time, verbose=False, seed=123)
+    hawkes.adjust_spectral_radius(0.8)
+    hawkes.simulate()
+
+    return [("ModelLogReg %d x %d" % (n_samples, n_features), model._model),
+            ("SimuHawkes %d jumps" % hawkes.n_total_jumps, hawkes._pp),
+            ("HawkesKernelExp", hawkes.kernels[0, 0])]
+
+
+def run_benchmark(n_repeats=5):
+    initial_format = get_pickle_format()
+    objects = build_objects()
+
+    print("{:<28} {:>7} {:>12} {:>10} {:>10}".format(
+        "object", "format", "size (kB)", "dump (ms)", "load (ms)"))
+    for name, obj in objects:
+        for pickle_format in ['json', 'binary']:
+            set_pickle_format(pickle_format)
+            size, dump_time, load_time = time_pickle(obj, n_repeats)
+            print("{:<28} {:>7} {:>12.1f} {:>10.2f} {:>10.2f}".format(
+                name, pickle_format, size / 1e3, 1e3 * dump_time,
+                1e3 * load_time))
+
+    set_pickle_format(initial_format)
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,63 @@
+"""
+===========================================================
+Persistent thread pool versus thread creation at each call
+===========================================================
+
+Compares the time needed to compute `ModelLogReg.grad` with several threads
+when threads are taken from the persistent pool of tick and when they are
+created and joined at each call (pool size set to 0).
+"""
+
+import time
+
+import numpy as np
+
+from tick.base import set_thread_pool_size, get_thread_pool_size
+from tick.optim.model import ModelLogReg
+from tick.simulation import SimuLogReg, weights_sparse_gauss
+
+
+def time_grad(model, coeffs, n_calls):
+    out = np.empty(model.n_coeffs)
+    # Inner products must be computed at each call
+    model._model.set_inner_prods_cache_size(0)
+    start = time.perf_counter()
+    for _ in range(n_calls):
+        model._model.grad(coeffs, out)
+    return (time.perf_counter() - start) / n_calls
+
+
+def run_benchmark(n_samples_list=(100, 1000, 10000, 100000), n_features=50,
+                  n_threads_list=(2, 4, 8), n_calls=200):
+    pool_size = get_thread_pool_size()
+    w0 = weights_sparse_gauss(n_features, nnz=10)
+
+    print("{:>10} {:>10} {:>14} {:>14} {:>8}".format(
+        "n_samples", "n_threads", "spawn (ms)", "pool (ms)", "speedup"))
+
+    for n_samples in n_samples_list:
+        features, labels = SimuLogReg(w0, n_samples=n_samples, verbose=False,
+                                      seed=123).simulate()
+        coeffs = np.random.randn(n_features + 1)
+
+        for n_threads in n_threads_list:
+            model = ModelLogReg(fit_intercept=True, n_threads=n_threads) \
+                .fit(features, labels)
+
+            set_thread_pool_size(0)
+            spawn_time = time_grad(model, coeffs, n_calls)
+
+            set_thread_pool_size(max(pool_size, n_threads - 1))
+            # First call starts the workers
+            time_grad(model, coeffs, 1)
+            pool_time = time_grad(model, coeffs, n_calls)
+
+            print("{:>10} {:>10} {:>14.4f} {:>14.4f} {:>8.2f}".format(
+                n_samples, n_threads, 1e3 * spawn_time, 1e3 * pool_time,
+                spawn_time / pool_time))
+
+    set_thread_pool_size(pool_size)
+
+
+if __name__ == '__main__':
+    run_benchmark()